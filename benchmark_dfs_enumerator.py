@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark DFS énumérateur - moteur récursif legacy vs pile explicite
+
+Chaînes linéaires profondes (500 à 3000 nœuds),
+limites profondeur/mémoire levées pour atteindre ces profondeurs:
+1. dfs_engine="RECURSIVE": générateurs imbriqués (yield from par niveau)
+2. dfs_engine="ITERATIVE": pile explicite d'itérateurs d'arêtes
+
+Usage: python benchmark_dfs_enumerator.py
+"""
+
+import os
+import sys
+import logging
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+CHAIN_DEPTHS = [500, 900, 1500, 3000]
+
+
+class UnboundedDepthEnumerator(DAGPathEnumerator):
+    """Limites profondeur/mémoire levées (benchmark chaînes longues)"""
+    MEMORY_PROTECTION_THRESHOLD = 10 ** 9
+
+    def _get_adaptive_max_depth(self) -> int:
+        return 10 ** 6
+
+
+def build_chain(depth: int) -> Edge:
+    """Arête transaction vers le sink d'une chaîne de depth nœuds"""
+    nodes = [Node(f"chain_{i}") for i in range(depth)]
+    for upstream, downstream in zip(nodes[1:], nodes):
+        connect_nodes(upstream, downstream, Edge(f"e_{upstream.node_id}", upstream, downstream))
+    return Edge("tx", Node("payer"), nodes[0], edge_type=EdgeType.TEMPORARY)
+
+
+def run_engine(engine: str, transaction_edge: Edge):
+    enumerator = UnboundedDepthEnumerator(AccountTaxonomy(), max_paths=100000)
+    enumerator.dfs_engine = engine
+    start = time.perf_counter()
+    paths = [tuple(node.node_id for node in path)
+             for path in enumerator.enumerate_paths_from_transaction(transaction_edge, 0)]
+    return paths, (time.perf_counter() - start) * 1000
+
+
+def time_engine(engine: str, transaction_edge: Edge, repeats: int = 3):
+    timings, paths = [], None
+    for _ in range(repeats):
+        paths, elapsed_ms = run_engine(engine, transaction_edge)
+        timings.append(elapsed_ms)
+    return paths, statistics.median(timings)
+
+
+def run_benchmark() -> None:
+    # Moteur récursif: RecursionError interceptée et loggée par nœud
+    logging.getLogger("icgs_core.path_enumerator").setLevel(logging.CRITICAL)
+
+    print("=" * 72)
+    print(f"BENCHMARK DFS ÉNUMÉRATEUR (recursionlimit={sys.getrecursionlimit()})")
+    print("=" * 72)
+    print(f"{'depth':>7} {'recursive (ms)':>16} {'iterative (ms)':>16} {'speedup':>9} {'identical':>22}")
+
+    for depth in CHAIN_DEPTHS:
+        transaction_edge = build_chain(depth)
+        reference, recursive_ms = time_engine("RECURSIVE", transaction_edge)
+        paths, iterative_ms = time_engine("ITERATIVE", transaction_edge)
+
+        # Au-delà de la limite de récursion, le moteur legacy perd les chemins
+        identical = "yes" if paths == reference else "no (recursion limit)"
+        print(f"{depth:>7} {recursive_ms:>16.2f} {iterative_ms:>16.2f} "
+              f"{recursive_ms / iterative_ms:>8.2f}x {identical:>22}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
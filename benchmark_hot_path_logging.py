@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark logging hot-path DAGPathEnumerator - formatage systématique vs niveaux capturés
+
+DAG en couches de ~1000 arêtes (liaisons complètes entre couches),
+logger à WARNING:
+1. Avant: messages debug/info f-string formatés à chaque nœud/chemin
+   (trace forcée, simulant les appels logger non gardés)
+2. Après: niveaux capturés une fois par énumération, compteurs
+   EnumerationStatistics seulement
+
+Usage: python benchmark_hot_path_logging.py [max_paths]
+"""
+
+import os
+import sys
+import logging
+import time
+import statistics
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+LAYERS = 21
+WIDTH = 7
+
+
+class UnguardedLoggingEnumerator(DAGPathEnumerator):
+    """Comportement avant garde: toutes les chaînes de log formatées"""
+
+    def _capture_trace_flags(self) -> None:
+        self.trace_debug = True
+        self.trace_info = True
+
+
+def build_layered_dag(layers: int = LAYERS, width: int = WIDTH):
+    """Arête transaction vers le sink d'un DAG en couches complètes"""
+    grid = [[Node(f"layer{layer}_{index}") for index in range(width)] for layer in range(layers)]
+    edge_count = 0
+    for upstream_layer, downstream_layer in zip(grid[1:], grid):
+        for upstream in upstream_layer:
+            for downstream in downstream_layer:
+                connect_nodes(upstream, downstream,
+                              Edge(f"e_{upstream.node_id}_{downstream.node_id}", upstream, downstream))
+                edge_count += 1
+    sink = Node("sink")
+    for node in grid[0]:
+        connect_nodes(node, sink, Edge(f"e_{node.node_id}_sink", node, sink))
+        edge_count += 1
+    return Edge("tx", Node("payer"), sink, edge_type=EdgeType.TEMPORARY), edge_count
+
+
+def run_enumerator(enumerator_class, transaction_edge: Edge, max_paths: int):
+    enumerator = enumerator_class(AccountTaxonomy(), max_paths=max_paths)
+    start = time.perf_counter()
+    num_paths = sum(1 for _ in enumerator.enumerate_paths_from_transaction(transaction_edge, 0))
+    return num_paths, (time.perf_counter() - start) * 1e6, enumerator
+
+
+def count_log_calls(enumerator_class, transaction_edge: Edge, max_paths: int) -> int:
+    """Appels logger.debug/info (= messages formatés) pendant une énumération"""
+    enumerator = enumerator_class(AccountTaxonomy(), max_paths=max_paths)
+    with patch.object(enumerator.logger, 'debug') as debug, patch.object(enumerator.logger, 'info') as info:
+        for _ in enumerator.enumerate_paths_from_transaction(transaction_edge, 0):
+            pass
+    return debug.call_count + info.call_count
+
+
+def run_benchmark(max_paths: int = 5000, repeats: int = 5) -> None:
+    enumerator_logger = logging.getLogger("icgs_core.path_enumerator")
+    enumerator_logger.setLevel(logging.WARNING)
+    # Warnings explosion conservés (niveau WARNING) mais non affichés
+    enumerator_logger.addHandler(logging.NullHandler())
+    enumerator_logger.propagate = False
+    transaction_edge, edge_count = build_layered_dag()
+
+    print("=" * 72)
+    print(f"BENCHMARK LOGGING HOT-PATH ({edge_count} arêtes, logger WARNING)")
+    print("=" * 72)
+    print(f"{'mode':>10} {'paths':>7} {'median (ms)':>12} {'µs/path':>9} {'log calls':>10}")
+
+    results = {}
+    for label, enumerator_class in (("before", UnguardedLoggingEnumerator), ("after", DAGPathEnumerator)):
+        timings, num_paths = [], 0
+        for _ in range(repeats):
+            num_paths, elapsed_us, enumerator = run_enumerator(enumerator_class, transaction_edge, max_paths)
+            timings.append(elapsed_us)
+        log_calls = count_log_calls(enumerator_class, transaction_edge, max_paths)
+        per_path = statistics.median(timings) / max(num_paths, 1)
+        results[label] = (per_path, enumerator)
+        print(f"{label:>10} {num_paths:>7} {statistics.median(timings) / 1000:>12.2f} "
+              f"{per_path:>9.2f} {log_calls:>10}")
+
+    before, after = results["before"][0], results["after"][0]
+    stats = results["after"][1].stats
+    print(f"\nOverhead logging supprimé: {before - after:.2f} µs/path ({before / after:.2f}x)")
+    print(f"Compteurs: edges_explored={stats.causal_edges_explored} "
+          f"complete_paths={stats.complete_paths_found} backtracks={stats.backtracks}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
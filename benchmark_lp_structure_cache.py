@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark cache structure LP - cold-start vs dernière base par structure_fingerprint
+
+Séquences de LPs transaction par paire de secteurs: structure identique
+(patterns + poids secteur fixes), seuls montant et bornes changent. Paires
+entrelacées pour que la dernière base persistée (stored_basis) soit celle
+d'une autre structure; sans pivot précédent, seul le cache structure
+permet le warm-start.
+
+Usage: python benchmark_lp_structure_cache.py [transactions_par_paire]
+"""
+
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.linear_programming import (
+    LinearProgram, build_source_constraint, build_target_constraint, build_secondary_constraint
+)
+from icgs_core.simplex_solver import TripleValidationOrientedSimplex
+
+
+# (paire secteurs, classes de chemins)
+SECTOR_PAIRS = [("AGRICULTURE", "INDUSTRY", 7), ("INDUSTRY", "SERVICES", 65),
+                ("SERVICES", "FINANCE", 130), ("FINANCE", "ENERGY", 195)]
+
+
+def build_pair_lp(pair_index: int, num_classes: int, amount: Decimal, rnd: random.Random) -> LinearProgram:
+    """LP paire: poids fixés par la paire (seed), montant et bornes variables"""
+    weights_rnd = random.Random(pair_index)
+    program = LinearProgram(f"pair_{pair_index}_{amount}")
+    state_ids = [f"pair_{pair_index}_class_{i}" for i in range(num_classes)]
+    for state_id in state_ids:
+        program.add_variable(state_id, Decimal('0'), Decimal(rnd.randint(50, 500)))
+
+    source_weights = {s: Decimal(weights_rnd.randint(80, 120)) / 100 for s in state_ids}
+    target_weights = {s: Decimal(weights_rnd.randint(60, 110)) / 100 for s in state_ids if weights_rnd.random() < 0.7}
+    secondary_weights = {s: Decimal(weights_rnd.randint(-100, 30)) / 100 for s in state_ids if weights_rnd.random() < 0.3}
+    program.add_constraint(build_source_constraint(source_weights, Decimal('1'), amount))
+    program.add_constraint(build_target_constraint(target_weights, Decimal('1'), amount * Decimal('0.85')))
+    if secondary_weights:
+        program.add_constraint(build_secondary_constraint(secondary_weights, Decimal('1'), "secondary"))
+    return program
+
+
+def build_sequence(per_pair: int, seed: int = 23):
+    rnd = random.Random(seed)
+    sequence = []
+    for _ in range(per_pair):
+        for pair_index, (_, _, num_classes) in enumerate(SECTOR_PAIRS):
+            amount = Decimal(rnd.randint(10000, 90000)) / 100
+            program = build_pair_lp(pair_index, num_classes, amount, rnd)
+            objective = {state_id: Decimal(i % 7 + 1) for i, state_id in enumerate(program.variables)}
+            sequence.append((program, objective))
+    return sequence
+
+
+def run_sequence(sequence, max_structure_bases: int):
+    solver = TripleValidationOrientedSimplex(max_structure_bases=max_structure_bases)
+    start = time.perf_counter()
+    solutions = [solver.solve_optimization_problem(program, objective) for program, objective in sequence]
+    return solutions, (time.perf_counter() - start) * 1000, solver.get_solver_stats()
+
+
+def run_benchmark(per_pair: int = 25) -> None:
+    sequence = build_sequence(per_pair)
+    cold, cold_ms, cold_stats = run_sequence(sequence, 0)
+    cached, cached_ms, cached_stats = run_sequence(sequence, 128)
+
+    # Optimum exact (certificat Fraction): les prix Decimal peuvent différer au 50e chiffre
+    # quand un autre sommet optimal est atteint
+    def outcomes(solutions):
+        return [(s.status, s.certificate.objective_value if s.certificate else None) for s in solutions]
+    assert outcomes(cold) == outcomes(cached), "Structure cache changed optimal values"
+
+    print("=" * 78)
+    print(f"BENCHMARK CACHE STRUCTURE LP ({len(sequence)} LPs, {len(SECTOR_PAIRS)} structures)")
+    print("=" * 78)
+    print(f"{'mode':<18} {'time (ms)':>10} {'pivots':>8} {'dual':>6} {'warm':>6} {'hit rate':>9}")
+    for name, elapsed_ms, stats in (("cold-start", cold_ms, cold_stats), ("structure cache", cached_ms, cached_stats)):
+        print(f"{name:<18} {elapsed_ms:>10.1f} {stats['simplex_pivots']:>8} {stats['dual_simplex_pivots']:>6} "
+              f"{stats['warm_starts_used']:>6} {stats['structure_cache_hit_rate']:>9.2%}")
+    speedup = cold_ms / cached_ms if cached_ms > 0 else float('inf')
+    print(f"Speedup: {speedup:.2f}x, pivots économisés: {cached_stats['warm_start_pivots_saved']}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 25)
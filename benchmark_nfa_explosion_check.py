@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark pré-check explosion NFA - deepcopy vs projection analytique
+
+Mesure le coût par transaction de DAG._validate_transaction_nfa_explosion
+lorsque le NFA permanent grossit jusqu'à 10k mesures:
+1. Ancienne méthode: copy.deepcopy(NFA) + ajout mesures + comptage états finaux
+2. Nouvelle méthode: project_final_state_count (O(nouvelles mesures), sans copie)
+
+Usage: python benchmark_nfa_explosion_check.py [max_measures]
+"""
+
+import copy
+import os
+import sys
+import time
+import statistics
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+
+
+SECTOR_PATTERNS = [".*[ABC].*", ".*[IJ].*", ".*[STU].*", ".*[EF].*", ".*[XY].*"]
+CHECKPOINTS = [100, 1000, 2500, 5000, 10000]
+
+
+def _transaction_measures(tx_num: int):
+    """Deux mesures (source, cible) par transaction, patterns sectoriels"""
+    return [
+        (f"tx_{tx_num}_source", SECTOR_PATTERNS[tx_num % len(SECTOR_PATTERNS)]),
+        (f"tx_{tx_num}_target", SECTOR_PATTERNS[(tx_num + 1) % len(SECTOR_PATTERNS)])
+    ]
+
+
+def deepcopy_check(nfa: AnchoredWeightedNFA, measures) -> int:
+    """Ancien pré-check: copie complète puis ajout réel"""
+    temp_nfa = copy.deepcopy(nfa)
+    for measure_id, pattern in measures:
+        temp_nfa.add_weighted_regex(measure_id, pattern, Decimal('1'))
+    return len(temp_nfa.get_final_states())
+
+
+def projection_check(nfa: AnchoredWeightedNFA, measures) -> int:
+    """Nouveau pré-check analytique"""
+    return nfa.project_final_state_count(measures)
+
+
+def time_check(check, nfa, measures, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        check(nfa, measures)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def run_benchmark(max_measures: int = 10000) -> None:
+    print("=" * 72)
+    print("BENCHMARK PRÉ-CHECK EXPLOSION NFA")
+    print("=" * 72)
+    print(f"{'measures':>10} {'deepcopy (ms)':>15} {'projection (ms)':>17} {'speedup':>10}")
+
+    nfa = AnchoredWeightedNFA("benchmark_nfa")
+    tx_num = 0
+    for checkpoint in [c for c in CHECKPOINTS if c <= max_measures]:
+        while len(nfa.shared_nfa.entry_points) < checkpoint:
+            for measure_id, pattern in _transaction_measures(tx_num):
+                nfa.add_weighted_regex(measure_id, pattern, Decimal('1'))
+            tx_num += 1
+
+        measures = _transaction_measures(tx_num)
+        assert deepcopy_check(nfa, measures) == projection_check(nfa, measures)
+
+        deepcopy_ms = time_check(deepcopy_check, nfa, measures, repeats=3)
+        projection_ms = time_check(projection_check, nfa, measures, repeats=200)
+        print(f"{checkpoint:>10} {deepcopy_ms:>15.3f} {projection_ms:>17.4f} "
+              f"{deepcopy_ms / max(projection_ms, 1e-9):>9.0f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
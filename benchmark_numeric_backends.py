@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark backends numériques Simplex - float vs fraction vs scaled_integer
+
+LPs dimensionnés comme les transactions 65 agents: une variable f_i par classe
+de chemins (jusqu'à 195 = 65 agents × 3 caractères), contraintes source (LEQ),
+cible (GEQ) et secondaires (LEQ 0) à coefficients monétaires (2 décimales).
+Chaque mesure résout Phase 1 + Phase 2 depuis un solveur neuf (cold-start).
+
+Usage: python benchmark_numeric_backends.py [repeats]
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.linear_programming import (
+    LinearProgram, build_source_constraint, build_target_constraint, build_secondary_constraint
+)
+from icgs_core.numeric_backend import NUMERIC_BACKENDS
+from icgs_core.simplex_solver import TripleValidationOrientedSimplex
+
+
+# (classes de chemins, contraintes secondaires)
+LP_SIZES = [(7, 1), (65, 2), (130, 3), (195, 4)]
+
+
+def build_transaction_lp(num_classes: int, num_secondary: int, seed: int = 65) -> LinearProgram:
+    """LP transaction: source ≤ montant, cible ≥ montant × ratio, secondaires ≤ 0"""
+    rnd = random.Random(seed + num_classes)
+    program = LinearProgram(f"tx_{num_classes}_classes")
+    state_ids = [f"class_{i}" for i in range(num_classes)]
+    for state_id in state_ids:
+        program.add_variable(state_id, Decimal('0'), Decimal(rnd.randint(50, 500)))
+
+    amount = Decimal(rnd.randint(10000, 90000)) / 100
+    source_weights = {s: Decimal(rnd.randint(80, 120)) / 100 for s in state_ids}
+    target_weights = {s: Decimal(rnd.randint(60, 110)) / 100 for s in state_ids if rnd.random() < 0.7}
+    program.add_constraint(build_source_constraint(source_weights, Decimal('1'), amount))
+    program.add_constraint(build_target_constraint(target_weights, Decimal('1'), amount * Decimal('0.85')))
+    for k in range(num_secondary):
+        weights = {s: Decimal(rnd.randint(-100, 30)) / 100 for s in state_ids if rnd.random() < 0.3}
+        if weights:
+            program.add_constraint(build_secondary_constraint(weights, Decimal('1'), f"secondary_{k}"))
+    return program
+
+
+def time_backend(backend: str, program: LinearProgram, objective, repeats: int):
+    timings = []
+    solution = None
+    for _ in range(repeats):
+        solver = TripleValidationOrientedSimplex(numeric_backend=backend)
+        start = time.perf_counter()
+        solution = solver.solve_optimization_problem(program, objective)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, solution
+
+
+def run_benchmark(repeats: int = 5) -> None:
+    names = list(NUMERIC_BACKENDS)
+    print("=" * 78)
+    print("BENCHMARK BACKENDS NUMÉRIQUES SIMPLEX (Phase 1 + Phase 2, cold-start)")
+    print("=" * 78)
+    print(f"{'classes':>8} {'rows':>5} " + " ".join(f"{name + ' (ms)':>20}" for name in names) + "  status")
+
+    for num_classes, num_secondary in LP_SIZES:
+        program = build_transaction_lp(num_classes, num_secondary)
+        objective = {state_id: Decimal(i % 7 + 1) for i, state_id in enumerate(program.variables)}
+
+        row = []
+        outcomes = set()
+        for name in names:
+            elapsed_ms, solution = time_backend(name, program, objective, repeats)
+            row.append(elapsed_ms)
+            outcomes.add((solution.status, solution.final_objective_value))
+
+        assert len(outcomes) == 1, f"Backends disagree: {outcomes}"
+        status = next(iter(outcomes))[0].value
+        print(f"{num_classes:>8} {len(program.constraints):>5} "
+              + " ".join(f"{ms:>20.2f}" for ms in row) + f"  {status}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
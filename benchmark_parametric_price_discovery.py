@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark price discovery paramétrique - re-résolution par montant vs courbe prix
+
+Analyse what-if: prix optimal pour N montants candidats.
+1. Re-résolution: solve_optimization_problem par montant (LP neuf, cache structure actif)
+2. Paramétrique: solve_parametric_rhs une fois, puis price_at (O(log points de rupture))
+
+LPs transaction (benchmark_numeric_backends): RHS source = montant, RHS cible =
+0.85 × montant. Prix exacts (certificats) identiques exigés.
+
+Usage: python benchmark_parametric_price_discovery.py [montants_candidats]
+"""
+
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from benchmark_numeric_backends import build_transaction_lp
+from icgs_core.simplex_solver import TripleValidationOrientedSimplex, SolutionStatus
+
+
+# (classes de chemins, contraintes secondaires)
+LP_SIZES = [(7, 1), (65, 2), (130, 3)]
+AMOUNT_RANGE = (Decimal('0'), Decimal('2000'))
+
+
+def build_parametric_lp(num_classes: int, num_secondary: int):
+    """LP transaction à montant nul + direction RHS (source, cible) par unité de montant"""
+    program = build_transaction_lp(num_classes, num_secondary)
+    source, target = program.constraints[0], program.constraints[1]
+    source.bound = target.bound = Decimal('0')
+    direction = {source.name: Decimal('1'), target.name: Decimal('0.85')}
+    objective = {state_id: Decimal(i % 7 + 1) for i, state_id in enumerate(program.variables)}
+    return program, objective, direction
+
+
+def run_benchmark(num_amounts: int = 200) -> None:
+    low, high = AMOUNT_RANGE
+    amounts = [low + (high - low) * Decimal(k) / num_amounts for k in range(num_amounts + 1)]
+
+    print("=" * 86)
+    print(f"BENCHMARK PRICE DISCOVERY PARAMÉTRIQUE ({len(amounts)} montants dans [{low}, {high}])")
+    print("=" * 86)
+    print(f"{'classes':>8} {'re-solve (ms)':>14} {'curve (ms)':>11} {'queries (ms)':>13} "
+          f"{'speedup':>8} {'breakpoints':>12} {'basis chg':>10}")
+
+    for num_classes, num_secondary in LP_SIZES:
+        program, objective, direction = build_parametric_lp(num_classes, num_secondary)
+
+        solver = TripleValidationOrientedSimplex()
+        start = time.perf_counter()
+        direct = []
+        for amount in amounts:
+            solution = solver.solve_optimization_problem(program.with_rhs_shift(direction, amount), objective)
+            direct.append(solution.certificate.objective_value if solution.status == SolutionStatus.OPTIMAL else None)
+        resolve_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(program, objective, direction, low, high)
+        curve_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        parametric = [curve.exact_price_at(amount) for amount in amounts]
+        query_ms = (time.perf_counter() - start) * 1000
+
+        assert parametric == direct, "Parametric curve differs from direct solves"
+        speedup = resolve_ms / (curve_ms + query_ms)
+        print(f"{num_classes:>8} {resolve_ms:>14.1f} {curve_ms:>11.1f} {query_ms:>13.2f} "
+              f"{speedup:>7.1f}x {len(curve.breakpoints):>12} {curve.basis_changes:>10}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
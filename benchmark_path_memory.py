@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark mémoire chemins énumérés - List[Node] copiés vs arbre de préfixes
+
+Mesure (tracemalloc) le stockage des chemins d'une transaction sur des
+chaînes de losanges (2^k chemins, longueur 2k+1):
+1. Ancienne représentation: copie List[Node] par chemin dans paths_found,
+   puis références dans _path_cache, all_paths et path_classes
+2. Nouvelle représentation: PathPrefixTree (8 octets/entrée) + un int par
+   chemin dans chaque CompactPathList
+
+Usage: python benchmark_path_memory.py [max_diamonds]
+"""
+
+import os
+import sys
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+from icgs_core.path_store import PathPrefixTree, CompactPathList
+
+
+def build_diamond_chain(num_diamonds: int) -> Node:
+    """Sink d'une chaîne de losanges depuis source_0"""
+    current = Node("source_0")
+    for index in range(num_diamonds):
+        upper, lower, joined = Node(f"up_{index}"), Node(f"down_{index}"), Node(f"join_{index}")
+        for start, end in ((current, upper), (current, lower), (upper, joined), (lower, joined)):
+            connect_nodes(start, end, Edge(f"e_{start.node_id}_{end.node_id}", start, end))
+        current = joined
+    return current
+
+
+def measure(build) -> int:
+    """Octets alloués et retenus par build()"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = build()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del retained
+    return allocated
+
+
+def run_benchmark(max_diamonds: int = 13) -> None:
+    print("=" * 72)
+    print("BENCHMARK MÉMOIRE CHEMINS ÉNUMÉRÉS")
+    print("=" * 72)
+    print(f"{'paths':>8} {'length':>7} {'lists (B/path)':>16} {'compact (B/path)':>18} {'ratio':>8}")
+
+    for num_diamonds in range(3, max_diamonds + 1, 2):
+        sink = build_diamond_chain(num_diamonds)
+        transaction_edge = Edge("tx", Node("payer"), sink, edge_type=EdgeType.TEMPORARY)
+        enumerator = DAGPathEnumerator(AccountTaxonomy(), max_paths=100000)
+        entries = list(enumerator._enumerate_path_entries(transaction_edge, 0))
+        tree = enumerator.path_tree
+
+        def legacy_storage():
+            paths_found = [tree.materialize(entry) for entry in entries]
+            cached = paths_found.copy()
+            all_paths = list(cached)
+            path_classes = {"final": list(all_paths)}
+            return paths_found, cached, all_paths, path_classes
+
+        def compact_storage():
+            # Copie de l'arbre pour compter ses entrées dans la mesure
+            rebuilt = PathPrefixTree()
+            rebuilt.nodes, rebuilt.node_index = list(tree.nodes), dict(tree.node_index)
+            rebuilt.parents, rebuilt.node_indices = array('i', tree.parents), array('i', tree.node_indices)
+            paths_found = CompactPathList(rebuilt, array('i', entries))
+            all_paths = CompactPathList(rebuilt, paths_found.entries[:])
+            path_classes = {"final": CompactPathList(rebuilt, all_paths.entries[:])}
+            return rebuilt, paths_found, all_paths, path_classes
+
+        legacy_bytes = measure(legacy_storage)
+        compact_bytes = measure(compact_storage)
+        num_paths = len(entries)
+        print(f"{num_paths:>8} {2 * num_diamonds + 1:>7} {legacy_bytes / num_paths:>16.1f} "
+              f"{compact_bytes / num_paths:>18.1f} {legacy_bytes / max(compact_bytes, 1):>7.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 13)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark flux inter-sectoriels - validation exacte par paire vs agrégation par secteur
+
+EconomicSimulation.validate_inter_sectoral_flows sur économies de répartition
+sectorielle 65 agents (10/15/20/8/12) mises à l'échelle:
+1. PAIR: chaque paire agent×agent créée et validée dans le DAG (quadratique),
+   possible seulement dans la capacité taxonomique (65 agents)
+2. SECTOR: une transaction représentative par paire secteurs, verdict étendu
+
+Quand PAIR est exécutable, verdicts par paire et volumes doivent être identiques.
+
+Usage: python benchmark_sector_flow_aggregation.py [nombre_agents ...]
+"""
+
+import os
+import sys
+import logging
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_simulation.api.icgs_bridge import EconomicSimulation, FlowAggregation
+
+
+SECTOR_SHARES = {'AGRICULTURE': 10, 'INDUSTRY': 15, 'SERVICES': 20, 'FINANCE': 8, 'ENERGY': 12}
+AGENT_COUNTS = [65, 500, 5000]
+PAIR_MODE_MAX_AGENTS = 65  # Capacité Character-Set Manager mode 65_agents
+
+
+def build_simulation(total_agents: int) -> EconomicSimulation:
+    """Économie répartie selon SECTOR_SHARES, balances 500-3500"""
+    agents_mode = "65_agents" if total_agents <= PAIR_MODE_MAX_AGENTS else "7_agents"
+    simulation = EconomicSimulation(f"sector_flows_bench_{total_agents}", agents_mode=agents_mode)
+    total_shares = sum(SECTOR_SHARES.values())
+    for sector, share in SECTOR_SHARES.items():
+        for i in range(max(1, round(total_agents * share / total_shares))):
+            simulation.create_agent(f"{sector}_{i:04d}", sector, Decimal(500 + (i * 137) % 3000))
+    return simulation
+
+
+def timed_validation(total_agents: int, aggregation: FlowAggregation):
+    simulation = build_simulation(total_agents)
+    start = time.perf_counter()
+    result = simulation.validate_inter_sectoral_flows(0.5, aggregation)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run_benchmark(agent_counts) -> None:
+    print("=" * 92)
+    print("BENCHMARK FLUX INTER-SECTORIELS (validation PAIR exacte vs agrégation SECTOR)")
+    print("=" * 92)
+    print(f"{'agents':>7} {'pairs':>10} {'accepted':>10} {'DAG PAIR':>9} {'DAG SECTOR':>11} "
+          f"{'PAIR (ms)':>10} {'SECTOR (ms)':>12} {'speedup':>9}")
+
+    for total_agents in agent_counts:
+        sector_result, sector_ms = timed_validation(total_agents, FlowAggregation.SECTOR)
+
+        pair_validations, pair_time, speedup = "n/a", "n/a", "n/a"
+        if total_agents <= PAIR_MODE_MAX_AGENTS:
+            pair_result, pair_ms = timed_validation(total_agents, FlowAggregation.PAIR)
+            assert pair_result.pair_count == sector_result.pair_count, "Pair counts differ"
+            assert pair_result.volume == sector_result.volume, "Flow volumes differ"
+            for flow in pair_result.flows:
+                aggregated = sector_result.get_flow(flow.source_sector, flow.target_sector)
+                assert list(aggregated.iter_pairs()) == list(flow.iter_pairs()), "Pair verdicts differ"
+            pair_validations, pair_time = str(pair_result.full_validations), f"{pair_ms:.1f}"
+            speedup = f"{pair_ms / sector_ms:.1f}x" if sector_ms > 0 else "inf"
+
+        print(f"{total_agents:>7} {sector_result.pair_count:>10} {sector_result.accepted_count:>10} "
+              f"{pair_validations:>9} {sector_result.full_validations:>11} "
+              f"{pair_time:>10} {sector_ms:>12.1f} {speedup:>9}")
+
+    print(f"\nPAIR limité à {PAIR_MODE_MAX_AGENTS} agents (3 caractères taxonomiques par agent).")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    counts = [int(arg) for arg in sys.argv[1:]] or AGENT_COUNTS
+    run_benchmark(counts)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark registre transactions - liste + scans linéaires vs TransactionRegistry
+
+100k transactions entre 65 agents (5 secteurs), opérations de EconomicSimulation
+et du sérialiseur:
+1. Lookup par transaction_id (validate_transaction)
+2. Compteurs envoyées/reçues par agent (SimulationSerializer.serialize)
+3. Agrégats nombre/volume par paire de secteurs
+
+Usage: python benchmark_transaction_registry.py [num_transactions]
+"""
+
+import os
+import sys
+import random
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_core import Transaction
+from icgs_simulation.api.icgs_bridge import TransactionRegistry
+
+
+SECTORS = ['AGRICULTURE', 'INDUSTRY', 'SERVICES', 'FINANCE', 'ENERGY']
+NUM_AGENTS = 65
+NUM_LOOKUPS = 1000
+
+
+def build_transactions(count: int, seed: int = 21):
+    rnd = random.Random(seed)
+    agents = [(f"AGENT_{i:02d}", SECTORS[i % len(SECTORS)]) for i in range(NUM_AGENTS)]
+    transactions = []
+    for i in range(count):
+        (source, source_sector), (target, target_sector) = rnd.sample(agents, 2)
+        transactions.append(Transaction(
+            f"TX_bench_{i:06d}", source, target, Decimal(rnd.randint(100, 99999)) / 100,
+            metadata={'source_sector': source_sector, 'target_sector': target_sector}
+        ))
+    return [agent_id for agent_id, _ in agents], transactions
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def scan_lookups(transactions, lookup_ids):
+    return [next((tx for tx in transactions if tx.transaction_id == tx_id), None) for tx_id in lookup_ids]
+
+
+def scan_agent_counters(transactions, agent_ids):
+    return {agent_id: (len([tx for tx in transactions if tx.source_account_id == agent_id]),
+                       len([tx for tx in transactions if tx.target_account_id == agent_id]))
+            for agent_id in agent_ids}
+
+
+def scan_sector_pairs(transactions):
+    pairs = {}
+    for tx in transactions:
+        pair = (tx.metadata['source_sector'], tx.metadata['target_sector'])
+        count, volume = pairs.get(pair, (0, Decimal('0')))
+        pairs[pair] = (count + 1, volume + tx.amount)
+    return pairs
+
+
+def build_registry(transactions) -> TransactionRegistry:
+    registry = TransactionRegistry()
+    for transaction in transactions:
+        registry.append(transaction)
+    return registry
+
+
+def run_benchmark(num_transactions: int = 100000) -> None:
+    agent_ids, transactions = build_transactions(num_transactions)
+    lookup_ids = [tx.transaction_id for tx in random.Random(7).sample(transactions, NUM_LOOKUPS)]
+
+    registry, build_ms = timed(lambda: build_registry(transactions))
+
+    print("=" * 78)
+    print(f"BENCHMARK REGISTRE TRANSACTIONS ({num_transactions} transactions, {NUM_AGENTS} agents)")
+    print("=" * 78)
+    print(f"Construction registre (append incrémental): {build_ms:.1f}ms")
+    print(f"{'operation':<32} {'scan (ms)':>12} {'registry (ms)':>14} {'speedup':>10}")
+
+    rows = []
+    found_scan, scan_ms = timed(lambda: scan_lookups(transactions, lookup_ids))
+    found_registry, registry_ms = timed(lambda: [registry.get(tx_id) for tx_id in lookup_ids])
+    assert found_scan == found_registry
+    rows.append((f"{NUM_LOOKUPS} lookups par ID", scan_ms, registry_ms))
+
+    counters_scan, scan_ms = timed(lambda: scan_agent_counters(transactions, agent_ids))
+    counters_registry, registry_ms = timed(lambda: {
+        agent_id: (registry.sent_count(agent_id), registry.received_count(agent_id)) for agent_id in agent_ids
+    })
+    assert counters_scan == counters_registry
+    rows.append(("compteurs envoyées/reçues", scan_ms, registry_ms))
+
+    pairs_scan, scan_ms = timed(lambda: scan_sector_pairs(transactions))
+    pairs_registry, registry_ms = timed(lambda: {
+        pair: (aggregate['count'], aggregate['volume']) for pair, aggregate in registry.get_sector_pairs().items()
+    })
+    assert pairs_scan == pairs_registry
+    rows.append(("agrégats paires secteurs", scan_ms, registry_ms))
+
+    for name, scan_ms, registry_ms in rows:
+        speedup = scan_ms / registry_ms if registry_ms > 0 else float('inf')
+        print(f"{name:<32} {scan_ms:>12.2f} {registry_ms:>14.3f} {speedup:>9.0f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark validation batch - boucle add_transaction_auto vs add_transactions_batch_auto
+
+Flux inter-sectoriels EconomicSimulation (create_inter_sectoral_flows_batch),
+même liste de transactions validée sur deux simulations identiques:
+1. Boucle: EnhancedDAG.add_transaction_auto par transaction (NFA temporaire neuf chacune)
+2. Batch: EnhancedDAG.add_transactions_batch_auto (NFA frozen par signature patterns)
+
+Résultats acceptés/rejetés et pivots finaux doivent être identiques.
+
+Usage: python benchmark_transactions_batch.py [agents_par_secteur ...]
+"""
+
+import os
+import sys
+import logging
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from icgs_simulation.api.icgs_bridge import EconomicSimulation
+
+
+SECTORS = ['AGRICULTURE', 'INDUSTRY', 'SERVICES', 'FINANCE', 'ENERGY']
+AGENTS_PER_SECTOR = [1, 2, 3]
+
+
+def build_simulation(agents_per_sector: int) -> EconomicSimulation:
+    """Simulation avec agents par secteur, flux créés et taxonomie configurée"""
+    simulation = EconomicSimulation(f"batch_bench_{agents_per_sector}")
+    for sector in SECTORS:
+        for i in range(agents_per_sector):
+            simulation.create_agent(f"{sector}_{i}", sector)
+    simulation.create_inter_sectoral_flows_batch(flow_intensity=0.5)
+    simulation._configure_taxonomy_batch()
+    simulation.taxonomy_configured = True
+    return simulation
+
+
+def run_loop(agents_per_sector: int):
+    simulation = build_simulation(agents_per_sector)
+    start = time.perf_counter()
+    accepted = [simulation.dag.add_transaction_auto(tx) for tx in simulation.transactions]
+    return accepted, (time.perf_counter() - start) * 1000, simulation
+
+
+def run_batch(agents_per_sector: int):
+    simulation = build_simulation(agents_per_sector)
+    start = time.perf_counter()
+    batch = simulation.dag.add_transactions_batch_auto(simulation.transactions)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return [result.accepted for result in batch.results], elapsed_ms, simulation, batch
+
+
+def run_benchmark(sizes) -> None:
+    print("=" * 86)
+    print("BENCHMARK VALIDATION BATCH (add_transaction_auto en boucle vs add_transactions_batch_auto)")
+    print("=" * 86)
+    print(f"{'agents':>7} {'txs':>5} {'accepted':>9} {'loop (ms)':>11} {'batch (ms)':>11} "
+          f"{'speedup':>8} {'tx/s batch':>11} {'NFA sigs':>9} {'warm':>5}")
+
+    for agents_per_sector in sizes:
+        loop_accepted, loop_ms, loop_sim = run_loop(agents_per_sector)
+        batch_accepted, batch_ms, batch_sim, batch = run_batch(agents_per_sector)
+
+        assert batch_accepted == loop_accepted, "Batch results differ from sequential loop"
+        assert batch_sim.dag.stored_pivot == loop_sim.dag.stored_pivot, "Final pivots differ"
+
+        speedup = loop_ms / batch_ms if batch_ms > 0 else float('inf')
+        print(f"{agents_per_sector * len(SECTORS):>7} {len(batch.results):>5} {batch.accepted_count:>9} "
+              f"{loop_ms:>11.1f} {batch_ms:>11.1f} {speedup:>7.2f}x "
+              f"{batch.transactions_per_second:>11.1f} {batch.distinct_nfa_signatures:>9} "
+              f"{batch.warm_starts:>5}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    sizes = [int(arg) for arg in sys.argv[1:]] or AGENTS_PER_SECTOR
+    run_benchmark(sizes)
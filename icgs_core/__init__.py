@@ -33,9 +33,12 @@ from .dag_structures import Account, Node, Edge, EdgeType, NodeType
 # Imports Phase 2.6-2.8 + Price Discovery activés - Simplex et DAG Core implémentés
 from .simplex_solver import (
     TripleValidationOrientedSimplex, MathematicallyRigorousPivotManager,
-    SimplexSolution, SolutionStatus, PivotStatus, ValidationMode
+    SimplexSolution, SolutionStatus, PivotStatus, ValidationMode, ParametricPriceCurve
+)
+from .dag import (
+    DAG, Transaction, TransactionMeasure, DAGConfiguration,
+    BatchTransactionResult, TransactionBatchResult
 )
-from .dag import DAG, Transaction, TransactionMeasure, DAGConfiguration
 
 __all__ = [
     'AccountTaxonomy',
@@ -68,8 +71,11 @@ __all__ = [
     'SolutionStatus',
     'PivotStatus',
     'ValidationMode',
+    'ParametricPriceCurve',
     'DAG',
     'Transaction',
     'TransactionMeasure',
-    'DAGConfiguration'
+    'DAGConfiguration',
+    'BatchTransactionResult',
+    'TransactionBatchResult'
 ]
\ No newline at end of file
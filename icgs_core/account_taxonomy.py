@@ -13,11 +13,15 @@ Propriétés mathématiques garanties:
 - Historisation: évolution temporelle de classification des comptes
 - Alphabet UTF-32: évite collisions jusqu'à 1M+ comptes
 - Déterminisme: même état DAG → même mapping
-- Complexité: O(log n) récupération, O(n×t) stockage
+- Complexité: O(log n) récupération, O(changements) stockage par snapshot
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Mapping, Set, Optional, Tuple
+from collections import OrderedDict
+from collections.abc import Mapping as MappingABC
+from itertools import islice
 import bisect
+from array import array
 from decimal import Decimal
 from dataclasses import dataclass
 
@@ -25,12 +29,87 @@ from dataclasses import dataclass
 from .character_set_manager import NamedCharacterSetManager
 
 
+class MappingHistory:
+    """
+    Historique persistant des mappings partagé par tous les snapshots
+
+    Chaque compte conserve ses seules versions (transaction_num, caractère):
+    stockage O(changements), lecture par bisection O(log v) sur les versions
+    du compte. Les comptes sont ordonnés par première apparition, les
+    transaction_num étant strictement croissants l'ensemble des comptes d'un
+    snapshot est un préfixe de cet ordre.
+    """
+
+    def __init__(self):
+        self.account_order: List[str] = []
+        self.versions: Dict[str, Tuple[List[int], List[str]]] = {}
+
+    def latest(self, account_id: str) -> Optional[str]:
+        """Dernier caractère enregistré pour le compte"""
+        entry = self.versions.get(account_id)
+        return entry[1][-1] if entry is not None else None
+
+    def record(self, account_id: str, transaction_num: int, character: str) -> None:
+        """Enregistre une version seulement si le caractère change"""
+        entry = self.versions.get(account_id)
+        if entry is None:
+            self.versions[account_id] = ([transaction_num], [character])
+            self.account_order.append(account_id)
+        elif entry[1][-1] != character:
+            entry[0].append(transaction_num)
+            entry[1].append(character)
+
+    def lookup(self, account_id: str, transaction_num: int) -> Optional[str]:
+        """Caractère du compte applicable à transaction_num"""
+        entry = self.versions.get(account_id)
+        if entry is None or entry[0][0] > transaction_num:
+            return None
+        return entry[1][bisect.bisect_right(entry[0], transaction_num) - 1]
+
+
+class SharedMappingView(MappingABC):
+    """Vue lecture seule du mapping complet d'un snapshot sur MappingHistory"""
+
+    __slots__ = ('_history', '_transaction_num', '_size')
+
+    def __init__(self, history: MappingHistory, transaction_num: int, size: int):
+        self._history = history
+        self._transaction_num = transaction_num
+        self._size = size
+
+    def __getitem__(self, account_id: str) -> str:
+        character = self._history.lookup(account_id, self._transaction_num)
+        if character is None:
+            raise KeyError(account_id)
+        return character
+
+    def __contains__(self, account_id) -> bool:
+        entry = self._history.versions.get(account_id)
+        return entry is not None and entry[0][0] <= self._transaction_num
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(self._history.account_order, self._size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def copy(self) -> Dict[str, str]:
+        """Matérialisation dict (compatibilité appelants mutant la copie)"""
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"SharedMappingView(transaction_num={self._transaction_num}, size={self._size})"
+
+
 @dataclass
 class TaxonomySnapshot:
     """Snapshot taxonomie à transaction donnée pour historisation"""
     transaction_num: int
-    account_mappings: Dict[str, str]  # account_id -> character
+    account_mappings: Mapping[str, str]  # account_id -> character (SharedMappingView ou dict)
     timestamp: float
+    # Incrémentée seulement si un compte existant change de caractère:
+    # même version ⇒ mêmes mots pour les comptes présents (cache mots)
+    mapping_version: int = 0
     
     def __lt__(self, other):
         """Comparaison pour bisect sur transaction_num"""
@@ -47,12 +126,25 @@ class AccountTaxonomy:
     """
 
     def __init__(self, character_set_manager: Optional[NamedCharacterSetManager] = None,
-                 start_character: int = 0x41):  # Commence à 'A'
+                 start_character: int = 0x41,  # Commence à 'A'
+                 max_snapshot_tables: int = 8):
         # Architecture existante préservée (backward compatibility)
         self.taxonomy_history: List[TaxonomySnapshot] = []
         self.account_registry: Set[str] = set()
         self.next_character: int = start_character
 
+        # Mappings partagés structurellement entre snapshots (O(changements)
+        # par mise à jour au lieu d'une copie complète par snapshot)
+        self.mapping_history = MappingHistory()
+
+        # Tables denses par snapshot (index compte → code point, 0 = absent),
+        # construites à la demande pour convert_path_to_word; LRU borné
+        # (mémoire O(comptes × max_snapshot_tables), pas × snapshots)
+        self.account_index: Dict[str, int] = {}
+        self.max_snapshot_tables = max(1, max_snapshot_tables)
+        self._snapshot_tables: 'OrderedDict[int, array]' = OrderedDict()
+        self._last_table_lookup: Optional[Tuple[int, int, Optional[array]]] = None
+
         # NOUVEAU: Support character-sets nommés
         self.character_set_manager = character_set_manager
         self.use_character_sets = character_set_manager is not None
@@ -67,7 +159,8 @@ class AccountTaxonomy:
             # Nouvelles métriques character-sets
             'sector_allocations': 0,
             'character_set_mode': self.use_character_sets,
-            'freeze_transaction': None
+            'freeze_transaction': None,
+            'snapshot_tables_evicted': 0
         }
     
     def update_taxonomy(self, accounts: Dict[str, Optional[str]], transaction_num: int) -> Dict[str, str]:
@@ -85,19 +178,16 @@ class AccountTaxonomy:
         elif transaction_num < -1:
             raise ValueError(f"Invalid initialization transaction number: {transaction_num} (must be >= -1)")
         
-        # Récupération mapping précédent pour héritage SEULEMENT des comptes existants
-        previous_mapping = {}
+        # Héritage structurel: le nouveau snapshot partage l'historique des
+        # mappings, seuls les comptes de cette transaction y sont enregistrés
+        previous_version = 0
         if self.taxonomy_history:
-            previous_mapping = self.taxonomy_history[-1].account_mappings.copy()
+            previous_version = self.taxonomy_history[-1].mapping_version
+            self._absorb_external_snapshot()
+        history = self.mapping_history
         
-        # CORRECTION: Nouveau mapping contient SEULEMENT les comptes de cette transaction
-        # mais avec héritage des mappings précédents pour comptes déjà existants
-        new_mapping = {}
-        
-        # Phase 1: Validation et préparation
+        # Phase 1: Validation complète avant toute écriture dans l'historique partagé
         # SUPPRESSION CONTRAINTE UNICITÉ: Caractères partagés autorisés pour agents illimités
-        auto_assign_accounts = []
-
         for account_id, requested_char in accounts.items():
             self.account_registry.add(account_id)
 
@@ -108,22 +198,22 @@ class AccountTaxonomy:
                 if not self._is_valid_utf32_character(requested_char):
                     raise ValueError(f"Invalid UTF-32 character: {requested_char} for account {account_id}")
 
-                # MODIFICATION BREAKTHROUGH: Caractères dupliqués AUTORISÉS pour agents illimités
-                # Suppression validation collision - caractères peuvent être partagés par secteur
-                new_mapping[account_id] = requested_char
-        
         # Phase 2: Pas d'auto-assignment - tous les mappings sont explicites
+        # MODIFICATION BREAKTHROUGH: Caractères dupliqués AUTORISÉS pour agents illimités
+        remapped = False
+        for account_id, requested_char in accounts.items():
+            previous_char = history.latest(account_id)
+            if previous_char is not None and previous_char != requested_char:
+                remapped = True
+            history.record(account_id, transaction_num, requested_char)
         
-        # CORRECTION: Héritage comptes précédents NON mentionnés dans cette transaction
-        for prev_account, prev_char in previous_mapping.items():
-            if prev_account not in new_mapping:
-                new_mapping[prev_account] = prev_char
-        
-        # Phase 3: Création snapshot historique
+        # Phase 3: Création snapshot historique (vue sur l'historique partagé,
+        # comptes précédents NON mentionnés hérités)
         snapshot = TaxonomySnapshot(
             transaction_num=transaction_num,
-            account_mappings=new_mapping,
-            timestamp=time.time()
+            account_mappings=SharedMappingView(history, transaction_num, len(history.account_order)),
+            timestamp=time.time(),
+            mapping_version=previous_version + 1 if remapped else previous_version
         )
         
         # Insertion ordonnée pour recherche dichotomique
@@ -137,8 +227,7 @@ class AccountTaxonomy:
         )
         
         # CORRECTION: Retourner seulement mappings des comptes de cette transaction
-        result_mapping = {account_id: new_mapping[account_id] for account_id in accounts.keys()}
-        return result_mapping
+        return dict(accounts)
 
     def update_taxonomy_with_sectors(self,
                                    accounts_with_sectors: Dict[str, str],
@@ -174,38 +263,47 @@ class AccountTaxonomy:
             if transaction_num <= self.taxonomy_history[-1].transaction_num:
                 raise ValueError(f"Transaction number must be strictly increasing: {transaction_num}")
 
-        # Récupération mapping précédent pour héritage
-        previous_mapping = {}
+        # Héritage structurel via l'historique partagé
+        previous_version = 0
         if self.taxonomy_history:
-            previous_mapping = self.taxonomy_history[-1].account_mappings.copy()
-
-        new_mapping = previous_mapping.copy()  # Héritage comptes précédents
+            previous_version = self.taxonomy_history[-1].mapping_version
+            self._absorb_external_snapshot()
+        history = self.mapping_history
 
-        # Phase 1: Allocation automatique avec character-sets
+        # Phase 1: Allocation automatique avec character-sets (comptes existants conservés)
+        result_mapping = {}
         allocated_mappings = {}
         for account_id, sector_name in accounts_with_sectors.items():
             self.account_registry.add(account_id)
 
-            if account_id not in new_mapping:  # Nouveau compte
-                try:
-                    allocated_char = self.character_set_manager.allocate_character_for_sector(sector_name)
-                    new_mapping[account_id] = allocated_char
-                    allocated_mappings[account_id] = allocated_char
-                    self.stats['sector_allocations'] += 1
+            existing_char = history.latest(account_id)
+            if existing_char is not None:
+                result_mapping[account_id] = existing_char
+                continue
+
+            try:
+                allocated_char = self.character_set_manager.allocate_character_for_sector(sector_name)
+                allocated_mappings[account_id] = allocated_char
+                result_mapping[account_id] = allocated_char
+                self.stats['sector_allocations'] += 1
+
+            except (ValueError, RuntimeError) as e:
+                raise ValueError(f"Échec allocation secteur '{sector_name}' pour compte '{account_id}': {e}")
 
-                except (ValueError, RuntimeError) as e:
-                    raise ValueError(f"Échec allocation secteur '{sector_name}' pour compte '{account_id}': {e}")
+        for account_id, allocated_char in allocated_mappings.items():
+            history.record(account_id, transaction_num, allocated_char)
 
         # Phase 2: Freeze après première transaction (transaction_num == 0)
         if transaction_num == 0 and self.character_set_manager:
             self.character_set_manager.freeze()
             self.stats['freeze_transaction'] = transaction_num
 
-        # Phase 3: Création snapshot historique
+        # Phase 3: Création snapshot historique (allocations nouvelles seulement: version inchangée)
         snapshot = TaxonomySnapshot(
             transaction_num=transaction_num,
-            account_mappings=new_mapping,
-            timestamp=time.time()
+            account_mappings=SharedMappingView(history, transaction_num, len(history.account_order)),
+            timestamp=time.time(),
+            mapping_version=previous_version
         )
 
         # Insertion ordonnée pour recherche dichotomique
@@ -219,7 +317,19 @@ class AccountTaxonomy:
         )
 
         # Retourner seulement mappings des comptes de cette transaction
-        return {account_id: new_mapping[account_id] for account_id in accounts_with_sectors.keys()}
+        return result_mapping
+
+    def _absorb_external_snapshot(self) -> None:
+        """
+        Intègre à l'historique partagé un dernier snapshot inséré directement
+        dans taxonomy_history (mapping dict hors API) pour préserver l'héritage
+        """
+        last = self.taxonomy_history[-1]
+        mappings = last.account_mappings
+        if isinstance(mappings, SharedMappingView) and mappings._history is self.mapping_history:
+            return
+        for account_id, character in mappings.items():
+            self.mapping_history.record(account_id, last.transaction_num, character)
     
     def get_character_mapping(self, account_id: str, transaction_num: int) -> Optional[str]:
         """
@@ -244,6 +354,39 @@ class AccountTaxonomy:
         # Account non trouvé dans historique
         return None
     
+    def _get_snapshot_table(self, snapshot: TaxonomySnapshot) -> array:
+        """Table dense array('I') du snapshot, construite au premier accès (LRU)"""
+        tables = self._snapshot_tables
+        table = tables.get(snapshot.transaction_num)
+        if table is not None:
+            tables.move_to_end(snapshot.transaction_num)
+        else:
+            account_index = self.account_index
+            for account_id in snapshot.account_mappings:
+                if account_id not in account_index:
+                    account_index[account_id] = len(account_index)
+            table = array('I', bytes(4 * len(account_index)))
+            for account_id, character in snapshot.account_mappings.items():
+                if len(character) == 1:
+                    table[account_index[account_id]] = ord(character)
+            tables[snapshot.transaction_num] = table
+            if len(tables) > self.max_snapshot_tables:
+                tables.popitem(last=False)
+                self.stats['snapshot_tables_evicted'] += 1
+        return table
+
+    def _get_transaction_table(self, transaction_num: int) -> Optional[array]:
+        """Table du snapshot applicable (une bisection, mémorisée par transaction)"""
+        history_size = len(self.taxonomy_history)
+        last = self._last_table_lookup
+        if last is not None and last[0] == transaction_num and last[1] == history_size:
+            return last[2]
+
+        snapshot = self.get_taxonomy_snapshot(transaction_num)
+        table = self._get_snapshot_table(snapshot) if snapshot is not None else None
+        self._last_table_lookup = (transaction_num, history_size, table)
+        return table
+
     def convert_path_to_word(self, path: List['Node'], transaction_num: int) -> str:
         """
         Convertit chemin DAG en mot pour évaluation NFA - FONCTION CRITIQUE
@@ -270,7 +413,27 @@ class AccountTaxonomy:
 
         C'est pourquoi l'architecture tri-caractères est NON-NÉGOCIABLE :
         Chaque agent nécessite 3 mappings : principal + _source + _sink
+
+        Chemin rapide: chaque snapshot contient le mapping hérité complet,
+        le mot est un gather sur la table dense du snapshot applicable.
+        Mapping absent de ce snapshot → chemin historique nœud par nœud
+        (recherche arrière et erreur explicite).
         """
+        table = self._get_transaction_table(transaction_num)
+        if table is not None:
+            account_index = self.account_index
+            table_size = len(table)
+            indices = []
+            for node in path:
+                account_id = getattr(node, 'account_id', None) or getattr(node, 'node_id', None)
+                index = account_index.get(account_id, table_size)
+                if index >= table_size or not table[index]:
+                    break
+                indices.append(index)
+            else:
+                self.stats['queries_count'] += 1
+                return ''.join(map(chr, map(table.__getitem__, indices)))
+
         word_chars = []
 
         for node in path:
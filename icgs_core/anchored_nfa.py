@@ -24,14 +24,126 @@ Propriétés:
 - État frozen: NFA figé pendant énumération pour cohérence
 - RegexWeight: extraction coefficients pour construction LP
 - Character-class: Support [ABC] syntax avec states individuels
+
+Snapshot frozen: FrozenNFASnapshot immuable (adjacence CSR indexée par entiers +
+epsilon-closures précalculées), partagé entre freeze() successifs tant que la
+structure (structure_version) n'a pas changé.
 """
 
-from typing import Dict, List, Set, Optional, Any
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Set, Optional, Any, Sequence, Tuple
 from decimal import Decimal
-import copy
 import re
+import time
 from .weighted_nfa import WeightedNFA, NFAState, NFATransition, RegexWeight, TransitionType
-from .nfa_performance_optimizations import PerformanceOptimizedMixin
+from .nfa_performance_optimizations import PerformanceOptimizedMixin, SectorBitsetClassifier
+
+
+@dataclass(frozen=True)
+class FrozenNFASnapshot:
+    """
+    Snapshot immuable NFA figé
+
+    États indexés densément; transitions non-epsilon en CSR:
+    transitions de l'état i = symbol_transitions[offsets[i]:offsets[i+1]], cibles
+    (index) dans targets. epsilon_closures[i] = fermeture epsilon précalculée de i.
+    Les objets NFAState/NFATransition sont partagés (aucune copie): le NFA est
+    non modifiable tant qu'il est frozen et toute modification ultérieure
+    incrémente structure_version, ce qui invalide le snapshot.
+    """
+    version: int
+    state_ids: Tuple[str, ...]
+    state_index: Dict[str, int]
+    offsets: Tuple[int, ...]
+    symbol_transitions: Tuple[NFATransition, ...]
+    targets: Tuple[int, ...]
+    epsilon_closures: Tuple[FrozenSet[int], ...]
+    initial_index: Optional[int]
+    final_indices: FrozenSet[int]
+    final_states: Tuple[NFAState, ...]
+    transitions: Tuple[NFATransition, ...]
+    timestamp: float
+
+    @classmethod
+    def build(cls, nfa: 'AnchoredWeightedNFA') -> 'FrozenNFASnapshot':
+        """Construction O(états + transitions + taille closures epsilon)"""
+        state_ids = tuple(nfa.states.keys())
+        state_index = {state_id: i for i, state_id in enumerate(state_ids)}
+
+        symbol_adjacency: List[List[NFATransition]] = [[] for _ in state_ids]
+        epsilon_adjacency: List[List[int]] = [[] for _ in state_ids]
+        for transition in nfa.transitions:
+            source = state_index.get(transition.from_state)
+            if source is None or transition.to_state not in state_index:
+                continue
+            if transition.transition_type == TransitionType.EPSILON:
+                epsilon_adjacency[source].append(state_index[transition.to_state])
+            else:
+                symbol_adjacency[source].append(transition)
+
+        offsets = [0]
+        symbol_transitions: List[NFATransition] = []
+        for transitions in symbol_adjacency:
+            symbol_transitions.extend(transitions)
+            offsets.append(len(symbol_transitions))
+
+        epsilon_closures = []
+        for i in range(len(state_ids)):
+            if not epsilon_adjacency[i]:
+                epsilon_closures.append(frozenset((i,)))
+                continue
+            closure, stack = {i}, [i]
+            while stack:
+                for target in epsilon_adjacency[stack.pop()]:
+                    if target not in closure:
+                        closure.add(target)
+                        stack.append(target)
+            epsilon_closures.append(frozenset(closure))
+
+        final_states = tuple(nfa.get_final_states())
+        return cls(
+            version=nfa.structure_version,
+            state_ids=state_ids,
+            state_index=state_index,
+            offsets=tuple(offsets),
+            symbol_transitions=tuple(symbol_transitions),
+            targets=tuple(state_index[t.to_state] for t in symbol_transitions),
+            epsilon_closures=tuple(epsilon_closures),
+            initial_index=state_index.get(nfa.initial_state_id),
+            final_indices=frozenset(state_index[state.state_id] for state in final_states
+                                    if state.state_id in state_index),
+            final_states=final_states,
+            transitions=tuple(nfa.transitions),
+            timestamp=time.time()
+        )
+
+    def closure_of(self, indices: Iterable[int]) -> Set[int]:
+        """Union des epsilon-closures précalculées"""
+        result: Set[int] = set()
+        for index in indices:
+            result |= self.epsilon_closures[index]
+        return result
+
+    def step(self, indices: Iterable[int], symbol: str) -> Set[int]:
+        """Transition sur symbole puis epsilon-closure (lookups CSR)"""
+        offsets, transitions, targets = self.offsets, self.symbol_transitions, self.targets
+        next_indices: Set[int] = set()
+        for index in indices:
+            for k in range(offsets[index], offsets[index + 1]):
+                if transitions[k].matches(symbol):
+                    next_indices |= self.epsilon_closures[targets[k]]
+        return next_indices
+
+    def evaluate(self, word: str) -> Set[str]:
+        """États finaux atteints par simulation sur le snapshot"""
+        if self.initial_index is None:
+            return set()
+        current = set(self.epsilon_closures[self.initial_index])
+        for symbol in word:
+            if not current:
+                break
+            current = self.step(current, symbol)
+        return {self.state_ids[i] for i in current & self.final_indices}
 
 
 class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
@@ -53,19 +165,49 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
     def __init__(self, name: str = "AnchoredWeightedNFA"):
         super().__init__(name)
         
-        # État frozen pour cohérence
+        # État frozen pour cohérence (snapshot immuable partagé entre freeze())
         self.is_frozen: bool = False
-        self.frozen_final_states: List[NFAState] = []
-        self.frozen_transitions: List[NFATransition] = []
+        self.frozen_final_states: Sequence[NFAState] = []
+        self.frozen_transitions: Sequence[NFATransition] = []
         self._frozen_snapshot_timestamp: Optional[float] = None
+        self.frozen_snapshot: Optional[FrozenNFASnapshot] = None
+        self._cached_snapshot: Optional[FrozenNFASnapshot] = None
+        self.structure_version: int = 0  # Incrémenté à chaque modification structurelle
+
+        # Classifier bitset NFA complet (None si patterns hors famille sectorielle)
+        self._full_sector_classifier: Optional[SectorBitsetClassifier] = None
+        self._full_sector_signature: Optional[tuple] = None
         
         # Statistiques ancrage et frozen
         self.stats.update({
             'patterns_anchored': 0,
             'freeze_operations': 0,
             'frozen_evaluations': 0,
-            'anchor_transformations': 0
+            'anchor_transformations': 0,
+            'bitset_evaluations': 0,
+            'snapshot_builds': 0,
+            'snapshot_reuses': 0
         })
+
+    def add_state(self, state_id: str, is_final: bool = False,
+                  regex_weights: Optional[List[RegexWeight]] = None,
+                  metadata: Optional[Dict[str, Any]] = None) -> NFAState:
+        state = super().add_state(state_id, is_final, regex_weights, metadata)
+        self.structure_version += 1
+        return state
+
+    def add_transition(self, from_state_id: str, to_state_id: str,
+                       condition: Optional[str] = None,
+                       transition_type: TransitionType = TransitionType.CHARACTER,
+                       regex_weight: Optional[RegexWeight] = None) -> NFATransition:
+        transition = super().add_transition(from_state_id, to_state_id, condition,
+                                            transition_type, regex_weight)
+        self.structure_version += 1
+        return transition
+
+    def set_initial_state(self, state_id: str):
+        super().set_initial_state(state_id)
+        self.structure_version += 1
     
     def add_weighted_regex(self, measure_id: str, regex_pattern: str, 
                           weight: Decimal, regex_id: Optional[str] = None) -> NFAState:
@@ -230,9 +372,11 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
 
         # 5. Enregistrement état final dans NFA
         self.states[final_state.state_id] = final_state
+        self.structure_version += 1
 
         # Invalidation cache pour cohérence
         self._final_states_cache = None
+        self._full_sector_signature = None
 
         # Statistiques
         self.stats['patterns_anchored'] += 1
@@ -315,40 +459,41 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         """
         Fige NFA pour énumération cohérente
 
-        Capture snapshot états finaux et transitions actuels.
+        Capture snapshot immuable (FrozenNFASnapshot) états finaux et transitions.
         Bloque modifications ultérieures.
         Garantit déterminisme évaluation pendant énumération.
 
-        OPTIMIZED: Invalidation caches pour cohérence performance.
+        OPTIMIZED: Snapshot réutilisé tel quel si structure_version inchangée
+        depuis le dernier freeze (O(1)); reconstruction + invalidation caches sinon.
 
         Fonctionnement:
-        1. Capture snapshot immuable états finaux
-        2. Capture snapshot transitions pour cohérence
+        1. Réutilisation ou construction snapshot (CSR + epsilon-closures)
+        2. Exposition frozen_final_states / frozen_transitions (tuples partagés)
         3. Marque NFA comme frozen avec timestamp
         4. Bloque toute modification jusqu'à unfreeze()
-        5. Invalidation caches optimisation
         """
         if self.is_frozen:
             return  # Déjà frozen
 
-        import time
+        snapshot = self._cached_snapshot
+        if snapshot is None or snapshot.version != self.structure_version:
+            snapshot = FrozenNFASnapshot.build(self)
+            self._cached_snapshot = snapshot
+            self.stats['snapshot_builds'] += 1
 
-        # Capture snapshot états finaux (deep copy pour immutabilité)
-        self.frozen_final_states = []
-        for state in self.get_final_states():
-            frozen_state = copy.deepcopy(state)
-            self.frozen_final_states.append(frozen_state)
+            # OPTIMIZED: Invalidation caches pour cohérence (structure modifiée)
+            if hasattr(self, '_invalidate_optimization_caches'):
+                self._invalidate_optimization_caches()
+        else:
+            self.stats['snapshot_reuses'] += 1
 
-        # Capture snapshot transitions pour cohérence complète
-        self.frozen_transitions = copy.deepcopy(self.transitions)
+        self.frozen_snapshot = snapshot
+        self.frozen_final_states = snapshot.final_states
+        self.frozen_transitions = snapshot.transitions
 
         # Marquage frozen avec timestamp
         self.is_frozen = True
-        self._frozen_snapshot_timestamp = time.time()
-
-        # OPTIMIZED: Invalidation caches pour cohérence
-        if hasattr(self, '_invalidate_optimization_caches'):
-            self._invalidate_optimization_caches()
+        self._frozen_snapshot_timestamp = snapshot.timestamp
 
         self.stats['freeze_operations'] += 1
     
@@ -357,17 +502,20 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         Dégèle NFA pour permettre modifications
 
         Restaure capacité de modification après énumération.
-        Invalide snapshots frozen précédents.
+        Le snapshot reste en cache et sera réutilisé si aucune modification
+        structurelle n'intervient avant le prochain freeze().
 
         OPTIMIZED: Invalidation caches optimisation pour cohérence.
         """
         self.is_frozen = False
         self.frozen_final_states = []
         self.frozen_transitions = []
+        self.frozen_snapshot = None
         self._frozen_snapshot_timestamp = None
 
         # Invalidation cache pour cohérence
         self._final_states_cache = None
+        self._full_sector_signature = None
 
         # OPTIMIZED: Invalidation caches optimisation
         if hasattr(self, '_invalidate_optimization_caches'):
@@ -414,6 +562,13 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         Returns:
             Set[str]: États finaux atteints (standard + character-class)
         """
+        # 0. Fast path: NFA entièrement composé de patterns sectoriels .*X.* / .*[ABC].*
+        sector_classifier = self._get_full_sector_classifier()
+        if sector_classifier is not None and word and '\n' not in word:
+            self.stats['evaluations_performed'] += 1
+            self.stats['bitset_evaluations'] += 1
+            return set(sector_classifier.classify(word))
+
         # 1. Évaluation WeightedNFA standard (peut être vide si pas d'état initial)
         try:
             standard_results = super().evaluate_word(word)
@@ -429,6 +584,42 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
 
         return unified_results
 
+    def _get_full_sector_classifier(self) -> Optional[SectorBitsetClassifier]:
+        """
+        Classifier bitset couvrant tout le NFA, ou None si évaluation générale requise
+
+        Couverture complète si:
+        - toutes transitions sont REGEX_MATCH depuis l'état initial avec pattern sectoriel
+        - tous compiled_patterns (character-class) sont sectoriels
+        Reconstruit quand la structure (états/transitions) change.
+        """
+        signature = (len(self.states), len(self.transitions), self.initial_state_id)
+        if signature == self._full_sector_signature:
+            return self._full_sector_classifier
+
+        classifier = SectorBitsetClassifier()
+        covered = bool(self.states)
+
+        for transition in self.transitions:
+            if (transition.transition_type != TransitionType.REGEX_MATCH or
+                    transition.from_state != self.initial_state_id or
+                    not classifier.register(transition.to_state, transition.condition)):
+                covered = False
+                break
+
+        if covered:
+            for state in self.states.values():
+                for pattern_info in getattr(state, 'compiled_patterns', None) or []:
+                    if not classifier.register(state.state_id, pattern_info.get('pattern')):
+                        covered = False
+                        break
+                if not covered:
+                    break
+
+        self._full_sector_classifier = classifier if covered and len(classifier) > 0 else None
+        self._full_sector_signature = signature
+        return self._full_sector_classifier
+
     def _evaluate_character_class_patterns_direct(self, word: str) -> Set[str]:
         """
         Évaluation directe patterns character-class avec optimisations performance
@@ -609,6 +800,8 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
             'frozen_final_states_count': len(self.frozen_final_states),
             'frozen_transitions_count': len(self.frozen_transitions),
             'frozen_timestamp': self._frozen_snapshot_timestamp,
+            'snapshot_version': self.frozen_snapshot.version if self.frozen_snapshot else None,
+            'snapshot_reuses': self.stats.get('snapshot_reuses', 0),
             'freeze_operations_total': self.stats.get('freeze_operations', 0),
             'frozen_evaluations_performed': self.stats.get('frozen_evaluations', 0)
         }
@@ -656,8 +849,8 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         """
         Évaluation avec snapshot frozen pour cohérence
         
-        Utilise frozen_transitions et frozen_final_states
-        pour évaluation cohérente pendant énumération.
+        Utilise l'adjacence CSR et les epsilon-closures précalculées du
+        FrozenNFASnapshot: lookups O(1) par état actif et par symbole.
         
         Args:
             word: Mot à évaluer
@@ -665,39 +858,16 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         Returns:
             Set des états finaux atteints avec snapshot frozen
         """
-        if not self.is_frozen or self.initial_state_id is None:
+        if not self.is_frozen or self.frozen_snapshot is None:
             return set()
         
-        # Configuration courante avec états frozen
-        current_states = self._epsilon_closure_frozen({self.initial_state_id})
-        
-        # Traitement de chaque symbole avec transitions frozen
-        for symbol in word:
-            next_states = set()
-            
-            for state_id in current_states:
-                frozen_transitions = [
-                    t for t in self.frozen_transitions 
-                    if t.from_state == state_id
-                ]
-                
-                for transition in frozen_transitions:
-                    if transition.matches(symbol):
-                        next_states.add(transition.to_state)
-            
-            current_states = self._epsilon_closure_frozen(next_states)
-        
-        # États finaux frozen dans configuration finale
-        frozen_final_ids = {state.state_id for state in self.frozen_final_states}
-        final_state_ids = current_states & frozen_final_ids
-        
-        return final_state_ids
+        return self.frozen_snapshot.evaluate(word)
     
     def _epsilon_closure_frozen(self, states: Set[str]) -> Set[str]:
         """
-        Epsilon-closure utilisant transitions frozen pour cohérence
+        Epsilon-closure utilisant snapshot frozen pour cohérence
         
-        Similaire à méthode parent mais utilise snapshot frozen.
+        Union des closures précalculées (pas de parcours).
         
         Args:
             states: États de départ
@@ -705,26 +875,21 @@ class AnchoredWeightedNFA(PerformanceOptimizedMixin, WeightedNFA):
         Returns:
             Epsilon-closure avec transitions frozen
         """
-        closure = set(states)
-        stack = list(states)
-        
-        while stack:
-            current = stack.pop()
-            
-            # Transitions epsilon depuis frozen_transitions
-            epsilon_transitions = [
-                t for t in self.frozen_transitions
-                if (t.from_state == current and 
-                    t.transition_type == TransitionType.EPSILON)
-            ]
-            
-            for transition in epsilon_transitions:
-                if transition.to_state not in closure:
-                    closure.add(transition.to_state)
-                    stack.append(transition.to_state)
+        snapshot = self.frozen_snapshot
+        if snapshot is None:
+            return set(states)
         
+        known = [snapshot.state_index[state_id] for state_id in states if state_id in snapshot.state_index]
+        closure = {snapshot.state_ids[i] for i in snapshot.closure_of(known)}
+        closure.update(state_id for state_id in states if state_id not in snapshot.state_index)
         return closure
     
+    def _epsilon_closure(self, states: Set[str]) -> Set[str]:
+        """Epsilon-closure: closures précalculées du snapshot si NFA frozen"""
+        if self.is_frozen and self.frozen_snapshot is not None:
+            return self._epsilon_closure_frozen(states)
+        return super()._epsilon_closure(states)
+    
     def __repr__(self) -> str:
         """Représentation string avec info frozen state"""
         frozen_info = " [FROZEN]" if self.is_frozen else ""
@@ -7,7 +7,7 @@ API compatible mais architecture SharedNFA rigoureuse
 import re
 import copy
 import time
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 from decimal import Decimal
 
 try:
@@ -42,7 +42,9 @@ class AnchoredWeightedNFA(WeightedNFA):
             'patterns_anchored': 0,
             'freeze_operations': 0,
             'frozen_evaluations': 0,
-            'anchor_transformations': 0
+            'anchor_transformations': 0,
+            'batch_classifications': 0,
+            'batch_words_classified': 0
         })
 
     def add_weighted_regex(self, measure_id: str, regex_pattern: str,
@@ -148,6 +150,15 @@ class AnchoredWeightedNFA(WeightedNFA):
         self.shared_nfa.unfreeze()
         self.frozen_final_states = []
 
+    def enable_lazy_dfa(self, max_states: int = 4096) -> None:
+        """
+        Active DFA paresseux pour classification après freeze()
+
+        Args:
+            max_states: Plafond états DFA avant éviction / fallback NFA
+        """
+        self.shared_nfa.enable_lazy_dfa(max_states)
+
     def evaluate_to_final_state(self, word: str) -> Optional[str]:
         """
         Évaluation mot vers état final
@@ -168,6 +179,46 @@ class AnchoredWeightedNFA(WeightedNFA):
         except Exception:
             return None
 
+    def evaluate_words_batch(self, words: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Évaluation batch mots dédupliqués (freeze automatique)
+
+        Returns:
+            Dict mot → ID état final ou None
+        """
+        if not self.shared_nfa.is_frozen:
+            self.shared_nfa.freeze()
+
+        unique_words = set(words)
+        self.stats['frozen_evaluations'] += len(unique_words)
+        return self.shared_nfa.evaluate_words_batch(unique_words)
+
+    def classify_words_batch(self, words: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Classification duale batch: NFA principal puis target NFA (metadata)
+
+        Les mots rejetés par le NFA principal sont évalués en un seul appel
+        sur le target NFA, comme le fallback mot à mot de la classification.
+
+        Returns:
+            Dict mot → ID état final (principal prioritaire) ou None
+        """
+        results = self.evaluate_words_batch(words)
+
+        target_nfa = self.metadata.get('target_nfa') if isinstance(self.metadata, dict) else None
+        rejected = [word for word, final_state_id in results.items() if not final_state_id]
+
+        if target_nfa is not None and rejected:
+            if hasattr(target_nfa, 'evaluate_words_batch'):
+                target_results = target_nfa.evaluate_words_batch(rejected)
+            else:
+                target_results = {word: target_nfa.evaluate_to_final_state(word) for word in rejected}
+            results.update(target_results)
+
+        self.stats['batch_classifications'] += 1
+        self.stats['batch_words_classified'] += len(results)
+        return results
+
     def get_state_weights_for_measure(self, measure_id: str) -> Dict[str, Decimal]:
         """
         Récupère poids par état pour mesure donnée
@@ -205,6 +256,36 @@ class AnchoredWeightedNFA(WeightedNFA):
 
         return classifications
 
+    def project_final_state_count(self, measures: Iterable[Tuple[str, str]]) -> int:
+        """
+        Nombre d'états finaux après ajout hypothétique de mesures, sans copie NFA
+
+        Un état final par measure_id (entry point), pattern identique ⇒ fragment
+        Thompson partagé. Seules les nouvelles mesures sont examinées: ancrage +
+        parsing des patterns absents du registre (aucun état construit).
+
+        Args:
+            measures: Couples (measure_id, regex_pattern) à ajouter
+
+        Returns:
+            Nombre d'états finaux que produiraient les add_weighted_regex
+
+        Raises:
+            ValueError: Pattern invalide (ancrage ou parsing Thompson)
+        """
+        entry_points = self.shared_nfa.entry_points
+        pattern_registry = self.shared_nfa.pattern_registry
+        new_measure_ids = set()
+
+        for measure_id, regex_pattern in measures:
+            anchored_pattern = self._apply_automatic_anchoring(regex_pattern)
+            if anchored_pattern not in pattern_registry:
+                self.shared_nfa.thompson_builder.regex_parser.parse(anchored_pattern)
+            if measure_id not in entry_points:
+                new_measure_ids.add(measure_id)
+
+        return len(entry_points) + len(new_measure_ids)
+
     def _is_properly_anchored(self, pattern: str) -> bool:
         """Vérifie si pattern correctement ancré"""
         return pattern.endswith('$')
@@ -22,7 +22,6 @@ from decimal import Decimal
 from dataclasses import dataclass, field
 import time
 import logging
-import copy
 
 # Imports ICGS modules
 from .account_taxonomy import AccountTaxonomy
@@ -31,6 +30,8 @@ try:
 except ImportError:
     from anchored_nfa_v2 import AnchoredWeightedNFA
 from .path_enumerator import DAGPathEnumerator, EnumerationStatistics
+from .path_count_engine import PathCountDPEngine
+from .reachability_index import ReachabilityIndex
 from .simplex_solver import TripleValidationOrientedSimplex, SimplexSolution, SolutionStatus
 from .linear_programming import (
     LinearProgram, FluxVariable, LinearConstraint, ConstraintType,
@@ -135,12 +136,55 @@ class DAGConfiguration:
     enable_warm_start: bool = True
     enable_cross_validation: bool = True
     validation_mode: str = "STRICT"  # STRICT, MODERATE, LENIENT
+    path_classification_engine: str = "ENUMERATION"  # ENUMERATION, DP_COUNT
+    dp_max_witness_paths: int = 3
+    enable_lazy_dfa: bool = True
+    lazy_dfa_max_states: int = 4096
     
     def __post_init__(self):
         if not isinstance(self.simplex_tolerance, Decimal):
             self.simplex_tolerance = Decimal(str(self.simplex_tolerance))
 
 
+@dataclass
+class BatchTransactionResult:
+    """Résultat validation d'une transaction au sein de add_transactions_batch"""
+    transaction_id: str
+    accepted: bool
+    rejection_reason: Optional[str] = None  # NFA_EXPLOSION, SIMPLEX_INFEASIBLE, ERROR
+    validation_time_ms: float = 0.0
+    nfa_reused: bool = False
+    warm_start: bool = False
+
+
+@dataclass
+class TransactionBatchResult:
+    """Résultats par transaction (ordre d'entrée) et timings agrégés d'un batch"""
+    results: List[BatchTransactionResult] = field(default_factory=list)
+    total_time_ms: float = 0.0
+    distinct_nfa_signatures: int = 0
+
+    @property
+    def accepted_count(self) -> int:
+        return sum(1 for result in self.results if result.accepted)
+
+    @property
+    def rejected_count(self) -> int:
+        return len(self.results) - self.accepted_count
+
+    @property
+    def nfa_reuses(self) -> int:
+        return sum(1 for result in self.results if result.nfa_reused)
+
+    @property
+    def warm_starts(self) -> int:
+        return sum(1 for result in self.results if result.warm_start)
+
+    @property
+    def transactions_per_second(self) -> float:
+        return len(self.results) / (self.total_time_ms / 1000) if self.total_time_ms > 0 else 0.0
+
+
 class DAG:
     """
     DAG Principal avec Pipeline de Validation Économique Complet
@@ -181,6 +225,16 @@ class DAG:
             self.account_taxonomy, 
             max_paths=self.configuration.max_path_enumeration
         )
+        # Index ancêtres/descendants incrémental partagé avec l'énumérateur (pruning)
+        self.reachability_index = ReachabilityIndex()
+        self.path_enumerator.reachability_index = self.reachability_index
+        # Version structurelle DAG: clé cache chemins énumérateur (invalidation précise)
+        self.structure_version = 0
+        self.path_enumerator._path_cache.advance_versions(self.structure_version, self.nfa_taxonomy_version)
+        self.path_count_engine = PathCountDPEngine(
+            self.path_enumerator,
+            max_witnesses_per_class=self.configuration.dp_max_witness_paths
+        )
         self.simplex_solver = TripleValidationOrientedSimplex(
             max_iterations=self.configuration.simplex_max_iterations,
             tolerance=self.configuration.simplex_tolerance
@@ -216,8 +270,18 @@ class DAG:
             'avg_enumeration_time_ms': 0.0,
             'avg_simplex_solve_time_ms': 0.0,
             'max_paths_enumerated': 0,
+            'dp_path_counts_used': 0,
+            'temporary_nfa_reuses': 0,
+            'batches_processed': 0,
             'total_validation_time_ms': 0.0
         }
+
+        # Cache NFA temporaires frozen par signature patterns (actif pendant add_transactions_batch)
+        self._temporary_nfa_cache: Optional[Dict[Tuple, Tuple[AnchoredWeightedNFA, List[str]]]] = None
+
+        # Niveaux logger capturés une fois par transaction (hot-path sans formatage)
+        self.trace_debug = False
+        self.trace_info = False
         
         self.logger.info(f"DAG initialized with ICGS Phase 2 pipeline - config: {self.configuration}")
     
@@ -266,6 +330,8 @@ class DAG:
             self.edges[internal_edge_id] = internal_edge
             account.source_node.add_outgoing_edge(internal_edge)
             account.sink_node.add_incoming_edge(internal_edge)
+            self.reachability_index.add_edge(internal_edge)
+            self._advance_structure_version(internal_edge)
 
             # Ajout compte
             self.accounts[account.account_id] = account
@@ -277,16 +343,46 @@ class DAG:
             self.logger.error(f"Failed to add account {account.account_id}: {e}")
             return False
 
-    def _configure_account_taxonomy_immediate(self, account: Account, taxonomic_chars: Dict[str, str]):
+    def add_accounts_batch(self, accounts: List[Tuple[Account, Dict[str, str]]]) -> int:
         """
-        Configure la taxonomie immédiatement pour un compte avec caractères explicites
+        Ajoute plusieurs comptes avec une configuration taxonomique unique
+
+        Tous les mappings (_source, _sink) du lot sont enregistrés dans un seul
+        snapshot taxonomique au lieu d'un snapshot par compte.
 
         Args:
-            account: Compte à configurer
-            taxonomic_chars: Mapping des caractères {'source': 'X', 'sink': 'Y'}
+            accounts: Liste (account, taxonomic_chars {'source': 'X', 'sink': 'Y'})
+
+        Returns:
+            Nombre de comptes ajoutés
 
         Raises:
-            ValueError: Si format taxonomic_chars invalide ou caractères en collision
+            ValueError: Si un taxonomic_chars est invalide (aucun compte ajouté)
+        """
+        new_accounts = []
+        account_mappings = {}
+        for account, taxonomic_chars in accounts:
+            if account.account_id in self.accounts or f"{account.account_id}_source" in account_mappings:
+                self.logger.warning(f"Account {account.account_id} already exists")
+                continue
+            account_mappings.update(self._build_account_taxonomy_mappings(account, taxonomic_chars))
+            new_accounts.append(account)
+
+        if account_mappings:
+            try:
+                self.account_taxonomy.update_taxonomy(account_mappings, self.transaction_counter)
+                self.transaction_counter += 1
+            except Exception as e:
+                raise ValueError(f"Échec configuration taxonomie batch ({len(new_accounts)} comptes): {e}")
+
+        return sum(1 for account in new_accounts if self.add_account(account))
+
+    def _build_account_taxonomy_mappings(self, account: Account, taxonomic_chars: Dict[str, str]) -> Dict[str, str]:
+        """
+        Mappings taxonomiques (_source, _sink) d'un compte depuis taxonomic_chars
+
+        Raises:
+            ValueError: Si format taxonomic_chars invalide
         """
         # Validation format
         required_keys = {'source', 'sink'}
@@ -295,15 +391,26 @@ class DAG:
 
         # SUPPRESSION CONTRAINTE UNICITÉ: Caractères dupliqués autorisés pour agents illimités
         # Validation supprimée - caractères peuvent être partagés par secteur économique
-        chars_list = list(taxonomic_chars.values())
         # Aucune validation unicité nécessaire - DAG-NFA-Simplex fonctionne avec caractères partagés
-
-        # Configuration taxonomique avec transaction_num incrémental
-        account_mappings = {
+        return {
             f"{account.account_id}_source": taxonomic_chars['source'],
             f"{account.account_id}_sink": taxonomic_chars['sink']
         }
 
+    def _configure_account_taxonomy_immediate(self, account: Account, taxonomic_chars: Dict[str, str]):
+        """
+        Configure la taxonomie immédiatement pour un compte avec caractères explicites
+
+        Args:
+            account: Compte à configurer
+            taxonomic_chars: Mapping des caractères {'source': 'X', 'sink': 'Y'}
+
+        Raises:
+            ValueError: Si format taxonomic_chars invalide ou caractères en collision
+        """
+        # Configuration taxonomique avec transaction_num incrémental
+        account_mappings = self._build_account_taxonomy_mappings(account, taxonomic_chars)
+
         try:
             # Utiliser transaction_counter incrémental pour éviter collisions "strictly increasing"
             self.account_taxonomy.update_taxonomy(account_mappings, self.transaction_counter)
@@ -327,7 +434,74 @@ class DAG:
         Returns:
             True si transaction validée et commitée, False si rejetée
         """
-        self.logger.info(f"Processing transaction {transaction.transaction_id}: {transaction.source_account_id} → {transaction.target_account_id}, amount={transaction.amount}")
+        self.trace_debug = self.logger.isEnabledFor(logging.DEBUG)
+        self.trace_info = self.logger.isEnabledFor(logging.INFO)
+        return self._process_transaction(transaction) is None
+
+    def add_transactions_batch(self, transactions: List[Transaction]) -> TransactionBatchResult:
+        """
+        Validation batch ordonnée avec sémantique séquentielle
+
+        Chaque transaction passe par le même pipeline que add_transaction
+        (NFA explosion → Simplex → commit) et voit les commits des précédentes.
+        Travail partagé sur le batch:
+        - Un NFA temporaire frozen par signature de patterns (DFA paresseux inclus)
+        - Index reachability et cache chemins mis à jour par commit (incrémental)
+        - Pivot/base Simplex de la transaction précédente en warm-start
+
+        Args:
+            transactions: Transactions dans l'ordre de validation
+
+        Returns:
+            TransactionBatchResult: résultat par transaction + timings agrégés
+        """
+        self.trace_debug = self.logger.isEnabledFor(logging.DEBUG)
+        self.trace_info = self.logger.isEnabledFor(logging.INFO)
+
+        batch = TransactionBatchResult()
+        batch_start = time.time()
+        self._temporary_nfa_cache = {}
+        try:
+            for transaction in transactions:
+                self._prepare_batch_transaction(transaction)
+                reuses_before = self.stats['temporary_nfa_reuses']
+                warm_starts_before = self.stats['warm_starts_used']
+                start_time = time.time()
+
+                rejection_reason = self._process_transaction(transaction)
+
+                batch.results.append(BatchTransactionResult(
+                    transaction_id=transaction.transaction_id,
+                    accepted=rejection_reason is None,
+                    rejection_reason=rejection_reason,
+                    validation_time_ms=(time.time() - start_time) * 1000,
+                    nfa_reused=self.stats['temporary_nfa_reuses'] > reuses_before,
+                    warm_start=self.stats['warm_starts_used'] > warm_starts_before
+                ))
+            batch.distinct_nfa_signatures = len(self._temporary_nfa_cache)
+        finally:
+            self._temporary_nfa_cache = None
+
+        batch.total_time_ms = (time.time() - batch_start) * 1000
+        self.stats['batches_processed'] += 1
+        if self.trace_info:
+            self.logger.info(f"Transaction batch processed: {batch.accepted_count}/{len(batch.results)} accepted, "
+                             f"{batch.distinct_nfa_signatures} NFA signatures, {batch.total_time_ms:.2f}ms")
+        return batch
+
+    def _prepare_batch_transaction(self, transaction: Transaction) -> None:
+        """Préparation état DAG avant chaque transaction d'un batch (aucune en DAG de base)"""
+
+    def _process_transaction(self, transaction: Transaction) -> Optional[str]:
+        """
+        Exécution pipeline 3 phases pour une transaction
+
+        Returns:
+            None si transaction commitée, sinon raison du rejet
+            (NFA_EXPLOSION, SIMPLEX_INFEASIBLE, ERROR)
+        """
+        if self.trace_info:
+            self.logger.info(f"Processing transaction {transaction.transaction_id}: {transaction.source_account_id} → {transaction.target_account_id}, amount={transaction.amount}")
         
         start_time = time.time()
         
@@ -340,14 +514,14 @@ class DAG:
                 self.stats['nfa_explosions_detected'] += 1
                 self.stats['transactions_rejected'] += 1
                 self.logger.warning(f"Transaction {transaction.transaction_id} rejected - NFA explosion risk")
-                return False
+                return "NFA_EXPLOSION"
             
             # Phase 2: Validation Simplex économique (NOUVEAU selon blueprint)
             if not self._validate_transaction_simplex(transaction):
                 self.stats['simplex_infeasible'] += 1
                 self.stats['transactions_rejected'] += 1
                 self.logger.warning(f"Transaction {transaction.transaction_id} rejected - Simplex infeasible")
-                return False
+                return "SIMPLEX_INFEASIBLE"
             
             # Phase 3: Commit atomique transaction
             self._commit_transaction_atomic(transaction)
@@ -361,13 +535,14 @@ class DAG:
             total_time = (time.time() - start_time) * 1000
             self.stats['total_validation_time_ms'] += total_time
             
-            self.logger.info(f"Transaction {transaction.transaction_id} validated and committed successfully in {total_time:.2f}ms")
-            return True
+            if self.trace_info:
+                self.logger.info(f"Transaction {transaction.transaction_id} validated and committed successfully in {total_time:.2f}ms")
+            return None
             
         except Exception as e:
             self.logger.error(f"Transaction {transaction.transaction_id} processing error: {e}")
             self.stats['transactions_rejected'] += 1
-            return False
+            return "ERROR"
     
     def _validate_transaction_nfa_explosion(self, transaction: Transaction) -> bool:
         """
@@ -375,32 +550,22 @@ class DAG:
         
         Vérifie que l'ajout de nouvelles mesures NFA ne causera pas
         d'explosion combinatoire selon seuil configuration.
+
+        Comptage analytique des états finaux après ajout hypothétique
+        (project_final_state_count): O(nouvelles mesures), aucune copie du NFA
+        permanent dont la taille croît à chaque commit.
         """
         if not self.anchored_nfa:
             return True  # Pas de NFA = pas de risque explosion
         
-        # Simulation ajout mesures temporaire pour test explosion
-        temp_nfa = copy.deepcopy(self.anchored_nfa)
-        
         try:
-            # Ajout mesures source temporaires
-            for measure in transaction.source_measures:
-                temp_nfa.add_weighted_regex(
-                    measure.measure_id,
-                    measure.primary_regex_pattern,
-                    measure.primary_regex_weight
-                )
-            
-            # Ajout mesures cible temporaires  
-            for measure in transaction.target_measures:
-                temp_nfa.add_weighted_regex(
-                    measure.measure_id,
-                    measure.primary_regex_pattern,
-                    measure.primary_regex_weight
-                )
+            new_measures = [
+                (measure.measure_id, measure.primary_regex_pattern)
+                for measure in transaction.source_measures + transaction.target_measures
+            ]
             
-            # Test explosion via comptage états
-            final_states_count = len(temp_nfa.get_final_states())
+            # Test explosion via comptage états projeté
+            final_states_count = self.anchored_nfa.project_final_state_count(new_measures)
             if final_states_count > self.configuration.nfa_explosion_threshold:
                 self.logger.warning(f"NFA explosion detected: {final_states_count} > {self.configuration.nfa_explosion_threshold}")
                 return False
@@ -436,26 +601,14 @@ class DAG:
             new_accounts = self._extract_accounts_from_transaction(transaction)
             # Taxonomie déjà mise à jour dans _extract_accounts_from_transaction
             
-            # Étape 2: Création NFA temporaire avec état frozen
-            temp_nfa = self._create_temporary_nfa_for_transaction(transaction)
-            temp_nfa.freeze()
-
-            # HYBRID DUAL-NFA: Freeze target NFA si disponible
-            if hasattr(temp_nfa, 'metadata') and isinstance(temp_nfa.metadata, dict):
-                target_nfa = temp_nfa.metadata.get('target_nfa')
-                if target_nfa:
-                    target_nfa.freeze()
-                    self.logger.debug(f"Target NFA frozen with {len(target_nfa.get_final_states())} final states")
-
-            self.logger.debug(f"Temporary NFA created and frozen with {len(temp_nfa.get_final_states())} final states")
+            # Étape 2: NFA temporaire frozen (partagé par signature patterns en batch)
+            temp_nfa, measure_aliases = self._get_frozen_temporary_nfa(transaction)
             
             # Étape 3: Énumération et classification chemins
             transaction_edge = self._create_temporary_transaction_edge(transaction)
             
             try:
-                path_classes = self.path_enumerator.enumerate_and_classify(
-                    transaction_edge, temp_nfa, self.transaction_counter
-                )
+                path_classes = self._classify_transaction_paths(transaction_edge, temp_nfa)
                 
                 # PHASE 2.9: Vérification résultat path enumeration avec taxonomie explicite
                 if not path_classes:
@@ -473,11 +626,14 @@ class DAG:
                 (self.stats['transactions_added'] + 1)
             )
             
-            self.logger.debug(f"Path enumeration completed: {len(path_classes)} equivalence classes, {sum(len(paths) for paths in path_classes.values())} total paths")
+            if self.trace_debug:
+                self.logger.debug(f"Path enumeration completed: {len(path_classes)} equivalence classes, {sum(len(paths) for paths in path_classes.values())} total paths")
             
             # Étape 4: Construction problème LP
-            lp_problem = self._build_lp_from_path_classes(path_classes, transaction, temp_nfa)
-            self.logger.debug(f"LP problem constructed: {len(lp_problem.variables)} variables, {len(lp_problem.constraints)} constraints")
+            lp_problem = self._build_lp_from_path_classes(path_classes, transaction, temp_nfa,
+                                                          measure_aliases)
+            if self.trace_debug:
+                self.logger.debug(f"LP problem constructed: {len(lp_problem.variables)} variables, {len(lp_problem.constraints)} constraints")
             
             # Étape 5: Résolution avec garanties absolues
             solution = self.simplex_solver.solve_with_absolute_guarantees(
@@ -504,18 +660,21 @@ class DAG:
                     self.stats['cross_validations_performed'] += 1
 
                 # NOUVEAU: Capture métriques validation réelles pour visualisations SVG
-                self.logger.info(f"📊 Attempting to capture validation metrics for transaction {self.transaction_counter}")
+                if self.trace_info:
+                    self.logger.info(f"📊 Attempting to capture validation metrics for transaction {self.transaction_counter}")
 
                 # Utilisation import paresseux pour éviter circular imports
                 collector, collector_available = _get_validation_collector_lazy()
 
                 if collector_available and collector is not None:
                     try:
-                        self.logger.info("📊 ValidationDataCollector successfully imported and instantiated")
+                        if self.trace_info:
+                            self.logger.info("📊 ValidationDataCollector successfully imported and instantiated")
 
                         nfa_states_count = len(temp_nfa.get_final_states()) if hasattr(temp_nfa, 'get_final_states') else 0
 
-                        self.logger.info(f"📊 Capturing metrics: tx_num={self.transaction_counter}, vertices={len(path_classes) if path_classes else 0}, constraints={len(lp_problem.constraints) if lp_problem.constraints else 0}")
+                        if self.trace_info:
+                            self.logger.info(f"📊 Capturing metrics: tx_num={self.transaction_counter}, vertices={len(path_classes) if path_classes else 0}, constraints={len(lp_problem.constraints) if lp_problem.constraints else 0}")
 
                         metrics = collector.capture_simplex_metrics(
                             transaction_num=self.transaction_counter,
@@ -528,8 +687,9 @@ class DAG:
                             nfa_final_states_count=nfa_states_count
                         )
 
-                        self.logger.info(f"✅ Validation metrics captured successfully for transaction {self.transaction_counter}")
-                        self.logger.info(f"✅ Metrics: vertices={metrics.vertices_count}, constraints={metrics.constraints_count}, steps={metrics.algorithm_steps}")
+                        if self.trace_info:
+                            self.logger.info(f"✅ Validation metrics captured successfully for transaction {self.transaction_counter}")
+                            self.logger.info(f"✅ Metrics: vertices={metrics.vertices_count}, constraints={metrics.constraints_count}, steps={metrics.algorithm_steps}")
 
                     except Exception as collector_error:
                         # Non-critique : ne pas faire échouer validation si collecteur a problème
@@ -539,7 +699,8 @@ class DAG:
                 else:
                     self.logger.warning(f"⚠️ ValidationDataCollector not available with lazy import")
 
-                self.logger.info(f"Simplex validation successful: {solution.status.value}, iterations={solution.iterations_used}, warm_start={solution.warm_start_successful}")
+                if self.trace_info:
+                    self.logger.info(f"Simplex validation successful: {solution.status.value}, iterations={solution.iterations_used}, warm_start={solution.warm_start_successful}")
                 return True
             else:
                 self.logger.warning(f"Simplex validation failed: {solution.status.value}")
@@ -549,6 +710,35 @@ class DAG:
             self.logger.error(f"Simplex validation error: {e}")
             return False
     
+    def _classify_transaction_paths(self, transaction_edge: Edge,
+                                    temp_nfa: AnchoredWeightedNFA) -> Dict[str, List[List[Node]]]:
+        """
+        Classes d'équivalence chemins selon moteur configuré
+
+        ENUMERATION: énumération explicite chemins (DAGPathEnumerator)
+        DP_COUNT: comptage DP DAG × NFA, classes = chemins témoins bornés
+        """
+        if self.configuration.path_classification_engine == "DP_COUNT":
+            count_result = self.path_count_engine.count_and_classify(
+                transaction_edge, temp_nfa, self.transaction_counter
+            )
+            self.stats['dp_path_counts_used'] += 1
+            self.stats['max_paths_enumerated'] = max(
+                self.stats['max_paths_enumerated'], count_result.total_paths
+            )
+            if self.trace_debug:
+                self.logger.debug(f"DP path count: {count_result.path_counts} ({count_result.engine})")
+            return count_result.to_path_classes()
+
+        path_classes = self.path_enumerator.enumerate_and_classify(
+            transaction_edge, temp_nfa, self.transaction_counter
+        )
+        self.stats['max_paths_enumerated'] = max(
+            self.stats['max_paths_enumerated'],
+            sum(len(paths) for paths in path_classes.values())
+        )
+        return path_classes
+
     def _extract_accounts_from_transaction(self, transaction: Transaction) -> Dict[str, Optional[str]]:
         """
         Extraction et création des comptes nécessaires pour une transaction
@@ -672,6 +862,66 @@ class DAG:
 
         return False
 
+    def _get_frozen_temporary_nfa(self, transaction: Transaction) -> Tuple[AnchoredWeightedNFA, Dict[str, str]]:
+        """
+        NFA temporaire frozen (NFA target en metadata) pour une transaction
+
+        Hors batch: NFA neuf à chaque transaction. Pendant add_transactions_batch,
+        un NFA par signature de patterns (_temporary_nfa_signature): une
+        transaction de même signature le réutilise, ses measure_id étant aliasés
+        vers ceux de la transaction qui l'a construit. Les états Thompson ne
+        dépendent que des patterns, donc classes et LP sont identiques.
+
+        Returns:
+            (NFA frozen, alias measure_id transaction → measure_id enregistré dans le NFA)
+        """
+        cache = self._temporary_nfa_cache
+        signature = None
+        if cache is not None:
+            signature = self._temporary_nfa_signature(transaction)
+            cached = cache.get(signature)
+            if cached is not None:
+                temp_nfa, nfa_measure_ids = cached
+                self.stats['temporary_nfa_reuses'] += 1
+                transaction_measure_ids = [measure.measure_id for measure in
+                                           transaction.source_measures + transaction.target_measures]
+                return temp_nfa, dict(zip(transaction_measure_ids, nfa_measure_ids))
+
+        temp_nfa = self._create_temporary_nfa_for_transaction(transaction)
+        temp_nfa.freeze()
+
+        # HYBRID DUAL-NFA: Freeze target NFA si disponible
+        if hasattr(temp_nfa, 'metadata') and isinstance(temp_nfa.metadata, dict):
+            target_nfa = temp_nfa.metadata.get('target_nfa')
+            if target_nfa:
+                target_nfa.freeze()
+                if self.trace_debug:
+                    self.logger.debug(f"Target NFA frozen with {len(target_nfa.get_final_states())} final states")
+
+        if self.trace_debug:
+            self.logger.debug(f"Temporary NFA created and frozen with {len(temp_nfa.get_final_states())} final states")
+
+        if cache is not None:
+            cache[signature] = (temp_nfa, [measure.measure_id for measure in
+                                           transaction.source_measures + transaction.target_measures])
+        return temp_nfa, {}
+
+    def _temporary_nfa_signature(self, transaction: Transaction) -> Tuple:
+        """
+        Clé NFA temporaire: patterns/poids ordonnés des mesures source et target
+
+        Les measure_id sont exclus (aliasés), seuls patterns et poids
+        déterminent états, transitions et poids par état.
+        """
+        def measures_signature(measures: List[TransactionMeasure]) -> Tuple:
+            return tuple(
+                (measure.primary_regex_pattern, measure.primary_regex_weight,
+                 tuple(measure.secondary_patterns))
+                for measure in measures
+            )
+        return (measures_signature(transaction.source_measures),
+                measures_signature(transaction.target_measures))
+
     def _create_temporary_nfa_for_transaction(self, transaction: Transaction) -> AnchoredWeightedNFA:
         """
         Création NFA temporaire avec mesures transaction
@@ -692,6 +942,11 @@ class DAG:
         # NFA PROPRE pour patterns target (évite conflicts avec existing patterns)
         temp_nfa_target = AnchoredWeightedNFA(f"clean_target_tx_{self.transaction_counter}")
 
+        # Classification par DFA paresseux une fois les NFAs frozen
+        if self.configuration.enable_lazy_dfa:
+            temp_nfa.enable_lazy_dfa(self.configuration.lazy_dfa_max_states)
+            temp_nfa_target.enable_lazy_dfa(self.configuration.lazy_dfa_max_states)
+
         # CORRECTION: Support patterns target ET fallback si vide
         has_target_measures = len(transaction.target_measures) > 0
 
@@ -783,7 +1038,8 @@ class DAG:
     
     def _build_lp_from_path_classes(self, path_classes: Dict[str, List[List[Node]]], 
                                    transaction: Transaction, 
-                                   nfa: AnchoredWeightedNFA) -> LinearProgram:
+                                   nfa: AnchoredWeightedNFA,
+                                   measure_aliases: Optional[Dict[str, str]] = None) -> LinearProgram:
         """
         Construction automatique problème LP depuis classifications chemins selon blueprint
         
@@ -797,10 +1053,12 @@ class DAG:
             path_classes: Classes équivalence chemin par état final NFA
             transaction: Transaction avec mesures économiques
             nfa: NFA temporaire pour extraction coefficients
+            measure_aliases: measure_id transaction → measure_id du NFA (NFA partagé en batch)
             
         Returns:
             LinearProgram: Problème LP complet pour résolution Simplex
         """
+        measure_aliases = measure_aliases or {}
         # Étape 1: Variables flux par classe équivalence (avec fallback)
         program = LinearProgram(f"transaction_{self.transaction_counter}_{transaction.transaction_id}")
         
@@ -849,7 +1107,8 @@ class DAG:
         # Étape 2: Contraintes source (compte débiteur)
         source_measure = transaction.get_primary_source_measure()
         if source_measure:
-            state_weights = nfa.get_state_weights_for_measure(source_measure.measure_id)
+            nfa_measure_id = measure_aliases.get(source_measure.measure_id, source_measure.measure_id)
+            state_weights = nfa.get_state_weights_for_measure(nfa_measure_id)
             
             # Contrainte primaire source: Σ(f_i × weight_i) ≤ V_source_acceptable
             if state_weights:
@@ -863,7 +1122,7 @@ class DAG:
             
             # Contraintes secondaires source: Σ(f_i × weight_i) ≤ 0
             for pattern, weight in source_measure.secondary_patterns:
-                secondary_state_weights = nfa.get_state_weights_for_measure(f"{source_measure.measure_id}_secondary")
+                secondary_state_weights = nfa.get_state_weights_for_measure(f"{nfa_measure_id}_secondary")
                 if secondary_state_weights:
                     secondary_constraint = build_secondary_constraint(
                         secondary_state_weights,
@@ -875,7 +1134,8 @@ class DAG:
         # Étape 3: Contraintes cible (compte créditeur)
         target_measure = transaction.get_primary_target_measure()
         if target_measure:
-            state_weights = nfa.get_state_weights_for_measure(target_measure.measure_id)
+            nfa_measure_id = measure_aliases.get(target_measure.measure_id, target_measure.measure_id)
+            state_weights = nfa.get_state_weights_for_measure(nfa_measure_id)
             
             # Contrainte primaire cible: Σ(f_i × weight_i) ≥ V_target_required
             if state_weights:
@@ -889,7 +1149,7 @@ class DAG:
             
             # Contraintes secondaires cible
             for pattern, weight in target_measure.secondary_patterns:
-                secondary_state_weights = nfa.get_state_weights_for_measure(f"{target_measure.measure_id}_secondary")
+                secondary_state_weights = nfa.get_state_weights_for_measure(f"{nfa_measure_id}_secondary")
                 if secondary_state_weights:
                     secondary_constraint = build_secondary_constraint(
                         secondary_state_weights,
@@ -912,14 +1172,16 @@ class DAG:
         Finalise transaction validée en créant structures DAG permanentes
         et mise à jour balances comptes.
         """
-        self.logger.debug(f"COMMIT DEBUG: Starting commit for transaction {transaction.transaction_id}")
+        if self.trace_debug:
+            self.logger.debug(f"COMMIT DEBUG: Starting commit for transaction {transaction.transaction_id}")
         # Récupération comptes source/target
         source_account = self._get_or_create_account(transaction.source_account_id)
         target_account = self._get_or_create_account(transaction.target_account_id)
         
         # Création arête transaction permanente
         edge_id = f"transaction_{transaction.transaction_id}"
-        self.logger.debug(f"COMMIT DEBUG: Creating transaction edge {edge_id}")
+        if self.trace_debug:
+            self.logger.debug(f"COMMIT DEBUG: Creating transaction edge {edge_id}")
 
         transaction_edge = Edge(
             edge_id=edge_id,
@@ -938,23 +1200,29 @@ class DAG:
         )
         
         # Ajout edge au DAG (éviter doublons complets)
+        added_edge = None
         edge_exists_in_dag = transaction_edge.edge_id in self.edges
         edge_exists_in_source = transaction_edge.edge_id in source_account.source_node.outgoing_edges
         edge_exists_in_target = transaction_edge.edge_id in target_account.sink_node.incoming_edges
 
         if edge_exists_in_dag or edge_exists_in_source or edge_exists_in_target:
-            self.logger.debug(f"Transaction edge {transaction_edge.edge_id} already exists (DAG:{edge_exists_in_dag}, Source:{edge_exists_in_source}, Target:{edge_exists_in_target}), skipping creation")
+            if self.trace_debug:
+                self.logger.debug(f"Transaction edge {transaction_edge.edge_id} already exists (DAG:{edge_exists_in_dag}, Source:{edge_exists_in_source}, Target:{edge_exists_in_target}), skipping creation")
         else:
             # Connection défensive avec gestion complète erreurs
             try:
                 self.edges[transaction_edge.edge_id] = transaction_edge
                 connect_nodes(source_account.source_node, target_account.sink_node, transaction_edge)
-                self.logger.debug(f"Transaction edge {transaction_edge.edge_id} created successfully")
+                self.reachability_index.add_edge(transaction_edge)
+                added_edge = transaction_edge
+                if self.trace_debug:
+                    self.logger.debug(f"Transaction edge {transaction_edge.edge_id} created successfully")
             except ValueError as e:
                 # Edge déjà existe dans les nœuds - nettoyer edge du DAG et skip silencieusement
                 if transaction_edge.edge_id in self.edges:
                     del self.edges[transaction_edge.edge_id]
-                self.logger.debug(f"Transaction edge {transaction_edge.edge_id} connection failed (edge already exists), skipping: {e}")
+                if self.trace_debug:
+                    self.logger.debug(f"Transaction edge {transaction_edge.edge_id} connection failed (edge already exists), skipping: {e}")
         
         # Mise à jour balances comptes
         source_account.add_outgoing_transaction(transaction_edge, transaction.amount)
@@ -974,9 +1242,38 @@ class DAG:
 
         # OPTIMISATION: Mise à jour version taxonomie pour éviter deepcopy inutile
         self.nfa_taxonomy_version = len(self.account_taxonomy.taxonomy_history)
+        self._advance_structure_version(added_edge)
 
-        self.logger.debug(f"Transaction {transaction.transaction_id} committed atomically (NFA version: {self.nfa_taxonomy_version})")
+        if self.trace_debug:
+            self.logger.debug(f"Transaction {transaction.transaction_id} committed atomically (NFA version: {self.nfa_taxonomy_version})")
     
+    def _advance_structure_version(self, added_edge: Optional[Edge] = None) -> None:
+        """
+        Nouvelle version structurelle DAG/NFA après modification
+
+        Les chemins cachés par l'énumérateur restent valides sauf si leur
+        arbre contient une extrémité de l'arête ajoutée (seul cas où le
+        parcours reverse verrait la nouvelle arête).
+        """
+        self.structure_version += 1
+        touched = ()
+        if added_edge is not None:
+            touched = (added_edge.source_node.node_id, added_edge.target_node.node_id)
+        self.path_enumerator._path_cache.advance_versions(
+            self.structure_version, self.nfa_taxonomy_version, touched
+        )
+    
+    def get_state_version(self) -> Tuple[int, int, int, int]:
+        """
+        Version état DAG/NFA/taxonomie pour caches de validation par contenu
+
+        Change à chaque commit (structure_version, transaction_counter), création
+        de compte et snapshot taxonomie: deux validations d'un même contenu à
+        version égale donnent le même résultat.
+        """
+        return (self.structure_version, self.transaction_counter,
+                len(self.accounts), len(self.account_taxonomy.taxonomy_history))
+
     def _get_or_create_account(self, account_id: str) -> Account:
         """
         Récupère compte existant ou crée nouveau compte
@@ -1038,6 +1335,31 @@ class DAG:
                 self.add_account(new_account)
                 self.logger.debug(f"Created account '{account_id}' with pre-configured taxonomy")
     
+    def get_feeding_accounts(self, account_id: str) -> Set[str]:
+        """
+        Comptes dont le nœud source alimente le sink de account_id
+
+        Lecture directe masque ancêtres de l'index reachability (pas de traversal DAG).
+        """
+        if account_id not in self.accounts:
+            return set()
+
+        sink_node_id = self.accounts[account_id].sink_node.node_id
+        return {
+            node_id[:-len('_source')]
+            for node_id in self.reachability_index.ancestors_of(sink_node_id)
+            if node_id.endswith('_source') and node_id[:-len('_source')] in self.accounts
+        }
+
+    def can_account_feed(self, source_account_id: str, target_account_id: str) -> bool:
+        """Test O(1): flux possible de source_account_id vers sink de target_account_id"""
+        if source_account_id not in self.accounts or target_account_id not in self.accounts:
+            return False
+        return self.reachability_index.can_feed(
+            self.accounts[source_account_id].source_node.node_id,
+            self.accounts[target_account_id].sink_node.node_id
+        )
+
     def validate_dag_integrity(self) -> DAGValidationResult:
         """
         Validation intégrité DAG complète
@@ -1091,6 +1413,7 @@ class DAG:
             'simplex_stats': simplex_stats,
             'taxonomy_stats': taxonomy_stats,
             'nfa_stats': nfa_stats,
+            'reachability_stats': self.reachability_index.get_statistics(),
             'configuration': {
                 'max_path_enumeration': self.configuration.max_path_enumeration,
                 'simplex_tolerance': str(self.configuration.simplex_tolerance),
@@ -1116,6 +1439,8 @@ class DAG:
                 self.stats['warm_starts_used'] / max(1, self.stats['warm_starts_used'] + self.stats['cold_starts_used']), 4
             ),
             'pivot_stored': self.stored_pivot is not None,
+            'basis_stored': self.simplex_solver.stored_basis is not None,
+            'warm_start_pivots_saved': self.simplex_solver.stats['warm_start_pivots_saved'],
             'transactions_processed': total_transactions,
             'nfa_explosion_incidents': self.stats['nfa_explosions_detected'],
             'system_status': 'OPERATIONAL' if success_rate > 0.95 else 'DEGRADED' if success_rate > 0.8 else 'CRITICAL'
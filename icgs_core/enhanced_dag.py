@@ -17,12 +17,12 @@ OBJECTIFS:
 - Faciliter adoption et onboarding équipe
 """
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Mapping, Set, Optional, Any
 import logging
 from decimal import Decimal
 
 # Imports système core (inchangés)
-from .dag import DAG, DAGConfiguration, Transaction, TransactionMeasure
+from .dag import DAG, DAGConfiguration, Transaction, TransactionMeasure, TransactionBatchResult
 from .transaction_manager import TransactionManager
 from .dag_structures import Node
 from .account_taxonomy import AccountTaxonomy
@@ -171,6 +171,42 @@ class EnhancedDAG(DAG):
             logger.error(f"Failed to process transaction auto: {e}")
             raise
 
+    def add_transactions_batch_auto(self, transactions: List[Transaction]) -> TransactionBatchResult:
+        """
+        Validation batch ordonnée avec gestion automatique versioning
+
+        Équivalent à add_transaction_auto appelé sur chaque transaction, via
+        DAG.add_transactions_batch (NFA temporaires partagés, warm-start).
+
+        Args:
+            transactions: Transactions dans l'ordre de validation
+
+        Returns:
+            TransactionBatchResult: résultat par transaction + timings agrégés
+
+        Raises:
+            ValueError: Si taxonomie pas configurée
+        """
+        self._using_enhanced_api = True
+        self._enhanced_api_calls += 1
+        self._migration_stats['transactions_auto'] += len(transactions)
+
+        self._validate_historical_integrity()
+
+        if self.transaction_manager.get_current_transaction_num() == -1:
+            raise ValueError(
+                "Must configure accounts with configure_accounts_simple() before adding transactions. "
+                "Use: enhanced_dag.configure_accounts_simple({'account_id': 'character'})"
+            )
+
+        result = self.add_transactions_batch(transactions)
+        logger.info(f"Transaction batch processed via simplified API: {len(transactions)} transactions")
+        return result
+
+    def _prepare_batch_transaction(self, transaction: Transaction) -> None:
+        """Synchronisation compteurs/extension taxonomie avant chaque transaction du batch"""
+        self._synchronize_transaction_counters()
+
     def get_current_account_mapping(self, account_id: str) -> Optional[str]:
         """
         Récupération mapping actuel sans spécifier transaction_num
@@ -289,7 +325,7 @@ class EnhancedDAG(DAG):
         try:
             # Validation structure snapshot
             assert isinstance(snapshot.transaction_num, int)
-            assert isinstance(snapshot.account_mappings, dict)
+            assert isinstance(snapshot.account_mappings, Mapping)
             assert isinstance(snapshot.timestamp, float)
 
             # Validation cohérence mappings
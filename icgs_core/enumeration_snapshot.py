@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Snapshot DAG picklable - énumération multi-source en processus workers
+
+Le DAG figé (composante connexe des sources et de l'arête transaction)
+est aplati en tables d'identifiants et d'index d'arêtes: pas de graphe
+d'objets Node/Edge récursif à sérialiser. Le snapshot est envoyé une fois
+par worker (initializer ProcessPoolExecutor); chaque tâche ne transporte
+qu'un node_id source et renvoie des chemins sous forme de tuples node_id,
+réhydratés côté parent avec les Node d'origine.
+"""
+
+import pickle
+from collections import deque
+from decimal import Decimal
+from typing import Dict, List, Tuple, Any, Iterable, Optional, FrozenSet
+
+from .dag_structures import Node, Edge, EdgeType
+
+
+class DAGSnapshot:
+    """
+    Composante DAG aplatie: nœuds (id, metadata), arêtes (id, source, target,
+    poids, type, contexte) et ordre exact des dictionnaires incoming/outgoing
+    de chaque nœud (parcours DFS identique au DAG d'origine).
+    """
+
+    def __init__(self, node_ids: List[str], node_metadata: List[Dict[str, Any]],
+                 edge_records: List[Tuple[str, int, int, Decimal, EdgeType, Dict[str, Any]]],
+                 incoming: List[List[int]], outgoing: List[List[int]],
+                 unreachable_ids: Optional[FrozenSet[str]] = None):
+        self.node_ids = node_ids
+        self.node_metadata = node_metadata
+        self.edge_records = edge_records
+        self.incoming = incoming
+        self.outgoing = outgoing
+        # Réponses can_reach_source figées du ReachabilityIndex parent (None = pas d'index)
+        self.unreachable_ids = unreachable_ids
+
+    @classmethod
+    def capture(cls, roots: Iterable[Node],
+                reachability_index: Optional[Any] = None) -> Tuple['DAGSnapshot', Dict[str, Node]]:
+        """
+        Capture composante connexe (incoming + outgoing) des racines
+
+        Returns:
+            (snapshot, nœuds live par node_id pour réhydratation des chemins)
+        """
+        live_nodes: Dict[str, Node] = {}
+        queue = deque()
+        for root in roots:
+            if root is not None and root.node_id not in live_nodes:
+                live_nodes[root.node_id] = root
+                queue.append(root)
+
+        while queue:
+            node = queue.popleft()
+            for edge in list(node.incoming_edges.values()) + list(node.outgoing_edges.values()):
+                for neighbour in (edge.source_node, edge.target_node):
+                    if neighbour is not None and neighbour.node_id not in live_nodes:
+                        live_nodes[neighbour.node_id] = neighbour
+                        queue.append(neighbour)
+
+        node_position = {node_id: index for index, node_id in enumerate(live_nodes)}
+        edge_position: Dict[str, int] = {}
+        edge_records = []
+
+        def edge_index(edge: Edge) -> int:
+            index = edge_position.get(edge.edge_id)
+            if index is None:
+                index = len(edge_records)
+                edge_position[edge.edge_id] = index
+                edge_records.append((
+                    edge.edge_id,
+                    node_position[edge.source_node.node_id],
+                    node_position[edge.target_node.node_id],
+                    edge.weight,
+                    edge.edge_metadata.edge_type,
+                    edge.edge_metadata.context
+                ))
+            return index
+
+        incoming, outgoing = [], []
+        for node in live_nodes.values():
+            incoming.append([edge_index(edge) for edge in node.incoming_edges.values()])
+            outgoing.append([edge_index(edge) for edge in node.outgoing_edges.values()])
+
+        unreachable_ids = None
+        if reachability_index is not None:
+            unreachable_ids = frozenset(
+                node_id for node_id, node in live_nodes.items()
+                if not reachability_index.can_reach_source(node)
+            )
+
+        snapshot = cls(list(live_nodes), [dict(node.metadata) for node in live_nodes.values()],
+                       edge_records, incoming, outgoing, unreachable_ids)
+        return snapshot, live_nodes
+
+    def restore(self) -> Dict[str, Node]:
+        """Reconstruit Node/Edge (ordre incoming/outgoing préservé)"""
+        nodes = [Node(node_id, metadata) for node_id, metadata in zip(self.node_ids, self.node_metadata)]
+        edges = [
+            Edge(edge_id, nodes[source], nodes[target], weight, edge_type, context)
+            for edge_id, source, target, weight, edge_type, context in self.edge_records
+        ]
+        for node, incoming, outgoing in zip(nodes, self.incoming, self.outgoing):
+            node.incoming_edges = {edges[index].edge_id: edges[index] for index in incoming}
+            node.outgoing_edges = {edges[index].edge_id: edges[index] for index in outgoing}
+        return {node.node_id: node for node in nodes}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+
+class SnapshotReachability:
+    """can_reach_source figé (mêmes réponses que l'index du processus parent)"""
+
+    def __init__(self, unreachable_ids: FrozenSet[str]):
+        self.unreachable_ids = unreachable_ids
+
+    def can_reach_source(self, node: Node) -> bool:
+        return node.node_id not in self.unreachable_ids
+
+
+# État worker: énumérateur et DAG restaurés une fois par processus
+_worker_state: Dict[str, Any] = {}
+
+
+def init_enumeration_worker(payload: bytes) -> None:
+    """Initializer ProcessPoolExecutor: restaure snapshot, NFA et énumérateur"""
+    from .path_enumerator import DAGPathEnumerator
+
+    spec = pickle.loads(payload)
+    snapshot: DAGSnapshot = spec['snapshot']
+    nodes = snapshot.restore()
+
+    enumerator = DAGPathEnumerator(spec['taxonomy'], spec['max_paths'], spec['batch_size'])
+    enumerator.dfs_engine = spec['dfs_engine']
+    if snapshot.unreachable_ids is not None:
+        enumerator.reachability_index = SnapshotReachability(snapshot.unreachable_ids)
+
+    edge_id, source_id, target_id, weight, edge_type, context = spec['target_edge']
+    source_node = nodes.get(source_id) or Node(source_id)
+    target_edge = Edge(edge_id, source_node, nodes[target_id], weight, edge_type, context)
+
+    _worker_state.update(nodes=nodes, enumerator=enumerator, target_edge=target_edge,
+                         nfa=spec['nfa'], transaction_num=spec['transaction_num'])
+
+
+def enumerate_source_in_worker(source_id: str) -> Dict[str, Any]:
+    """Tâche worker: _enumerate_single_source, chemins renvoyés en tuples node_id"""
+    enumerator = _worker_state['enumerator']
+    result = enumerator._enumerate_single_source(
+        _worker_state['nodes'][source_id], _worker_state['target_edge'],
+        _worker_state['nfa'], _worker_state['transaction_num']
+    )
+    result['classification_result'] = {
+        state: [tuple(node.node_id for node in path) for path in paths]
+        for state, paths in result['classification_result'].items()
+    }
+    return result
+
+
+def rehydrate_source_result(result: Dict[str, Any], live_nodes: Dict[str, Node]) -> Dict[str, Any]:
+    """Chemins tuples node_id → List[Node] du DAG parent"""
+    result['classification_result'] = {
+        state: [[live_nodes[node_id] for node_id in path] for path in paths]
+        for state, paths in result['classification_result'].items()
+    }
+    return result
@@ -40,4 +40,9 @@ class TaxonomyMappingError(ICGSException):
 class DAGValidationError(ICGSException):
     """Exception pour erreurs validation DAG"""
     def __init__(self, message: str, error_code: str = "DAG_VALIDATION_ERROR"):
-        super().__init__(message, error_code)
\ No newline at end of file
+        super().__init__(message, error_code)
+
+class SingularBasisError(ICGSException):
+    """Exception pour base Simplex singulière lors factorisation LU"""
+    def __init__(self, message: str, error_code: str = "SINGULAR_BASIS"):
+        super().__init__(message, error_code)
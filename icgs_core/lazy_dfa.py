@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+LazySubsetDFA ICGS - DFA compilé à la demande sur NFA frozen
+
+Construction des sous-ensembles paresseuse: un état DFA = frozenset d'états
+NFA epsilon-clos, créé au premier passage. Les transitions calculées sont
+mises en cache (dict caractère → état DFA), une classification de mot
+devient une recherche dict par caractère.
+
+Garde-fous:
+- Plafond max_states: cache vidé (éviction complète) puis reconstruit
+- Après max_cache_resets vidages: DFA abandonné, simulation NFA directe
+"""
+
+from typing import Callable, Dict, FrozenSet, List, Optional, Any
+
+
+# Identifiant état puits (aucun état NFA actif)
+DEAD_STATE = -1
+
+
+class LazySubsetDFA:
+    """
+    DFA paresseux par construction des sous-ensembles
+
+    Le NFA est fourni via trois primitives sur ensembles d'états
+    (SharedNFA.initial_state_set / step_state_set / resolve_final_state),
+    valides tant que le NFA reste frozen. Chaque état DFA final est annoté
+    avec l'ensemble des IDs d'états finaux NFA qu'il contient.
+    """
+
+    def __init__(self, initial_states: FrozenSet[str],
+                 step: Callable[[FrozenSet[str], str], FrozenSet[str]],
+                 resolve: Callable[[FrozenSet[str]], Optional[str]],
+                 final_state_ids: FrozenSet[str],
+                 max_states: int = 4096, max_cache_resets: int = 3):
+        if max_states < 1:
+            raise ValueError(f"max_states must be positive, got {max_states}")
+
+        self.initial_states = frozenset(initial_states)
+        self.final_state_ids = frozenset(final_state_ids)
+        self.max_states = max_states
+        self.max_cache_resets = max_cache_resets
+        self._step = step
+        self._resolve = resolve
+
+        # Abandon DFA après explosion répétée du nombre d'états
+        self.blown_up = False
+
+        self.stats = {
+            'evaluations': 0,
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'states_created': 0,
+            'cache_resets': 0,
+            'nfa_fallbacks': 0
+        }
+
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """Vide table états/transitions (éviction complète)"""
+        self._state_index: Dict[FrozenSet[str], int] = {}
+        self._subsets: List[FrozenSet[str]] = []
+        self._transitions: List[Dict[str, int]] = []
+        self._final_annotations: List[FrozenSet[str]] = []
+        self._accepting: List[Optional[str]] = []
+        self.start_state = self._intern(self.initial_states) if self.initial_states else DEAD_STATE
+
+    def _intern(self, subset: FrozenSet[str]) -> int:
+        """Retourne état DFA du sous-ensemble, créé si nouveau"""
+        dfa_state = self._state_index.get(subset)
+        if dfa_state is not None:
+            return dfa_state
+
+        dfa_state = len(self._subsets)
+        self._state_index[subset] = dfa_state
+        self._subsets.append(subset)
+        self._transitions.append({})
+
+        final_reached = subset & self.final_state_ids
+        self._final_annotations.append(final_reached)
+        self._accepting.append(self._resolve(subset) if final_reached else None)
+
+        self.stats['states_created'] += 1
+        return dfa_state
+
+    def _compute_transition(self, dfa_state: int, char: str) -> Optional[int]:
+        """
+        Calcule transition manquante via NFA et la met en cache
+
+        Returns:
+            État DFA cible (DEAD_STATE si rejet), None si le DFA vient
+            d'être abandonné (trop de vidages)
+        """
+        self.stats['cache_misses'] += 1
+        next_subset = self._step(self._subsets[dfa_state], char)
+
+        if not next_subset:
+            self._transitions[dfa_state][char] = DEAD_STATE
+            return DEAD_STATE
+
+        if next_subset not in self._state_index and len(self._subsets) >= self.max_states:
+            if self.stats['cache_resets'] >= self.max_cache_resets:
+                self.blown_up = True
+                return None
+
+            # Éviction: les IDs DFA sont invalidés, la transition n'est pas mise en cache
+            self.stats['cache_resets'] += 1
+            self._reset_cache()
+            return self._intern(next_subset)
+
+        target = self._intern(next_subset)
+        self._transitions[dfa_state][char] = target
+        return target
+
+    def _run(self, word: str) -> Optional[int]:
+        """État DFA atteint en fin de mot, None si DFA abandonné en cours de route"""
+        state = self.start_state
+        for char in word:
+            if state == DEAD_STATE:
+                return DEAD_STATE
+
+            next_state = self._transitions[state].get(char)
+            if next_state is None:
+                next_state = self._compute_transition(state, char)
+                if next_state is None:
+                    return None
+            else:
+                self.stats['cache_hits'] += 1
+            state = next_state
+
+        return state
+
+    def _simulate(self, word: str) -> FrozenSet[str]:
+        """Simulation NFA directe (fallback après explosion)"""
+        self.stats['nfa_fallbacks'] += 1
+        current_states = self.initial_states
+        for char in word:
+            if not current_states:
+                break
+            current_states = self._step(current_states, char)
+        return current_states
+
+    def evaluate(self, word: str) -> Optional[str]:
+        """
+        État final NFA atteint par le mot (sémantique resolve_final_state)
+
+        Returns:
+            ID état final ou None si rejet
+        """
+        self.stats['evaluations'] += 1
+
+        if not self.blown_up:
+            state = self._run(word)
+            if state is not None:
+                return None if state == DEAD_STATE else self._accepting[state]
+
+        current_states = self._simulate(word)
+        return self._resolve(current_states) if current_states & self.final_state_ids else None
+
+    def evaluate_final_states(self, word: str) -> FrozenSet[str]:
+        """Ensemble complet des états finaux NFA atteints par le mot"""
+        self.stats['evaluations'] += 1
+
+        if not self.blown_up:
+            state = self._run(word)
+            if state is not None:
+                return frozenset() if state == DEAD_STATE else self._final_annotations[state]
+
+        return self._simulate(word) & self.final_state_ids
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques cache DFA pour monitoring"""
+        lookups = self.stats['cache_hits'] + self.stats['cache_misses']
+        return {
+            **self.stats,
+            'dfa_states': len(self._subsets),
+            'cached_transitions': sum(len(row) for row in self._transitions),
+            'hit_rate': self.stats['cache_hits'] / lookups if lookups else 0.0,
+            'max_states': self.max_states,
+            'blown_up': self.blown_up
+        }
@@ -8,6 +8,7 @@ Composants principaux:
 - FluxVariable: Variables de flux avec bounds et état Simplex
 - LinearConstraint: Contraintes linéaires avec types LEQ/GEQ/EQ
 - LinearProgram: Problème LP complet avec matrice et validation
+- CompiledConstraintMatrix: Matrice contraintes CSR compilée, index variables stable
 - Constructeurs: build_source/target/secondary_constraint pour économie
 
 Propriétés mathématiques:
@@ -15,6 +16,8 @@ Propriétés mathématiques:
 - Validation stricte cohérence problèmes LP
 - Support bounds inférieurs/supérieurs variables
 - Extraction matrice standard form pour solveurs
+- Représentation compilée CSR (float64 + ombre Decimal exacte) pour
+  opérations vectorisées A @ x, violations et slacks
 
 Architecture:
 - Conçu pour TripleValidationOrientedSimplex
@@ -23,10 +26,18 @@ Architecture:
 """
 
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import Decimal, MAX_PREC, localcontext
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+from array import array
+from itertools import count
 import copy
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy optionnel: noyaux array('d') en Python pur
+    np = None
 
 
 class ConstraintType(Enum):
@@ -92,6 +103,57 @@ class FluxVariable:
             self.value = min(self.value, self.upper_bound)
 
 
+# Révisions globalement uniques: toute mutation d'une contrainte en prend une nouvelle
+_CONSTRAINT_REVISIONS = count()
+
+
+class _TrackedCoefficients(dict):
+    """Coefficients d'une contrainte: chaque mutation change la révision (invalide les caches LP)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.revision = next(_CONSTRAINT_REVISIONS)
+
+    def _touch(self):
+        self.revision = next(_CONSTRAINT_REVISIONS)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._touch()
+        return result
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def setdefault(self, key, default=None):
+        result = super().setdefault(key, default)
+        self._touch()
+        return result
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self._touch()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self._touch()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._touch()
+
+
 @dataclass  
 class LinearConstraint:
     """
@@ -117,6 +179,18 @@ class LinearConstraint:
         if self.name is None:
             self.name = f"constraint_{id(self)}"
     
+    def __setattr__(self, name, value):
+        # Toute affectation (bound, type, coefficients...) invalide les représentations compilées
+        if name == 'coefficients' and not isinstance(value, _TrackedCoefficients):
+            value = _TrackedCoefficients(value)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_revision', next(_CONSTRAINT_REVISIONS))
+    
+    @property
+    def revision(self) -> Tuple[int, int]:
+        """Révision du contenu: change à chaque affectation d'attribut ou mutation des coefficients"""
+        return self._revision, getattr(self.coefficients, 'revision', -1)
+    
     def evaluate(self, variables: Dict[str, Decimal]) -> Decimal:
         """
         Évalue LHS contrainte avec valeurs variables données
@@ -183,6 +257,213 @@ class LinearConstraint:
             return abs(self.bound - lhs_value)  # écart absolu
 
 
+class CompiledConstraintMatrix:
+    """
+    Matrice contraintes compilée au format CSR (une ligne par contrainte)
+
+    - variable_order / variable_index: index colonnes stable (ordre trié)
+    - indptr, indices: structure CSR (array('q'))
+    - data: coefficients float64 (array('d')) pour noyaux vectorisés
+    - exact_data: ombre Decimal exacte des coefficients
+    - exact_bounds / bounds, constraint_types, tolerances, names par ligne
+
+    Les entrées d'une ligne suivent l'ordre des coefficients de la contrainte:
+    les évaluations exactes reproduisent LinearConstraint.evaluate à l'identique.
+    Le produit flottant sert de filtre; les lignes trop proches de leur borne
+    pour être tranchées en float sont réévaluées sur l'ombre Decimal.
+    """
+
+    # Garde relative filtre flottant (erreur arrondi << garde jusqu'à ~10^6 termes/ligne)
+    FLOAT_SCREEN_GUARD = 1e-9
+
+    def __init__(self, constraints: Sequence[LinearConstraint], variable_ids: Sequence[str]):
+        self.variable_order: List[str] = sorted(variable_ids)
+        self.variable_index: Dict[str, int] = {var_id: j for j, var_id in enumerate(self.variable_order)}
+
+        self.indptr = array('q', [0])
+        self.indices = array('q')
+        self.data = array('d')
+        self.exact_data: List[Decimal] = []
+        self.exact_bounds: List[Decimal] = []
+        self.constraint_types: List[ConstraintType] = []
+        self.tolerances: List[Decimal] = []
+        self.names: List[str] = []
+
+        variable_index = self.variable_index
+        for constraint in constraints:
+            for var_id, coeff in constraint.coefficients.items():
+                self.indices.append(variable_index[var_id])
+                self.data.append(float(coeff))
+                self.exact_data.append(coeff)
+            self.indptr.append(len(self.indices))
+            self.exact_bounds.append(constraint.bound)
+            self.constraint_types.append(constraint.constraint_type)
+            self.tolerances.append(constraint.tolerance)
+            self.names.append(constraint.name)
+
+        self.bounds = array('d', map(float, self.exact_bounds))
+        self.float_tolerances = array('d', map(float, self.tolerances))
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.exact_bounds)
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.variable_order)
+
+    def to_dense(self) -> List[List[Decimal]]:
+        """Matrice dense exacte [m×n] (get_constraint_matrix)"""
+        rows = []
+        for i in range(self.num_rows):
+            row = [Decimal('0')] * self.num_columns
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                row[self.indices[k]] = self.exact_data[k]
+            rows.append(row)
+        return rows
+
+    def row_entries(self, row: int) -> List[Tuple[str, Decimal]]:
+        """Coefficients exacts (variable_id, coeff) de la ligne, ordre contrainte"""
+        order = self.variable_order
+        return [(order[self.indices[k]], self.exact_data[k])
+                for k in range(self.indptr[row], self.indptr[row + 1])]
+
+    def to_vector(self, values: Dict[str, Decimal]) -> array:
+        """Vecteur float64 x dans l'ordre colonnes (variable absente = 0)"""
+        return array('d', [float(values.get(var_id, 0)) for var_id in self.variable_order])
+
+    def multiply(self, x: Sequence[float]) -> array:
+        """Produit flottant A @ x (x ordonné selon variable_order)"""
+        return self._float_rows(x)[0]
+
+    def exact_multiply(self, values: Dict[str, Decimal]) -> List[Decimal]:
+        """Produit exact A @ x en Decimal (identique à LinearConstraint.evaluate)"""
+        zero = Decimal('0')
+        column_values = [values.get(var_id) for var_id in self.variable_order]
+        indptr, indices, exact_data = self.indptr, self.indices, self.exact_data
+        lhs = []
+        for i in range(self.num_rows):
+            total = zero
+            for k in range(indptr[i], indptr[i + 1]):
+                value = column_values[indices[k]]
+                if value is not None:
+                    total += exact_data[k] * value
+            lhs.append(total)
+        return lhs
+
+    def violation_vector(self, values: Dict[str, Decimal]) -> List[Decimal]:
+        """Violations exactes par ligne (> 0 = violée), cf. LinearConstraint.get_violation"""
+        zero = Decimal('0')
+        violations = []
+        for lhs, bound, constraint_type in zip(self.exact_multiply(values), self.exact_bounds,
+                                               self.constraint_types):
+            if constraint_type == ConstraintType.LEQ:
+                violations.append(max(zero, lhs - bound))
+            elif constraint_type == ConstraintType.GEQ:
+                violations.append(max(zero, bound - lhs))
+            else:
+                violations.append(abs(lhs - bound))
+        return violations
+
+    def slack_vector(self, values: Dict[str, Decimal]) -> List[Decimal]:
+        """Slacks exacts par ligne, cf. LinearConstraint.get_slack"""
+        slacks = []
+        for lhs, bound, constraint_type in zip(self.exact_multiply(values), self.exact_bounds,
+                                               self.constraint_types):
+            if constraint_type == ConstraintType.LEQ:
+                slacks.append(bound - lhs)
+            elif constraint_type == ConstraintType.GEQ:
+                slacks.append(lhs - bound)
+            else:
+                slacks.append(abs(bound - lhs))
+        return slacks
+
+    def satisfied_mask(self, values: Dict[str, Decimal]) -> List[bool]:
+        """Satisfaction par ligne avec tolérance, cf. LinearConstraint.is_satisfied"""
+        lhs_values, magnitudes = self._float_rows(self.to_vector(values))
+        mask = []
+        for i in range(self.num_rows):
+            decided = self._screen_row(i, lhs_values[i], magnitudes[i])
+            mask.append(decided if decided is not None else self._exact_row_satisfied(i, values))
+        return mask
+
+    def all_satisfied(self, values: Dict[str, Decimal]) -> bool:
+        """True si toutes les lignes sont satisfaites (arrêt à la première violation)"""
+        lhs_values, magnitudes = self._float_rows(self.to_vector(values))
+        for i in range(self.num_rows):
+            decided = self._screen_row(i, lhs_values[i], magnitudes[i])
+            if decided is None:
+                decided = self._exact_row_satisfied(i, values)
+            if not decided:
+                return False
+        return True
+
+    def _float_rows(self, x: Sequence[float]) -> Tuple[Sequence[float], Sequence[float]]:
+        """(A @ x, |A| @ |x|) en float64; NumPy si disponible"""
+        if not self.num_rows:
+            return array('d'), array('d')
+        if np is not None:
+            terms = np.frombuffer(self.data, dtype=np.float64) * np.asarray(x, dtype=np.float64)[
+                np.frombuffer(self.indices, dtype=np.int64)]
+            starts = np.frombuffer(self.indptr, dtype=np.int64)[:-1]
+            return np.add.reduceat(terms, starts), np.add.reduceat(np.abs(terms), starts)
+
+        indptr, indices, data = self.indptr, self.indices, self.data
+        lhs_values = array('d')
+        magnitudes = array('d')
+        for i in range(self.num_rows):
+            total = 0.0
+            magnitude = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                term = data[k] * x[indices[k]]
+                total += term
+                magnitude += abs(term)
+            lhs_values.append(total)
+            magnitudes.append(magnitude)
+        return lhs_values, magnitudes
+
+    def _screen_row(self, row: int, lhs: float, magnitude: float) -> Optional[bool]:
+        """Décision flottante de satisfaction, None si la ligne est trop proche de sa borne"""
+        bound = self.bounds[row]
+        tolerance = self.float_tolerances[row]
+        constraint_type = self.constraint_types[row]
+        if constraint_type == ConstraintType.LEQ:
+            margin = bound + tolerance - lhs
+        elif constraint_type == ConstraintType.GEQ:
+            margin = lhs - bound + tolerance
+        else:
+            margin = tolerance - abs(lhs - bound)
+        if abs(margin) <= self.FLOAT_SCREEN_GUARD * (magnitude + abs(bound) + tolerance):
+            return None
+        return margin > 0
+
+    def _exact_row_satisfied(self, row: int, values: Dict[str, Decimal]) -> bool:
+        """Satisfaction exacte d'une ligne sur l'ombre Decimal"""
+        lhs = Decimal('0')
+        for var_id, coeff in self.row_entries(row):
+            if var_id in values:
+                lhs += coeff * values[var_id]
+        bound = self.exact_bounds[row]
+        tolerance = self.tolerances[row]
+        constraint_type = self.constraint_types[row]
+        if constraint_type == ConstraintType.LEQ:
+            return lhs <= bound + tolerance
+        elif constraint_type == ConstraintType.GEQ:
+            return lhs >= bound - tolerance
+        return abs(lhs - bound) <= tolerance
+
+
+def _canonical_decimal(value: Optional[Decimal]) -> Optional[str]:
+    """Écriture canonique Decimal pour empreintes (1.0 ≡ 1.00, -0 ≡ 0)"""
+    return None if value is None else str((Decimal(value) + 0).normalize())
+
+
+def _canonical_coefficients(constraint: LinearConstraint) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Coefficients non nuls triés par variable, écriture canonique"""
+    return tuple(sorted((var_id, _canonical_decimal(coeff))
+                        for var_id, coeff in constraint.coefficients.items() if coeff != 0))
+
+
 class LinearProgram:
     """
     Problème LP complet avec variables, contraintes, et métadonnées
@@ -206,12 +487,20 @@ class LinearProgram:
         self.problem_name = problem_name
         self.metadata: Dict[str, Any] = {}
         
+        # Représentation CSR compilée, invalidée à chaque ajout variable/contrainte
+        # ou modification d'une contrainte (révisions LinearConstraint)
+        self._compiled: Optional[CompiledConstraintMatrix] = None
+        self._compiled_key: Optional[Tuple] = None
+        self._structure_fingerprint: Optional[str] = None
+        self._structure_key: Optional[Tuple] = None
+        
         # Statistiques construction
         self.stats = {
             'variables_added': 0,
             'constraints_added': 0,
             'validations_performed': 0,
-            'matrix_extractions': 0
+            'matrix_extractions': 0,
+            'matrix_compilations': 0
         }
     
     def add_variable(self, var_id: str, lower_bound: Decimal = Decimal('0'), 
@@ -266,6 +555,125 @@ class LinearProgram:
         self.constraints.append(constraint)
         self.stats['constraints_added'] += 1
     
+    def compile_constraints(self) -> CompiledConstraintMatrix:
+        """
+        Représentation compilée CSR des contraintes (mise en cache)
+        
+        Recompilée seulement si des variables/contraintes ont été ajoutées,
+        remplacées ou modifiées; partagée par le solveur, le mapper 3D et le
+        collecteur de validation.
+        
+        Returns:
+            CompiledConstraintMatrix avec index variables stable (ordre trié)
+        """
+        key = self._content_key()
+        if self._compiled is None or self._compiled_key != key:
+            self._compiled = CompiledConstraintMatrix(self.constraints, self.variables.keys())
+            self._compiled_key = key
+            self.stats['matrix_compilations'] += 1
+        return self._compiled
+    
+    def _content_key(self) -> Tuple:
+        """Clé d'invalidation des caches: ids variables + révision de chaque contrainte"""
+        return tuple(self.variables), tuple(constraint.revision for constraint in self.constraints)
+    
+    def fingerprint(self) -> str:
+        """
+        Empreinte canonique SHA-256 du problème (clé cache par contenu)
+        
+        Couvre variables (id, bornes) et contraintes (type, coefficients non
+        nuls, RHS, tolérance). Indépendante du nom du problème et des
+        contraintes, de l'ordre d'insertion et de l'écriture des Decimal
+        (1.0 ≡ 1.00, -0 ≡ 0).
+        """
+        variables = sorted(
+            (var_id, _canonical_decimal(variable.lower_bound), _canonical_decimal(variable.upper_bound))
+            for var_id, variable in self.variables.items()
+        )
+        constraints = sorted(
+            (constraint.constraint_type.value,
+             _canonical_coefficients(constraint),
+             _canonical_decimal(constraint.bound),
+             _canonical_decimal(constraint.tolerance))
+            for constraint in self.constraints
+        )
+        return hashlib.sha256(repr((variables, constraints)).encode('utf-8')).hexdigest()
+    
+    def structure_fingerprint(self) -> str:
+        """
+        Empreinte SHA-256 de la structure seule (mise en cache)
+        
+        Ids variables et, ligne par ligne, type + coefficients non nuls des
+        contraintes: deux LPs de même structure ne diffèrent que par bornes
+        variables, RHS et tolérances (rhs_signature), et partagent donc leurs
+        bases. L'ordre des lignes est conservé (variables lignes positionnelles
+        dans le Simplex révisé).
+        """
+        key = self._content_key()
+        if self._structure_fingerprint is None or self._structure_key != key:
+            structure = (
+                tuple(sorted(self.variables)),
+                tuple((constraint.constraint_type.value, _canonical_coefficients(constraint))
+                      for constraint in self.constraints)
+            )
+            self._structure_fingerprint = hashlib.sha256(repr(structure).encode('utf-8')).hexdigest()
+            self._structure_key = key
+        return self._structure_fingerprint
+    
+    def rhs_signature(self) -> Tuple:
+        """
+        Partie non structurelle du problème, complément de structure_fingerprint
+        
+        Returns:
+            Tuple (bornes variables triées par id, (RHS, tolérance) par ligne)
+        """
+        return (
+            tuple((var_id, _canonical_decimal(self.variables[var_id].lower_bound),
+                   _canonical_decimal(self.variables[var_id].upper_bound))
+                  for var_id in sorted(self.variables)),
+            tuple((_canonical_decimal(constraint.bound), _canonical_decimal(constraint.tolerance))
+                  for constraint in self.constraints)
+        )
+    
+    def with_rhs_shift(self, rhs_direction: Dict[str, Decimal], parameter: Decimal) -> 'LinearProgram':
+        """
+        Copie du problème avec RHS paramétrés: bound_i + parameter × direction_i
+        
+        Calcul Decimal exact (produit et somme sans arrondi, quelle que soit
+        la précision du contexte courant).
+        
+        Args:
+            rhs_direction: Nom contrainte → coefficient du paramètre dans son RHS
+            parameter: Valeur du paramètre
+            
+        Returns:
+            Nouveau LinearProgram de même structure (structure_fingerprint identique)
+            
+        Raises:
+            ValueError: Si une contrainte nommée n'existe pas
+        """
+        names = {constraint.name for constraint in self.constraints}
+        missing = set(rhs_direction) - names
+        if missing:
+            raise ValueError(f"Constraints {sorted(missing)} not found in problem {self.problem_name}")
+        
+        shifted = LinearProgram(self.problem_name)
+        shifted.metadata = dict(self.metadata)
+        for var_id, variable in self.variables.items():
+            shifted.add_variable(var_id, variable.lower_bound, variable.upper_bound, variable.value)
+        for constraint in self.constraints:
+            bound = constraint.bound
+            if constraint.name in rhs_direction:
+                with localcontext() as context:
+                    context.prec = MAX_PREC
+                    bound = bound + parameter * rhs_direction[constraint.name]
+            shifted.add_constraint(LinearConstraint(
+                coefficients=dict(constraint.coefficients), bound=bound,
+                constraint_type=constraint.constraint_type, name=constraint.name,
+                tolerance=constraint.tolerance
+            ))
+        return shifted
+    
     def get_constraint_matrix(self) -> Tuple[List[List[Decimal]], List[Decimal], List[str]]:
         """
         Extraction matrice standard form pour Simplex: Ax {≤,≥,=} b
@@ -280,28 +688,9 @@ class LinearProgram:
         
         if not self.constraints:
             return [], [], []
-            
-        # Ordre variables fixe pour cohérence
-        variable_order = sorted(self.variables.keys())
-        n_vars = len(variable_order)
-        m_constraints = len(self.constraints)
         
-        # Construction matrice A et vecteur b
-        A_matrix = []
-        b_vector = []
-        
-        for constraint in self.constraints:
-            row = [Decimal('0')] * n_vars
-            
-            # Remplissage coefficients
-            for var_id, coeff in constraint.coefficients.items():
-                var_index = variable_order.index(var_id)
-                row[var_index] = coeff
-                
-            A_matrix.append(row)
-            b_vector.append(constraint.bound)
-            
-        return A_matrix, b_vector, variable_order
+        compiled = self.compile_constraints()
+        return compiled.to_dense(), list(compiled.exact_bounds), list(compiled.variable_order)
     
     def get_variable_values(self) -> Dict[str, Decimal]:
         """Retourne valeurs actuelles toutes variables"""
@@ -377,19 +766,13 @@ class LinearProgram:
         Returns:
             True si toutes contraintes et bounds satisfaites
         """
-        current_values = self.get_variable_values()
-        
         # Test bounds variables
         for var in self.variables.values():
             if not var.is_feasible(tolerance):
                 return False
                 
-        # Test contraintes
-        for constraint in self.constraints:
-            if not constraint.is_satisfied(current_values):
-                return False
-                
-        return True
+        # Test contraintes (filtre vectorisé, lignes limites en Decimal exact)
+        return self.compile_constraints().all_satisfied(self.get_variable_values())
     
     def get_constraint_violations(self) -> Dict[str, Decimal]:
         """
@@ -398,16 +781,25 @@ class LinearProgram:
         Returns:
             Dict constraint_name → magnitude violation
         """
-        current_values = self.get_variable_values()
+        compiled = self.compile_constraints()
         violations = {}
         
-        for constraint in self.constraints:
-            violation = constraint.get_violation(current_values)
+        for name, violation in zip(compiled.names, compiled.violation_vector(self.get_variable_values())):
             if violation > Decimal('0'):
-                violations[constraint.name] = violation
+                violations[name] = violation
                 
         return violations
     
+    def get_constraint_slacks(self) -> Dict[str, Decimal]:
+        """
+        Retourne slacks toutes contraintes (solution courante)
+        
+        Returns:
+            Dict constraint_name → slack (cf. LinearConstraint.get_slack)
+        """
+        compiled = self.compile_constraints()
+        return dict(zip(compiled.names, compiled.slack_vector(self.get_variable_values())))
+    
     def __repr__(self) -> str:
         """Représentation string pour debugging"""
         return (f"LinearProgram(name='{self.problem_name}', "
@@ -9,10 +9,12 @@ Optimisations:
 2. Indexation lazy des états character-class
 3. Batch processing pour évaluations multiples
 4. Invalidation cache intelligente
+5. Classification bitset patterns sectoriels .*X.* / .*[ABC].*
 """
 
-from typing import Dict, List, Set, Optional, Any, Tuple
+from typing import Dict, List, Set, Optional, Any, Tuple, FrozenSet
 from collections import OrderedDict
+import re
 import time
 import weakref
 
@@ -113,6 +115,124 @@ class CharacterClassStateIndex:
         }
 
 
+# Famille patterns sectoriels émis par NamedCharacterSetManager (ancrés ou non):
+# .*X.*  .*[ABC].*  .*.*[ABC].*$  ^.*X.*$
+_SECTOR_PATTERN_RE = re.compile(
+    r'^\^?(?:\.\*)+'
+    r'(?:([^\\\[\]().*+?^$|{}])|\[([^\]\\^-][^\]\\-]*)\])'
+    r'(?:\.\*)+\$?$'
+)
+
+
+class SectorBitsetClassifier:
+    """
+    Classification bitset pour patterns sectoriels .*X.* et .*[ABC].*
+
+    Un mot matche .*[ABC].* ssi il contient au moins un caractère de {A, B, C}.
+    Chaque caractère est donc associé à un bitmask des états finaux dont la classe
+    le contient; classifier un mot = OR des masks de ses caractères, soit
+    O(len(word)) opérations entières sans moteur regex.
+
+    Les patterns hors famille ne sont pas enregistrés (register retourne False):
+    l'appelant conserve l'évaluation NFA générale pour ceux-ci.
+    """
+
+    def __init__(self):
+        self.char_masks: Dict[str, int] = {}
+        self.state_ids: List[str] = []
+        self._state_bits: Dict[str, int] = {}
+        self._decoded_masks: Dict[int, FrozenSet[str]] = {0: frozenset()}
+
+        self.stats = {
+            'patterns_compiled': 0,
+            'patterns_rejected': 0,
+            'words_classified': 0
+        }
+
+    @staticmethod
+    def parse_sector_pattern(pattern: str) -> Optional[FrozenSet[str]]:
+        """
+        Extrait ensemble caractères d'un pattern sectoriel
+
+        Returns:
+            frozenset caractères si pattern dans la famille, None sinon
+        """
+        if not pattern:
+            return None
+
+        match = _SECTOR_PATTERN_RE.match(pattern)
+        if not match:
+            return None
+
+        single_char, char_class = match.groups()
+        return frozenset(single_char) if single_char else frozenset(char_class)
+
+    def register(self, state_id: str, pattern: str) -> bool:
+        """
+        Enregistre pattern pour état final donné
+
+        Plusieurs patterns pour un même état sont combinés (union caractères).
+
+        Returns:
+            True si pattern compilé en bitset, False si hors famille
+        """
+        characters = self.parse_sector_pattern(pattern)
+        if characters is None:
+            self.stats['patterns_rejected'] += 1
+            return False
+
+        bit = self._state_bits.get(state_id)
+        if bit is None:
+            bit = 1 << len(self.state_ids)
+            self._state_bits[state_id] = bit
+            self.state_ids.append(state_id)
+
+        for char in characters:
+            self.char_masks[char] = self.char_masks.get(char, 0) | bit
+
+        self._decoded_masks = {0: frozenset()}
+        self.stats['patterns_compiled'] += 1
+        return True
+
+    def classify_mask(self, word: str) -> int:
+        """OR des masks caractères du mot"""
+        char_masks = self.char_masks
+        mask = 0
+        for char in word:
+            mask |= char_masks.get(char, 0)
+        return mask
+
+    def classify(self, word: str) -> FrozenSet[str]:
+        """
+        États finaux atteints par le mot
+
+        Note: '.' ne matche pas '\\n' en regex; l'appelant doit utiliser
+        l'évaluation générale pour mots contenant un saut de ligne.
+        """
+        self.stats['words_classified'] += 1
+        mask = self.classify_mask(word)
+
+        decoded = self._decoded_masks.get(mask)
+        if decoded is None:
+            decoded = frozenset(
+                state_id for index, state_id in enumerate(self.state_ids)
+                if mask >> index & 1
+            )
+            self._decoded_masks[mask] = decoded
+        return decoded
+
+    def __len__(self) -> int:
+        return len(self.state_ids)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques classifier"""
+        return {
+            **self.stats,
+            'registered_states': len(self.state_ids),
+            'indexed_characters': len(self.char_masks)
+        }
+
+
 class PerformanceOptimizedMixin:
     """
     Mixin pour optimisations performance character-class
@@ -130,6 +250,10 @@ class PerformanceOptimizedMixin:
         # Index optimisé états character-class
         self._character_class_index = CharacterClassStateIndex()
 
+        # Bitset patterns sectoriels + états nécessitant regex
+        self._sector_classifier = SectorBitsetClassifier()
+        self._regex_fallback_states: List = []
+
         # Métriques performance
         self._evaluation_times: List[float] = []
         self._last_cache_cleanup = time.time()
@@ -161,11 +285,17 @@ class PerformanceOptimizedMixin:
         # 2. Build index lazy
         if not self._character_class_index.is_built:
             self._character_class_index.build_index(self.states)
+            self._build_sector_bitset_index()
 
-        # 3. Évaluation contre états indexés seulement
-        matched_finals = set()
+        # 3. Évaluation bitset patterns sectoriels, regex pour états restants
+        if '\n' in word:
+            matched_finals = set()
+            regex_states = self._character_class_index.get_character_class_states()
+        else:
+            matched_finals = set(self._sector_classifier.classify(word))
+            regex_states = self._regex_fallback_states
 
-        for state in self._character_class_index.get_character_class_states():
+        for state in regex_states:
             # Test chaque pattern compilé dans cet état
             for pattern_info in state.compiled_patterns:
                 try:
@@ -189,6 +319,24 @@ class PerformanceOptimizedMixin:
 
         return matched_finals
 
+    def _build_sector_bitset_index(self) -> None:
+        """
+        Compile états character-class en bitset si tous leurs patterns sont sectoriels
+
+        États avec au moins un pattern hors famille restent évalués par regex.
+        """
+        self._sector_classifier = SectorBitsetClassifier()
+        self._regex_fallback_states = []
+
+        for state in self._character_class_index.get_character_class_states():
+            patterns = [pattern_info.get('pattern') for pattern_info in state.compiled_patterns]
+
+            if all(SectorBitsetClassifier.parse_sector_pattern(p) is not None for p in patterns):
+                for pattern in patterns:
+                    self._sector_classifier.register(state.state_id, pattern)
+            else:
+                self._regex_fallback_states.append(state)
+
     def _periodic_cleanup(self) -> None:
         """Cleanup périodique pour maintenir performance"""
         current_time = time.time()
@@ -220,6 +368,8 @@ class PerformanceOptimizedMixin:
         """Invalidation caches pour cohérence lors modifications NFA"""
         self._character_class_cache.clear()
         self._character_class_index.invalidate()
+        self._sector_classifier = SectorBitsetClassifier()
+        self._regex_fallback_states = []
         self._last_cache_cleanup = time.time()
 
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -235,6 +385,10 @@ class PerformanceOptimizedMixin:
         return {
             'cache': cache_stats,
             'index': index_stats,
+            'sector_bitset': {
+                **self._sector_classifier.get_stats(),
+                'regex_fallback_states': len(self._regex_fallback_states)
+            },
             'evaluation_metrics': {
                 'total_evaluations': len(self._evaluation_times),
                 'avg_evaluation_time_ms': avg_evaluation_time * 1000,
@@ -275,8 +429,8 @@ class BatchEvaluationOptimizer:
             if not nfa._character_class_index.is_built:
                 nfa._character_class_index.build_index(nfa.states)
 
-        # Évaluation batch
-        for word in words:
+        # Évaluation batch: chaque mot distinct évalué une seule fois
+        for word in dict.fromkeys(words):
             results[word] = nfa.evaluate_word(word)
 
         return results
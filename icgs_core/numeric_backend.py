@@ -0,0 +1,112 @@
+"""
+NumericBackend - Arithmétiques de pivot du Simplex révisé borné
+
+Backends sélectionnables par instance TripleValidationOrientedSimplex:
+- float: pivots float64 (recherche rapide), certificat exact Fraction ensuite
+  et re-solve exact si la certification échoue
+- fraction: pivots fractions.Fraction directement sur les données Decimal
+- scaled_integer: pivots Fraction sur lignes mises à l'échelle 10^E (exposant
+  fixe du problème) pour que coefficients et RHS soient entiers: montants
+  monétaires à précision bornée → dénominateurs initiaux égaux à 1
+
+Tous les backends exacts ont des tolérances nulles. La mise à l'échelle des
+lignes ne change pas l'ensemble faisable en x (r' = 10^E r); les certificats
+sont ramenés à l'échelle d'origine par BoundedRevisedSimplex.
+"""
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Dict, Tuple, Union
+
+
+class NumericBackend(ABC):
+    """Arithmétique de pivot: type numérique, tolérances, échelle des lignes"""
+
+    name = "abstract"
+    exact = False
+
+    @abstractmethod
+    def number(self, value: Any) -> Any:
+        """Conversion d'une valeur exacte (Fraction/int) vers le type de pivot"""
+
+    @abstractmethod
+    def tolerances(self, tolerance: float) -> Tuple[Any, Any]:
+        """(tolérance faisabilité/optimalité, tolérance pivot)"""
+
+    def row_scale(self, compiled) -> int:
+        """Facteur multiplicatif appliqué à toutes les lignes (1 = aucune échelle)"""
+        return 1
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name='{self.name}')"
+
+
+class FloatBackend(NumericBackend):
+    """float64: recherche rapide, garanties apportées par la certification exacte"""
+
+    name = "float"
+    exact = False
+
+    def number(self, value: Any) -> float:
+        return float(value)
+
+    def tolerances(self, tolerance: float) -> Tuple[float, float]:
+        return tolerance, tolerance * 1e-2
+
+
+class FractionBackend(NumericBackend):
+    """fractions.Fraction: pivots exacts, tolérances nulles"""
+
+    name = "fraction"
+    exact = True
+
+    def number(self, value: Any) -> Fraction:
+        return Fraction(value)
+
+    def tolerances(self, tolerance: float) -> Tuple[Fraction, Fraction]:
+        return Fraction(0), Fraction(0)
+
+
+class ScaledIntegerBackend(FractionBackend):
+    """
+    Fraction sur données entières: lignes × 10^E, E = plus grand nombre de
+    décimales des coefficients/RHS (au plus max_exponent, sinon pas d'échelle)
+    """
+
+    name = "scaled_integer"
+
+    def __init__(self, max_exponent: int = 18):
+        self.max_exponent = max_exponent
+
+    def row_scale(self, compiled) -> int:
+        exponent = 0
+        for value in list(compiled.exact_data) + list(compiled.exact_bounds):
+            value_exponent = Decimal(value).normalize().as_tuple().exponent
+            if not isinstance(value_exponent, int):
+                return 1  # NaN/Infinity: pas de mise à l'échelle
+            exponent = max(exponent, -value_exponent)
+            if exponent > self.max_exponent:
+                return 1
+        return 10 ** exponent
+
+
+NUMERIC_BACKENDS: Dict[str, NumericBackend] = {
+    backend.name: backend for backend in (FloatBackend(), FractionBackend(), ScaledIntegerBackend())
+}
+
+
+def get_numeric_backend(backend: Union[str, NumericBackend]) -> NumericBackend:
+    """
+    Résolution backend par nom ou instance
+
+    Raises:
+        ValueError: Si nom de backend inconnu
+    """
+    if isinstance(backend, NumericBackend):
+        return backend
+    try:
+        return NUMERIC_BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown numeric backend '{backend}' "
+                         f"(available: {', '.join(sorted(NUMERIC_BACKENDS))})")
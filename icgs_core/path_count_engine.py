@@ -0,0 +1,304 @@
+"""
+PathCountDPEngine - Comptage Chemins par Programmation Dynamique
+
+Moteur alternatif à l'énumération explicite de DAGPathEnumerator.enumerate_and_classify:
+au lieu de matérialiser chaque chemin sink→source, convertir en mot puis évaluer le NFA,
+le DAG est parcouru une seule fois en ordre topologique (reverse) avec un état produit
+
+    (nœud DAG, profondeur, ensemble états NFA principal, ensemble états NFA cible)
+
+Chaque état produit porte un compteur de chemins et un échantillon borné de chemins
+témoins. Les préfixes qui aboutissent au même état produit sont fusionnés, donc le coût
+dépend du nombre d'états produit atteints et non du nombre de chemins.
+
+Propriétés garanties:
+- Sémantique identique à l'énumérateur: règles causales (_select_traversal_edges),
+  limite profondeur adaptive, conversion taxonomique, priorité NFA principal → NFA cible
+- Comptes exacts (pas de troncature max_paths) pour graphes acycliques
+- Fallback énumération explicite si graphe cyclique ou NFA non compatible
+"""
+
+from typing import Dict, List, Optional, Tuple, Any, FrozenSet
+from dataclasses import dataclass, field
+import logging
+import time
+
+from .dag_structures import Node, Edge
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PathCountResult:
+    """Résultat comptage DP: nombre chemins et témoins par état final NFA"""
+    path_counts: Dict[str, int] = field(default_factory=dict)
+    witness_paths: Dict[str, List[List[Node]]] = field(default_factory=dict)
+    total_paths: int = 0
+    classified_paths: int = 0
+    product_states: int = 0
+    computation_time_ms: float = 0.0
+    engine: str = "dp"  # "dp" ou "enumeration" (fallback)
+
+    def to_path_classes(self) -> Dict[str, List[List[Node]]]:
+        """
+        Format compatible enumerate_and_classify: state_id → chemins témoins
+
+        Chaque classe non vide est présente même sans témoin échantillonné.
+        """
+        return {
+            state_id: self.witness_paths.get(state_id, [])
+            for state_id in self.path_counts
+        }
+
+
+class PathCountDPEngine:
+    """
+    Moteur comptage chemins DAG × NFA par programmation dynamique
+
+    Réutilise l'énumérateur pour taxonomie, règles de traversal causal et limites,
+    afin que les classes produites soient identiques à enumerate_and_classify.
+    """
+
+    def __init__(self, enumerator: Any, max_witnesses_per_class: int = 3):
+        """
+        Args:
+            enumerator: DAGPathEnumerator source des règles de traversal
+            max_witnesses_per_class: Nombre max chemins témoins conservés par classe
+        """
+        self.enumerator = enumerator
+        self.max_witnesses_per_class = max_witnesses_per_class
+        self.logger = logging.getLogger(f"{__name__}.PathCountDPEngine")
+
+        self.stats = {
+            'dp_runs': 0,
+            'enumeration_fallbacks': 0,
+            'cyclic_graph_fallbacks': 0,
+            'product_states_created': 0,
+            'paths_counted': 0,
+            'total_time_ms': 0.0
+        }
+
+    def count_and_classify(self, transaction_edge: Edge, nfa: Any,
+                           transaction_num: int) -> PathCountResult:
+        """
+        Comptage chemins par état final NFA sans énumération explicite
+
+        Args:
+            transaction_edge: Edge transaction à valider
+            nfa: AnchoredWeightedNFA (v2) frozen, target NFA optionnel dans metadata
+            transaction_num: Numéro transaction pour mapping taxonomique
+
+        Returns:
+            PathCountResult avec comptes et témoins par état final
+
+        Raises:
+            ValueError: Si inputs invalides
+        """
+        if not self.enumerator._validate_pipeline_inputs(transaction_edge, nfa, transaction_num):
+            raise ValueError("Invalid pipeline inputs")
+
+        start_time = time.time()
+
+        main_core = self._get_steppable_core(nfa)
+        target_nfa = None
+        if hasattr(nfa, 'metadata') and isinstance(nfa.metadata, dict):
+            target_nfa = nfa.metadata.get('target_nfa')
+        target_core = self._get_steppable_core(target_nfa) if target_nfa else None
+
+        if main_core is None or (target_nfa is not None and target_core is None):
+            self.logger.debug("NFA without state-set stepping support - enumeration fallback")
+            return self._fallback_to_enumeration(transaction_edge, nfa, transaction_num, start_time)
+
+        self.enumerator.current_transaction_edge = transaction_edge
+        try:
+            start_node = transaction_edge.target_node
+            topological_order = self._reverse_topological_order(start_node)
+
+            if topological_order is None:
+                self.stats['cyclic_graph_fallbacks'] += 1
+                self.logger.info("Cycle detected in reverse traversal graph - enumeration fallback")
+                return self._fallback_to_enumeration(transaction_edge, nfa, transaction_num, start_time)
+
+            result = self._propagate_counts(topological_order, start_node, main_core,
+                                            target_core, transaction_num)
+        finally:
+            self.enumerator.current_transaction_edge = None
+
+        result.computation_time_ms = (time.time() - start_time) * 1000
+        self.stats['dp_runs'] += 1
+        self.stats['product_states_created'] += result.product_states
+        self.stats['paths_counted'] += result.total_paths
+        self.stats['total_time_ms'] += result.computation_time_ms
+
+        self.logger.info(f"DP path count complete: {result.total_paths} paths, "
+                         f"{len(result.path_counts)} classes, {result.product_states} product states "
+                         f"in {result.computation_time_ms:.2f}ms")
+        return result
+
+    def _get_steppable_core(self, nfa: Any) -> Optional[Any]:
+        """SharedNFA frozen exposant l'API step_state_set, sinon None"""
+        core = getattr(nfa, 'shared_nfa', None)
+        if core is None or not hasattr(core, 'step_state_set'):
+            return None
+        if not core.is_frozen:
+            core.freeze()
+        return core
+
+    def _reverse_topological_order(self, start_node: Node) -> Optional[List[Node]]:
+        """
+        Ordre topologique des nœuds atteignables via incoming edges (reverse)
+
+        Le traversal causal ne suit que edge.source_node d'arêtes entrantes: ce graphe
+        couvre tous les mouvements possibles de l'énumérateur.
+
+        Returns:
+            Nœuds depuis start_node (premier) vers sources, None si cycle détecté
+        """
+        WHITE, GREY, BLACK = 0, 1, 2
+        color: Dict[str, int] = {start_node.node_id: GREY}
+        postorder: List[Node] = []
+        stack: List[Tuple[Node, Any]] = [(start_node, iter(list(start_node.incoming_edges.values())))]
+
+        while stack:
+            node, edges_iter = stack[-1]
+            advanced = False
+
+            for edge in edges_iter:
+                next_node = edge.source_node
+                if next_node is None or next_node == node:
+                    continue
+
+                next_color = color.get(next_node.node_id, WHITE)
+                if next_color == GREY:
+                    return None
+                if next_color == WHITE:
+                    color[next_node.node_id] = GREY
+                    stack.append((next_node, iter(list(next_node.incoming_edges.values()))))
+                    advanced = True
+                    break
+
+            if not advanced:
+                stack.pop()
+                color[node.node_id] = BLACK
+                postorder.append(node)
+
+        postorder.reverse()
+        return postorder
+
+    def _propagate_counts(self, topological_order: List[Node], start_node: Node,
+                          main_core: Any, target_core: Optional[Any],
+                          transaction_num: int) -> PathCountResult:
+        """
+        Propagation comptes sur état produit en ordre topologique
+
+        frontier[node_id][(depth, main_states, target_states)] = [count, témoins]
+        où main_states None signifie préfixe non convertible (mapping manquant).
+        """
+        result = PathCountResult()
+        max_depth = self.enumerator._get_adaptive_max_depth()
+        witness_limit = self.max_witnesses_per_class
+        char_cache: Dict[str, Optional[str]] = {}
+
+        def node_character(node: Node) -> Optional[str]:
+            if node.node_id not in char_cache:
+                account_id = getattr(node, 'account_id', None) or node.node_id
+                char_cache[node.node_id] = self.enumerator.taxonomy.get_character_mapping(
+                    account_id, transaction_num
+                )
+            return char_cache[node.node_id]
+
+        def advance(states: Tuple, char: Optional[str]) -> Tuple:
+            main_states, target_states = states
+            if main_states is None or char is None:
+                return (None, None)
+            next_main = main_core.step_state_set(main_states, char) if main_states else main_states
+            next_target = None
+            if target_core is not None and target_states:
+                next_target = target_core.step_state_set(target_states, char)
+            return (next_main, next_target or None)
+
+        initial_states = (
+            main_core.initial_state_set(),
+            target_core.initial_state_set() if target_core is not None else None
+        )
+        frontier: Dict[str, Dict[Tuple, List[Any]]] = {
+            start_node.node_id: {
+                (1,) + advance(initial_states, node_character(start_node)): [1, [(start_node,)]]
+            }
+        }
+
+        for node in topological_order:
+            entries = frontier.pop(node.node_id, None)
+            if not entries:
+                continue
+
+            result.product_states += len(entries)
+
+            if self.enumerator._is_source_node(node):
+                for (depth, main_states, target_states), (count, witnesses) in entries.items():
+                    result.total_paths += count
+                    final_state_id = self._classify_state(main_states, target_states,
+                                                          main_core, target_core)
+                    if not final_state_id:
+                        continue
+
+                    result.classified_paths += count
+                    result.path_counts[final_state_id] = result.path_counts.get(final_state_id, 0) + count
+                    class_witnesses = result.witness_paths.setdefault(final_state_id, [])
+                    for witness in witnesses[:max(0, witness_limit - len(class_witnesses))]:
+                        class_witnesses.append(list(witness))
+                continue
+
+            for (depth, main_states, target_states), (count, witnesses) in entries.items():
+                if depth + 1 > max_depth:
+                    continue
+
+                for edge in self.enumerator._select_traversal_edges(node, depth):
+                    next_node = edge.source_node
+                    if not next_node or next_node == node:
+                        continue
+
+                    next_key = (depth + 1,) + advance((main_states, target_states),
+                                                      node_character(next_node))
+                    next_entries = frontier.setdefault(next_node.node_id, {})
+                    slot = next_entries.get(next_key)
+                    if slot is None:
+                        slot = [0, []]
+                        next_entries[next_key] = slot
+                    slot[0] += count
+                    for witness in witnesses[:max(0, witness_limit - len(slot[1]))]:
+                        slot[1].append(witness + (next_node,))
+
+        return result
+
+    def _classify_state(self, main_states: Optional[FrozenSet[str]],
+                        target_states: Optional[FrozenSet[str]],
+                        main_core: Any, target_core: Optional[Any]) -> Optional[str]:
+        """Classification fin de mot: NFA principal prioritaire puis NFA cible"""
+        if main_states is None:
+            return None
+
+        final_state_id = main_core.resolve_final_state(main_states) if main_states else None
+        if not final_state_id and target_core is not None and target_states:
+            final_state_id = target_core.resolve_final_state(target_states)
+        return final_state_id
+
+    def _fallback_to_enumeration(self, transaction_edge: Edge, nfa: Any,
+                                 transaction_num: int, start_time: float) -> PathCountResult:
+        """Fallback énumération explicite avec comptes dérivés des classes"""
+        self.stats['enumeration_fallbacks'] += 1
+
+        path_classes = self.enumerator.enumerate_and_classify(transaction_edge, nfa, transaction_num)
+
+        result = PathCountResult(engine="enumeration")
+        for state_id, paths in path_classes.items():
+            result.path_counts[state_id] = len(paths)
+            result.witness_paths[state_id] = [list(path) for path in paths[:self.max_witnesses_per_class]]
+            result.classified_paths += len(paths)
+        result.total_paths = result.classified_paths
+        result.computation_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistiques moteur DP pour monitoring"""
+        return dict(self.stats)
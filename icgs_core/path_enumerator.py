@@ -28,6 +28,7 @@ from .dag_structures import (
     Node, Edge, EdgeType, Account, 
     DAGStructureValidator, DAGValidationResult
 )
+from .path_store import PathPrefixTree, CompactPathList, PathLRUCache, WordLRUCache, ROOT_ENTRY
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,18 @@ class EnumerationStatistics:
     overflow_detections: int = 0
     adaptive_limit_adjustments: int = 0
     batch_overflows: int = 0
+    
+    # Pruning index reachability incrémental
+    reachability_prunes: int = 0
+    
+    # Compteurs instrumentation hot-path (remplacent les logs debug par nœud)
+    causal_edges_explored: int = 0
+    causal_edges_filtered: int = 0
+    causal_fallbacks: int = 0
+    transaction_origin_hits: int = 0
+    transaction_edges_injected: int = 0
+    complete_paths_found: int = 0
+    backtracks: int = 0
 
 
 @dataclass
@@ -81,8 +94,18 @@ class DAGPathEnumerator:
     - Classification: regroupement par états finaux NFA
     """
     
+    # Protection mémoire DFS: longueur chemin × nœuds visités
+    MEMORY_PROTECTION_THRESHOLD = 10000
+    
+    # Budget octets cache LRU chemins (PathLRUCache)
+    PATH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+    
+    # Budget cache LRU mots (WordLRUCache): entrées et octets
+    WORD_CACHE_MAX_ENTRIES = 1000
+    WORD_CACHE_MAX_BYTES = 4 * 1024 * 1024
+    
     def __init__(self, taxonomy: AccountTaxonomy, max_paths: int = 10000, 
-                 batch_size: int = 200):
+                 batch_size: int = 200, max_workers: int = 4):
         """
         Initialize DAGPathEnumerator avec paramètres performance
         
@@ -90,19 +113,35 @@ class DAGPathEnumerator:
             taxonomy: AccountTaxonomy pour conversion path→word
             max_paths: Limite maximum chemins énumérés (protection explosion)
             batch_size: Taille batch pour processing optimisé
+            max_workers: Workers multi-source (modes "parallel" et "process")
         """
         self.taxonomy = taxonomy
         self.max_paths = max_paths
         self.batch_size = batch_size
+        self.max_workers = max_workers
         
         # Structures de données énumération
         self.visited_nodes: Set[str] = set()
         self.current_path: List[Node] = []
         self.enumerated_paths: List[List[Node]] = []
         
+        # Chemins compacts: arbre de préfixes (1 int par chemin complet)
+        self.path_tree = PathPrefixTree()
+        self._current_entries: List[int] = []
+        
+        # Moteur DFS: ITERATIVE (pile explicite) ou RECURSIVE (legacy, référence)
+        self.dfs_engine = "ITERATIVE"
+        
+        # Traçage hot-path: niveaux logger capturés une fois par énumération/conversion
+        self.trace_debug = False
+        self.trace_info = False
+        
         # Cache performance
-        self._path_cache: Dict[str, List[List[Node]]] = {}
-        self._word_cache: Dict[Tuple[str, ...], str] = {}
+        self._path_cache = PathLRUCache(self.PATH_CACHE_MAX_BYTES)
+        self._word_cache = WordLRUCache(self.WORD_CACHE_MAX_ENTRIES, self.WORD_CACHE_MAX_BYTES)
+        
+        # Index ancêtres/descendants optionnel (maintenu par DAG) pour pruning branches
+        self.reachability_index: Optional[Any] = None
         
         # Statistiques et monitoring
         self.stats = EnumerationStatistics()
@@ -131,7 +170,10 @@ class DAGPathEnumerator:
             'path_overlaps_detected': 0,
             'coordination_time_ms': 0.0,
             'merge_operations': 0,
-            'parallel_efficiency': 0.0
+            'parallel_efficiency': 0.0,
+            'process_pool_runs': 0,
+            'process_pool_fallbacks': 0,
+            'snapshot_nodes_shipped': 0
         }
     
     def validate_dag_before_enumeration(self, nodes: List[Node], edges: List[Edge], 
@@ -917,13 +959,12 @@ class DAGPathEnumerator:
             target_edge: Edge transaction target commune
             nfa: NFA pour classification paths
             transaction_num: Numéro transaction
-            coordination_mode: "parallel" | "sequential" | "adaptive"
+            coordination_mode: "parallel" | "process" | "sequential" | "adaptive"
             
         Returns:
             Dict[str, Any]: Résultats multi-source avec analytics détaillées
         """
         import time
-        from concurrent.futures import ThreadPoolExecutor, as_completed
         
         start_time = time.time()
         coordination_start = time.time()
@@ -969,7 +1010,7 @@ class DAGPathEnumerator:
             self.multi_source_stats['path_overlaps_detected'] += overlap_analysis['total_overlaps']
             
             # Calculate parallel efficiency
-            if coordination_mode == "parallel" and len(valid_sources) > 1:
+            if actual_mode_used in ("parallel", "process") and len(valid_sources) > 1:
                 sequential_time_estimate = sum(result.get('enumeration_time_ms', 0) 
                                              for result in source_results.values())
                 if sequential_time_estimate > 0:
@@ -1013,9 +1054,13 @@ class DAGPathEnumerator:
         
         Coordination Modes:
         - parallel: Enumeration simultanée avec ThreadPoolExecutor
+        - process: Fan-out par source sur ProcessPoolExecutor (snapshot DAG par worker)
         - sequential: Enumeration séquentielle avec shared state
         - adaptive: Selection automatique selon source count et complexity
         
+        Résultats toujours indexés dans l'ordre de source_nodes: la fusion
+        (merge_enumeration_results) est identique quel que soit le mode.
+        
         Args:
             source_nodes: Sources validées pour enumeration
             target_edge: Edge target commune
@@ -1027,7 +1072,7 @@ class DAGPathEnumerator:
             tuple[Dict[str, Dict], str]: (Résultats par source avec métriques, mode_utilisé)
         """
         import time
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor
         
         source_results = {}
         
@@ -1037,9 +1082,17 @@ class DAGPathEnumerator:
                 coordination_mode = "parallel" if len(source_nodes) > 2 else "sequential"
                 self.logger.info(f"Adaptive coordination selected: {coordination_mode}")
             
+            if coordination_mode == "process":
+                process_results = self._enumerate_sources_in_processes(
+                    source_nodes, target_edge, nfa, transaction_num
+                )
+                if process_results is not None:
+                    return process_results, coordination_mode
+                coordination_mode = "sequential"
+            
             if coordination_mode == "parallel":
                 # Parallel enumeration avec ThreadPoolExecutor
-                with ThreadPoolExecutor(max_workers=min(len(source_nodes), 4)) as executor:
+                with ThreadPoolExecutor(max_workers=max(1, min(len(source_nodes), self.max_workers))) as executor:
                     # Submit enumeration tasks
                     future_to_source = {}
                     for source in source_nodes:
@@ -1049,9 +1102,8 @@ class DAGPathEnumerator:
                         )
                         future_to_source[future] = source
                     
-                    # Collect results as completed
-                    for future in as_completed(future_to_source):
-                        source = future_to_source[future]
+                    # Collect results dans l'ordre de soumission (merge déterministe)
+                    for future, source in future_to_source.items():
                         try:
                             result = future.result()
                             source_results[source.node_id] = result
@@ -1086,6 +1138,77 @@ class DAGPathEnumerator:
             self.logger.error(f"Source coordination failed: {e}")
             raise RuntimeError(f"Source enumeration coordination failed: {e}") from e
     
+    def _enumerate_sources_in_processes(self, source_nodes: List[Node], target_edge: Edge,
+                                        nfa: Any, transaction_num: int) -> Optional[Dict[str, Dict]]:
+        """
+        Fan-out par source sur ProcessPoolExecutor - snapshot DAG picklable
+        
+        Snapshot (DAGSnapshot), taxonomie et NFA figé sont sérialisés une fois
+        puis restaurés une fois par worker; chaque tâche ne transporte que le
+        node_id source. Chemins renvoyés en tuples node_id et réhydratés avec
+        les Node du DAG parent, dans l'ordre de source_nodes.
+        
+        Returns:
+            Résultats par source, ou None si snapshot/pool indisponible
+            (l'appelant bascule en séquentiel)
+        """
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        from .enumeration_snapshot import (
+            DAGSnapshot, init_enumeration_worker, enumerate_source_in_worker, rehydrate_source_result
+        )
+        
+        try:
+            snapshot, live_nodes = DAGSnapshot.capture(
+                [target_edge.source_node, target_edge.target_node, *source_nodes],
+                self.reachability_index
+            )
+            payload = pickle.dumps({
+                'snapshot': snapshot,
+                'taxonomy': self.taxonomy,
+                'nfa': nfa,
+                'max_paths': self.max_paths,
+                'batch_size': self.batch_size,
+                'dfs_engine': self.dfs_engine,
+                'transaction_num': transaction_num,
+                'target_edge': (target_edge.edge_id, target_edge.source_node.node_id,
+                                target_edge.target_node.node_id, target_edge.weight,
+                                target_edge.edge_metadata.edge_type, target_edge.edge_metadata.context)
+            }, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            self.multi_source_stats['process_pool_fallbacks'] += 1
+            self.logger.warning(f"DAG snapshot not picklable, falling back to sequential: {e}")
+            return None
+        
+        source_results = {}
+        workers = max(1, min(len(source_nodes), self.max_workers))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_enumeration_worker,
+                                     initargs=(payload,)) as executor:
+                futures = [(source, executor.submit(enumerate_source_in_worker, source.node_id))
+                           for source in source_nodes]
+                for source, future in futures:
+                    try:
+                        source_results[source.node_id] = rehydrate_source_result(future.result(), live_nodes)
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        self.logger.warning(f"Source {source.node_id} enumeration failed: {e}")
+                        source_results[source.node_id] = {
+                            'classification_result': {},
+                            'error': str(e),
+                            'enumeration_time_ms': 0
+                        }
+        except (BrokenProcessPool, OSError) as e:
+            self.multi_source_stats['process_pool_fallbacks'] += 1
+            self.logger.warning(f"Process pool unavailable, falling back to sequential: {e}")
+            return None
+        
+        self.multi_source_stats['process_pool_runs'] += 1
+        self.multi_source_stats['snapshot_nodes_shipped'] += len(snapshot) * workers
+        return source_results
+    
     def merge_enumeration_results(self, source_results: Dict[str, Dict], 
                                 overlap_analysis: Dict[str, Any],
                                 deduplication: bool = True) -> Dict[str, Any]:
@@ -1502,7 +1625,9 @@ class DAGPathEnumerator:
         is_origin = node.node_id == target_sink_node_id
 
         if is_origin:
-            self.logger.debug(f"Transaction origin node detected: {node.node_id} (sink of source account)")
+            self.stats.transaction_origin_hits += 1
+            if self.trace_debug:
+                self.logger.debug(f"Transaction origin node detected: {node.node_id} (sink of source account)")
 
         return is_origin
 
@@ -1551,7 +1676,8 @@ class DAGPathEnumerator:
             is_tx_source = self._is_transaction_source_node(current_node)
 
             if is_tx_source:
-                self.logger.debug(f"Transaction source node detected: {current_node.node_id} - using INCOMING edges only")
+                if self.trace_debug:
+                    self.logger.debug(f"Transaction source node detected: {current_node.node_id} - using INCOMING edges only")
 
                 # Exclusion critique des arêtes sortantes pour nœud source transaction
                 incoming_edges = list(current_node.incoming_edges.values())
@@ -1561,7 +1687,9 @@ class DAGPathEnumerator:
                     self.current_transaction_edge and
                     current_node == self.current_transaction_edge.target_node):
                     incoming_edges.append(self.current_transaction_edge)
-                    self.logger.debug(f"Added transaction edge to incoming edges for target node: {current_node.node_id}")
+                    self.stats.transaction_edges_injected += 1
+                    if self.trace_debug:
+                        self.logger.debug(f"Added transaction edge to incoming edges for target node: {current_node.node_id}")
 
                 edges_to_explore = incoming_edges
 
@@ -1576,7 +1704,8 @@ class DAGPathEnumerator:
                     edges_to_explore = list(current_node.outgoing_edges.values())
                     direction = "OUTGOING"
 
-                self.logger.debug(f"Depth {traversal_depth} (even/odd alternation): using {direction} edges for node {current_node.node_id}")
+                if self.trace_debug:
+                    self.logger.debug(f"Depth {traversal_depth} (even/odd alternation): using {direction} edges for node {current_node.node_id}")
 
             # Filtrage causal: garder uniquement arêtes vers nœuds transactionnels
             filtered_edges = []
@@ -1591,9 +1720,12 @@ class DAGPathEnumerator:
                 if next_node and self._is_transaction_node(next_node):
                     filtered_edges.append(edge)
                 else:
-                    self.logger.debug(f"Filtered out non-transactional node: {getattr(next_node, 'node_id', 'unknown')}")
+                    self.stats.causal_edges_filtered += 1
+                    if self.trace_debug:
+                        self.logger.debug(f"Filtered out non-transactional node: {getattr(next_node, 'node_id', 'unknown')}")
 
-            self.logger.debug(f"Causal traversal for {current_node.node_id}: {len(filtered_edges)}/{len(edges_to_explore)} edges after filtering")
+            if self.trace_debug:
+                self.logger.debug(f"Causal traversal for {current_node.node_id}: {len(filtered_edges)}/{len(edges_to_explore)} edges after filtering")
 
             return filtered_edges
 
@@ -1606,10 +1738,21 @@ class DAGPathEnumerator:
             else:
                 return []
 
+    def _capture_trace_flags(self) -> None:
+        """
+        Capture niveaux logger pour le hot-path (une fois par opération)
+        
+        Sous DEBUG/INFO inactifs, parcours et conversion ne formatent
+        aucune chaîne: seuls les compteurs EnumerationStatistics avancent.
+        """
+        self.trace_debug = self.logger.isEnabledFor(logging.DEBUG)
+        self.trace_info = self.logger.isEnabledFor(logging.INFO)
+    
     def reset_enumeration_state(self):
         """Reset état énumération pour nouvelle transaction - Étape 2.2 Enhanced"""
         self.visited_nodes.clear()
         self.current_path.clear()
+        self._current_entries.clear()
         self.enumerated_paths.clear()
         self.stats = EnumerationStatistics()
         
@@ -1643,9 +1786,16 @@ class DAGPathEnumerator:
             
         return True
     
-    def _generate_cache_key(self, start_node: Node, transaction_num: int) -> str:
-        """Génère clé cache pour énumération depuis nœud"""
-        return f"{start_node.node_id}_{transaction_num}_{self.max_paths}"
+    def _generate_cache_key(self, start_node: Node, transaction_num: int,
+                            transaction_edge: Optional[Edge] = None) -> str:
+        """
+        Génère clé cache pour énumération depuis nœud
+        
+        Versions DAG/NFA du cache si versionné par le DAG, sinon transaction_num.
+        La source de l'arête transaction (injectée au nœud départ) fait partie de la clé.
+        """
+        source_id = transaction_edge.source_node.node_id if transaction_edge is not None else ""
+        return self._path_cache.make_key(start_node.node_id, source_id, transaction_num, self.max_paths)
     
     def _is_source_node(self, node: Node) -> bool:
         """
@@ -1748,17 +1898,14 @@ class DAGPathEnumerator:
             return False
             
         # Strategy 1: Adaptive depth limit basée sur complexity
-        adaptive_max_depth = min(50, self.max_paths // 100 + 10)
-        if depth > adaptive_max_depth:
-            self.logger.warning(f"Adaptive depth limit reached: {depth} > {adaptive_max_depth}")
-            self.stats.cycles_detected += 1
-            self.stats.depth_limit_hits += 1
+        if not self._within_adaptive_depth(depth):
             return False
         
         # Strategy 2: Complex cycle detection
         cycle_detected, cycle_type = self._detect_complex_cycle_patterns(node, depth)
         if cycle_detected:
-            self.logger.debug(f"Complex cycle detected: {cycle_type} at node {node.node_id}")
+            if self.trace_debug:
+                self.logger.debug(f"Complex cycle detected: {cycle_type} at node {node.node_id}")
             self.stats.cycles_detected += 1
             
             # Mise à jour métriques détaillées
@@ -1774,22 +1921,57 @@ class DAGPathEnumerator:
             return False
         
         # Strategy 3: Resource protection - memory usage
-        current_memory_usage = len(self.current_path) * len(self.visited_nodes)
-        if current_memory_usage > 10000:  # Arbitrary but reasonable limit
-            self.logger.warning(f"Memory protection: usage {current_memory_usage} > 10000")
-            self.stats.early_terminations += 1
-            self.stats.memory_limit_hits += 1
+        if not self._within_memory_protection():
             return False
         
         # Strategy 4: Pattern-based early warning
         if self._detect_cycle_warning_patterns(node, depth):
-            self.logger.debug(f"Cycle warning pattern detected at node {node.node_id}")
+            if self.trace_debug:
+                self.logger.debug(f"Cycle warning pattern detected at node {node.node_id}")
             self.stats.cycles_detected += 1
             self.stats.warning_patterns += 1
             return False
         
         return True
     
+    def _within_adaptive_depth(self, depth: int) -> bool:
+        """Strategy 1 prévention cycles: limite profondeur adaptive"""
+        adaptive_max_depth = self._get_adaptive_max_depth()
+        if depth > adaptive_max_depth:
+            self.logger.warning(f"Adaptive depth limit reached: {depth} > {adaptive_max_depth}")
+            self.stats.cycles_detected += 1
+            self.stats.depth_limit_hits += 1
+            return False
+        return True
+    
+    def _within_memory_protection(self) -> bool:
+        """Strategy 3 prévention cycles: protection mémoire chemin × visités"""
+        current_memory_usage = len(self.current_path) * len(self.visited_nodes)
+        if current_memory_usage > self.MEMORY_PROTECTION_THRESHOLD:
+            self.logger.warning(f"Memory protection: usage {current_memory_usage} > "
+                                f"{self.MEMORY_PROTECTION_THRESHOLD}")
+            self.stats.early_terminations += 1
+            self.stats.memory_limit_hits += 1
+            return False
+        return True
+    
+    def _unique_path_cycle_prevention(self, node: Node, depth: int) -> bool:
+        """
+        _advanced_cycle_prevention en O(1) pour le moteur DFS itératif
+        
+        Invariant du moteur: current_path sans doublon et visited_nodes = ses
+        node_id. Les patterns alternant/oscillation/convergence et
+        l'heuristique deep recursion exigent alors que le nœud soit déjà
+        visité: seul ce cas délègue à l'analyse complète (mêmes stats).
+        """
+        if not node or node.node_id in self.visited_nodes:
+            return self._advanced_cycle_prevention(node, depth)
+        return self._within_adaptive_depth(depth) and self._within_memory_protection()
+    
+    def _get_adaptive_max_depth(self) -> int:
+        """Profondeur maximale autorisée selon max_paths (partagée avec moteur DP)"""
+        return min(50, self.max_paths // 100 + 10)
+    
     def _detect_cycle_warning_patterns(self, node: Node, depth: int) -> bool:
         """
         Détection patterns warning de cycles probables
@@ -1910,21 +2092,23 @@ class DAGPathEnumerator:
         
         # Logging informatif selon raison
         if termination_reason == "max_paths_reached":
-            self.logger.info(f"Graceful termination: max_paths {self.max_paths} reached. "
-                           f"Found {len(paths_found)} valid paths.")
+            if self.trace_info:
+                self.logger.info(f"Graceful termination: max_paths {self.max_paths} reached. "
+                               f"Found {len(paths_found)} valid paths.")
         elif termination_reason == "explosion_detected":
             self.stats.explosion_preventions += 1
             self.logger.warning(f"Graceful termination: explosion risk detected. "
                               f"Enumeration stopped at {len(paths_found)} paths.")
         elif termination_reason == "adaptive_limit":
             self.stats.adaptive_limit_adjustments += 1
-            self.logger.info(f"Graceful termination: adaptive limit applied. "
-                           f"Complexity-based early stop at {len(paths_found)} paths.")
-        else:
+            if self.trace_info:
+                self.logger.info(f"Graceful termination: adaptive limit applied. "
+                               f"Complexity-based early stop at {len(paths_found)} paths.")
+        elif self.trace_debug:
             self.logger.debug(f"Graceful termination: {termination_reason}")
         
         # Cache résultat partiel si reasonable
-        if len(paths_found) <= self.max_paths // 2:
+        if len(paths_found) <= self.max_paths // 2 and self.trace_debug:
             # Cache partiel peut être utile pour requêtes futures similaires
             self.logger.debug(f"Partial result cached: {len(paths_found)} paths")
     
@@ -1948,8 +2132,9 @@ class DAGPathEnumerator:
             
             # Strategy: yield batch et continue si sous limite totale
             if total_paths < self.max_paths:
-                self.logger.debug(f"Batch overflow handled: {len(current_batch)} paths yielded, "
-                                f"continuing enumeration ({total_paths}/{self.max_paths})")
+                if self.trace_debug:
+                    self.logger.debug(f"Batch overflow handled: {len(current_batch)} paths yielded, "
+                                    f"continuing enumeration ({total_paths}/{self.max_paths})")
                 return True
             else:
                 self.stats.overflow_detections += 1
@@ -1977,25 +2162,40 @@ class DAGPathEnumerator:
         Yields:
             List[Node]: Chemins complets sink→source
         """
+        for entry in self._enumerate_path_entries(transaction_edge, transaction_num):
+            yield self.path_tree.materialize(entry)
+    
+    def _enumerate_path_entries(self, transaction_edge: Edge, 
+                                transaction_num: int) -> Iterator[int]:
+        """
+        Énumération compacte: yield entrées de self.path_tree (un int par chemin)
+        
+        Chaque énumération non cachée construit un nouvel arbre de préfixes;
+        un cache hit réinstalle l'arbre du résultat caché.
+        """
         if not self.validate_enumeration_parameters():
             self.logger.error("Invalid enumeration parameters")
             return
         
         start_time = time.time()
         self.reset_enumeration_state()
+        self._capture_trace_flags()
 
         # CRITICAL FIX: Store temporary transaction edge for enumeration
         # The transaction edge must be available during recursive traversal
         self.current_transaction_edge = transaction_edge
-        self.logger.debug(f"Stored transaction edge for enumeration: {transaction_edge.edge_id}")
+        if self.trace_debug:
+            self.logger.debug(f"Stored transaction edge for enumeration: {transaction_edge.edge_id}")
 
         # Cache check
-        cache_key = self._generate_cache_key(transaction_edge.target_node, transaction_num)
-        if cache_key in self._path_cache:
-            self.logger.debug(f"Cache hit for key: {cache_key}")
+        cache_key = self._generate_cache_key(transaction_edge.target_node, transaction_num, transaction_edge)
+        cached_paths = self._path_cache.lookup(cache_key)
+        if cached_paths is not None:
+            if self.trace_debug:
+                self.logger.debug(f"Cache hit for key: {cache_key}")
             self.stats.cache_hits += 1
-            for path in self._path_cache[cache_key]:
-                yield path
+            self.path_tree = cached_paths.tree
+            yield from cached_paths.iter_entries()
             return
         
         self.stats.cache_misses += 1
@@ -2009,14 +2209,21 @@ class DAGPathEnumerator:
                 self.logger.error("Invalid DAG structure for enumeration")
                 return
             
-            self.logger.info(f"Starting reverse enumeration from target: {start_node.node_id}")
+            if self.trace_info:
+                self.logger.info(f"Starting reverse enumeration from target: {start_node.node_id}")
             
             # DFS reverse recursif avec limite et monitoring amélioré
-            paths_found = []
+            self.path_tree = PathPrefixTree()
+            paths_found = CompactPathList(self.path_tree)
             start_enumeration_time = time.time()
             
-            for path in self._enumerate_recursive(start_node, paths_found):
-                yield path
+            if self.dfs_engine == "RECURSIVE":
+                dfs_entries = self._enumerate_recursive(start_node, paths_found)
+            else:
+                dfs_entries = self._enumerate_iterative(start_node, paths_found)
+            
+            for entry in dfs_entries:
+                yield entry
                 
                 # Monitoring progress périodique avec explosion risk detection
                 if len(paths_found) % 50 == 0:  # Check plus fréquent
@@ -2034,8 +2241,9 @@ class DAGPathEnumerator:
                         break
                     
                     # Progress logging
-                    self.logger.debug(f"Enumeration progress: {len(paths_found)} paths found "
-                                    f"in {elapsed_time:.2f}s, depth: {current_depth}")
+                    if self.trace_debug:
+                        self.logger.debug(f"Enumeration progress: {len(paths_found)} paths found "
+                                        f"in {elapsed_time:.2f}s, depth: {current_depth}")
                 
                 # Limite globale paths avec terminaison gracieuse
                 if len(paths_found) >= self.max_paths:
@@ -2044,14 +2252,16 @@ class DAGPathEnumerator:
             
             # Stockage cache si pas trop de paths
             if len(paths_found) <= self.max_paths // 4:  # Cache seulement si reasonable
-                self._path_cache[cache_key] = paths_found.copy()
+                self._path_cache.store(cache_key, paths_found, start_node.node_id,
+                                       transaction_edge.source_node.node_id, self.max_paths)
             
             # Statistiques finales
             self.stats.enumeration_time_ms = (time.time() - start_time) * 1000
             self.stats.paths_enumerated = len(paths_found)
             
-            self.logger.info(f"Enumeration completed - {self.stats.paths_enumerated} paths "
-                           f"in {self.stats.enumeration_time_ms:.2f}ms")
+            if self.trace_info:
+                self.logger.info(f"Enumeration completed - {self.stats.paths_enumerated} paths "
+                               f"in {self.stats.enumeration_time_ms:.2f}ms")
 
         except Exception as e:
             self.logger.error(f"Enumeration error: {e}")
@@ -2060,13 +2270,153 @@ class DAGPathEnumerator:
             # CRITICAL FIX: Cleanup temporary transaction edge
             if hasattr(self, 'current_transaction_edge'):
                 self.current_transaction_edge = None
-                self.logger.debug("Cleaned up temporary transaction edge")
+                if self.trace_debug:
+                    self.logger.debug("Cleaned up temporary transaction edge")
+    
+    def _enter_enumeration_node(self, current_node: Node,
+                                paths_found: CompactPathList) -> Optional[int]:
+        """
+        Entrée DFS sur un nœud: limites adaptives, prévention cycles, empilement
+        
+        Returns:
+            Entrée self.path_tree du préfixe courant, None si nœud refusé
+        """
+        current_complexity = len(self.current_path) * len(self.visited_nodes)
+        adaptive_max_paths, _ = self._calculate_adaptive_limits(current_complexity)
+        
+        if len(paths_found) >= adaptive_max_paths:
+            self.stats.early_terminations += 1
+            
+            if adaptive_max_paths < self.max_paths:
+                self.stats.adaptive_limit_adjustments += 1
+                self.logger.info(f"Adaptive limit termination - {adaptive_max_paths} reached "
+                               f"(complexity-based reduction from {self.max_paths})")
+            else:
+                self.logger.warning(f"Early termination - max_paths {self.max_paths} reached")
+            return None
+        
+        current_depth = len(self.current_path) + 1
+        if not self._unique_path_cycle_prevention(current_node, current_depth):
+            return None
+        
+        self.visited_nodes.add(current_node.node_id)
+        self.current_path.append(current_node)
+        parent_entry = self._current_entries[-1] if self._current_entries else ROOT_ENTRY
+        current_entry = self.path_tree.extend(parent_entry, current_node)
+        self._current_entries.append(current_entry)
+        
+        if current_depth > self.stats.max_depth_reached:
+            self.stats.max_depth_reached = current_depth
+        return current_entry
+    
+    def _leave_enumeration_node(self, current_node: Node, current_entry: int) -> None:
+        """Backtracking DFS: dépile nœud et entrée arbre de préfixes"""
+        if self.current_path and self.current_path[-1] == current_node:
+            self.current_path.pop()
+        if self._current_entries and self._current_entries[-1] == current_entry:
+            self._current_entries.pop()
+        self.visited_nodes.discard(current_node.node_id)
+        self.stats.backtracks += 1
+    
+    def _enumerate_iterative(self, start_node: Node,
+                             paths_found: CompactPathList) -> Iterator[int]:
+        """
+        Énumération DFS itérative à pile explicite d'itérateurs d'arêtes
+        
+        Mêmes chemins, même ordre et mêmes statistiques que _enumerate_recursive
+        (alternance causale pair/impair via _select_traversal_edges), sans
+        récursion Python: profondeur non bornée par la limite de récursion
+        et chaque chemin yieldé directement, sans remonter les frames.
+        
+        Args:
+            start_node: Nœud de départ (sink transaction)
+            paths_found: Accumulation compacte chemins trouvés
+        
+        Yields:
+            int: Entrée self.path_tree du chemin complet sink→source
+        """
+        # Frame: (nœud, entrée arbre, itérateur arêtes, nombre arêtes | None si source)
+        stack: List[Tuple[Node, int, Iterator[Edge], Optional[int]]] = []
+        pending_node: Optional[Node] = start_node
+        
+        try:
+            while True:
+                if pending_node is not None:
+                    current_node, pending_node = pending_node, None
+                    
+                    try:
+                        current_entry = self._enter_enumeration_node(current_node, paths_found)
+                    except Exception as e:
+                        if not stack:
+                            raise
+                        # Erreur propagée au parent comme dans la version récursive
+                        parent_node, parent_entry, _, _ = stack.pop()
+                        self.logger.error(f"Enumeration error at node {parent_node.node_id}: {e}")
+                        self._leave_enumeration_node(parent_node, parent_entry)
+                        continue
+                    
+                    if current_entry is not None:
+                        try:
+                            if self._is_source_node(current_node):
+                                stack.append((current_node, current_entry, iter(()), None))
+                                paths_found.append_entry(current_entry)
+                                self.stats.complete_paths_found += 1
+                                
+                                if self.trace_debug:
+                                    self.logger.debug(f"Complete path found - length: {len(self.current_path)}, "
+                                                    f"source: {current_node.node_id}, "
+                                                    f"path: {' -> '.join([n.node_id for n in self.current_path])}")
+                                
+                                yield current_entry
+                            else:
+                                edges_to_explore = self._select_traversal_edges(current_node, len(self.current_path))
+                                if self.trace_debug:
+                                    self.logger.debug(f"Exploring {len(edges_to_explore)} incoming edges "
+                                                    f"from node: {current_node.node_id}")
+                                stack.append((current_node, current_entry, iter(edges_to_explore),
+                                              len(edges_to_explore)))
+                        except Exception as e:
+                            self.logger.error(f"Enumeration error at node {current_node.node_id}: {e}")
+                            self._leave_enumeration_node(current_node, current_entry)
+                            continue
+                
+                if not stack:
+                    break
+                
+                current_node, current_entry, edge_iterator, num_edges = stack[-1]
+                edge = next(edge_iterator, None)
+                
+                if edge is None:
+                    # Toutes arêtes explorées: backtracking
+                    stack.pop()
+                    if num_edges is not None:
+                        self.stats.causal_edges_explored += num_edges
+                    self._leave_enumeration_node(current_node, current_entry)
+                    if self.trace_debug:
+                        self.logger.debug(f"Backtracked from node: {current_node.node_id}, "
+                                        f"remaining path depth: {len(self.current_path)}")
+                    continue
+                
+                # Pour incoming edges, next_node = source_node
+                next_node = edge.source_node
+                if next_node and next_node != current_node:
+                    pending_node = next_node
+                else:
+                    self.logger.warning(f"Invalid or self-loop edge structure: {edge.edge_id}")
+        finally:
+            # Arrêt consommateur (max_paths, explosion): nettoyage état DFS
+            while stack:
+                current_node, current_entry, _, _ = stack.pop()
+                self._leave_enumeration_node(current_node, current_entry)
     
     def _enumerate_recursive(self, current_node: Node, 
-                           paths_found: List[List[Node]]) -> Iterator[List[Node]]:
+                           paths_found: CompactPathList) -> Iterator[int]:
         """
         Énumération récursive DFS avec backtracking - Version améliorée
         
+        Moteur legacy (dfs_engine="RECURSIVE"), conservé comme référence
+        d'équivalence pour _enumerate_iterative.
+        
         Algorithme DFS reverse optimisé:
         1. Protection explosion et cycles
         2. Traversal via incoming_edges (reverse direction)  
@@ -2075,10 +2425,10 @@ class DAGPathEnumerator:
         
         Args:
             current_node: Node courant dans traversal reverse
-            paths_found: Liste accumulation chemins trouvés
+            paths_found: Accumulation compacte chemins trouvés
         
         Yields:
-            List[Node]: Chemins complets sink→source
+            int: Entrée self.path_tree du chemin complet sink→source
         """
         # Protection explosion avec limites adaptives
         current_complexity = len(self.current_path) * len(self.visited_nodes)
@@ -2106,6 +2456,9 @@ class DAGPathEnumerator:
         # Ajout au chemin courant avec state management
         self.visited_nodes.add(current_node.node_id)
         self.current_path.append(current_node)
+        parent_entry = self._current_entries[-1] if self._current_entries else ROOT_ENTRY
+        current_entry = self.path_tree.extend(parent_entry, current_node)
+        self._current_entries.append(current_entry)
         
         # Mise à jour profondeur max atteinte
         self.stats.max_depth_reached = max(self.stats.max_depth_reached, current_depth)
@@ -2113,40 +2466,28 @@ class DAGPathEnumerator:
         try:
             # Test si source (pas d'incoming edges) - condition d'arrêt
             if self._is_source_node(current_node):
-                # Chemin complet trouvé depuis sink vers source
-                complete_path = self.current_path.copy()
-                paths_found.append(complete_path)
+                # Chemin complet trouvé depuis sink vers source (préfixe partagé)
+                paths_found.append_entry(current_entry)
+                self.stats.complete_paths_found += 1
                 
-                self.logger.debug(f"Complete path found - length: {len(complete_path)}, "
-                                f"source: {current_node.node_id}, "
-                                f"path: {' -> '.join([n.node_id for n in complete_path])}")
+                if self.trace_debug:
+                    self.logger.debug(f"Complete path found - length: {len(self.current_path)}, "
+                                    f"source: {current_node.node_id}, "
+                                    f"path: {' -> '.join([n.node_id for n in self.current_path])}")
                 
-                yield complete_path
+                yield current_entry
             else:
                 # Continuer traversal reverse via incoming edges
                 # NOUVEAU: Mode hybride - optimisation causale avec fallback exhaustif
                 current_depth = len(self.current_path)
-                edges_to_explore = self._get_edges_for_causal_traversal(current_node, current_depth)
-
-                # FALLBACK critique : si optimisation causale trouve 0 edges mais que incoming_edges existent
-                if len(edges_to_explore) == 0 and len(current_node.incoming_edges) > 0:
-                    self.logger.debug(f"Causal optimization found 0 edges for {current_node.node_id}, falling back to exhaustive DFS")
-                    edges_to_explore = list(current_node.incoming_edges.values())
-
-                    # Note: Pas besoin d'ajouter transaction edge ici car elle est déjà dans incoming_edges
-                    # si sink_node.add_incoming_edge(transaction_edge) a été appelé
-
-                    # Stats fallback
-                    if hasattr(self.stats, 'causal_fallbacks'):
-                        self.stats.causal_fallbacks += 1
-                    else:
-                        self.stats.causal_fallbacks = 1
+                edges_to_explore = self._select_traversal_edges(current_node, current_depth)
 
                 # Legacy compatibility: maintenir la variable pour le code suivant
                 # Note: edges_to_explore contient déjà toutes les edges nécessaires (y compris transaction edge)
                 incoming_edges_list = edges_to_explore
-                self.logger.debug(f"Exploring {len(incoming_edges_list)} incoming edges "
-                                f"from node: {current_node.node_id}")
+                if self.trace_debug:
+                    self.logger.debug(f"Exploring {len(incoming_edges_list)} incoming edges "
+                                    f"from node: {current_node.node_id}")
                 
                 # NOUVEAU: Boucle causale simplifiée - incoming edges seulement
                 # Note: incoming_edges_list contient déjà les bonnes edges causales
@@ -2156,17 +2497,15 @@ class DAGPathEnumerator:
 
                     # Validation nœud suivant avant récursion
                     if next_node and next_node != current_node:
-                        self.logger.debug(f"Causal DFS: following incoming edge to {next_node.node_id}")
+                        if self.trace_debug:
+                            self.logger.debug(f"Causal DFS: following incoming edge to {next_node.node_id}")
                         # Récursion causale sur le nœud suivant
                         yield from self._enumerate_recursive(next_node, paths_found)
                     else:
                         self.logger.warning(f"Invalid or self-loop edge structure: {edge.edge_id}")
 
                 # Performance metric: nombre d'arêtes explorées avec optimisation causale
-                if hasattr(self.stats, 'causal_edges_explored'):
-                    self.stats.causal_edges_explored += len(incoming_edges_list)
-                else:
-                    self.stats.causal_edges_explored = len(incoming_edges_list)
+                self.stats.causal_edges_explored += len(incoming_edges_list)
                         
         except Exception as e:
             self.logger.error(f"Enumeration error at node {current_node.node_id}: {e}")
@@ -2174,11 +2513,51 @@ class DAGPathEnumerator:
             # Backtracking critique - nettoyage état pour eviter corruption
             if self.current_path and self.current_path[-1] == current_node:
                 self.current_path.pop()
+            if self._current_entries and self._current_entries[-1] == current_entry:
+                self._current_entries.pop()
             if current_node.node_id in self.visited_nodes:
                 self.visited_nodes.remove(current_node.node_id)
+            self.stats.backtracks += 1
             
-            self.logger.debug(f"Backtracked from node: {current_node.node_id}, "
-                            f"remaining path depth: {len(self.current_path)}")
+            if self.trace_debug:
+                self.logger.debug(f"Backtracked from node: {current_node.node_id}, "
+                                f"remaining path depth: {len(self.current_path)}")
+    
+    def _select_traversal_edges(self, current_node: Node, current_depth: int) -> List[Edge]:
+        """
+        Arêtes à explorer depuis nœud: optimisation causale + fallback exhaustif
+        
+        Args:
+            current_node: Nœud courant (déjà dans chemin)
+            current_depth: Longueur chemin courant incluant current_node
+            
+        Returns:
+            List[Edge]: Arêtes dont source_node sera visité ensuite
+        """
+        edges_to_explore = self._get_edges_for_causal_traversal(current_node, current_depth)
+
+        # FALLBACK critique : si optimisation causale trouve 0 edges mais que incoming_edges existent
+        if len(edges_to_explore) == 0 and len(current_node.incoming_edges) > 0:
+            if self.trace_debug:
+                self.logger.debug(f"Causal optimization found 0 edges for {current_node.node_id}, falling back to exhaustive DFS")
+            edges_to_explore = list(current_node.incoming_edges.values())
+
+            # Note: Pas besoin d'ajouter transaction edge ici car elle est déjà dans incoming_edges
+            # si sink_node.add_incoming_edge(transaction_edge) a été appelé
+
+            # Stats fallback
+            self.stats.causal_fallbacks += 1
+
+        # Pruning branches ne pouvant aboutir à aucune source (index reachability)
+        if self.reachability_index is not None and edges_to_explore:
+            reachable_edges = [
+                edge for edge in edges_to_explore
+                if edge.source_node is None or self.reachability_index.can_reach_source(edge.source_node)
+            ]
+            self.stats.reachability_prunes += len(edges_to_explore) - len(reachable_edges)
+            edges_to_explore = reachable_edges
+
+        return edges_to_explore
     
     def _validate_dag_structure(self, start_node: Node) -> bool:
         """
@@ -2202,7 +2581,8 @@ class DAGPathEnumerator:
             self.logger.error("Start node missing incoming_edges structure")
             return False
         
-        self.logger.debug(f"DAG structure validation passed for node: {start_node.node_id}")
+        if self.trace_debug:
+            self.logger.debug(f"DAG structure validation passed for node: {start_node.node_id}")
         return True
     
     def convert_paths_to_words(self, paths: List[List[Node]], 
@@ -2224,19 +2604,24 @@ class DAGPathEnumerator:
         Returns:
             List[str]: Mots correspondants aux chemins (même ordre)
         """
+        self._capture_trace_flags()
         if not paths:
-            self.logger.debug("Empty paths list for conversion")
+            if self.trace_debug:
+                self.logger.debug("Empty paths list for conversion")
             return []
         
         words = []
         conversion_errors = 0
-        cache_cleanup_threshold = 1000
         
-        # Cache cleanup périodique pour éviter memory leak
-        if len(self._word_cache) > cache_cleanup_threshold:
+        # Budget rétabli si insertions directes l'ont dépassé (store évince déjà en O(1))
+        if self._word_cache.over_budget():
             self._cleanup_word_cache()
         
-        self.logger.debug(f"Converting {len(paths)} paths to words for transaction {transaction_num}")
+        # Snapshot taxonomie applicable résolu une fois par batch
+        snapshot_mappings, mapping_version = self._resolve_word_cache_version(transaction_num)
+        
+        if self.trace_debug:
+            self.logger.debug(f"Converting {len(paths)} paths to words for transaction {transaction_num}")
         
         for path_index, path in enumerate(paths):
             try:
@@ -2246,19 +2631,23 @@ class DAGPathEnumerator:
                     conversion_errors += 1
                     continue
                 
-                # Génération clé cache optimisée
+                # Clé: identité chemin + version mappings applicable (partagée
+                # entre transactions tant qu'aucun compte du chemin n'est remappé)
                 path_key = tuple(node.node_id for node in path)
-                cache_key = (path_key, transaction_num)
+                if snapshot_mappings is not None and all(node_id in snapshot_mappings for node_id in path_key):
+                    cache_key = (path_key, mapping_version)
+                else:
+                    cache_key = (path_key, transaction_num)
                 
-                if cache_key in self._word_cache:
-                    word = self._word_cache[cache_key]
+                word = self._word_cache.lookup(cache_key)
+                if word is not None:
                     self.stats.cache_hits += 1
                 else:
                     # Conversion via taxonomy avec validation
                     word = self._convert_single_path_to_word(path, transaction_num)
                     
                     if word is not None:  # Seulement cache si success
-                        self._word_cache[cache_key] = word
+                        self._word_cache.store(cache_key, word)
                         self.stats.cache_misses += 1
                     else:
                         word = ""  # Fallback
@@ -2273,10 +2662,11 @@ class DAGPathEnumerator:
                 conversion_errors += 1
         
         # Logging résultats conversion
-        success_rate = ((len(paths) - conversion_errors) / len(paths)) * 100 if paths else 100
-        self.logger.info(f"Conversion completed: {len(words)} words generated, "
-                        f"success rate: {success_rate:.1f}% "
-                        f"({conversion_errors} errors)")
+        if self.trace_info:
+            success_rate = ((len(paths) - conversion_errors) / len(paths)) * 100 if paths else 100
+            self.logger.info(f"Conversion completed: {len(words)} words generated, "
+                            f"success rate: {success_rate:.1f}% "
+                            f"({conversion_errors} errors)")
         
         # Validation ordre préservé
         assert len(words) == len(paths), "Word count mismatch - order not preserved"
@@ -2343,29 +2733,30 @@ class DAGPathEnumerator:
             self.logger.error(f"Taxonomy conversion failed: {e}")
             return None
     
+    def _resolve_word_cache_version(self, transaction_num: int) -> Tuple[Optional[Dict[str, str]], Any]:
+        """
+        Mappings et version du snapshot taxonomie applicable à transaction_num
+        
+        Returns:
+            (account_mappings, ("taxonomy", mapping_version)), ou (None, None) si
+            taxonomie sans snapshots versionnés (clé cache par transaction_num)
+        """
+        get_snapshot = getattr(self.taxonomy, 'get_taxonomy_snapshot', None)
+        if get_snapshot is None:
+            return None, None
+        snapshot = get_snapshot(transaction_num)
+        if snapshot is None:
+            return None, None
+        return snapshot.account_mappings, ("taxonomy", snapshot.mapping_version)
+    
     def _cleanup_word_cache(self) -> None:
         """
-        Nettoyage cache mots avec stratégie LRU approximative
+        Nettoyage cache mots: éviction LRU jusqu'au budget entrées/octets
         """
-        initial_size = len(self._word_cache)
-        
-        if initial_size <= 500:  # Garde minimum
-            return
-        
-        # Strategy: Garder 70% des entrées (removal 30%)
-        target_size = int(initial_size * 0.7)
-        
-        # Simple cleanup: remove oldest entries (approximation LRU)
-        # Note: Vrai LRU nécessiterait OrderedDict, mais overhead pas justifié ici
-        cache_items = list(self._word_cache.items())
-        items_to_keep = cache_items[-target_size:] if target_size > 0 else []
-        
-        self._word_cache.clear()
-        self._word_cache.update(items_to_keep)
-        
-        cleaned_count = initial_size - len(self._word_cache)
-        self.logger.debug(f"Word cache cleanup: removed {cleaned_count} entries, "
-                        f"kept {len(self._word_cache)}")
+        cleaned_count = self._word_cache.trim()
+        if cleaned_count and self.trace_debug:
+            self.logger.debug(f"Word cache cleanup: removed {cleaned_count} entries, "
+                            f"kept {len(self._word_cache)}")
     
     def get_conversion_statistics(self) -> Dict[str, Any]:
         """
@@ -2382,7 +2773,8 @@ class DAGPathEnumerator:
             'cache_hit_rate_percent': round(cache_hit_rate, 1),
             'total_cache_hits': self.stats.cache_hits,
             'total_cache_misses': self.stats.cache_misses,
-            'estimated_memory_kb': len(self._word_cache) * 0.1  # Rough estimate
+            'word_cache_evictions': self._word_cache.stats['evictions'],
+            'estimated_memory_kb': self._word_cache.current_bytes / 1024
         }
     
     def enumerate_and_classify(self, transaction_edge: Edge, nfa: Any,
@@ -2412,6 +2804,7 @@ class DAGPathEnumerator:
         # Validation inputs rigoureuse
         if not self._validate_pipeline_inputs(transaction_edge, nfa, transaction_num):
             raise ValueError("Invalid pipeline inputs")
+        self._capture_trace_flags()
         
         # PHASE 2.9: PRÉ-CONDITION STRICTE - Taxonomie configurée pour transaction_num (si disponible)
         if hasattr(self.taxonomy, 'taxonomy_history') and self.taxonomy.taxonomy_history:
@@ -2429,7 +2822,7 @@ class DAGPathEnumerator:
                 # Note: Le système utilisera automatiquement le snapshot le plus récent via get_character_mapping()
         else:
             # Mock taxonomy ou pas d'historique - tolérance pour tests
-            self.logger.debug(f"Mock taxonomy detected or no history available - skipping strict validation")
+            self.logger.debug("Mock taxonomy detected or no history available - skipping strict validation")
             
         start_time = time.time()
         pipeline_stats = {
@@ -2444,17 +2837,18 @@ class DAGPathEnumerator:
         }
         
         path_classes = defaultdict(list)
-        all_paths = []
+        all_paths = CompactPathList(self.path_tree)
         
         try:
-            self.logger.info(f"Starting production pipeline for transaction {transaction_num}")
+            if self.trace_info:
+                self.logger.info(f"Starting production pipeline for transaction {transaction_num}")
             
             # PHASE 1: Énumération avec monitoring performance
             enum_start = time.time()
             self.logger.debug("Phase 1: Path enumeration starting")
             
-            for path in self.enumerate_paths_from_transaction(transaction_edge, transaction_num):
-                all_paths.append(path)
+            for entry in self._enumerate_path_entries(transaction_edge, transaction_num):
+                all_paths.append_entry(entry)
                 
                 # Performance monitoring énumération
                 if len(all_paths) % 100 == 0:
@@ -2467,12 +2861,17 @@ class DAGPathEnumerator:
             pipeline_stats['enumeration_time'] = time.time() - enum_start
             pipeline_stats['paths_enumerated'] = len(all_paths)
             
+            # Classes d'équivalence partagent l'arbre de préfixes de l'énumération
+            all_paths.tree = self.path_tree
+            path_classes = defaultdict(all_paths.empty_like)
+            
             if not all_paths:
                 self.logger.warning("No paths found during enumeration - pipeline termination")
                 return self._finalize_pipeline_results(dict(path_classes), pipeline_stats, start_time)
             
-            self.logger.info(f"Phase 1 complete: {len(all_paths)} paths enumerated in "
-                           f"{pipeline_stats['enumeration_time']:.2f}s")
+            if self.trace_info:
+                self.logger.info(f"Phase 1 complete: {len(all_paths)} paths enumerated in "
+                               f"{pipeline_stats['enumeration_time']:.2f}s")
             
             # PHASE 2: Conversion batch processing optimisé  
             conv_start = time.time()
@@ -2483,8 +2882,9 @@ class DAGPathEnumerator:
             pipeline_stats['conversion_time'] = time.time() - conv_start
             pipeline_stats['words_generated'] = len([w for w in words if w])
             
-            self.logger.info(f"Phase 2 complete: {pipeline_stats['words_generated']}/{len(words)} "
-                           f"words generated in {pipeline_stats['conversion_time']:.2f}s")
+            if self.trace_info:
+                self.logger.info(f"Phase 2 complete: {pipeline_stats['words_generated']}/{len(words)} "
+                               f"words generated in {pipeline_stats['conversion_time']:.2f}s")
             
             # PHASE 3: Classification avec validation NFA
             class_start = time.time()
@@ -2500,9 +2900,10 @@ class DAGPathEnumerator:
                 (classified_count / len(all_paths)) * 100 if all_paths else 0
             )
             
-            self.logger.info(f"Phase 3 complete: {classified_count}/{len(all_paths)} paths classified "
-                           f"({pipeline_stats['classification_rate']:.1f}%) in "
-                           f"{pipeline_stats['classification_time']:.2f}s")
+            if self.trace_info:
+                self.logger.info(f"Phase 3 complete: {classified_count}/{len(all_paths)} paths classified "
+                               f"({pipeline_stats['classification_rate']:.1f}%) in "
+                               f"{pipeline_stats['classification_time']:.2f}s")
             
             # PHASE 4: Validation output et finalisation
             validated_results = self._validate_and_finalize_results(
@@ -2559,7 +2960,8 @@ class DAGPathEnumerator:
         chunk_size = 50
         total_chunks = (len(all_paths) + chunk_size - 1) // chunk_size
         
-        self.logger.debug(f"Batch conversion: {len(all_paths)} paths in {total_chunks} chunks")
+        if self.trace_debug:
+            self.logger.debug(f"Batch conversion: {len(all_paths)} paths in {total_chunks} chunks")
         
         for chunk_idx in range(0, len(all_paths), chunk_size):
             chunk_start = time.time()
@@ -2595,15 +2997,30 @@ class DAGPathEnumerator:
             if target_nfa:
                 self.logger.debug("Hybrid dual-NFA mode: using both main and target NFAs for classification")
 
-        for path_idx, (path, word) in enumerate(zip(all_paths, words)):
+        # BATCH: un seul appel pour NFA principal + target NFA, mots dédupliqués
+        batch_results = None
+        if hasattr(nfa, 'classify_words_batch'):
+            try:
+                batch_results = nfa.classify_words_batch(word for word in words if word)
+            except Exception as batch_error:
+                self.logger.warning(f"Batch NFA classification failed, word-by-word fallback: {batch_error}")
+
+        # Chemins compacts: entrées arbre de préfixes, aucun List[Node] matérialisé
+        compact_paths = isinstance(all_paths, CompactPathList)
+        path_refs = all_paths.iter_entries() if compact_paths else all_paths
+
+        for path_idx, (path, word) in enumerate(zip(path_refs, words)):
             if not word:  # Skip conversion failures
                 continue
 
             try:
                 final_state_id = None
 
+                if batch_results is not None:
+                    final_state_id = batch_results.get(word)
+
                 # Try main NFA first
-                if hasattr(nfa, 'evaluate_to_final_state'):
+                elif hasattr(nfa, 'evaluate_to_final_state'):
                     final_state_id = nfa.evaluate_to_final_state(word)
                 elif hasattr(nfa, 'evaluate_word'):
                     result = nfa.evaluate_word(word)
@@ -2613,7 +3030,7 @@ class DAGPathEnumerator:
                     break
 
                 # HYBRID: If main NFA failed and target NFA available, try target NFA
-                if not final_state_id and target_nfa:
+                if not final_state_id and target_nfa and batch_results is None:
                     try:
                         if hasattr(target_nfa, 'evaluate_to_final_state'):
                             final_state_id = target_nfa.evaluate_to_final_state(word)
@@ -2621,18 +3038,22 @@ class DAGPathEnumerator:
                             result = target_nfa.evaluate_word(word)
                             final_state_id = result[0] if isinstance(result, tuple) else result
 
-                        if final_state_id:
+                        if final_state_id and self.trace_debug:
                             self.logger.debug(f"Word '{word}' classified by target NFA → {final_state_id}")
                     except Exception as target_error:
-                        self.logger.debug(f"Target NFA evaluation failed for '{word}': {target_error}")
+                        if self.trace_debug:
+                            self.logger.debug(f"Target NFA evaluation failed for '{word}': {target_error}")
 
                 if final_state_id:
-                    path_classes[final_state_id].append(path)
+                    if compact_paths:
+                        path_classes[final_state_id].append_entry(path)
+                    else:
+                        path_classes[final_state_id].append(path)
                     classified_count += 1
 
-                    if classified_count % 100 == 0:  # Progress logging
+                    if classified_count % 100 == 0 and self.trace_debug:  # Progress logging
                         self.logger.debug(f"Classified {classified_count}/{len(all_paths)} paths")
-                else:
+                elif self.trace_debug:
                     self.logger.debug(f"Path {path_idx} rejected by both NFAs: word='{word[:20]}...'")
 
             except Exception as e:
@@ -2664,13 +3085,14 @@ class DAGPathEnumerator:
         total_classified = sum(len(paths) for paths in path_classes.values())
         
         # Logging performance summary
-        self.logger.info(
-            f"PIPELINE COMPLETE - Total: {total_time:.2f}s | "
-            f"Enum: {pipeline_stats['enumeration_time']:.2f}s | "
-            f"Conv: {pipeline_stats['conversion_time']:.2f}s | "
-            f"Class: {pipeline_stats['classification_time']:.2f}s | "
-            f"Rate: {pipeline_stats['classification_rate']:.1f}%"
-        )
+        if self.trace_info:
+            self.logger.info(
+                f"PIPELINE COMPLETE - Total: {total_time:.2f}s | "
+                f"Enum: {pipeline_stats['enumeration_time']:.2f}s | "
+                f"Conv: {pipeline_stats['conversion_time']:.2f}s | "
+                f"Class: {pipeline_stats['classification_time']:.2f}s | "
+                f"Rate: {pipeline_stats['classification_rate']:.1f}%"
+            )
         
         # Performance warnings summary
         if pipeline_stats['performance_warnings']:
@@ -2718,6 +3140,8 @@ class DAGPathEnumerator:
         enum_stats = self.get_enumeration_statistics()
         conversion_stats = self.get_conversion_statistics()
         
+        path_cache_stats = self._path_cache.get_stats()
+        
         # Pipeline-specific metrics
         total_cache_operations = enum_stats.cache_hits + enum_stats.cache_misses
         overall_cache_hit_rate = (
@@ -2746,6 +3170,18 @@ class DAGPathEnumerator:
                 'estimated_memory_kb': conversion_stats['estimated_memory_kb']
             },
             
+            # Path Cache (LRU borné, versionné DAG/NFA)
+            'path_cache': {
+                'entries': path_cache_stats['entries'],
+                'bytes': path_cache_stats['bytes'],
+                'max_bytes': path_cache_stats['max_bytes'],
+                'hits': path_cache_stats['hits'],
+                'misses': path_cache_stats['misses'],
+                'evicted': path_cache_stats['evictions'],
+                'invalidated': path_cache_stats['invalidations'],
+                'hit_rate_percent': round(path_cache_stats['hit_rate'] * 100, 1)
+            },
+            
             # Overall Pipeline Metrics
             'pipeline': {
                 'overall_cache_hit_rate_percent': round(overall_cache_hit_rate, 1),
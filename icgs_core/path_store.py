@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Stockage compact des chemins énumérés - arbre de préfixes à pointeurs parents
+
+Chaque entrée de l'arbre = (index entrée parente, index nœud) dans deux
+array('i'): un chemin complet est l'index de sa dernière entrée (int) et
+partage son préfixe avec tous les chemins issus du même parcours DFS.
+Les objets Node ne sont reconstruits qu'à la demande (API List[List[Node]]).
+"""
+
+import sys
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
+
+from .dag_structures import Node
+
+
+# Entrée parente de la racine
+ROOT_ENTRY = -1
+
+
+class PathPrefixTree:
+    """
+    Arbre de préfixes des chemins d'une énumération
+
+    Les nœuds sont internés (node_id → index) dans une table unique;
+    une entrée occupe 8 octets (parent + nœud, int32).
+    """
+
+    def __init__(self):
+        self.nodes: List[Node] = []
+        self.node_index: Dict[str, int] = {}
+        self.parents = array('i')
+        self.node_indices = array('i')
+
+    def intern_node(self, node: Node) -> int:
+        """Index du nœud dans la table, ajouté si nouveau"""
+        index = self.node_index.get(node.node_id)
+        if index is None:
+            index = len(self.nodes)
+            self.node_index[node.node_id] = index
+            self.nodes.append(node)
+        return index
+
+    def extend(self, parent_entry: int, node: Node) -> int:
+        """Nouvelle entrée = préfixe parent_entry prolongé par node"""
+        self.parents.append(parent_entry)
+        self.node_indices.append(self.intern_node(node))
+        return len(self.parents) - 1
+
+    def node_index_path(self, entry: int) -> List[int]:
+        """Indices nœuds du chemin (ordre racine → entrée)"""
+        indices = []
+        parents, node_indices = self.parents, self.node_indices
+        while entry != ROOT_ENTRY:
+            indices.append(node_indices[entry])
+            entry = parents[entry]
+        indices.reverse()
+        return indices
+
+    def materialize(self, entry: int) -> List[Node]:
+        """Reconstruit List[Node] du chemin (API legacy)"""
+        nodes = self.nodes
+        return [nodes[index] for index in self.node_index_path(entry)]
+
+    def path_node_ids(self, entry: int) -> List[str]:
+        """node_id du chemin sans matérialiser de liste de Node"""
+        nodes = self.nodes
+        return [nodes[index].node_id for index in self.node_index_path(entry)]
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def memory_bytes(self) -> int:
+        """Taille arrays entrées (hors table nœuds partagée)"""
+        return (self.parents.itemsize * len(self.parents) +
+                self.node_indices.itemsize * len(self.node_indices))
+
+
+class CompactPathList(Sequence):
+    """
+    Liste de chemins adossée à un PathPrefixTree
+
+    Stocke un int par chemin. Indexation et itération matérialisent
+    les List[Node] à la demande: utilisable partout où List[List[Node]]
+    est seulement parcourue (len, for, index).
+    """
+
+    def __init__(self, tree: PathPrefixTree, entries: Optional[array] = None):
+        self.tree = tree
+        self.entries = entries if entries is not None else array('i')
+
+    def append_entry(self, entry: int) -> None:
+        self.entries.append(entry)
+
+    def iter_entries(self) -> Iterator[int]:
+        return iter(self.entries)
+
+    def empty_like(self) -> 'CompactPathList':
+        """Liste vide sur le même arbre (classes d'équivalence)"""
+        return CompactPathList(self.tree)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self.tree.materialize(entry) for entry in self.entries[index]]
+        return self.tree.materialize(self.entries[index])
+
+    def __iter__(self) -> Iterator[List[Node]]:
+        materialize = self.tree.materialize
+        for entry in self.entries:
+            yield materialize(entry)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactPathList):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactPathList(paths={len(self.entries)}, tree_entries={len(self.tree)})"
+
+
+class PathLRUCache(OrderedDict):
+    """
+    Cache LRU borné en octets des énumérations (clé → CompactPathList)
+
+    Clé = (nœud départ, source transaction, version structurelle DAG,
+    version NFA, max_paths). Versionné par le DAG (advance_versions à chaque
+    modification structurelle), les entrées dont l'arbre ne contient aucune
+    extrémité de l'arête ajoutée sont reportées sur la nouvelle version:
+    une énumération reverse ne lit que les arêtes des nœuds de son arbre.
+    Sans version DAG (énumérateur autonome), transaction_num remplace la
+    version comme avant: pas de partage entre transactions.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.dag_version: Optional[int] = None
+        self.nfa_version: Optional[int] = None
+        self.current_bytes = 0
+        # key → (octets, start_id, source_id, max_paths, versions DAG/NFA au stockage)
+        self._entry_info: Dict[str, Tuple[int, str, str, int, Tuple]] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'invalidations': 0,
+            'carried_over': 0,
+            'rejected_oversize': 0
+        }
+
+    def make_key(self, start_id: str, source_id: str, transaction_num: int, max_paths: int) -> str:
+        if self.dag_version is None:
+            version_token = f"tx{transaction_num}"
+        else:
+            version_token = f"v{self.dag_version}.{self.nfa_version}"
+        return f"{start_id}_{source_id}_{version_token}_{max_paths}"
+
+    @staticmethod
+    def estimate_bytes(paths: CompactPathList) -> int:
+        """Arrays arbre + entrées + table nœuds (Node partagés non comptés)"""
+        tree = paths.tree
+        return (tree.memory_bytes() + paths.entries.itemsize * len(paths.entries) +
+                sys.getsizeof(tree.nodes) + sys.getsizeof(tree.node_index))
+
+    def lookup(self, key: str) -> Optional[CompactPathList]:
+        paths = self.get(key)
+        if paths is None:
+            self.stats['misses'] += 1
+            return None
+        self.move_to_end(key)
+        self.stats['hits'] += 1
+        return paths
+
+    def store(self, key: str, paths: CompactPathList, start_id: str,
+              source_id: str, max_paths: int) -> bool:
+        """Insère (MRU) puis évince les entrées LRU au-delà du budget"""
+        size = self.estimate_bytes(paths)
+        if size > self.max_bytes:
+            self.stats['rejected_oversize'] += 1
+            return False
+        if key in self:
+            self._remove(key)
+        self[key] = paths
+        self._entry_info[key] = (size, start_id, source_id, max_paths,
+                                 (self.dag_version, self.nfa_version))
+        self.current_bytes += size
+        self.stats['stores'] += 1
+        while self.current_bytes > self.max_bytes:
+            self._remove(next(iter(self)))
+            self.stats['evictions'] += 1
+        return True
+
+    def advance_versions(self, dag_version: int, nfa_version: Optional[int] = None,
+                         touched_node_ids: Iterable[str] = ()) -> int:
+        """
+        Passage à une nouvelle version DAG/NFA
+
+        Invalide les entrées dont l'arbre contient un nœud touché
+        (extrémités de l'arête ajoutée), reporte les autres sous la
+        nouvelle clé en conservant l'ordre LRU.
+
+        Returns:
+            Nombre d'entrées invalidées
+        """
+        touched = set(touched_node_ids)
+        current = (self.dag_version, self.nfa_version)
+        carried = []
+        invalidated = 0
+        for key, paths in self.items():
+            size, start_id, source_id, max_paths, versions = self._entry_info[key]
+            # Entrées non versionnées (tx) ou d'une version antérieure: jamais reportées
+            if (current[0] is None or versions != current or
+                    any(node_id in paths.tree.node_index for node_id in touched)):
+                invalidated += 1
+            else:
+                carried.append((paths, size, start_id, source_id, max_paths))
+
+        self.clear()
+        self.dag_version, self.nfa_version = dag_version, nfa_version
+        for paths, size, start_id, source_id, max_paths in carried:
+            key = self.make_key(start_id, source_id, 0, max_paths)
+            self[key] = paths
+            self._entry_info[key] = (size, start_id, source_id, max_paths, (dag_version, nfa_version))
+            self.current_bytes += size
+
+        self.stats['invalidations'] += invalidated
+        self.stats['carried_over'] += len(carried)
+        return invalidated
+
+    def clear(self) -> None:
+        super().clear()
+        self._entry_info.clear()
+        self.current_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        del self[key]
+        self.current_bytes -= self._entry_info.pop(key)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
+
+
+class WordLRUCache(OrderedDict):
+    """
+    Cache LRU mots (clé chemin → mot) borné en entrées et en octets
+
+    Clé = (tuple node_id, version taxonomie applicable). lookup/store en
+    O(1): un hit déplace l'entrée en fin (MRU), un store évince par la
+    tête (LRU) jusqu'à revenir dans le budget. Les insertions directes
+    (cache[key] = word) sont comptabilisées sans éviction; trim() rétablit
+    le budget.
+    """
+
+    # Surcoût estimé par entrée (nœud OrderedDict + slot dict + tuple clé)
+    ENTRY_OVERHEAD_BYTES = 120
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 4 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        super().__init__()
+
+    @classmethod
+    def entry_bytes(cls, word: str) -> int:
+        return cls.ENTRY_OVERHEAD_BYTES + sys.getsizeof(word)
+
+    def __setitem__(self, key: Any, word: str) -> None:
+        if key in self:
+            self.current_bytes -= self.entry_bytes(super().__getitem__(key))
+        super().__setitem__(key, word)
+        self.current_bytes += self.entry_bytes(word)
+
+    def __delitem__(self, key: Any) -> None:
+        self.current_bytes -= self.entry_bytes(super().__getitem__(key))
+        super().__delitem__(key)
+
+    def popitem(self, last: bool = True) -> Tuple[Any, str]:
+        key, word = super().popitem(last)
+        self.current_bytes -= self.entry_bytes(word)
+        return key, word
+
+    def clear(self) -> None:
+        super().clear()
+        self.current_bytes = 0
+
+    def over_budget(self) -> bool:
+        return len(self) > self.max_entries or self.current_bytes > self.max_bytes
+
+    def lookup(self, key: Any) -> Optional[str]:
+        word = self.get(key)
+        if word is None:
+            self.stats['misses'] += 1
+            return None
+        self.move_to_end(key)
+        self.stats['hits'] += 1
+        return word
+
+    def store(self, key: Any, word: str) -> None:
+        self[key] = word
+        self.stats['stores'] += 1
+        self.trim()
+
+    def trim(self) -> int:
+        """Éviction LRU jusqu'au budget, retourne nombre d'entrées évincées"""
+        evicted = 0
+        while self and self.over_budget():
+            self.popitem(last=False)
+            evicted += 1
+        self.stats['evictions'] += evicted
+        return evicted
@@ -0,0 +1,181 @@
+"""
+ReachabilityIndex - Index Incrémental Ancêtres/Descendants DAG
+
+Le DAG ne gagne qu'une arête par commit transaction: au lieu de re-parcourir le graphe
+depuis le sink à chaque validation, l'index maintient la fermeture transitive sous forme
+de bitsets (int Python) indexés par un identifiant dense de nœud:
+
+    ancestors[i]   = nœuds pouvant atteindre i (direction edge source → target)
+    descendants[i] = nœuds atteignables depuis i
+
+Ajout arête u → v: seuls v et ses descendants gagnent les ancêtres de u (et u lui-même),
+seuls u et ses ancêtres gagnent les descendants de v. Le coût dépend du nombre de nœuds
+affectés par le changement et non de la taille du graphe.
+
+Requêtes O(1) (test bit / masque):
+- can_reach_source(node): la traversal reverse depuis node peut-elle aboutir à une source
+- can_feed(ancestor_id, node_id): ancestor_id alimente-t-il node_id
+- ancestor_mask(node_id): masque complet ancêtres (décodage via ancestors_of)
+"""
+
+from typing import Dict, List, Set, Any, Iterable
+import logging
+
+from .dag_structures import Node, Edge
+
+logger = logging.getLogger(__name__)
+
+
+class ReachabilityIndex:
+    """
+    Index ancêtres/descendants maintenu incrémentalement par bitsets
+
+    Les arêtes suivies doivent être celles présentes dans node.incoming_edges;
+    le degré entrant indexé permet de détecter un nœud modifié hors index (stale),
+    auquel cas les requêtes de pruning restent conservatrices.
+    """
+
+    def __init__(self):
+        self.node_index: Dict[str, int] = {}
+        self.nodes: List[Node] = []
+        self.ancestors: List[int] = []
+        self.descendants: List[int] = []
+        self.in_degree: List[int] = []
+        self.source_mask: int = 0  # Nœuds sans arête entrante
+        self.edge_ids: Set[str] = set()
+        self.version: int = 0
+
+        self.stats = {
+            'nodes_indexed': 0,
+            'edges_indexed': 0,
+            'incremental_updates': 0,
+            'nodes_touched': 0,
+            'full_rebuilds': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.node_index
+
+    def add_node(self, node: Node) -> int:
+        """Enregistre nœud (idempotent) et retourne son index dense"""
+        index = self.node_index.get(node.node_id)
+        if index is not None:
+            return index
+
+        index = len(self.nodes)
+        self.node_index[node.node_id] = index
+        self.nodes.append(node)
+        self.ancestors.append(0)
+        self.descendants.append(0)
+        self.in_degree.append(0)
+        self.source_mask |= 1 << index
+        self.stats['nodes_indexed'] += 1
+        self.version += 1
+        return index
+
+    def add_edge(self, edge: Edge) -> bool:
+        """
+        Mise à jour incrémentale fermeture transitive pour arête source → target
+
+        Returns:
+            True si arête ajoutée, False si déjà indexée
+        """
+        if edge.edge_id in self.edge_ids:
+            return False
+
+        source_index = self.add_node(edge.source_node)
+        target_index = self.add_node(edge.target_node)
+        self.edge_ids.add(edge.edge_id)
+
+        self.in_degree[target_index] += 1
+        self.source_mask &= ~(1 << target_index)
+
+        # Ancêtres gagnés par target et ses descendants
+        gained_ancestors = self.ancestors[source_index] | (1 << source_index)
+        touched = 0
+        for index in self._iter_bits(self.descendants[target_index] | (1 << target_index)):
+            if gained_ancestors & ~self.ancestors[index]:
+                self.ancestors[index] |= gained_ancestors
+                touched += 1
+
+        # Descendants gagnés par source et ses ancêtres
+        gained_descendants = self.descendants[target_index] | (1 << target_index)
+        for index in self._iter_bits(self.ancestors[source_index] | (1 << source_index)):
+            if gained_descendants & ~self.descendants[index]:
+                self.descendants[index] |= gained_descendants
+                touched += 1
+
+        self.stats['edges_indexed'] += 1
+        self.stats['incremental_updates'] += 1
+        self.stats['nodes_touched'] += touched
+        self.version += 1
+        return True
+
+    def rebuild(self, nodes: Iterable[Node], edges: Iterable[Edge]) -> None:
+        """Reconstruction complète depuis collections DAG"""
+        full_rebuilds = self.stats['full_rebuilds']
+        self.__init__()
+        self.stats['full_rebuilds'] = full_rebuilds + 1
+        for node in nodes:
+            self.add_node(node)
+        for edge in edges:
+            if edge.edge_id in edge.target_node.incoming_edges:
+                self.add_edge(edge)
+
+    def is_current(self, node: Node) -> bool:
+        """Nœud indexé et degré entrant cohérent avec structure Node"""
+        index = self.node_index.get(node.node_id)
+        return index is not None and self.in_degree[index] == len(node.incoming_edges)
+
+    def can_reach_source(self, node: Node) -> bool:
+        """
+        Traversal reverse depuis node peut-elle aboutir à un nœud source
+
+        Conservateur: True pour nœud inconnu ou non synchronisé avec l'index.
+        """
+        if not self.is_current(node):
+            return True
+        index = self.node_index[node.node_id]
+        return bool(self.source_mask & ((1 << index) | self.ancestors[index]))
+
+    def can_feed(self, ancestor_id: str, node_id: str) -> bool:
+        """Test O(1): ancestor_id atteint node_id via arêtes DAG"""
+        ancestor_index = self.node_index.get(ancestor_id)
+        node_index = self.node_index.get(node_id)
+        if ancestor_index is None or node_index is None:
+            return False
+        return bool(self.ancestors[node_index] >> ancestor_index & 1)
+
+    def ancestor_mask(self, node_id: str) -> int:
+        """Masque bitset ancêtres (0 si nœud inconnu)"""
+        index = self.node_index.get(node_id)
+        return self.ancestors[index] if index is not None else 0
+
+    def ancestors_of(self, node_id: str) -> Set[str]:
+        """Identifiants des nœuds ancêtres de node_id"""
+        return {self.nodes[index].node_id for index in self._iter_bits(self.ancestor_mask(node_id))}
+
+    def descendants_of(self, node_id: str) -> Set[str]:
+        """Identifiants des nœuds descendants de node_id"""
+        index = self.node_index.get(node_id)
+        if index is None:
+            return set()
+        return {self.nodes[i].node_id for i in self._iter_bits(self.descendants[index])}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Statistiques index pour monitoring"""
+        stats = dict(self.stats)
+        stats['version'] = self.version
+        stats['source_nodes'] = bin(self.source_mask).count('1')
+        return stats
+
+    @staticmethod
+    def _iter_bits(mask: int):
+        """Indices des bits positionnés dans mask"""
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
@@ -0,0 +1,1132 @@
+"""
+BoundedRevisedSimplex - Simplex Révisé Borné avec Certificat Exact
+
+Moteur LP utilisé par TripleValidationOrientedSimplex:
+- Formulation bornée: A x - r = 0, l ≤ (x, r) ≤ u où r = activité des contraintes
+  (LEQ: r ≤ b, GEQ: r ≥ b, EQ: r = b). Base initiale = variables lignes (B = -I).
+- Phase 1: minimisation somme des infaisabilités (coûts ±1 sur variables de base hors bornes)
+- Phase 2: minimisation objectif depuis base faisable, ratio test borné avec bound flips
+- Pivots en arithmétique flottante: factorisation LU dense (pivot partiel) + fichier eta
+  (forme produit), refactorisation toutes les refactor_frequency mises à jour
+- Arithmétique de pivot choisie par NumericBackend (float, fraction, scaled_integer)
+- Vérification exacte (Fraction) de la base finale → certificat:
+    PRIMAL_POINT: point satisfaisant exactement contraintes et bornes (+ faisabilité duale)
+    FARKAS_RAY: multiplicateurs y avec max_{l≤z≤u} (y·[A | -I]) z < 0
+- Fallback arithmétique exacte depuis la base flottante si la vérification échoue
+- Warm-start: SimplexBasis (labels base + factorisation) réinstallée sur le LP suivant;
+  si seules bornes/RHS changent, factorisation réutilisée et Simplex dual borné
+  (la base reste duale-faisable, seule la faisabilité primale est à restaurer)
+- Analyse paramétrique RHS exacte (b + t·d): valeur optimale linéaire par morceaux,
+  points de rupture = changements de base (pivots duals)
+
+Note: la vitesse vient des pivots flottants, les garanties absolues du certificat exact.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple, Any, Union
+import logging
+
+from .linear_programming import LinearProgram, ConstraintType
+from .numeric_backend import NumericBackend, get_numeric_backend
+from .exceptions import SingularBasisError
+
+logger = logging.getLogger(__name__)
+
+INFINITY = float('inf')
+ROW_LABEL_PREFIX = "__row_"
+
+
+def fraction_to_decimal(value: Fraction) -> Decimal:
+    """Conversion Fraction → Decimal (précision contexte Decimal courant)"""
+    return Decimal(value.numerator) / Decimal(value.denominator)
+
+
+class BasisFactorization:
+    """
+    Factorisation base P·B = L·U (LU dense, pivot partiel) + fichier eta
+
+    Chaque pivot ajoute une matrice eta (forme produit) au lieu de refactoriser;
+    factorize() est rappelé toutes les refactor_frequency mises à jour.
+    Générique sur le type numérique: float (tolérance pivot) ou Fraction (tolérance 0).
+    """
+
+    def __init__(self, size: int, zero: Any, pivot_tolerance: Any, refactor_frequency: int = 20):
+        self.size = size
+        self.zero = zero
+        self.pivot_tolerance = pivot_tolerance
+        self.refactor_frequency = refactor_frequency
+        self.lu: List[List[Any]] = []
+        self.permutation: List[int] = list(range(size))
+        self.etas: List[Tuple[int, List[Any]]] = []
+        self.factorizations = 0
+
+    def factorize(self, columns: List[Dict[int, Any]]) -> None:
+        """
+        LU dense de la base dont columns[k] est la colonne (creuse) en position k
+
+        Raises:
+            SingularBasisError: Si pivot ≤ pivot_tolerance
+        """
+        size = self.size
+        lu = [[self.zero] * size for _ in range(size)]
+        for position, column in enumerate(columns):
+            for row, value in column.items():
+                lu[row][position] = value
+
+        permutation = list(range(size))
+        for k in range(size):
+            pivot_row = max(range(k, size), key=lambda i: abs(lu[i][k]))
+            if abs(lu[pivot_row][k]) <= self.pivot_tolerance:
+                raise SingularBasisError(f"Singular basis at position {k}")
+            if pivot_row != k:
+                lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+                permutation[k], permutation[pivot_row] = permutation[pivot_row], permutation[k]
+
+            row_k = lu[k]
+            pivot = row_k[k]
+            for i in range(k + 1, size):
+                row_i = lu[i]
+                if row_i[k]:
+                    factor = row_i[k] / pivot
+                    row_i[k] = factor
+                    for j in range(k + 1, size):
+                        if row_k[j]:
+                            row_i[j] -= factor * row_k[j]
+
+        self.lu = lu
+        self.permutation = permutation
+        self.etas = []
+        self.factorizations += 1
+
+    def update(self, position: int, entering_column: List[Any]) -> None:
+        """Mise à jour forme produit: colonne B^{-1}a_q entre en position"""
+        self.etas.append((position, list(entering_column)))
+
+    def copy(self) -> 'BasisFactorization':
+        """Copie légère: LU partagé (jamais modifié en place), fichier eta dupliqué"""
+        clone = BasisFactorization(self.size, self.zero, self.pivot_tolerance, self.refactor_frequency)
+        clone.lu = self.lu
+        clone.permutation = list(self.permutation)
+        clone.etas = list(self.etas)
+        return clone
+
+    def needs_refactorization(self) -> bool:
+        return len(self.etas) >= self.refactor_frequency
+
+    def ftran(self, rhs: List[Any]) -> List[Any]:
+        """Résout B w = rhs"""
+        size, lu = self.size, self.lu
+        x = [rhs[p] for p in self.permutation]
+
+        for i in range(size):
+            row, total = lu[i], x[i]
+            for j in range(i):
+                if row[j]:
+                    total -= row[j] * x[j]
+            x[i] = total
+
+        for i in reversed(range(size)):
+            row, total = lu[i], x[i]
+            for j in range(i + 1, size):
+                if row[j]:
+                    total -= row[j] * x[j]
+            x[i] = total / row[i]
+
+        for position, eta in self.etas:
+            pivot_value = x[position]
+            if pivot_value:
+                pivot_value = pivot_value / eta[position]
+                for i in range(size):
+                    if i != position and eta[i]:
+                        x[i] -= eta[i] * pivot_value
+                x[position] = pivot_value
+        return x
+
+    def btran(self, rhs: List[Any]) -> List[Any]:
+        """Résout y B = rhs"""
+        size, lu = self.size, self.lu
+        y = list(rhs)
+
+        for position, eta in reversed(self.etas):
+            total = y[position]
+            for i in range(size):
+                if i != position and eta[i]:
+                    total -= y[i] * eta[i]
+            y[position] = total / eta[position]
+
+        # s U = y
+        for j in range(size):
+            total = y[j]
+            for i in range(j):
+                if lu[i][j]:
+                    total -= y[i] * lu[i][j]
+            y[j] = total / lu[j][j]
+
+        # t L = s (L unitaire)
+        for i in reversed(range(size)):
+            total = y[i]
+            for j in range(i + 1, size):
+                if lu[j][i]:
+                    total -= y[j] * lu[j][i]
+            y[i] = total
+
+        result = [self.zero] * size
+        for k, original_row in enumerate(self.permutation):
+            result[original_row] = y[k]
+        return result
+
+
+@dataclass
+class SimplexCertificate:
+    """
+    Certificat exact (Fraction) du résultat Simplex
+
+    - PRIMAL_POINT: primal_point satisfait exactement contraintes et bornes;
+      dual_feasible=True si coûts réduits exacts prouvent l'optimalité (Phase 2)
+    - FARKAS_RAY: farkas_multipliers y (un par contrainte) avec
+      farkas_bound = max_{l≤z≤u} (y·[A | -I]) z < 0, donc aucun point faisable
+    """
+    certificate_type: str
+    verified: bool = False
+    primal_point: Dict[str, Fraction] = field(default_factory=dict)
+    farkas_multipliers: List[Fraction] = field(default_factory=list)
+    farkas_bound: Optional[Fraction] = None
+    dual_feasible: bool = False
+    objective_value: Optional[Fraction] = None
+    basis: List[str] = field(default_factory=list)
+    nonbasic_at_upper: List[str] = field(default_factory=list)
+    arithmetic: str = "float"
+
+
+@dataclass
+class SimplexBasis:
+    """
+    Base finale persistée pour warm-start du LP suivant
+
+    column_signature identifie la structure [A | -I] (labels + coefficients exacts):
+    signature identique ⇒ seuls bornes/RHS ont changé, la factorisation est réutilisable.
+    reference_pivots et objective sont renseignés par le solveur appelant.
+    """
+    basic_labels: List[str]
+    nonbasic_at_upper: List[str]
+    column_signature: Tuple
+    factorization: Optional[BasisFactorization] = None
+    exact: bool = False
+    reference_pivots: int = 0  # Pivots Phase 1 cold-start de référence pour cette structure
+    objective: Optional[Dict[str, Decimal]] = None  # Objectif pour lequel la base est optimale
+
+
+@dataclass
+class RevisedSimplexResult:
+    """Résultat moteur révisé: statut, certificat exact et métriques pivots"""
+    status: str  # FEASIBLE, OPTIMAL, INFEASIBLE, UNBOUNDED, MAX_ITERATIONS, NUMERICAL_ERROR
+    certificate: Optional[SimplexCertificate] = None
+    phase1_iterations: int = 0
+    phase2_iterations: int = 0
+    dual_iterations: int = 0
+    bound_flips: int = 0
+    refactorizations: int = 0
+    exact_fallback_used: bool = False
+    warm_start_accepted: bool = False
+    factorization_reused: bool = False
+    final_basis: Optional[SimplexBasis] = None
+
+    @property
+    def iterations(self) -> int:
+        return self.phase1_iterations + self.phase2_iterations + self.dual_iterations
+
+    @property
+    def values(self) -> Dict[str, Fraction]:
+        """Point primal exact (vide si pas de certificat primal vérifié)"""
+        if self.certificate and self.certificate.verified and self.certificate.certificate_type == "PRIMAL_POINT":
+            return self.certificate.primal_point
+        return {}
+
+
+@dataclass
+class ParametricRHSResult:
+    """
+    Valeur optimale z(t) du LP de RHS b + t·d, linéaire par morceaux sur [0, end]
+
+    Segment i couvre [breakpoints[i], breakpoints[i+1]] (dernier: jusqu'à end),
+    z(t) = values[i] + slopes[i] × (t - breakpoints[i]). Tout exact (Fraction).
+    """
+    status: str  # OPTIMAL, MAX_ITERATIONS, NUMERICAL_ERROR
+    breakpoints: List[Fraction] = field(default_factory=list)
+    values: List[Fraction] = field(default_factory=list)
+    slopes: List[Fraction] = field(default_factory=list)
+    end: Fraction = Fraction(0)
+    basis_changes: int = 0
+    infeasible_beyond: bool = False  # LP infaisable juste après end
+
+
+class BoundedRevisedSimplex:
+    """
+    Simplex révisé borné sur LinearProgram
+
+    Une instance = un problème. solve() exécute Phase 1 (+ Phase 2 si objectif),
+    certifie la base finale en arithmétique exacte et bascule sur un re-solve exact
+    depuis cette base si la certification flottante échoue.
+    """
+
+    BLAND_THRESHOLD = 50  # Pivots dégénérés consécutifs avant règle de Bland
+
+    def __init__(self, problem: LinearProgram, max_iterations: int = 10000,
+                 tolerance: float = 1e-9, refactor_frequency: int = 20, exact: bool = False,
+                 backend: Union[str, NumericBackend, None] = None,
+                 rhs_shift: Optional[Dict[int, Fraction]] = None):
+        """
+        Args:
+            problem: Problème LP (variables bornées + contraintes LEQ/GEQ/EQ)
+            max_iterations: Limite pivots (Phase 1 + Phase 2)
+            tolerance: Tolérance flottante faisabilité/optimalité (ignorée si exact)
+            refactor_frequency: Nombre mises à jour eta avant refactorisation LU
+            exact: Arithmétique Fraction (tolérances nulles), raccourci backend="fraction"
+            backend: NumericBackend ou nom (float, fraction, scaled_integer), prioritaire sur exact
+            rhs_shift: Index contrainte → décalage exact ajouté au RHS (non mis à l'échelle),
+                pour des RHS non représentables en Decimal (ex. 84/11)
+        """
+        self.problem = problem
+        self.rhs_shift = dict(rhs_shift) if rhs_shift else {}
+        self.max_iterations = max_iterations
+        self.refactor_frequency = refactor_frequency
+        self.backend = get_numeric_backend(backend or ("fraction" if exact else "float"))
+        self.exact = self.backend.exact
+        self.tolerance, self.pivot_tolerance = self.backend.tolerances(tolerance)
+        self._num = self.backend.number
+        self.zero = self._num(0)
+
+        self.variable_ids = list(problem.variables.keys())
+        self.num_structural = len(self.variable_ids)
+        self.num_rows = len(problem.constraints)
+        self.labels = self.variable_ids + [f"{ROW_LABEL_PREFIX}{i}" for i in range(self.num_rows)]
+        self.label_index = {label: j for j, label in enumerate(self.labels)}
+
+        # Colonnes exactes [A | -I] et bornes exactes (None = infini)
+        variable_position = {var_id: j for j, var_id in enumerate(self.variable_ids)}
+        self.exact_columns: List[Dict[int, Fraction]] = [{} for _ in self.labels]
+        self.exact_lower: List[Optional[Fraction]] = []
+        self.exact_upper: List[Optional[Fraction]] = []
+
+        for var_id in self.variable_ids:
+            variable = problem.variables[var_id]
+            self.exact_lower.append(Fraction(variable.lower_bound) if variable.lower_bound is not None else None)
+            self.exact_upper.append(Fraction(variable.upper_bound) if variable.upper_bound is not None else None)
+
+        # Lignes (coefficients + RHS) × row_scale: ensemble faisable en x inchangé
+        compiled = problem.compile_constraints()
+        self.row_scale = self.backend.row_scale(compiled)
+        for i in range(self.num_rows):
+            for var_id, coeff in compiled.row_entries(i):
+                if coeff:
+                    self.exact_columns[variable_position[var_id]][i] = Fraction(coeff) * self.row_scale
+            self.exact_columns[self.num_structural + i][i] = Fraction(-1)
+
+            bound = (Fraction(compiled.exact_bounds[i]) + self.rhs_shift.get(i, 0)) * self.row_scale
+            constraint_type = compiled.constraint_types[i]
+            if constraint_type == ConstraintType.LEQ:
+                self.exact_lower.append(None)
+                self.exact_upper.append(bound)
+            elif constraint_type == ConstraintType.GEQ:
+                self.exact_lower.append(bound)
+                self.exact_upper.append(None)
+            else:
+                self.exact_lower.append(bound)
+                self.exact_upper.append(bound)
+
+        # Copies arithmétique de travail
+        num = self._num
+        self.columns = [{row: num(value) for row, value in column.items()} for column in self.exact_columns]
+        self.lower = [num(v) if v is not None else -INFINITY for v in self.exact_lower]
+        self.upper = [num(v) if v is not None else INFINITY for v in self.exact_upper]
+
+        self.factorization = BasisFactorization(self.num_rows, self.zero, self.pivot_tolerance,
+                                                refactor_frequency)
+        self.basis: List[int] = []
+        self.in_basis: List[bool] = [False] * len(self.labels)
+        self.at_upper: List[bool] = [False] * len(self.labels)
+        self.x: List[Any] = [self.zero] * len(self.labels)
+        self.costs: List[Any] = [self.zero] * len(self.labels)
+
+        self.bland_mode = False
+        self.degenerate_streak = 0
+        self.bound_flips = 0
+        self._column_signature: Optional[Tuple] = None
+
+    # ------------------------------------------------------------------
+    # Pipeline principal
+    # ------------------------------------------------------------------
+
+    def solve(self, objective: Optional[Dict[str, Decimal]] = None,
+              initial_basis: Optional[List[str]] = None,
+              nonbasic_at_upper: Optional[List[str]] = None,
+              warm_basis: Optional[SimplexBasis] = None) -> RevisedSimplexResult:
+        """
+        Résolution Phase 1 (+ Phase 2 si objectif) avec certificat exact
+
+        Args:
+            objective: Coefficients minimisation var_id → coût (None = faisabilité seule)
+            initial_basis: Labels variables de base de départ (base lignes si None/invalide)
+            nonbasic_at_upper: Labels variables hors base positionnées à leur borne supérieure
+            warm_basis: Base persistée d'un LP précédent (prioritaire sur initial_basis)
+
+        Returns:
+            RevisedSimplexResult avec certificat vérifié si possible
+        """
+        result = RevisedSimplexResult(status="FEASIBLE")
+        if warm_basis is not None:
+            result.warm_start_accepted, result.factorization_reused = self._install_warm_basis(warm_basis)
+        else:
+            self._install_basis(initial_basis, nonbasic_at_upper)
+
+        if result.warm_start_accepted:
+            # Simplex dual depuis base persistée: coûts de l'objectif courant, sinon de
+            # celui pour lequel la base était optimale (reste proche de l'optimum)
+            self._load_costs(objective or warm_basis.objective)
+            if not self._is_dual_feasible():
+                self._load_costs(None)
+            dual_status, result.dual_iterations = self._dual_iterate()
+            if dual_status == "NUMERICAL_ERROR":
+                self._install_basis(None, None)
+            self._load_costs(None)
+
+        status, result.phase1_iterations = self._iterate(phase=1)
+        if status == "FEASIBLE" and objective:
+            self._load_costs(objective)
+            status, result.phase2_iterations = self._iterate(phase=2)
+
+        result.status = status
+        result.bound_flips = self.bound_flips
+        result.refactorizations = self.factorization.factorizations
+
+        if status in ("MAX_ITERATIONS", "NUMERICAL_ERROR"):
+            return result
+
+        result.certificate = self.certify(objective)
+        if not self._certificate_confirms(result) and not self.exact:
+            logger.info("Float basis failed exact certification - exact re-solve from float basis")
+            exact_engine = BoundedRevisedSimplex(self.problem, self.max_iterations,
+                                                 refactor_frequency=self.refactor_frequency,
+                                                 backend="fraction", rhs_shift=self.rhs_shift)
+            exact_result = exact_engine.solve(objective, *self.get_basis())
+            exact_result.phase1_iterations += result.phase1_iterations
+            exact_result.phase2_iterations += result.phase2_iterations
+            exact_result.dual_iterations += result.dual_iterations
+            exact_result.refactorizations += result.refactorizations
+            exact_result.bound_flips += result.bound_flips
+            exact_result.exact_fallback_used = True
+            exact_result.warm_start_accepted = result.warm_start_accepted
+            exact_result.factorization_reused = result.factorization_reused
+            return exact_result
+
+        result.final_basis = self.snapshot_basis()
+        return result
+
+    def _certificate_confirms(self, result: RevisedSimplexResult) -> bool:
+        """Certificat exact cohérent avec le statut flottant"""
+        certificate = result.certificate
+        if certificate is None or not certificate.verified:
+            return False
+        if result.status == "INFEASIBLE":
+            return certificate.certificate_type == "FARKAS_RAY"
+        if certificate.certificate_type != "PRIMAL_POINT":
+            return False
+        return result.status != "OPTIMAL" or certificate.dual_feasible
+
+    def get_basis(self) -> Tuple[List[str], List[str]]:
+        """(labels base, labels hors base à borne supérieure) pour warm-start ultérieur"""
+        basis_labels = [self.labels[j] for j in self.basis]
+        at_upper_labels = [self.labels[j] for j in range(len(self.labels))
+                           if not self.in_basis[j] and self.at_upper[j]]
+        return basis_labels, at_upper_labels
+
+    @property
+    def column_signature(self) -> Tuple:
+        """Empreinte structure [A | -I]: labels + colonnes structurelles exactes"""
+        if self._column_signature is None:
+            self._column_signature = (
+                self.num_rows,
+                tuple(self.variable_ids),
+                tuple(tuple(sorted(self.exact_columns[j].items())) for j in range(self.num_structural))
+            )
+        return self._column_signature
+
+    def snapshot_basis(self) -> SimplexBasis:
+        """Base courante + copie légère de sa factorisation pour warm-start"""
+        basis_labels, at_upper_labels = self.get_basis()
+        return SimplexBasis(
+            basic_labels=basis_labels, nonbasic_at_upper=at_upper_labels,
+            column_signature=self.column_signature,
+            factorization=self.factorization.copy(), exact=self.exact
+        )
+
+    # ------------------------------------------------------------------
+    # Base et valeurs
+    # ------------------------------------------------------------------
+
+    def _install_warm_basis(self, warm_basis: SimplexBasis) -> Tuple[bool, bool]:
+        """
+        Installe base persistée d'un LP précédent
+
+        Structure identique (même signature, même arithmétique): la factorisation est
+        reprise telle quelle. Sinon mapping par labels, complété par variables lignes,
+        puis refactorisation. Base singulière ou identique à la base lignes: cold-start.
+
+        Returns:
+            (warm-start effectif, factorisation réutilisée)
+        """
+        slack_basis = list(range(self.num_structural, len(self.labels)))
+        upper_set = {self.label_index[label] for label in warm_basis.nonbasic_at_upper
+                     if label in self.label_index}
+        self.at_upper = [j in upper_set and self.upper[j] != INFINITY for j in range(len(self.labels))]
+
+        basis: List[int] = []
+        for label in warm_basis.basic_labels:
+            j = self.label_index.get(label)
+            if j is not None and j not in basis:
+                basis.append(j)
+        if len(basis) > self.num_rows:
+            self._install_basis(None, None)
+            return False, False
+        basis_set = set(basis)
+        basis.extend(j for j in slack_basis if j not in basis_set)
+        basis = basis[:self.num_rows]
+
+        if basis == slack_basis and not any(self.at_upper):
+            self._set_basis(slack_basis)
+            return False, False
+
+        reusable = (
+            warm_basis.factorization is not None
+            and warm_basis.exact == self.exact
+            and warm_basis.column_signature == self.column_signature
+            and [self.labels[j] for j in basis] == warm_basis.basic_labels
+        )
+        if reusable:
+            self.basis = basis
+            self.in_basis = [False] * len(self.labels)
+            for j in basis:
+                self.in_basis[j] = True
+            self.factorization = warm_basis.factorization.copy()
+            self._reset_nonbasic_values()
+            self._recompute_basic_values()
+            return True, True
+
+        try:
+            self._set_basis(basis)
+        except SingularBasisError:
+            logger.debug("Warm-start basis singular - falling back to row basis")
+            self._install_basis(None, None)
+            return False, False
+        return True, False
+
+    def _load_costs(self, objective: Optional[Dict[str, Decimal]]) -> None:
+        """Coûts de travail depuis objectif (nuls si None)"""
+        self.costs = [self.zero] * len(self.labels)
+        for var_id, coeff in (objective or {}).items():
+            if var_id in self.label_index:
+                self.costs[self.label_index[var_id]] = self._num(Fraction(coeff))
+
+    def _install_basis(self, initial_basis: Optional[List[str]],
+                       nonbasic_at_upper: Optional[List[str]]) -> None:
+        """Installe base demandée (fallback base lignes si taille/rang invalide)"""
+        slack_basis = list(range(self.num_structural, len(self.labels)))
+        basis = slack_basis
+
+        if initial_basis is not None:
+            requested = [self.label_index[label] for label in initial_basis if label in self.label_index]
+            if len(requested) == self.num_rows and len(set(requested)) == self.num_rows:
+                basis = requested
+
+        upper_set = {self.label_index[label] for label in (nonbasic_at_upper or []) if label in self.label_index}
+        self.at_upper = [j in upper_set and self.upper[j] != INFINITY for j in range(len(self.labels))]
+
+        try:
+            self._set_basis(basis)
+        except SingularBasisError:
+            logger.debug("Requested basis singular - falling back to row basis")
+            self._set_basis(slack_basis)
+
+    def _set_basis(self, basis: List[int]) -> None:
+        self.basis = list(basis)
+        self.in_basis = [False] * len(self.labels)
+        for j in self.basis:
+            self.in_basis[j] = True
+        self.factorization.factorize([self.columns[j] for j in self.basis])
+        self._reset_nonbasic_values()
+        self._recompute_basic_values()
+
+    def _nonbasic_value(self, j: int) -> Any:
+        """Valeur variable hors base: borne active (0 si libre)"""
+        if self.at_upper[j] and self.upper[j] != INFINITY:
+            return self.upper[j]
+        if self.lower[j] != -INFINITY:
+            return self.lower[j]
+        if self.upper[j] != INFINITY:
+            self.at_upper[j] = True
+            return self.upper[j]
+        return self.zero
+
+    def _reset_nonbasic_values(self) -> None:
+        for j in range(len(self.labels)):
+            if not self.in_basis[j]:
+                self.x[j] = self._nonbasic_value(j)
+
+    def _recompute_basic_values(self) -> None:
+        """x_B = B^{-1}(-N x_N)"""
+        rhs = [self.zero] * self.num_rows
+        for j in range(len(self.labels)):
+            if not self.in_basis[j] and self.x[j]:
+                value = self.x[j]
+                for row, coeff in self.columns[j].items():
+                    rhs[row] -= coeff * value
+        for position, value in enumerate(self.factorization.ftran(rhs)):
+            self.x[self.basis[position]] = value
+
+    def _dense_column(self, j: int) -> List[Any]:
+        column = [self.zero] * self.num_rows
+        for row, value in self.columns[j].items():
+            column[row] = value
+        return column
+
+    # ------------------------------------------------------------------
+    # Itérations Simplex
+    # ------------------------------------------------------------------
+
+    def _phase_costs(self, phase: int) -> List[Any]:
+        """Coûts variables de base: infaisabilités (Phase 1) ou objectif (Phase 2)"""
+        if phase == 2:
+            return [self.costs[j] for j in self.basis]
+
+        one = self._num(1)
+        costs = []
+        for j in self.basis:
+            if self.x[j] < self.lower[j] - self.tolerance:
+                costs.append(-one)
+            elif self.x[j] > self.upper[j] + self.tolerance:
+                costs.append(one)
+            else:
+                costs.append(self.zero)
+        return costs
+
+    def _iterate(self, phase: int) -> Tuple[str, int]:
+        """Boucle pivots jusqu'à optimalité de la phase"""
+        iterations = 0
+        self.bland_mode = False
+        self.degenerate_streak = 0
+
+        while True:
+            basic_costs = self._phase_costs(phase)
+            if phase == 1 and not any(basic_costs):
+                return "FEASIBLE", iterations
+
+            duals = self.factorization.btran(basic_costs)
+            entering, direction = self._price(duals, phase)
+            if entering is None:
+                return ("INFEASIBLE" if phase == 1 else "OPTIMAL"), iterations
+
+            if iterations >= self.max_iterations:
+                return "MAX_ITERATIONS", iterations
+
+            entering_column = self.factorization.ftran(self._dense_column(entering))
+            step, leaving_position, leaving_to_upper = self._ratio_test(
+                entering, direction, entering_column, phase
+            )
+            if step is None:
+                return ("UNBOUNDED" if phase == 2 else "NUMERICAL_ERROR"), iterations
+
+            try:
+                self._apply_step(entering, direction, entering_column, step,
+                                 leaving_position, leaving_to_upper)
+            except SingularBasisError:
+                return "NUMERICAL_ERROR", iterations
+            iterations += 1
+
+            if step <= self.tolerance:
+                self.degenerate_streak += 1
+                if self.degenerate_streak >= self.BLAND_THRESHOLD:
+                    self.bland_mode = True
+            else:
+                self.degenerate_streak = 0
+
+    def _price(self, duals: List[Any], phase: int) -> Tuple[Optional[int], int]:
+        """Pricing Dantzig (Bland si dégénérescence prolongée): (entrante, direction ±1)"""
+        best_index, best_direction, best_score = None, 0, self.zero
+
+        for j in range(len(self.labels)):
+            if self.in_basis[j] or self.lower[j] == self.upper[j]:
+                continue
+
+            reduced_cost = self.costs[j] if phase == 2 else self.zero
+            for row, coeff in self.columns[j].items():
+                reduced_cost -= duals[row] * coeff
+
+            if reduced_cost < -self.tolerance and self.x[j] < self.upper[j]:
+                direction, score = 1, -reduced_cost
+            elif reduced_cost > self.tolerance and self.x[j] > self.lower[j]:
+                direction, score = -1, reduced_cost
+            else:
+                continue
+
+            if self.bland_mode:
+                return j, direction
+            if score > best_score:
+                best_index, best_direction, best_score = j, direction, score
+
+        return best_index, best_direction
+
+    def _ratio_test(self, entering: int, direction: int, entering_column: List[Any],
+                    phase: int) -> Tuple[Optional[Any], int, bool]:
+        """
+        Ratio test borné
+
+        Returns:
+            (pas, position sortante ou -1 pour bound flip, sortante à borne supérieure)
+        """
+        best_step = None
+        best_position, best_to_upper = -1, False
+        best_magnitude = self.zero
+
+        if self.lower[entering] != -INFINITY and self.upper[entering] != INFINITY:
+            best_step = self.upper[entering] - self.lower[entering]
+            best_to_upper = direction > 0
+
+        for position, j in enumerate(self.basis):
+            magnitude = abs(entering_column[position])
+            if magnitude <= self.pivot_tolerance:
+                continue
+
+            delta = -direction * entering_column[position]
+            value, lower, upper = self.x[j], self.lower[j], self.upper[j]
+
+            if phase == 1 and value < lower - self.tolerance:
+                if delta <= 0:
+                    continue
+                limit, to_upper = (lower - value) / delta, False
+            elif phase == 1 and value > upper + self.tolerance:
+                if delta >= 0:
+                    continue
+                limit, to_upper = (upper - value) / delta, True
+            elif delta > 0 and upper != INFINITY:
+                limit, to_upper = (upper - value) / delta, True
+            elif delta < 0 and lower != -INFINITY:
+                limit, to_upper = (lower - value) / delta, False
+            else:
+                continue
+
+            if limit < 0:
+                limit = self.zero
+
+            if best_step is None or limit < best_step - self.tolerance:
+                take = True
+            elif limit <= best_step + self.tolerance and best_position >= 0:
+                # Égalité: Bland = plus petit indice, sinon pivot le plus stable
+                take = j < self.basis[best_position] if self.bland_mode else magnitude > best_magnitude
+            else:
+                take = False
+
+            if take:
+                best_step, best_position, best_to_upper, best_magnitude = limit, position, to_upper, magnitude
+
+        return best_step, best_position, best_to_upper
+
+    def _apply_step(self, entering: int, direction: int, entering_column: List[Any],
+                    step: Any, leaving_position: int, leaving_to_upper: bool) -> None:
+        """Mise à jour valeurs, base et factorisation"""
+        if step:
+            self.x[entering] += direction * step
+            for position, j in enumerate(self.basis):
+                if entering_column[position]:
+                    self.x[j] -= direction * step * entering_column[position]
+
+        if leaving_position < 0:
+            # Bound flip: variable entrante passe à l'autre borne, base inchangée
+            self.at_upper[entering] = leaving_to_upper
+            self.x[entering] = self.upper[entering] if leaving_to_upper else self.lower[entering]
+            self.bound_flips += 1
+            return
+
+        leaving = self.basis[leaving_position]
+        self.at_upper[leaving] = leaving_to_upper
+        self.x[leaving] = self.upper[leaving] if leaving_to_upper else self.lower[leaving]
+        self.in_basis[leaving] = False
+        self.in_basis[entering] = True
+        self.at_upper[entering] = False
+        self.basis[leaving_position] = entering
+
+        self.factorization.update(leaving_position, entering_column)
+        if self.factorization.needs_refactorization():
+            self.factorization.factorize([self.columns[j] for j in self.basis])
+            self._recompute_basic_values()
+
+    # ------------------------------------------------------------------
+    # Simplex dual (warm-start, bornes/RHS modifiés)
+    # ------------------------------------------------------------------
+
+    def _reduced_cost(self, j: int, duals: List[Any]) -> Any:
+        reduced_cost = self.costs[j]
+        for row, coeff in self.columns[j].items():
+            reduced_cost -= duals[row] * coeff
+        return reduced_cost
+
+    def _is_dual_feasible(self) -> bool:
+        """Coûts réduits compatibles avec positions hors base (tolérance flottante)"""
+        duals = self.factorization.btran([self.costs[j] for j in self.basis])
+        for j in range(len(self.labels)):
+            if self.in_basis[j] or self.lower[j] == self.upper[j]:
+                continue
+            reduced_cost = self._reduced_cost(j, duals)
+            if reduced_cost < -self.tolerance and self.x[j] < self.upper[j]:
+                return False
+            if reduced_cost > self.tolerance and self.x[j] > self.lower[j]:
+                return False
+        return True
+
+    def _dual_iterate(self) -> Tuple[str, int]:
+        """
+        Simplex dual borné depuis base duale-faisable
+
+        Sortante: variable de base la plus hors bornes, ramenée sur la borne violée.
+        Entrante: ratio test dual min |d_j| / |α_rj| parmi variables hors base pouvant
+        bouger dans le sens requis (égalité: plus grand |α_rj|). Limité à
+        max(50, 2·(m+n)) pivots; statut non FEASIBLE ⇒ Phase 1 primal depuis la base
+        courante (qui produit le certificat).
+        """
+        limit = min(self.max_iterations, max(50, 2 * len(self.labels)))
+        iterations = 0
+
+        while True:
+            leaving_position, worst, to_upper = -1, self.tolerance, False
+            for position, j in enumerate(self.basis):
+                if self.x[j] < self.lower[j] - self.tolerance:
+                    violation, above = self.lower[j] - self.x[j], False
+                elif self.x[j] > self.upper[j] + self.tolerance:
+                    violation, above = self.x[j] - self.upper[j], True
+                else:
+                    continue
+                if violation > worst:
+                    leaving_position, worst, to_upper = position, violation, above
+
+            if leaving_position < 0:
+                return "FEASIBLE", iterations
+            if iterations >= limit:
+                return "MAX_ITERATIONS", iterations
+
+            unit = [self.zero] * self.num_rows
+            unit[leaving_position] = self._num(1)
+            rho = self.factorization.btran(unit)
+            duals = self.factorization.btran([self.costs[j] for j in self.basis])
+
+            entering, best_ratio, best_alpha = None, None, self.zero
+            for j in range(len(self.labels)):
+                if self.in_basis[j] or self.lower[j] == self.upper[j]:
+                    continue
+                alpha = self.zero
+                for row, coeff in self.columns[j].items():
+                    alpha += rho[row] * coeff
+                if abs(alpha) <= self.pivot_tolerance:
+                    continue
+
+                # x_r varie de -α·Δx_j: sens requis selon borne violée
+                increase_ok = self.x[j] < self.upper[j]
+                decrease_ok = self.x[j] > self.lower[j]
+                if to_upper:
+                    eligible = (alpha > 0 and increase_ok) or (alpha < 0 and decrease_ok)
+                else:
+                    eligible = (alpha < 0 and increase_ok) or (alpha > 0 and decrease_ok)
+                if not eligible:
+                    continue
+
+                ratio = abs(self._reduced_cost(j, duals)) / abs(alpha)
+                if (best_ratio is None or ratio < best_ratio - self.tolerance
+                        or (ratio <= best_ratio + self.tolerance and abs(alpha) > best_alpha)):
+                    entering, best_ratio, best_alpha = j, ratio, abs(alpha)
+
+            if entering is None:
+                return "INFEASIBLE", iterations
+
+            leaving = self.basis[leaving_position]
+            entering_column = self.factorization.ftran(self._dense_column(entering))
+            if abs(entering_column[leaving_position]) <= self.pivot_tolerance:
+                return "NUMERICAL_ERROR", iterations
+
+            target = self.upper[leaving] if to_upper else self.lower[leaving]
+            entering_step = (self.x[leaving] - target) / entering_column[leaving_position]
+            self.x[entering] += entering_step
+            for position, j in enumerate(self.basis):
+                if entering_column[position]:
+                    self.x[j] -= entering_step * entering_column[position]
+
+            self.at_upper[leaving] = to_upper
+            self.x[leaving] = target
+            self.in_basis[leaving] = False
+            self.in_basis[entering] = True
+            self.at_upper[entering] = False
+            self.basis[leaving_position] = entering
+
+            self.factorization.update(leaving_position, entering_column)
+            if self.factorization.needs_refactorization():
+                try:
+                    self.factorization.factorize([self.columns[j] for j in self.basis])
+                except SingularBasisError:
+                    return "NUMERICAL_ERROR", iterations
+                self._recompute_basic_values()
+            iterations += 1
+
+    # ------------------------------------------------------------------
+    # Certification exacte
+    # ------------------------------------------------------------------
+
+    def certify(self, objective: Optional[Dict[str, Decimal]] = None) -> SimplexCertificate:
+        """
+        Vérification exacte (Fraction) de la base courante
+
+        Recalcule x_B exactement depuis les bornes hors base; produit PRIMAL_POINT
+        si faisable, sinon tente un rayon de Farkas depuis les coûts Phase 1 exacts.
+        """
+        basis_labels, at_upper_labels = self.get_basis()
+        certificate = SimplexCertificate(
+            certificate_type="PRIMAL_POINT", basis=basis_labels,
+            nonbasic_at_upper=at_upper_labels, arithmetic="exact" if self.exact else "float"
+        )
+
+        exact_factorization = BasisFactorization(self.num_rows, Fraction(0), Fraction(0))
+        try:
+            exact_factorization.factorize([self.exact_columns[j] for j in self.basis])
+        except SingularBasisError:
+            return certificate
+
+        values: List[Fraction] = [Fraction(0)] * len(self.labels)
+        for j in range(len(self.labels)):
+            if not self.in_basis[j]:
+                if self.at_upper[j] and self.exact_upper[j] is not None:
+                    values[j] = self.exact_upper[j]
+                elif self.exact_lower[j] is not None:
+                    values[j] = self.exact_lower[j]
+                elif self.exact_upper[j] is not None:
+                    values[j] = self.exact_upper[j]
+
+        rhs = [Fraction(0)] * self.num_rows
+        for j in range(len(self.labels)):
+            if not self.in_basis[j] and values[j]:
+                for row, coeff in self.exact_columns[j].items():
+                    rhs[row] -= coeff * values[j]
+        for position, value in enumerate(exact_factorization.ftran(rhs)):
+            values[self.basis[position]] = value
+
+        basic_costs = []
+        for j in self.basis:
+            if self.exact_lower[j] is not None and values[j] < self.exact_lower[j]:
+                basic_costs.append(Fraction(-1))
+            elif self.exact_upper[j] is not None and values[j] > self.exact_upper[j]:
+                basic_costs.append(Fraction(1))
+            else:
+                basic_costs.append(Fraction(0))
+
+        if not any(basic_costs):
+            certificate.primal_point = {var_id: values[j] for j, var_id in enumerate(self.variable_ids)}
+            certificate.verified = True
+            if objective:
+                certificate.objective_value = sum(
+                    (Fraction(coeff) * certificate.primal_point[var_id]
+                     for var_id, coeff in objective.items() if var_id in certificate.primal_point),
+                    Fraction(0)
+                )
+                certificate.dual_feasible = self._exact_dual_feasible(exact_factorization, objective)
+            return certificate
+
+        # Rayon de Farkas: y = c_B B^{-1} (coûts infaisabilité), max_box (y M) z < 0
+        certificate.certificate_type = "FARKAS_RAY"
+        multipliers = exact_factorization.btran(basic_costs)
+        box_maximum = Fraction(0)
+        for j in range(len(self.labels)):
+            weight = sum((multipliers[row] * coeff for row, coeff in self.exact_columns[j].items()),
+                         Fraction(0))
+            if weight > 0:
+                if self.exact_upper[j] is None:
+                    return certificate
+                box_maximum += weight * self.exact_upper[j]
+            elif weight < 0:
+                if self.exact_lower[j] is None:
+                    return certificate
+                box_maximum += weight * self.exact_lower[j]
+
+        # Lignes mises à l'échelle: même y, borne ramenée à l'échelle d'origine
+        certificate.farkas_multipliers = multipliers
+        certificate.farkas_bound = box_maximum / self.row_scale
+        certificate.verified = box_maximum < 0
+        return certificate
+
+    def _exact_dual_feasible(self, exact_factorization: BasisFactorization,
+                             objective: Dict[str, Decimal]) -> bool:
+        """Coûts réduits exacts compatibles avec positions hors base (optimalité)"""
+        costs = [Fraction(0)] * len(self.labels)
+        for var_id, coeff in objective.items():
+            if var_id in self.label_index:
+                costs[self.label_index[var_id]] = Fraction(coeff)
+
+        duals = exact_factorization.btran([costs[j] for j in self.basis])
+        for j in range(len(self.labels)):
+            lower, upper = self.exact_lower[j], self.exact_upper[j]
+            if self.in_basis[j] or (lower is not None and lower == upper):
+                continue
+
+            reduced_cost = costs[j] - sum((duals[row] * coeff for row, coeff in self.exact_columns[j].items()),
+                                          Fraction(0))
+            at_upper = upper is not None and (self.at_upper[j] or lower is None)
+            at_lower = lower is not None and not at_upper
+            if (reduced_cost < 0 and not at_upper) or (reduced_cost > 0 and not at_lower):
+                return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Analyse paramétrique RHS
+    # ------------------------------------------------------------------
+
+    def parametric_rhs(self, objective: Dict[str, Decimal], rhs_direction: Dict[int, Fraction],
+                       basis_labels: List[str], nonbasic_at_upper: List[str],
+                       span: Fraction) -> ParametricRHSResult:
+        """
+        Valeur optimale exacte pour RHS b + t·d, t ∈ [0, span], en une passe
+
+        Part d'une base optimale à t = 0 (certificat Phase 2). Base fixée,
+        x_B(t) = p + t·q et z(t) sont linéaires; le ratio test sur les bornes
+        (celles des variables lignes bougent avec t) donne le prochain point de
+        rupture, où un pivot Simplex dual (base duale-faisable conservée)
+        installe la base optimale suivante. Arithmétique Fraction exacte.
+
+        Args:
+            objective: Coefficients minimisation var_id → coût
+            rhs_direction: Index contrainte → d_i (RHS non mis à l'échelle)
+            basis_labels: Labels base optimale à t = 0
+            nonbasic_at_upper: Labels hors base à borne supérieure
+            span: Borne supérieure de t
+
+        Returns:
+            ParametricRHSResult (end < span si le LP devient infaisable)
+        """
+        num_labels = len(self.labels)
+        costs = [Fraction(0)] * num_labels
+        for var_id, coeff in objective.items():
+            if var_id in self.label_index:
+                costs[self.label_index[var_id]] = Fraction(coeff)
+
+        # Vitesse des bornes des variables lignes: l_i + t·s·d_i, u_i + t·s·d_i
+        rates = [Fraction(0)] * num_labels
+        for row, direction in rhs_direction.items():
+            rates[self.num_structural + row] = Fraction(direction) * self.row_scale
+
+        basis = [self.label_index[label] for label in basis_labels]
+        in_basis = [False] * num_labels
+        for j in basis:
+            in_basis[j] = True
+        upper_set = {self.label_index[label] for label in nonbasic_at_upper if label in self.label_index}
+        at_upper = [j in upper_set and self.exact_upper[j] is not None for j in range(num_labels)]
+
+        result = ParametricRHSResult(status="OPTIMAL", end=span)
+        factorization = BasisFactorization(self.num_rows, Fraction(0), Fraction(0))
+        t = Fraction(0)
+
+        def bound(j: int, upper: bool) -> Optional[Fraction]:
+            value = self.exact_upper[j] if upper else self.exact_lower[j]
+            return None if value is None else value + t * rates[j]
+
+        for _ in range(self.max_iterations):
+            try:
+                factorization.factorize([self.exact_columns[j] for j in basis])
+            except SingularBasisError:
+                result.status = "NUMERICAL_ERROR"
+                result.end = t
+                return result
+
+            # Hors base à leur borne active (valeur + vitesse), x_B = B^{-1}(-N x_N)
+            rhs_value = [Fraction(0)] * self.num_rows
+            rhs_rate = [Fraction(0)] * self.num_rows
+            value, slope = Fraction(0), Fraction(0)
+            for j in range(num_labels):
+                if in_basis[j]:
+                    continue
+                use_upper = self.exact_upper[j] is not None and (at_upper[j] or self.exact_lower[j] is None)
+                position = bound(j, use_upper)
+                rate = rates[j] if position is not None else Fraction(0)
+                position = position if position is not None else Fraction(0)
+                value += costs[j] * position
+                slope += costs[j] * rate
+                for row, coeff in self.exact_columns[j].items():
+                    rhs_value[row] -= coeff * position
+                    rhs_rate[row] -= coeff * rate
+            basic_values = factorization.ftran(rhs_value)
+            basic_rates = factorization.ftran(rhs_rate)
+            for position, j in enumerate(basis):
+                value += costs[j] * basic_values[position]
+                slope += costs[j] * basic_rates[position]
+
+            if result.breakpoints and result.breakpoints[-1] == t:
+                # Pivot dégénéré au même point: seule la pente change
+                result.slopes[-1] = slope
+            elif not result.slopes or result.slopes[-1] != slope:
+                result.breakpoints.append(t)
+                result.values.append(value)
+                result.slopes.append(slope)
+
+            # Ratio test primal paramétrique: première variable de base atteignant une borne
+            step: Optional[Fraction] = None
+            leaving: Optional[Tuple[int, bool]] = None
+            for position, j in enumerate(basis):
+                relative = basic_rates[position] - rates[j]
+                lower, upper = bound(j, False), bound(j, True)
+                for limit, to_upper in ((lower, False), (upper, True)):
+                    if limit is None or relative == 0 or (relative > 0) != to_upper:
+                        continue
+                    candidate = max(Fraction(0), (limit - basic_values[position]) / relative)
+                    if step is None or candidate < step or (candidate == step and j < basis[leaving[0]]):
+                        step, leaving = candidate, (position, to_upper)
+
+            if step is None or t + step >= span:
+                return result
+            t += step
+
+            # Pivot dual: la sortante passe hors base à sa borne, coûts réduits restent de bon signe
+            leaving_position, to_upper = leaving
+            unit = [Fraction(0)] * self.num_rows
+            unit[leaving_position] = Fraction(1)
+            pivot_row = factorization.btran(unit)
+            duals = factorization.btran([costs[j] for j in basis])
+
+            entering, best_ratio = None, None
+            for j in range(num_labels):
+                if in_basis[j] or (self.exact_lower[j] is not None and self.exact_lower[j] == self.exact_upper[j]):
+                    continue
+                alpha = sum((pivot_row[row] * coeff for row, coeff in self.exact_columns[j].items()), Fraction(0))
+                if alpha == 0:
+                    continue
+                free = self.exact_lower[j] is None and self.exact_upper[j] is None
+                nonbasic_upper = self.exact_upper[j] is not None and (at_upper[j] or self.exact_lower[j] is None)
+                # Sortante vers borne inf (x_k doit remonter): α < 0 à borne inf, α > 0 à borne sup;
+                # vers borne sup: signes inversés
+                eligible_at_lower = alpha < 0 if not to_upper else alpha > 0
+                if not free and eligible_at_lower == nonbasic_upper:
+                    continue
+                reduced_cost = costs[j] - sum((duals[row] * coeff for row, coeff in self.exact_columns[j].items()),
+                                              Fraction(0))
+                ratio = abs(reduced_cost) / abs(alpha)
+                if best_ratio is None or ratio < best_ratio:
+                    entering, best_ratio = j, ratio
+
+            if entering is None:
+                result.end = t
+                result.infeasible_beyond = True
+                return result
+
+            leaving_index = basis[leaving_position]
+            basis[leaving_position] = entering
+            in_basis[leaving_index], in_basis[entering] = False, True
+            at_upper[leaving_index] = to_upper
+            at_upper[entering] = False
+            result.basis_changes += 1
+
+        result.status = "MAX_ITERATIONS"
+        result.end = t
+        return result
@@ -6,7 +6,7 @@ Architecture centrale respectant règle d'or: 1 caractère = 1 transition
 
 import time
 import copy
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Any
 from decimal import Decimal
 from dataclasses import dataclass, field
 
@@ -15,11 +15,15 @@ try:
         ThompsonNFABuilder, PatternFragment, NFAState, NFATransition,
         TransitionType, EntryPoint, create_thompson_builder
     )
+    from .nfa_performance_optimizations import SectorBitsetClassifier
+    from .lazy_dfa import LazySubsetDFA
 except ImportError:
     from thompson_nfa import (
         ThompsonNFABuilder, PatternFragment, NFAState, NFATransition,
         TransitionType, EntryPoint, create_thompson_builder
     )
+    from nfa_performance_optimizations import SectorBitsetClassifier
+    from lazy_dfa import LazySubsetDFA
 
 
 @dataclass
@@ -30,6 +34,12 @@ class FrozenSnapshot:
     entry_points: Dict[str, EntryPoint]
     final_state_ids: Set[str]
     frozen_at: float = field(default_factory=time.time)
+    # Fast path pattern sectoriel initial: (caractères, état final) ou None
+    sector_plan: Optional[Tuple[FrozenSet[str], str]] = None
+    # Index transitions par état source (évite scan complet par caractère)
+    transitions_from: Dict[str, List[NFATransition]] = field(default_factory=dict)
+    # DFA paresseux compilé au premier mot évalué (si activé)
+    lazy_dfa: Optional[LazySubsetDFA] = None
 
 
 class SharedNFA:
@@ -61,6 +71,9 @@ class SharedNFA:
         self.is_frozen: bool = False
         self.frozen_snapshot: Optional[FrozenSnapshot] = None
 
+        # DFA paresseux optionnel: plafond états DFA, None = simulation NFA
+        self.lazy_dfa_max_states: Optional[int] = None
+
         # Construction tools
         self.thompson_builder = create_thompson_builder()
 
@@ -71,7 +84,10 @@ class SharedNFA:
             'states_created': 0,
             'transitions_created': 0,
             'freeze_operations': 0,
-            'evaluations_performed': 0
+            'evaluations_performed': 0,
+            'bitset_evaluations': 0,
+            'dfa_evaluations': 0,
+            'batch_evaluations': 0
         }
 
     def add_measure(self, measure_id: str, pattern: str, weight: Decimal) -> bool:
@@ -193,21 +209,82 @@ class SharedNFA:
         frozen_transitions = copy.deepcopy(self.transitions)
         frozen_entry_points = copy.deepcopy(self.entry_points)
 
+        transitions_from: Dict[str, List[NFATransition]] = {}
+        for transition in frozen_transitions:
+            transitions_from.setdefault(transition.from_state, []).append(transition)
+
         self.frozen_snapshot = FrozenSnapshot(
             states=frozen_states,
             transitions=frozen_transitions,
             entry_points=frozen_entry_points,
-            final_state_ids=self.final_state_ids.copy()
+            final_state_ids=self.final_state_ids.copy(),
+            sector_plan=self._compile_sector_plan(),
+            transitions_from=transitions_from
         )
 
         self.is_frozen = True
         self.stats['freeze_operations'] += 1
 
+    def _compile_sector_plan(self) -> Optional[Tuple[FrozenSet[str], str]]:
+        """
+        Compile fragment initial en test d'appartenance si pattern sectoriel
+
+        Seul le fragment de initial_state_id est atteignable à l'évaluation.
+        Pour .*X.* / .*[ABC].* (un seul état final), le mot atteint cet état
+        ssi il contient un caractère de la classe: pas de simulation NFA.
+        """
+        for pattern, fragment in self.pattern_registry.items():
+            if fragment.start_state_id != self.initial_state_id:
+                continue
+
+            characters = SectorBitsetClassifier.parse_sector_pattern(pattern)
+            if characters is None or len(fragment.final_state_ids) != 1:
+                return None
+            return characters, next(iter(fragment.final_state_ids))
+
+        return None
+
     def unfreeze(self) -> None:
         """Dégèle NFA pour permettre modifications"""
         self.is_frozen = False
         self.frozen_snapshot = None
 
+    def enable_lazy_dfa(self, max_states: int = 4096) -> None:
+        """
+        Active classification par DFA paresseux sur snapshot frozen
+
+        Le DFA est construit à la demande au premier mot évalué après
+        freeze() et jeté avec le snapshot à unfreeze().
+
+        Args:
+            max_states: Plafond états DFA avant éviction / fallback NFA
+        """
+        if max_states < 1:
+            raise ValueError(f"max_states must be positive, got {max_states}")
+        self.lazy_dfa_max_states = max_states
+
+    def disable_lazy_dfa(self) -> None:
+        """Retour à la simulation NFA caractère par caractère"""
+        self.lazy_dfa_max_states = None
+        if self.frozen_snapshot:
+            self.frozen_snapshot.lazy_dfa = None
+
+    def get_lazy_dfa(self) -> Optional[LazySubsetDFA]:
+        """DFA paresseux du snapshot courant, créé si activé et NFA frozen"""
+        snapshot = self.frozen_snapshot
+        if snapshot is None or self.lazy_dfa_max_states is None or self.initial_state_id is None:
+            return None
+
+        if snapshot.lazy_dfa is None:
+            snapshot.lazy_dfa = LazySubsetDFA(
+                self.initial_state_set(),
+                self.step_state_set,
+                self.resolve_final_state,
+                frozenset(snapshot.final_state_ids),
+                max_states=self.lazy_dfa_max_states
+            )
+        return snapshot.lazy_dfa
+
     def evaluate_word_to_final(self, word: str) -> Optional[str]:
         """
         Évaluation mot avec règle d'or: 1 caractère = 1 transition
@@ -227,26 +304,130 @@ class SharedNFA:
         if self.initial_state_id is None:
             return None
 
-        current_states = self._epsilon_closure({self.initial_state_id})
+        # Fast path pattern sectoriel: appartenance caractère, O(len(word))
+        sector_plan = self.frozen_snapshot.sector_plan
+        if sector_plan is not None:
+            self.stats['bitset_evaluations'] += 1
+            characters, final_state_id = sector_plan
+            return None if characters.isdisjoint(word) else final_state_id
 
-        # Évaluation caractère par caractère
-        for char in word:
-            next_states = set()
+        # DFA paresseux: une recherche dict par caractère une fois les transitions en cache
+        lazy_dfa = self.get_lazy_dfa()
+        if lazy_dfa is not None:
+            self.stats['dfa_evaluations'] += 1
+            return lazy_dfa.evaluate(word)
 
-            for state_id in current_states:
-                for transition in self.frozen_snapshot.transitions:
-                    if (transition.from_state == state_id and
-                        transition.matches_character(char)):
-                        next_states.add(transition.to_state)
+        current_states = self.initial_state_set()
 
-            current_states = self._epsilon_closure(next_states)
+        # Évaluation caractère par caractère
+        for char in word:
+            current_states = self.step_state_set(current_states, char)
 
             # Early termination si plus d'états
             if not current_states:
                 return None
 
+        return self.resolve_final_state(current_states)
+
+    def evaluate_words_batch(self, words: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Évaluation batch: mots dédupliqués, avancés ensemble sur le snapshot
+
+        Sans DFA paresseux, les mots triés partagent la simulation de leur
+        préfixe commun (pile d'ensembles d'états par position).
+
+        Args:
+            words: Mots à évaluer (doublons autorisés)
+
+        Returns:
+            Dict mot → ID état final atteint ou None si rejet
+        """
+        if not self.is_frozen or not self.frozen_snapshot:
+            raise RuntimeError("NFA must be frozen before evaluation")
+
+        unique_words = sorted(set(words))
+        self.stats['batch_evaluations'] += 1
+        self.stats['evaluations_performed'] += len(unique_words)
+
+        if self.initial_state_id is None:
+            return {word: None for word in unique_words}
+
+        sector_plan = self.frozen_snapshot.sector_plan
+        if sector_plan is not None:
+            self.stats['bitset_evaluations'] += len(unique_words)
+            characters, final_state_id = sector_plan
+            return {word: None if characters.isdisjoint(word) else final_state_id
+                    for word in unique_words}
+
+        lazy_dfa = self.get_lazy_dfa()
+        if lazy_dfa is not None:
+            self.stats['dfa_evaluations'] += len(unique_words)
+            return {word: lazy_dfa.evaluate(word) for word in unique_words}
+
+        results: Dict[str, Optional[str]] = {}
+        state_stack = [self.initial_state_set()]
+        previous_word = ""
+
+        for word in unique_words:
+            common = 0
+            max_common = min(len(previous_word), len(word))
+            while common < max_common and previous_word[common] == word[common]:
+                common += 1
+            del state_stack[common + 1:]
+
+            for char in word[common:]:
+                current_states = state_stack[-1]
+                state_stack.append(self.step_state_set(current_states, char) if current_states else current_states)
+
+            results[word] = self.resolve_final_state(state_stack[-1]) if state_stack[-1] else None
+            previous_word = word
+
+        return results
+
+    def initial_state_set(self) -> FrozenSet[str]:
+        """
+        Ensemble d'états initial (epsilon-closure état initial) sur snapshot frozen
+
+        Utilisé par evaluate_word_to_final et par les moteurs produit
+        (DAG × NFA) qui avancent l'automate caractère par caractère.
+        """
+        if self.initial_state_id is None:
+            return frozenset()
+        return frozenset(self._epsilon_closure({self.initial_state_id}))
+
+    def step_state_set(self, states: FrozenSet[str], char: str) -> FrozenSet[str]:
+        """
+        Transition d'un ensemble d'états sur un caractère (closure incluse)
+
+        Args:
+            states: Ensemble d'états courant (déjà epsilon-clos)
+            char: Caractère consommé
+
+        Returns:
+            Ensemble d'états suivant, vide si rejet
+        """
+        next_states = set()
+        transitions_from = self.frozen_snapshot.transitions_from
+
+        for state_id in states:
+            for transition in transitions_from.get(state_id, ()):
+                if transition.matches_character(char):
+                    next_states.add(transition.to_state)
+
+        if not next_states:
+            return frozenset()
+
+        return frozenset(self._epsilon_closure(next_states))
+
+    def resolve_final_state(self, states: FrozenSet[str]) -> Optional[str]:
+        """
+        État final retenu pour un ensemble d'états en fin de mot
+
+        Returns:
+            ID état final atteint ou None si aucun
+        """
         # Vérification états finaux atteints
-        final_reached = current_states & self.frozen_snapshot.final_state_ids
+        final_reached = states & self.frozen_snapshot.final_state_ids
 
         if final_reached:
             # Retourne premier état final trouvé
@@ -261,13 +442,13 @@ class SharedNFA:
 
         closure = set(states)
         stack = list(states)
+        transitions_from = self.frozen_snapshot.transitions_from
 
         while stack:
             current = stack.pop()
 
-            for transition in self.frozen_snapshot.transitions:
-                if (transition.from_state == current and
-                    transition.transition_type == TransitionType.EPSILON and
+            for transition in transitions_from.get(current, ()):
+                if (transition.transition_type == TransitionType.EPSILON and
                     transition.to_state not in closure):
                     closure.add(transition.to_state)
                     stack.append(transition.to_state)
@@ -359,7 +540,9 @@ class SharedNFA:
             'patterns_registered': len(self.pattern_registry),
             'final_states': len(self.final_state_ids),
             'is_frozen': self.is_frozen,
-            'initial_state': self.initial_state_id
+            'initial_state': self.initial_state_id,
+            'lazy_dfa': (self.frozen_snapshot.lazy_dfa.get_stats()
+                         if self.frozen_snapshot and self.frozen_snapshot.lazy_dfa else None)
         }
 
     def __str__(self) -> str:
@@ -14,19 +14,34 @@ Garanties mathématiques:
 - Triple validation: pivot + résolution + cross-validation
 - Métriques stabilité géométrique basées distance hyperplanes
 - Warm-start sécurisé avec fallback cold-start automatique
+- Warm-start réel: base optimale persistée (SimplexBasis) + Simplex dual si seuls bornes/RHS changent
 - Compatibilité sink-to-source pour énumération DAG reverse
+- Résolution BoundedRevisedSimplex (pivots float + LU) avec certificat exact Fraction
+- Arithmétique des pivots sélectionnable par instance (numeric_backend)
+- Mémoïsation bornée structure LP → dernière base optimale (LPs ne différant que par RHS/bornes)
+- Price discovery paramétrique: prix optimal linéaire par morceaux en fonction d'un RHS
 """
 
+from collections import OrderedDict
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from decimal import Decimal, getcontext
+from decimal import Decimal, getcontext, localcontext, MAX_PREC
+from fractions import Fraction
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Set, Any
+from typing import Dict, List, Optional, Tuple, Set, Any, Union
 import math
 import logging
 import time
 
 # Import des modules ICGS
 from .linear_programming import LinearProgram, LinearConstraint, FluxVariable, ConstraintType
+from .numeric_backend import NumericBackend, get_numeric_backend
+from .revised_simplex import (
+    BoundedRevisedSimplex, RevisedSimplexResult, SimplexCertificate, SimplexBasis, fraction_to_decimal
+)
+
+# Variable paramètre ajoutée pour calculer le domaine faisable d'un RHS paramétré
+PARAMETER_VARIABLE_ID = "__rhs_parameter__"
 
 
 # Configuration précision Decimal étendue pour Simplex
@@ -86,6 +101,66 @@ class SimplexSolution:
     phase2_iterations: int = 0               # Itérations Phase 2
     phase2_solving_time: float = 0.0         # Temps Phase 2
 
+    # Certificat exact (point primal ou rayon de Farkas) + base finale
+    certificate: Optional[SimplexCertificate] = None
+    basis: Optional[SimplexBasis] = None  # Base persistée réutilisable en warm-start
+
+
+@dataclass
+class ParametricPriceCurve:
+    """
+    Prix optimal en fonction d'un paramètre RHS (montant), linéaire par morceaux
+
+    Segment i: [breakpoints[i], breakpoints[i+1]] (dernier jusqu'à parameter_end),
+    prix = values[i] + slopes[i] × (paramètre - breakpoints[i]). Points de rupture
+    = changements de base optimale; valeurs exactes (Fraction).
+    """
+    status: SolutionStatus
+    parameter_min: Decimal
+    parameter_max: Decimal
+    breakpoints: List[Fraction] = field(default_factory=list)
+    values: List[Fraction] = field(default_factory=list)
+    slopes: List[Fraction] = field(default_factory=list)
+    parameter_end: Optional[Fraction] = None  # Fin domaine couvert (< parameter_max si infaisable au-delà)
+    basis_changes: int = 0
+    solving_time: float = 0.0
+
+    @property
+    def feasible_range(self) -> Optional[Tuple[Fraction, Fraction]]:
+        """Intervalle du paramètre couvert par la courbe, None si vide"""
+        if not self.breakpoints:
+            return None
+        return self.breakpoints[0], self.parameter_end
+
+    def exact_price_at(self, parameter: Union[Decimal, Fraction]) -> Optional[Fraction]:
+        """Prix optimal exact, O(log points de rupture); None hors domaine couvert"""
+        feasible_range = self.feasible_range
+        if feasible_range is None:
+            return None
+        parameter = Fraction(parameter)
+        if parameter < feasible_range[0] or parameter > feasible_range[1]:
+            return None
+        segment = bisect_right(self.breakpoints, parameter) - 1
+        return self.values[segment] + self.slopes[segment] * (parameter - self.breakpoints[segment])
+
+    def price_at(self, parameter: Decimal) -> Optional[Decimal]:
+        """Prix optimal (Decimal) pour parameter; None hors domaine couvert"""
+        price = self.exact_price_at(parameter)
+        return fraction_to_decimal(price) if price is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation sérialisable (API web)"""
+        return {
+            'status': self.status.value,
+            'parameter_min': str(self.parameter_min),
+            'parameter_max': str(self.parameter_max),
+            'parameter_end': str(fraction_to_decimal(self.parameter_end)) if self.parameter_end is not None else None,
+            'breakpoints': [str(fraction_to_decimal(value)) for value in self.breakpoints],
+            'values': [str(fraction_to_decimal(value)) for value in self.values],
+            'slopes': [str(fraction_to_decimal(value)) for value in self.slopes],
+            'basis_changes': self.basis_changes
+        }
+
 
 class MathematicallyRigorousPivotManager:
     """
@@ -288,16 +363,33 @@ class TripleValidationOrientedSimplex:
     - Métriques performance pour chemins complexes
     """
     
-    def __init__(self, max_iterations: int = 10000, tolerance: Decimal = Decimal('1e-10')):
+    def __init__(self, max_iterations: int = 10000, tolerance: Decimal = Decimal('1e-10'),
+                 refactor_frequency: int = 20, numeric_backend: Union[str, NumericBackend] = "float",
+                 max_structure_bases: int = 128):
         """
         Args:
             max_iterations: Limite itérations Simplex
             tolerance: Tolérance numérique générale
+            refactor_frequency: Pivots entre refactorisations LU du Simplex révisé
+            numeric_backend: Arithmétique des pivots (float, fraction, scaled_integer)
+            max_structure_bases: Taille max cache structure LP → dernière base (LRU, 0 = désactivé)
+
+        Raises:
+            ValueError: Si numeric_backend inconnu
         """
         self.max_iterations = max_iterations
         self.tolerance = tolerance
+        self.refactor_frequency = refactor_frequency
+        self.numeric_backend = get_numeric_backend(numeric_backend)
         self.pivot_manager = MathematicallyRigorousPivotManager(tolerance / 100)  # Plus strict
         self.logger = logging.getLogger("TripleValidationOrientedSimplex")
+
+        # Dernière base faisable/optimale (labels + factorisation) pour warm-start
+        self.stored_basis: Optional[SimplexBasis] = None
+
+        # Dernière base faisable/optimale par structure LP (structure_fingerprint), ordre LRU
+        self.max_structure_bases = max_structure_bases
+        self._structure_bases: "OrderedDict[str, SimplexBasis]" = OrderedDict()
         
         # Statistiques tracking
         self.stats = {
@@ -306,7 +398,21 @@ class TripleValidationOrientedSimplex:
             'cross_validations_performed': 0,
             'pivot_rejections': 0,
             'solutions_found': 0,
-            'infeasible_problems': 0
+            'infeasible_problems': 0,
+            'simplex_pivots': 0,
+            'lu_refactorizations': 0,
+            'exact_certificates': 0,
+            'exact_fallbacks': 0,
+            'warm_start_pivots': 0,
+            'cold_start_pivots': 0,
+            'warm_start_pivots_saved': 0,
+            'dual_simplex_pivots': 0,
+            'factorizations_reused': 0,
+            'structure_cache_hits': 0,
+            'structure_cache_misses': 0,
+            'structure_cache_evictions': 0,
+            'parametric_solves': 0,
+            'parametric_basis_changes': 0
         }
     
     def solve_with_absolute_guarantees(self, problem: LinearProgram, 
@@ -395,7 +501,8 @@ class TripleValidationOrientedSimplex:
         # Phase 2: Optimisation depuis solution faisible
         phase2_start = time.time()
         optimal_solution = self._solve_phase2_from_feasible_base(
-            problem, objective_coeffs, phase1_solution.variables
+            problem, objective_coeffs, phase1_solution.variables,
+            initial_certificate=phase1_solution.certificate
         )
 
         # Fusion métadonnées Phase 1 + Phase 2
@@ -418,6 +525,136 @@ class TripleValidationOrientedSimplex:
         self.logger.info(f"Price discovery completed: optimal_price={optimal_solution.optimal_price}")
         return optimal_solution
 
+    def solve_parametric_rhs(self, problem: LinearProgram,
+                             objective_coeffs: Dict[str, Decimal],
+                             rhs_direction: Dict[str, Decimal],
+                             parameter_min: Decimal, parameter_max: Decimal) -> ParametricPriceCurve:
+        """
+        Price Discovery paramétrique: prix optimal pour RHS bound_i + paramètre × d_i
+
+        Une résolution Phase 1 + Phase 2 au début du domaine faisable, puis une
+        passe exacte de pivots duals (BoundedRevisedSimplex.parametric_rhs) donne
+        la courbe complète sur [parameter_min, parameter_max]. Si le problème est
+        infaisable en parameter_min, le début du domaine faisable est obtenu
+        exactement (Fraction) par un LP minimisant le paramètre. Les RHS décalés
+        sont construits en Fraction (rhs_shift du moteur): aucun arrondi.
+
+        Args:
+            problem: Problème LP à paramètre nul
+            objective_coeffs: Coefficients objectif (var_id → prix_unitaire)
+            rhs_direction: Nom contrainte → coefficient du paramètre dans son RHS
+            parameter_min: Début intervalle paramètre
+            parameter_max: Fin intervalle paramètre
+
+        Returns:
+            ParametricPriceCurve (status OPTIMAL si courbe calculée)
+
+        Raises:
+            ValueError: Si intervalle vide ou contrainte nommée inconnue
+        """
+        if parameter_min > parameter_max:
+            raise ValueError(f"Empty parameter range [{parameter_min}, {parameter_max}]")
+        names = {constraint.name for constraint in problem.constraints}
+        missing = set(rhs_direction) - names
+        if missing:
+            raise ValueError(f"Constraints {sorted(missing)} not found in problem {problem.problem_name}")
+
+        start_time = time.time()
+        self.stats['parametric_solves'] += 1
+        curve = ParametricPriceCurve(status=SolutionStatus.OPTIMAL,
+                                     parameter_min=parameter_min, parameter_max=parameter_max)
+
+        start = Fraction(parameter_min)
+        engine, result = self._parametric_start_solve(problem, objective_coeffs, rhs_direction, start)
+        if result.status == "INFEASIBLE":
+            start = self._parametric_feasible_start(problem, rhs_direction, parameter_min, parameter_max)
+            if start is not None:
+                engine, result = self._parametric_start_solve(problem, objective_coeffs, rhs_direction, start)
+
+        certificate = result.certificate
+        if (result.status != "OPTIMAL" or certificate is None
+                or not certificate.verified or not certificate.dual_feasible):
+            curve.status = SolutionStatus(result.status) if result.status != "OPTIMAL" else SolutionStatus.NUMERICAL_ERROR
+            curve.solving_time = time.time() - start_time
+            return curve
+
+        parametric = engine.parametric_rhs(objective_coeffs, self._parametric_row_direction(problem, rhs_direction),
+                                           certificate.basis, certificate.nonbasic_at_upper,
+                                           Fraction(parameter_max) - start)
+
+        curve.breakpoints = [start + t for t in parametric.breakpoints]
+        curve.values = parametric.values
+        curve.slopes = parametric.slopes
+        curve.parameter_end = start + parametric.end
+        curve.basis_changes = parametric.basis_changes
+        if parametric.status != "OPTIMAL":
+            curve.status = SolutionStatus(parametric.status)
+        self.stats['parametric_basis_changes'] += parametric.basis_changes
+        curve.solving_time = time.time() - start_time
+        return curve
+
+    @staticmethod
+    def _parametric_row_direction(problem: LinearProgram,
+                                  rhs_direction: Dict[str, Decimal]) -> Dict[int, Fraction]:
+        """Direction RHS par index de ligne (Fraction exacte)"""
+        return {
+            row: Fraction(rhs_direction[constraint.name])
+            for row, constraint in enumerate(problem.constraints) if constraint.name in rhs_direction
+        }
+
+    def _parametric_start_solve(self, problem: LinearProgram, objective_coeffs: Dict[str, Decimal],
+                                rhs_direction: Dict[str, Decimal],
+                                parameter: Fraction) -> Tuple[BoundedRevisedSimplex, RevisedSimplexResult]:
+        """Résolution certifiée exacte à RHS b + parameter·d (décalage Fraction, sans arrondi)"""
+        row_direction = self._parametric_row_direction(problem, rhs_direction)
+        engine = BoundedRevisedSimplex(
+            problem,
+            max_iterations=self.max_iterations,
+            refactor_frequency=self.refactor_frequency,
+            backend=self.numeric_backend,
+            rhs_shift={row: parameter * direction for row, direction in row_direction.items()}
+        )
+        result = engine.solve(objective_coeffs)
+        self.stats['simplex_pivots'] += result.iterations
+        if result.certificate is not None and result.certificate.verified:
+            self.stats['exact_certificates'] += 1
+        if result.exact_fallback_used:
+            self.stats['exact_fallbacks'] += 1
+        return engine, result
+
+    def _parametric_feasible_start(self, problem: LinearProgram, rhs_direction: Dict[str, Decimal],
+                                   parameter_min: Decimal, parameter_max: Decimal) -> Optional[Fraction]:
+        """
+        Plus petit paramètre faisable dans [parameter_min, parameter_max] (exact), None si aucun
+
+        LP sur l'écart p' = p - parameter_min (borne inférieure 0, valeur
+        initiale dans ses bornes quel que soit le signe de parameter_min):
+        min p' s.t. A x - p'·d {≤,≥,=} b + parameter_min·d,
+        p' ∈ [0, parameter_max - parameter_min].
+        """
+        origin_problem = problem.with_rhs_shift(rhs_direction, parameter_min)
+        range_problem = LinearProgram(f"{problem.problem_name}_parameter_range")
+        for var_id, variable in problem.variables.items():
+            range_problem.add_variable(var_id, variable.lower_bound, variable.upper_bound)
+        with localcontext() as ctx:
+            ctx.prec = MAX_PREC
+            parameter_span = Decimal(parameter_max) - Decimal(parameter_min)
+        range_problem.add_variable(PARAMETER_VARIABLE_ID, Decimal('0'), parameter_span)
+        for constraint in origin_problem.constraints:
+            coefficients = dict(constraint.coefficients)
+            if constraint.name in rhs_direction:
+                coefficients[PARAMETER_VARIABLE_ID] = -rhs_direction[constraint.name]
+            range_problem.add_constraint(LinearConstraint(
+                coefficients, constraint.bound, constraint.constraint_type,
+                name=constraint.name, tolerance=constraint.tolerance
+            ))
+
+        solution = self.solve_optimization_problem(range_problem, {PARAMETER_VARIABLE_ID: Decimal('1')})
+        certificate = solution.certificate
+        if solution.status != SolutionStatus.OPTIMAL or certificate is None or not certificate.verified:
+            return None
+        return Fraction(parameter_min) + certificate.primal_point[PARAMETER_VARIABLE_ID]
+
     def _resolve_with_strategy(self, problem: LinearProgram, 
                              old_pivot: Optional[Dict[str, Decimal]], 
                              pivot_status: Optional[PivotStatus]) -> SimplexSolution:
@@ -425,21 +662,41 @@ class TripleValidationOrientedSimplex:
         Résolution avec stratégie adaptée au statut pivot
         
         Stratégies sink-to-source:
-        - HIGHLY_STABLE/MODERATELY_STABLE: warm-start avec pivot
-        - GEOMETRICALLY_UNSTABLE/INFEASIBLE: cold-start from scratch
+        - Structure LP déjà résolue: warm-start depuis sa dernière base, sans pivot
+          ou pivot non infaisable (seuls RHS/bornes diffèrent, Simplex dual)
+        - HIGHLY_STABLE/MODERATELY_STABLE: warm-start depuis base persistée
+        - GEOMETRICALLY_UNSTABLE: warm-start base également (un optimum de sommet est
+          toujours sur la frontière; la base ne dépend pas de cette distance),
+          cross-validation conservée
+        - MATHEMATICALLY_INFEASIBLE: cold-start from scratch
+
+        Un warm-start n'est compté que si la base persistée a effectivement été
+        installée (base différente de la base lignes du cold-start).
         """
+        structure_basis = None
+        if pivot_status != PivotStatus.MATHEMATICALLY_INFEASIBLE:
+            structure_basis = self._lookup_structure_basis(problem)
+
         # Décision stratégie résolution
-        use_warm_start = (
-            pivot_status in [PivotStatus.HIGHLY_STABLE, PivotStatus.MODERATELY_STABLE]
+        use_warm_start = structure_basis is not None or (
+            pivot_status in [PivotStatus.HIGHLY_STABLE, PivotStatus.MODERATELY_STABLE,
+                             PivotStatus.GEOMETRICALLY_UNSTABLE]
             and old_pivot is not None
+            and self.stored_basis is not None
         )
         
         if use_warm_start:
-            self.logger.info(f"Attempting warm-start with {pivot_status.value}")
-            solution = self._solve_phase1_tableau(problem, warm_start=True, initial_pivot=old_pivot)
-            if solution.status == SolutionStatus.FEASIBLE:
-                solution.warm_start_successful = True
-                self.stats['warm_starts_used'] += 1
+            self.logger.info(f"Attempting warm-start with "
+                             f"{'structure basis' if structure_basis is not None else pivot_status.value}")
+            solution = self._solve_phase1_tableau(problem, warm_start=True, initial_pivot=old_pivot,
+                                                  warm_basis=structure_basis)
+            if solution.status in (SolutionStatus.FEASIBLE, SolutionStatus.INFEASIBLE):
+                # Résultat certifié: base rejetée = cold-start effectif, pas de re-solve
+                if solution.warm_start_successful:
+                    self.stats['warm_starts_used'] += 1
+                else:
+                    self.stats['pivot_rejections'] += 1
+                    self.stats['cold_starts_used'] += 1
                 return solution
             else:
                 self.logger.warning("Warm-start failed, falling back to cold-start")
@@ -452,215 +709,152 @@ class TripleValidationOrientedSimplex:
         return solution
     
     def _solve_phase1_tableau(self, problem: LinearProgram, warm_start: bool = False,
-                            initial_pivot: Optional[Dict[str, Decimal]] = None) -> SimplexSolution:
+                            initial_pivot: Optional[Dict[str, Decimal]] = None,
+                            warm_basis: Optional[SimplexBasis] = None) -> SimplexSolution:
         """
-        Implémentation simplifiée Simplex Phase 1 pour validation de faisabilité
-        
-        Pour cette version académique, nous utilisons une approche simplifiée:
-        1. Tester si le point origine satisfait les contraintes
-        2. Si oui, retourner solution faisable 
-        3. Sinon, essayer de trouver une solution basique faisable
+        Simplex Phase 1 révisé borné pour validation de faisabilité
+
+        Pivots flottants (BoundedRevisedSimplex) puis vérification exacte de la base
+        finale: FEASIBLE porte un point primal exact, INFEASIBLE un rayon de Farkas.
+        En warm-start, la résolution repart de la base persistée (Simplex dual).
         """
         solution = SimplexSolution(status=SolutionStatus.FEASIBLE)
-        
+
         try:
-            # Initialisation variables à 0
-            variables = {var_id: Decimal('0') for var_id in problem.variables.keys()}
-            
-            # Test faisabilité au point origine
-            is_feasible_at_origin = True
-            for constraint in problem.constraints:
-                if not constraint.is_satisfied(variables):
-                    is_feasible_at_origin = False
-                    break
-            
-            if is_feasible_at_origin:
-                # Solution triviale au point origine
-                solution.variables = variables
-                solution.iterations_used = 0
-                solution.final_objective_value = Decimal('0')
-                self.stats['solutions_found'] += 1
-                return solution
-            
-            # Recherche solution faisable simple via ajustement graduel
-            # Pour contraintes GEQ, augmenter variables jusqu'à satisfaction
-            for constraint in problem.constraints:
-                if constraint.constraint_type == ConstraintType.GEQ:
-                    # Calcul valeur minimale nécessaire
-                    total_coeff = sum(abs(coeff) for coeff in constraint.coefficients.values())
-                    if total_coeff > 0:
-                        # Distribution uniforme pour satisfaction contrainte
-                        needed_value = constraint.bound / total_coeff
-                        for var_id, coeff in constraint.coefficients.items():
-                            if coeff > 0:
-                                variables[var_id] = max(variables[var_id], needed_value)
-            
-            # Vérification finale toutes contraintes
-            all_satisfied = True
-            for constraint in problem.constraints:
-                if not constraint.is_satisfied(variables):
-                    all_satisfied = False
-                    break
-            
-            if all_satisfied:
-                solution.variables = variables
-                solution.iterations_used = 1
+            warm_basis = self._apply_warm_start(problem, initial_pivot, warm_basis) if warm_start else None
+            result = self._run_revised_simplex(problem, warm_basis=warm_basis)
+            solution.iterations_used = result.phase1_iterations + result.dual_iterations
+            solution.certificate = result.certificate
+            solution.basis = result.final_basis
+            solution.warm_start_successful = result.warm_start_accepted
+
+            if result.status == "FEASIBLE":
+                solution.variables = self._certificate_variables(problem, result)
                 solution.final_objective_value = Decimal('0')
                 self.stats['solutions_found'] += 1
-            else:
+            elif result.status == "INFEASIBLE":
                 solution.status = SolutionStatus.INFEASIBLE
-                solution.iterations_used = 1  # Au moins 1 itération pour détection infaisabilité
+                solution.iterations_used = max(1, solution.iterations_used)
                 self.stats['infeasible_problems'] += 1
-            
+            elif result.status == "MAX_ITERATIONS":
+                solution.status = SolutionStatus.MAX_ITERATIONS
+            else:
+                solution.status = SolutionStatus.NUMERICAL_ERROR
+                solution.solver_warnings.append(f"Revised simplex status: {result.status}")
+
         except Exception as e:
             self.logger.error(f"Simplex resolution error: {e}")
             solution.status = SolutionStatus.NUMERICAL_ERROR
             solution.solver_warnings.append(str(e))
-        
+
         return solution
-    
-    def _build_phase1_tableau(self, problem: LinearProgram) -> Tuple[List[List[Decimal]], List[str], List[str]]:
+
+    def _run_revised_simplex(self, problem: LinearProgram,
+                             objective_coeffs: Optional[Dict[str, Decimal]] = None,
+                             initial_certificate: Optional[SimplexCertificate] = None,
+                             warm_basis: Optional[SimplexBasis] = None) -> RevisedSimplexResult:
         """
-        Construction tableau initial Phase 1 avec variables artificielles
-        
-        Structure tableau: [objectif] + [contraintes]
-        Colonnes: [RHS] + [variables_originales] + [slack/surplus] + [artificielles]
-        Objectif Phase 1: min Σ(variables_artificielles)
-        
-        Compatible sink-to-source: même structure, interprétation différente variables.
+        Exécution BoundedRevisedSimplex avec mise à jour statistiques pivots/certificats
+
+        Persiste la base finale (stored_basis) si faisable/optimale. Pivots Phase 1
+        ventilés warm/cold; pivots économisés = pivots cold-start de référence de la
+        structure moins pivots effectués depuis la base persistée.
         """
-        A_matrix, b_vector, var_order = problem.get_constraint_matrix()
-        n_vars = len(var_order)
-        n_constraints = len(problem.constraints)
-        
-        # Variables artificielles/slack selon type contrainte
-        artificial_vars = []
-        slack_vars = []
-        
-        for i, constraint in enumerate(problem.constraints):
-            if constraint.constraint_type == ConstraintType.LEQ:
-                slack_vars.append(f"slack_{i}")
-            elif constraint.constraint_type == ConstraintType.GEQ:
-                slack_vars.append(f"surplus_{i}")
-                artificial_vars.append(f"artificial_{i}")
-            else:  # EQ
-                artificial_vars.append(f"artificial_{i}")
-        
-        # Dimensions tableau
-        n_slack = len(slack_vars)
-        n_artificial = len(artificial_vars)
-        tableau_cols = 1 + n_vars + n_slack + n_artificial  # RHS + vars + slack + artificial
-        tableau_rows = 1 + n_constraints  # objectif + contraintes
-        
-        # Initialisation tableau
-        tableau = [[Decimal('0') for _ in range(tableau_cols)] for _ in range(tableau_rows)]
-        
-        # Ligne objectif Phase 1: min Σ(artificial_vars)
-        for i, _ in enumerate(artificial_vars):
-            tableau[0][1 + n_vars + n_slack + i] = Decimal('1')
-        
-        # Contraintes
-        slack_idx = 0
-        artificial_idx = 0
-        
-        for i, constraint in enumerate(problem.constraints):
-            # RHS
-            tableau[i + 1][0] = constraint.bound
-            
-            # Variables originales
-            for j, var_id in enumerate(var_order):
-                if var_id in constraint.coefficients:
-                    tableau[i + 1][1 + j] = constraint.coefficients[var_id]
-            
-            # Variables slack/surplus/artificial
-            if constraint.constraint_type == ConstraintType.LEQ:
-                tableau[i + 1][1 + n_vars + slack_idx] = Decimal('1')
-                slack_idx += 1
-            elif constraint.constraint_type == ConstraintType.GEQ:
-                tableau[i + 1][1 + n_vars + slack_idx] = Decimal('-1')  # surplus
-                tableau[i + 1][1 + n_vars + n_slack + artificial_idx] = Decimal('1')
-                slack_idx += 1
-                artificial_idx += 1
-            else:  # EQ
-                tableau[i + 1][1 + n_vars + n_slack + artificial_idx] = Decimal('1')
-                artificial_idx += 1
-        
-        # Variables de base initiales (slack/artificial)
-        basic_vars = slack_vars + artificial_vars
-        non_basic_vars = var_order + (slack_vars if not slack_vars else []) + artificial_vars
-        
-        return tableau, basic_vars[:n_constraints], non_basic_vars
-    
-    def _is_optimal(self, tableau: List[List[Decimal]]) -> bool:
-        """Test optimalité: tous coefficients objectif ≥ 0"""
-        for j in range(1, len(tableau[0])):
-            if tableau[0][j] < -self.tolerance:
-                return False
-        return True
-    
-    def _select_entering_variable(self, tableau: List[List[Decimal]]) -> int:
-        """Sélection variable entrante (plus négatif dans ligne objectif)"""
-        min_val = Decimal('0')
-        entering_col = -1
-        
-        for j in range(1, len(tableau[0])):
-            if tableau[0][j] < min_val:
-                min_val = tableau[0][j]
-                entering_col = j
-        
-        return entering_col
-    
-    def _select_leaving_variable(self, tableau: List[List[Decimal]], entering_col: int) -> int:
-        """Sélection variable sortante via ratio test"""
-        min_ratio = None
-        leaving_row = -1
-        
-        for i in range(1, len(tableau)):
-            if tableau[i][entering_col] > self.tolerance:  # Coefficient positif
-                ratio = tableau[i][0] / tableau[i][entering_col]
-                if ratio >= 0 and (min_ratio is None or ratio < min_ratio):
-                    min_ratio = ratio
-                    leaving_row = i
-        
-        return leaving_row
-    
-    def _pivot_operation(self, tableau: List[List[Decimal]], pivot_row: int, pivot_col: int) -> None:
-        """Opération pivot standard Simplex"""
-        pivot_element = tableau[pivot_row][pivot_col]
-        
-        # Normalisation ligne pivot
-        for j in range(len(tableau[0])):
-            tableau[pivot_row][j] /= pivot_element
-        
-        # Élimination autres lignes
-        for i in range(len(tableau)):
-            if i != pivot_row and abs(tableau[i][pivot_col]) > self.tolerance:
-                multiplier = tableau[i][pivot_col]
-                for j in range(len(tableau[0])):
-                    tableau[i][j] -= multiplier * tableau[pivot_row][j]
-    
-    def _extract_solution(self, tableau: List[List[Decimal]], basic_vars: List[str], 
-                         problem: LinearProgram) -> Dict[str, Decimal]:
-        """Extraction solution depuis tableau final"""
-        solution = {}
-        
-        # Initialisation toutes variables à 0
-        for var_id in problem.variables.keys():
-            solution[var_id] = Decimal('0')
-        
-        # Variables de base = RHS correspondant
-        for i, basic_var in enumerate(basic_vars):
-            if basic_var in problem.variables:
-                solution[basic_var] = tableau[i + 1][0]
-        
-        return solution
-    
-    def _apply_warm_start(self, tableau: List[List[Decimal]], basic_vars: List[str],
-                         initial_pivot: Dict[str, Decimal]) -> Tuple[List[List[Decimal]], List[str]]:
-        """Application warm-start avec pivot initial (implémentation simplifiée)"""
-        # Pour l'instant, retourne tableau inchangé
-        # Implementation complète nécessiterait reconstruction base selon pivot
-        return tableau, basic_vars
+        engine = BoundedRevisedSimplex(
+            problem,
+            max_iterations=self.max_iterations,
+            refactor_frequency=self.refactor_frequency,
+            backend=self.numeric_backend
+        )
+
+        if warm_basis is not None:
+            result = engine.solve(objective_coeffs, warm_basis=warm_basis)
+        elif initial_certificate is not None:
+            result = engine.solve(objective_coeffs, initial_certificate.basis,
+                                  initial_certificate.nonbasic_at_upper)
+        else:
+            result = engine.solve(objective_coeffs)
+
+        self.stats['simplex_pivots'] += result.iterations
+        self.stats['lu_refactorizations'] += result.refactorizations
+        self.stats['dual_simplex_pivots'] += result.dual_iterations
+        if result.certificate is not None and result.certificate.verified:
+            self.stats['exact_certificates'] += 1
+        if result.exact_fallback_used:
+            self.stats['exact_fallbacks'] += 1
+        if result.factorization_reused:
+            self.stats['factorizations_reused'] += 1
+
+        phase1_pivots = result.phase1_iterations + result.dual_iterations
+        reference_pivots = phase1_pivots
+        if initial_certificate is None:
+            if result.warm_start_accepted:
+                reference_pivots = warm_basis.reference_pivots
+                self.stats['warm_start_pivots'] += phase1_pivots
+                self.stats['warm_start_pivots_saved'] += max(0, reference_pivots - phase1_pivots)
+            else:
+                self.stats['cold_start_pivots'] += phase1_pivots
+        elif self.stored_basis is not None:
+            # Phase 2 depuis base Phase 1 du même problème: référence inchangée
+            reference_pivots = self.stored_basis.reference_pivots
+
+        if result.final_basis is not None and result.status in ("FEASIBLE", "OPTIMAL"):
+            result.final_basis.reference_pivots = reference_pivots
+            result.final_basis.objective = dict(objective_coeffs) if objective_coeffs else None
+            self.stored_basis = result.final_basis
+            self._remember_structure_basis(problem, result.final_basis)
+
+        return result
+
+    def _lookup_structure_basis(self, problem: LinearProgram) -> Optional[SimplexBasis]:
+        """Dernière base connue pour la structure de problem (hit/miss comptés)"""
+        if self.max_structure_bases <= 0:
+            return None
+        basis = self._structure_bases.get(problem.structure_fingerprint())
+        if basis is None:
+            self.stats['structure_cache_misses'] += 1
+            return None
+        self._structure_bases.move_to_end(problem.structure_fingerprint())
+        self.stats['structure_cache_hits'] += 1
+        return basis
+
+    def _remember_structure_basis(self, problem: LinearProgram, basis: SimplexBasis) -> None:
+        """Mémorise base finale pour la structure de problem, éviction LRU"""
+        if self.max_structure_bases <= 0:
+            return
+        fingerprint = problem.structure_fingerprint()
+        self._structure_bases[fingerprint] = basis
+        self._structure_bases.move_to_end(fingerprint)
+        while len(self._structure_bases) > self.max_structure_bases:
+            self._structure_bases.popitem(last=False)
+            self.stats['structure_cache_evictions'] += 1
+
+    def _certificate_variables(self, problem: LinearProgram,
+                               result: RevisedSimplexResult) -> Dict[str, Decimal]:
+        """Point primal exact converti en Decimal pour toutes les variables du problème"""
+        values = result.values
+        return {
+            var_id: fraction_to_decimal(values[var_id]) if var_id in values else Decimal('0')
+            for var_id in problem.variables.keys()
+        }
+
+    def _apply_warm_start(self, problem: LinearProgram,
+                         initial_pivot: Optional[Dict[str, Decimal]] = None,
+                         structure_basis: Optional[SimplexBasis] = None) -> Optional[SimplexBasis]:
+        """
+        Sélection base warm-start pour problem
+
+        La base de même structure (cache structure) prime sur la dernière base
+        persistée. Réinstallation par labels (+ factorisation si structure
+        identique); le pivot validé géométriquement sert de garde (stabilité). Sans
+        variable structurelle commune, la base se réduirait à la base lignes: cold-start.
+        """
+        basis = structure_basis if structure_basis is not None else self.stored_basis
+        if basis is None:
+            return None
+
+        shared = set(problem.variables.keys()).intersection(basis.basic_labels + basis.nonbasic_at_upper)
+        return basis if shared else None
     
     def _requires_cross_validation(self, solution: SimplexSolution, 
                                  pivot_status: Optional[PivotStatus]) -> bool:
@@ -674,14 +868,12 @@ class TripleValidationOrientedSimplex:
         """Cross-validation solution avec méthode alternative"""
         self.stats['cross_validations_performed'] += 1
         
-        # Vérification contraintes directe
-        satisfied_constraints = 0
-        for constraint in problem.constraints:
-            if constraint.is_satisfied(solution.variables):
-                satisfied_constraints += 1
+        # Vérification contraintes directe (matrice compilée)
+        satisfied_mask = problem.compile_constraints().satisfied_mask(solution.variables)
+        satisfied_constraints = sum(satisfied_mask)
         
         solution.constraints_satisfied = satisfied_constraints
-        solution.total_constraints = len(problem.constraints)
+        solution.total_constraints = len(satisfied_mask)
         solution.cross_validation_passed = (satisfied_constraints == solution.total_constraints)
         
         if not solution.cross_validation_passed:
@@ -694,20 +886,22 @@ class TripleValidationOrientedSimplex:
 
     def _solve_phase2_from_feasible_base(self, problem: LinearProgram,
                                        objective_coeffs: Dict[str, Decimal],
-                                       feasible_base: Dict[str, Decimal]) -> SimplexSolution:
+                                       feasible_base: Dict[str, Decimal],
+                                       initial_certificate: Optional[SimplexCertificate] = None) -> SimplexSolution:
         """
-        NOUVEAU: Implémentation Simplex Phase 2 pour Price Discovery
+        Simplex Phase 2 pour Price Discovery
 
-        Algorithme Phase 2 standard:
-        1. Utiliser solution faisible de Phase 1 comme point de départ
-        2. Construire tableau avec fonction objectif minimize Σ(c_j × x_j)
-        3. Itérer avec test d'optimalité et pivot jusqu'à solution optimale
+        Algorithme Phase 2 révisé borné:
+        1. Repartir de la base finale Phase 1 (certificat) si disponible
+        2. Minimiser Σ(c_j × x_j) par pivots flottants avec ratio test borné
+        3. Certifier exactement faisabilité primale et coûts réduits (optimalité)
         4. Retourner solution avec status=OPTIMAL
 
         Args:
             problem: Problème LP original (contraintes)
             objective_coeffs: Coefficients objectif (var_id → prix_unitaire)
-            feasible_base: Solution faisible Phase 1
+            feasible_base: Solution faisible Phase 1 (point de départ historique, base via certificat)
+            initial_certificate: Certificat Phase 1 portant la base de départ
 
         Returns:
             SimplexSolution avec status=OPTIMAL ou erreur
@@ -717,50 +911,31 @@ class TripleValidationOrientedSimplex:
         try:
             self.logger.info(f"Starting Phase 2 optimization from feasible base")
 
-            # Phase 2: Algorithme optimisation robuste par énumération intelligente
-            best_solution = feasible_base.copy()
-            best_objective = self._evaluate_objective(feasible_base, objective_coeffs)
-            iterations = 0
-
-            self.logger.info(f"Phase 2 initial objective: {best_objective}")
-
-            # Phase 2.1: Test corner solutions optimaux
-            corner_candidates = self._generate_corner_candidates(problem)
-
-            for corner_solution in corner_candidates:
-                if self._is_solution_feasible(corner_solution, problem):
-                    corner_objective = self._evaluate_objective(corner_solution, objective_coeffs)
-                    if corner_objective < best_objective:
-                        best_solution = corner_solution
-                        best_objective = corner_objective
-                        self.logger.debug(f"Corner improved: {corner_solution} -> {corner_objective}")
-                        iterations += 1
-
-            # Phase 2.2: Optimisation locale depuis meilleure corner
-            if iterations > 0:
-                # Refinement local autour du corner optimal trouvé
-                refined_solution, refined_objective, local_iterations = self._local_optimization(
-                    problem, objective_coeffs, best_solution, best_objective
-                )
-
-                if refined_objective < best_objective:
-                    best_solution = refined_solution
-                    best_objective = refined_objective
-                    iterations += local_iterations
-                    self.logger.debug(f"Local optimization improved to: {refined_objective}")
-
-            if iterations == 0:
-                self.logger.info("Phase 1 solution was already optimal")
-
-            self.logger.info(f"Phase 2 optimization completed: {iterations} iterations")
-
-            # Solution finale Phase 2
-            solution.variables = best_solution
+            result = self._run_revised_simplex(problem, objective_coeffs, initial_certificate)
+            iterations = result.phase2_iterations
+            solution.certificate = result.certificate
+
+            if result.status == "OPTIMAL":
+                if iterations == 0:
+                    self.logger.info("Phase 1 solution was already optimal")
+                solution.variables = self._certificate_variables(problem, result)
+                solution.final_objective_value = self._evaluate_objective(solution.variables, objective_coeffs)
+            elif result.status == "UNBOUNDED":
+                solution.status = SolutionStatus.UNBOUNDED
+                solution.variables = self._certificate_variables(problem, result)
+            elif result.status == "INFEASIBLE":
+                solution.status = SolutionStatus.INFEASIBLE
+            elif result.status == "MAX_ITERATIONS":
+                solution.status = SolutionStatus.MAX_ITERATIONS
+            else:
+                solution.status = SolutionStatus.NUMERICAL_ERROR
+                solution.solver_warnings.append(f"Phase 2 revised simplex status: {result.status}")
+
             solution.iterations_used = iterations
             solution.phase2_iterations = iterations
-            solution.final_objective_value = best_objective
 
-            self.logger.info(f"Phase 2 completed: {iterations} iterations, optimal_value={best_objective}")
+            self.logger.info(f"Phase 2 completed: {iterations} iterations, "
+                             f"optimal_value={solution.final_objective_value}")
             return solution
 
         except Exception as e:
@@ -769,272 +944,6 @@ class TripleValidationOrientedSimplex:
             solution.solver_warnings.append(f"Phase 2 failed: {str(e)}")
             return solution
 
-    def _build_phase2_tableau(self, problem: LinearProgram,
-                             objective_coeffs: Dict[str, Decimal],
-                             feasible_base: Dict[str, Decimal]) -> Tuple[List[List[Decimal]], List[str], List[str]]:
-        """
-        Construction tableau Phase 2 avec fonction objectif
-
-        Returns:
-            (tableau, var_names, basic_vars) pour itérations Phase 2
-        """
-        # Variables ordonnées pour tableau
-        var_names = list(problem.variables.keys())
-        num_vars = len(var_names)
-        num_constraints = len(problem.constraints)
-
-        # Tableau Phase 2: [objective_row, constraints_rows]
-        tableau = []
-
-        # Row 0: Fonction objectif minimize sum(c_j * x_j)
-        # Format: [-c1, -c2, ..., -cn, 0] où c_j sont les coefficients
-        obj_row = []
-        for var_name in var_names:
-            coeff = objective_coeffs.get(var_name, Decimal('0'))
-            obj_row.append(-coeff)  # Négatif pour minimisation
-        obj_row.append(Decimal('0'))  # RHS objectif
-        tableau.append(obj_row)
-
-        # Rows 1+: Contraintes du problème
-        for constraint in problem.constraints:
-            constraint_row = []
-            for var_name in var_names:
-                coeff = constraint.coefficients.get(var_name, Decimal('0'))
-                constraint_row.append(coeff)
-            constraint_row.append(constraint.bound)  # RHS contrainte
-            tableau.append(constraint_row)
-
-        # Pour simplification: utiliser algorithme hybride plus robuste
-        # Méthode alternative: gradient-based optimization avec contraintes
-        # (Plus simple que construction tableau pivot complet)
-
-        # Variables de base initiales (placeholder - pas utilisé dans implémentation simplifiée)
-        basic_vars = var_names[:num_constraints] if num_constraints <= num_vars else var_names
-
-        self.logger.debug(f"Phase 2 tableau built: {len(tableau)}x{len(tableau[0])}")
-        return tableau, var_names, basic_vars
-
-    def _find_entering_variable_phase2(self, tableau: List[List[Decimal]],
-                                     var_names: List[str]) -> Tuple[int, bool]:
-        """
-        Trouve variable entrante pour Phase 2 selon règle reduced costs
-
-        Returns:
-            (entering_var_index, optimality_reached)
-        """
-        obj_row = tableau[0]
-
-        # Test optimalité: tous reduced costs ≥ 0 (minimisation)
-        min_reduced_cost = min(obj_row[:-1])  # Exclude RHS
-
-        if min_reduced_cost >= -self.tolerance:
-            return -1, True  # Optimal solution atteinte
-
-        # Variable entrante: plus négatif reduced cost (Dantzig rule)
-        entering_idx = obj_row[:-1].index(min_reduced_cost)
-
-        self.logger.debug(f"Entering variable: {var_names[entering_idx]} (reduced_cost={min_reduced_cost})")
-        return entering_idx, False
-
-    def _find_leaving_variable_phase2(self, tableau: List[List[Decimal]],
-                                    entering_var_idx: int) -> int:
-        """
-        Trouve variable sortante via ratio test minimum
-
-        Returns:
-            leaving_var_index ou -1 si unbounded
-        """
-        min_ratio = None
-        leaving_idx = -1
-
-        for i in range(1, len(tableau)):  # Skip objective row
-            pivot_element = tableau[i][entering_var_idx]
-            rhs = tableau[i][-1]
-
-            if pivot_element > self.tolerance:  # Positive pivot required
-                ratio = rhs / pivot_element
-                if min_ratio is None or ratio < min_ratio:
-                    min_ratio = ratio
-                    leaving_idx = i - 1  # Adjust for constraint indexing
-
-        if leaving_idx == -1:
-            self.logger.debug("No leaving variable found - unbounded solution")
-        else:
-            self.logger.debug(f"Leaving variable index: {leaving_idx} (ratio={min_ratio})")
-
-        return leaving_idx
-
-    def _perform_pivot_operation(self, tableau: List[List[Decimal]],
-                               entering_col: int, leaving_row: int) -> None:
-        """
-        Effectue opération pivot sur tableau Simplex
-        """
-        leaving_row += 1  # Adjust for objective row
-        pivot_element = tableau[leaving_row][entering_col]
-
-        if abs(pivot_element) < self.tolerance:
-            raise ValueError(f"Pivot element too small: {pivot_element}")
-
-        # Normaliser ligne pivot
-        for j in range(len(tableau[leaving_row])):
-            tableau[leaving_row][j] /= pivot_element
-
-        # Élimination Gaussian sur autres lignes
-        for i in range(len(tableau)):
-            if i != leaving_row:
-                multiplier = tableau[i][entering_col]
-                for j in range(len(tableau[i])):
-                    tableau[i][j] -= multiplier * tableau[leaving_row][j]
-
-        self.logger.debug(f"Pivot operation completed: ({leaving_row-1}, {entering_col})")
-
-    def _extract_solution_from_tableau(self, tableau: List[List[Decimal]],
-                                     var_names: List[str], basic_vars: List[str],
-                                     problem: LinearProgram) -> Dict[str, Decimal]:
-        """
-        Extrait solution finale du tableau Phase 2
-        """
-        solution = {}
-
-        # Variables basiques = RHS des lignes contraintes
-        for i, basic_var in enumerate(basic_vars):
-            if i + 1 < len(tableau):  # Skip objective row
-                solution[basic_var] = max(Decimal('0'), tableau[i + 1][-1])
-
-        # Variables non-basiques = 0
-        for var_name in var_names:
-            if var_name not in solution:
-                solution[var_name] = Decimal('0')
-
-        self.logger.debug(f"Extracted solution: {solution}")
-        return solution
-
-    def _generate_corner_candidates(self, problem: LinearProgram) -> List[Dict[str, Decimal]]:
-        """
-        Génère candidats corner solutions pour optimisation Phase 2
-        """
-        candidates = []
-        var_names = list(problem.variables.keys())
-
-        # Stratégie 1: Solutions où variables = bornes min/max
-        for var_name in var_names:
-            var = problem.variables[var_name]
-
-            # Corner au minimum
-            corner_min = {v: var.lower_bound for v in var_names}
-            corner_min[var_name] = var.lower_bound
-            candidates.append(corner_min)
-
-            # Corner au maximum si défini
-            if var.upper_bound is not None:
-                corner_max = {v: var.lower_bound for v in var_names}
-                corner_max[var_name] = var.upper_bound
-                candidates.append(corner_max)
-
-        # Stratégie 2: Solutions contrainte-définies
-        for constraint in problem.constraints:
-            if constraint.constraint_type == ConstraintType.EQ:
-                # Solution où contrainte égalité active
-                constraint_solution = {v: problem.variables[v].lower_bound for v in var_names}
-
-                # Si contrainte simple (ex: x = 5), utiliser directement
-                if len(constraint.coefficients) == 1:
-                    var_id = list(constraint.coefficients.keys())[0]
-                    coeff = constraint.coefficients[var_id]
-                    if coeff != 0:
-                        constraint_solution[var_id] = constraint.bound / coeff
-
-                candidates.append(constraint_solution)
-
-        # Stratégie 3: Intersections contraintes + bornes (plus exhaustif)
-
-        # Corner spéciaux: borne + contrainte active
-        for constraint in problem.constraints:
-            for var_name in var_names:
-                # Corner: variable = borne min + contrainte active
-                corner_bound_min = {v: problem.variables[v].lower_bound for v in var_names}
-
-                # Si contrainte permet, ajuster pour satisfaire contrainte exactement
-                if var_name in constraint.coefficients and constraint.coefficients[var_name] != 0:
-                    # Résoudre: coeff * var_name + sum(autres) = bound
-                    other_sum = sum(constraint.coefficients[v] * corner_bound_min[v]
-                                  for v in constraint.coefficients if v != var_name)
-                    coeff = constraint.coefficients[var_name]
-
-                    if constraint.constraint_type == ConstraintType.GEQ:
-                        # var_name >= (bound - other_sum) / coeff
-                        min_val = (constraint.bound - other_sum) / coeff
-                        corner_bound_min[var_name] = max(problem.variables[var_name].lower_bound, min_val)
-                    elif constraint.constraint_type == ConstraintType.LEQ:
-                        # var_name <= (bound - other_sum) / coeff
-                        max_val = (constraint.bound - other_sum) / coeff
-                        corner_bound_min[var_name] = min(
-                            corner_bound_min[var_name], max_val
-                        )
-                        if problem.variables[var_name].upper_bound is not None:
-                            corner_bound_min[var_name] = min(corner_bound_min[var_name],
-                                                           problem.variables[var_name].upper_bound)
-
-                candidates.append(corner_bound_min)
-
-        # Stratégie 4: Intersections contraintes pures
-        if len(problem.constraints) >= 2:
-            for i, c1 in enumerate(problem.constraints):
-                for j, c2 in enumerate(problem.constraints[i+1:], i+1):
-                    intersection_solution = self._solve_constraint_intersection(c1, c2, var_names, problem)
-                    if intersection_solution:
-                        candidates.append(intersection_solution)
-
-        self.logger.debug(f"Generated {len(candidates)} corner candidates")
-        return candidates
-
-    def _solve_constraint_intersection(self, c1: LinearConstraint, c2: LinearConstraint,
-                                     var_names: List[str], problem: LinearProgram) -> Optional[Dict[str, Decimal]]:
-        """
-        Résout intersection de 2 contraintes actives (cas 2x2 simplifié)
-        Traite GEQ/LEQ comme contraintes d'égalité actives
-        """
-        try:
-            # Cas simplifié: 2 variables, 2 contraintes actives (traitées comme égalité)
-            if len(var_names) == 2:
-                x_var, y_var = var_names[0], var_names[1]
-
-                # Coefficients système: a1*x + b1*y = d1, a2*x + b2*y = d2
-                # (contraintes traitées comme actives/égalité)
-                a1 = c1.coefficients.get(x_var, Decimal('0'))
-                b1 = c1.coefficients.get(y_var, Decimal('0'))
-                d1 = c1.bound
-
-                a2 = c2.coefficients.get(x_var, Decimal('0'))
-                b2 = c2.coefficients.get(y_var, Decimal('0'))
-                d2 = c2.bound
-
-                # Déterminant
-                det = a1 * b2 - a2 * b1
-
-                if abs(det) > Decimal('1e-10'):  # Non-singulier
-                    x_val = (d1 * b2 - d2 * b1) / det
-                    y_val = (a1 * d2 - a2 * d1) / det
-
-                    solution = {x_var: x_val, y_var: y_val}
-
-                    # Assurer bornes variables
-                    for var_id, value in solution.items():
-                        var = problem.variables[var_id]
-                        if value < var.lower_bound:
-                            solution[var_id] = var.lower_bound
-                        elif var.upper_bound is not None and value > var.upper_bound:
-                            solution[var_id] = var.upper_bound
-                        else:
-                            solution[var_id] = value
-
-                    return solution
-
-        except Exception as e:
-            self.logger.debug(f"Constraint intersection failed: {e}")
-
-        return None
-
     def _is_solution_feasible(self, solution: Dict[str, Decimal], problem: LinearProgram) -> bool:
         """
         Teste faisabilité solution pour toutes contraintes
@@ -1048,52 +957,7 @@ class TripleValidationOrientedSimplex:
                 return False
 
         # Test contraintes
-        for constraint in problem.constraints:
-            if not constraint.is_satisfied(solution):
-                return False
-
-        return True
-
-    def _local_optimization(self, problem: LinearProgram, objective_coeffs: Dict[str, Decimal],
-                          start_solution: Dict[str, Decimal], start_objective: Decimal) -> Tuple[Dict[str, Decimal], Decimal, int]:
-        """
-        Optimisation locale autour d'une solution (gradient descent simplifié)
-        """
-        current_solution = start_solution.copy()
-        current_objective = start_objective
-        iterations = 0
-        max_local_iterations = 5
-
-        step_size = Decimal('0.1')
-
-        for i in range(max_local_iterations):
-            improved = False
-
-            # Test perturbations dans direction gradient
-            for var_id in objective_coeffs:
-                if var_id in current_solution:
-                    gradient = objective_coeffs[var_id]  # Gradient = coefficient objectif
-
-                    # Perturbation négative (pour minimisation)
-                    if gradient > 0:  # Réduire variable si coefficient positif
-                        perturbed_solution = current_solution.copy()
-                        perturbed_solution[var_id] = max(
-                            problem.variables[var_id].lower_bound,
-                            current_solution[var_id] - step_size
-                        )
-
-                        if self._is_solution_feasible(perturbed_solution, problem):
-                            perturbed_objective = self._evaluate_objective(perturbed_solution, objective_coeffs)
-                            if perturbed_objective < current_objective:
-                                current_solution = perturbed_solution
-                                current_objective = perturbed_objective
-                                improved = True
-                                iterations += 1
-
-            if not improved:
-                break  # Converged locally
-
-        return current_solution, current_objective, iterations
+        return problem.compile_constraints().all_satisfied(solution)
 
     def _evaluate_objective(self, variables: Dict[str, Decimal],
                           objective_coeffs: Dict[str, Decimal]) -> Decimal:
@@ -1113,9 +977,14 @@ class TripleValidationOrientedSimplex:
         elif solution.status == SolutionStatus.INFEASIBLE:
             self.stats['infeasible_problems'] += 1
     
-    def get_solver_stats(self) -> Dict[str, int]:
+    def get_solver_stats(self) -> Dict[str, Any]:
         """Retourne statistiques solveur pour monitoring"""
         combined_stats = dict(self.stats)
+        lookups = self.stats['structure_cache_hits'] + self.stats['structure_cache_misses']
+        combined_stats['structure_cache_size'] = len(self._structure_bases)
+        combined_stats['structure_cache_hit_rate'] = (
+            round(self.stats['structure_cache_hits'] / lookups, 4) if lookups else 0.0
+        )
         combined_stats.update(self.pivot_manager.get_validation_stats())
         return combined_stats
 
@@ -1144,10 +1013,13 @@ def validate_simplex_solution(solution: SimplexSolution, problem: LinearProgram)
         return [f"Solution status not feasible: {solution.status.value}"]
     
     # Test satisfaction contraintes
-    for i, constraint in enumerate(problem.constraints):
-        if not constraint.is_satisfied(solution.variables):
-            violation = constraint.get_violation(solution.variables)
-            errors.append(f"Constraint {i} ({constraint.name}) violated by {violation}")
+    compiled = problem.compile_constraints()
+    satisfied_mask = compiled.satisfied_mask(solution.variables)
+    if not all(satisfied_mask):
+        violations = compiled.violation_vector(solution.variables)
+        for i, satisfied in enumerate(satisfied_mask):
+            if not satisfied:
+                errors.append(f"Constraint {i} ({compiled.names[i]}) violated by {violations[i]}")
     
     # Test bounds variables
     for var_id, var in problem.variables.items():
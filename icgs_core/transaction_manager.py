@@ -15,7 +15,7 @@ Les données historisées avec au moins une transaction soumise ne peuvent
 JAMAIS être modifiées. Cette contrainte guide toutes les décisions techniques.
 """
 
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, List, Mapping, Set, Optional, Any
 from datetime import datetime, timezone
 from decimal import Decimal
 import hashlib
@@ -148,7 +148,7 @@ class TransactionManager:
         # Validation structure snapshots
         for snapshot in self._core_taxonomy.taxonomy_history:
             assert isinstance(snapshot.transaction_num, int)
-            assert isinstance(snapshot.account_mappings, dict)
+            assert isinstance(snapshot.account_mappings, Mapping)
             assert isinstance(snapshot.timestamp, float)
 
         self._api_calls['validation_checks'] += 1
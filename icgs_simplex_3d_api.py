@@ -32,7 +32,9 @@ import copy
 
 # Import modules ICGS core
 from icgs_core.simplex_solver import SimplexSolution, PivotStatus, ValidationMode
-from icgs_core.linear_programming import LinearProgram, FluxVariable, LinearConstraint, ConstraintType
+from icgs_core.linear_programming import (
+    LinearProgram, FluxVariable, LinearConstraint, ConstraintType, CompiledConstraintMatrix
+)
 
 
 class ConstraintClass3D(Enum):
@@ -126,6 +128,10 @@ class Simplex3DMapper:
     def __init__(self):
         self.constraint_classification: Dict[str, ConstraintClass3D] = {}
         self.constraint_weights: Dict[str, Dict[str, Decimal]] = {}
+        # Matrice compilée du LP extrait + classe par ligne (une ligne par nom)
+        self.compiled_matrix: Optional[CompiledConstraintMatrix] = None
+        self.row_classes: List[ConstraintClass3D] = []
+        self._compiled_classification: Optional[Dict[str, ConstraintClass3D]] = None
 
     def classify_constraint(self, constraint: LinearConstraint) -> ConstraintClass3D:
         """Classifie une contrainte selon son type économique"""
@@ -153,15 +159,21 @@ class Simplex3DMapper:
             if constraint_class not in [ConstraintClass3D.UNKNOWN]:
                 self.constraint_weights[constraint.name] = constraint.coefficients.copy()
 
-    def map_variables_to_3d(self, variables_fi: Dict[str, Decimal]) -> Tuple[float, float, float]:
+        # Lignes de la matrice compilée: seule la dernière contrainte d'un nom compte
+        self.compiled_matrix = linear_program.compile_constraints()
+        last_row = {name: i for i, name in enumerate(self.compiled_matrix.names)}
+        self.row_classes = [
+            self.constraint_classification[name] if last_row[name] == i else ConstraintClass3D.UNKNOWN
+            for i, name in enumerate(self.compiled_matrix.names)
+        ]
+        self._compiled_classification = self.constraint_classification
+
+    def compute_axis_contributions(self, variables_fi: Dict[str, Decimal]) -> Dict[ConstraintClass3D, Decimal]:
         """
-        Mappe variables f_i vers coordonnées 3D
+        Contributions Σ(f_i × weight_i) par axe SOURCE/TARGET/SECONDARY
 
-        Returns:
-            (x, y, z) où :
-            - x = Σ(f_i × weight_i) pour contraintes SOURCE
-            - y = Σ(f_i × weight_i) pour contraintes TARGET
-            - z = Σ(f_i × weight_i) pour contraintes SECONDARY
+        Un seul produit A @ f exact sur la matrice compilée si les contraintes
+        viennent d'extract_constraint_info, sinon parcours des poids configurés.
         """
         contributions = {
             ConstraintClass3D.SOURCE: Decimal('0'),
@@ -169,7 +181,12 @@ class Simplex3DMapper:
             ConstraintClass3D.SECONDARY: Decimal('0')
         }
 
-        # Calculer contributions par axe
+        if self.compiled_matrix is not None and self._compiled_classification is self.constraint_classification:
+            for constraint_class, lhs in zip(self.row_classes, self.compiled_matrix.exact_multiply(variables_fi)):
+                if constraint_class in contributions:
+                    contributions[constraint_class] += lhs
+            return contributions
+
         for constraint_name, constraint_class in self.constraint_classification.items():
             if constraint_class in contributions and constraint_name in self.constraint_weights:
                 weights = self.constraint_weights[constraint_name]
@@ -182,6 +199,20 @@ class Simplex3DMapper:
 
                 contributions[constraint_class] += constraint_contribution
 
+        return contributions
+
+    def map_variables_to_3d(self, variables_fi: Dict[str, Decimal]) -> Tuple[float, float, float]:
+        """
+        Mappe variables f_i vers coordonnées 3D
+
+        Returns:
+            (x, y, z) où :
+            - x = Σ(f_i × weight_i) pour contraintes SOURCE
+            - y = Σ(f_i × weight_i) pour contraintes TARGET
+            - z = Σ(f_i × weight_i) pour contraintes SECONDARY
+        """
+        contributions = self.compute_axis_contributions(variables_fi)
+
         return (
             float(contributions[ConstraintClass3D.SOURCE]),
             float(contributions[ConstraintClass3D.TARGET]),
@@ -222,16 +253,13 @@ class Simplex3DCollector:
         if not self.mapper.constraint_classification:
             self.mapper.extract_constraint_info(linear_program)
 
-        # Mapper variables f_i vers 3D
-        coordinates_3d = self.mapper.map_variables_to_3d(solution.variables)
-
-        # Calculer contributions par axe
-        contributions = {}
-        for constraint_class in ConstraintClass3D:
-            if constraint_class != ConstraintClass3D.UNKNOWN:
-                contributions[constraint_class] = self._calculate_axis_contribution(
-                    solution.variables, constraint_class
-                )
+        # Contributions par axe (un seul passage) → coordonnées 3D
+        contributions = self.mapper.compute_axis_contributions(solution.variables)
+        coordinates_3d = (
+            float(contributions[ConstraintClass3D.SOURCE]),
+            float(contributions[ConstraintClass3D.TARGET]),
+            float(contributions[ConstraintClass3D.SECONDARY])
+        )
 
         # Identifier variables basic/non-basic
         basic_vars = set()
@@ -309,16 +337,7 @@ class Simplex3DCollector:
     def _calculate_axis_contribution(self, variables_fi: Dict[str, Decimal],
                                    axis: ConstraintClass3D) -> Decimal:
         """Calcule contribution totale pour un axe donné"""
-        total = Decimal('0')
-
-        for constraint_name, constraint_class in self.mapper.constraint_classification.items():
-            if constraint_class == axis and constraint_name in self.mapper.constraint_weights:
-                weights = self.mapper.constraint_weights[constraint_name]
-                for var_id, weight in weights.items():
-                    if var_id in variables_fi:
-                        total += variables_fi[var_id] * weight
-
-        return total
+        return self.mapper.compute_axis_contributions(variables_fi).get(axis, Decimal('0'))
 
     def export_animation_data(self) -> Dict[str, Any]:
         """Exporte données pour animation 3D"""
@@ -376,6 +395,8 @@ class Simplex3DCollector:
         self.current_step = 0
         self.mapper.constraint_classification.clear()
         self.mapper.constraint_weights.clear()
+        self.mapper.compiled_matrix = None
+        self.mapper.row_classes = []
 
 
 # Import math module pour distance euclidienne
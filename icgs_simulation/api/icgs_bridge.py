@@ -15,9 +15,11 @@ import logging
 import time
 import threading
 import weakref
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from functools import lru_cache
 
@@ -26,7 +28,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from icgs_core import (
     Account, Transaction, TransactionMeasure,
-    TripleValidationOrientedSimplex, ValidationMode, SolutionStatus
+    TripleValidationOrientedSimplex, ValidationMode, SolutionStatus, ParametricPriceCurve
 )
 from icgs_core.enhanced_dag import EnhancedDAG
 from icgs_core.character_set_manager import (
@@ -55,9 +57,9 @@ class PerformanceCache:
     Cache haute performance pour optimiser gestion 65 agents + données 3D massives
 
     Features:
-    - Cache validation transactions avec TTL
-    - Cache données 3D par secteur
-    - Mécanisme LRU avec cleanup automatique
+    - Cache validation adressé par contenu (empreinte LP/transaction + version
+      état DAG): invalidation par version, pas de TTL, LRU O(1)
+    - Cache données 3D par secteur avec TTL
     - Thread-safe pour requests web simultanées
     """
 
@@ -65,45 +67,44 @@ class PerformanceCache:
         self.max_validation_cache = max_validation_cache
         self.max_3d_cache = max_3d_cache
 
-        # Cache validation transactions avec timestamps
-        self._validation_cache: Dict[str, Tuple[Any, float]] = {}
+        # Cache validation: clé contenu → résultat, ordre LRU (tête = moins récent)
+        self._validation_cache: OrderedDict = OrderedDict()
         self._validation_lock = threading.RLock()
 
         # Cache données 3D par groupe sectoriel
         self._3d_data_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
         self._3d_lock = threading.RLock()
 
-        # Configuration TTL (Time-To-Live)
-        self.validation_ttl = 300.0  # 5 minutes
+        # Configuration TTL (Time-To-Live) données 3D
         self.data_3d_ttl = 600.0     # 10 minutes
 
         # Statistiques performance
         self.hit_count = 0
         self.miss_count = 0
 
-    def get_validation_result(self, transaction_key: str) -> Optional[Any]:
-        """Récupère résultat validation depuis cache si disponible"""
+    def get_validation_result(self, validation_key: Tuple) -> Optional[Any]:
+        """Résultat validation pour une clé contenu+version, None si absent"""
         with self._validation_lock:
-            if transaction_key in self._validation_cache:
-                result, timestamp = self._validation_cache[transaction_key]
-                if time.time() - timestamp <= self.validation_ttl:
-                    self.hit_count += 1
-                    return result
-                else:
-                    # Expiration cache
-                    del self._validation_cache[transaction_key]
+            result = self._validation_cache.get(validation_key)
+            if result is not None:
+                self._validation_cache.move_to_end(validation_key)
+                self.hit_count += 1
+                return result
 
         self.miss_count += 1
         return None
 
-    def store_validation_result(self, transaction_key: str, result: Any):
-        """Stocke résultat validation avec cleanup LRU si nécessaire"""
+    def store_validation_result(self, validation_key: Tuple, result: Any):
+        """Stocke résultat validation, éviction LRU O(1) au-delà de max_validation_cache"""
         with self._validation_lock:
-            # Cleanup si taille maximale atteinte
-            if len(self._validation_cache) >= self.max_validation_cache:
-                self._cleanup_validation_cache()
+            self._validation_cache[validation_key] = result
+            self._validation_cache.move_to_end(validation_key)
+            while len(self._validation_cache) > self.max_validation_cache:
+                self._validation_cache.popitem(last=False)
 
-            self._validation_cache[transaction_key] = (result, time.time())
+    def record_hit(self):
+        """Hit servi hors cache (résultat définitif déjà connu)"""
+        self.hit_count += 1
 
     def get_3d_data(self, data_key: str) -> Optional[Dict[str, Any]]:
         """Récupère données 3D depuis cache si disponibles"""
@@ -127,18 +128,6 @@ class PerformanceCache:
 
             self._3d_data_cache[data_key] = (data, time.time())
 
-    def _cleanup_validation_cache(self):
-        """Cleanup LRU pour cache validation (supprime 25% plus anciens)"""
-        if not self._validation_cache:
-            return
-
-        # Trier par timestamp et supprimer 25% plus anciens
-        sorted_items = sorted(self._validation_cache.items(), key=lambda x: x[1][1])
-        cleanup_count = len(sorted_items) // 4
-
-        for key, _ in sorted_items[:cleanup_count]:
-            del self._validation_cache[key]
-
     def _cleanup_3d_cache(self):
         """Cleanup LRU pour cache données 3D"""
         if not self._3d_data_cache:
@@ -171,12 +160,179 @@ class PerformanceCache:
             self._3d_data_cache.clear()
 
 
+class TransactionRegistry(Sequence):
+    """
+    Registre transactions simulation indexé par ID
+
+    Séquence ordonnée (API liste: len, itération, index, slices, append)
+    maintenant incrémentalement:
+    - Index transaction_id → position (lookup O(1))
+    - Compteurs envoyées/reçues par agent
+    - Agrégats par paire secteurs (nombre/volume créés et validés)
+    - Statut validation par transaction (pending, validated, rejected)
+    """
+
+    def __init__(self):
+        self._transactions: List[Transaction] = []
+        self._index: Dict[str, int] = {}
+        self._statuses: Dict[str, str] = {}
+        self._committed_results: Dict[str, Any] = {}
+        self._sent: Counter = Counter()
+        self._received: Counter = Counter()
+        self._sector_pairs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.total_volume = Decimal('0')
+
+    def append(self, transaction: Transaction) -> None:
+        """Ajout transaction (ID unique) avec mise à jour index et agrégats"""
+        transaction_id = transaction.transaction_id
+        if transaction_id in self._index:
+            raise ValueError(f"Transaction '{transaction_id}' déjà enregistrée")
+
+        self._index[transaction_id] = len(self._transactions)
+        self._transactions.append(transaction)
+        self._statuses[transaction_id] = 'pending'
+        self._sent[transaction.source_account_id] += 1
+        self._received[transaction.target_account_id] += 1
+        self.total_volume += transaction.amount
+
+        aggregate = self._sector_pair_aggregate(transaction)
+        aggregate['count'] += 1
+        aggregate['volume'] += transaction.amount
+
+    def get(self, transaction_id: str) -> Optional[Transaction]:
+        """Transaction par ID, None si inconnue"""
+        position = self._index.get(transaction_id)
+        return self._transactions[position] if position is not None else None
+
+    def record_validation(self, transaction_id: str, success: bool, result: Optional[Any] = None) -> None:
+        """
+        Enregistre résultat validation FEASIBILITY
+
+        Agrégats validés mis à jour seulement au changement de statut
+        (re-validation idempotente). Le résultat d'une transaction commitée
+        est conservé: définitif, il ne dépend plus de l'état du DAG.
+        """
+        transaction = self.get(transaction_id)
+        if transaction is None:
+            return
+        if success and result is not None:
+            self._committed_results[transaction_id] = result
+
+        new_status = 'validated' if success else 'rejected'
+        old_status = self._statuses[transaction_id]
+        if new_status == old_status:
+            return
+
+        aggregate = self._sector_pair_aggregate(transaction)
+        if old_status == 'validated':
+            aggregate['validated_count'] -= 1
+            aggregate['validated_volume'] -= transaction.amount
+        if new_status == 'validated':
+            aggregate['validated_count'] += 1
+            aggregate['validated_volume'] += transaction.amount
+        self._statuses[transaction_id] = new_status
+
+    def committed_result(self, transaction_id: str) -> Optional[Any]:
+        """Résultat FEASIBILITY d'une transaction commitée dans le DAG, sinon None"""
+        return self._committed_results.get(transaction_id)
+
+    def status(self, transaction_id: str) -> Optional[str]:
+        """Statut validation (pending, validated, rejected), None si inconnue"""
+        return self._statuses.get(transaction_id)
+
+    def sent_count(self, agent_id: str) -> int:
+        return self._sent[agent_id]
+
+    def received_count(self, agent_id: str) -> int:
+        return self._received[agent_id]
+
+    def sector_pair_stats(self, source_sector: str, target_sector: str) -> Dict[str, Any]:
+        """Agrégats paire secteurs (zéros si aucune transaction)"""
+        aggregate = self._sector_pairs.get((source_sector, target_sector))
+        return dict(aggregate) if aggregate else self._empty_aggregate()
+
+    def get_sector_pairs(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Agrégats de toutes les paires secteurs rencontrées"""
+        return {pair: dict(aggregate) for pair, aggregate in self._sector_pairs.items()}
+
+    def _sector_pair_aggregate(self, transaction: Transaction) -> Dict[str, Any]:
+        pair = (transaction.metadata.get('source_sector'), transaction.metadata.get('target_sector'))
+        aggregate = self._sector_pairs.get(pair)
+        if aggregate is None:
+            aggregate = self._sector_pairs[pair] = self._empty_aggregate()
+        return aggregate
+
+    @staticmethod
+    def _empty_aggregate() -> Dict[str, Any]:
+        return {'count': 0, 'volume': Decimal('0'), 'validated_count': 0, 'validated_volume': Decimal('0')}
+
+    def __getitem__(self, position):
+        return self._transactions[position]
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def __iter__(self):
+        return iter(self._transactions)
+
+    def __contains__(self, item) -> bool:
+        """Appartenance par transaction_id ou par Transaction"""
+        if isinstance(item, str):
+            return item in self._index
+        return isinstance(item, Transaction) and self.get(item.transaction_id) is item
+
+    def __repr__(self) -> str:
+        return f"TransactionRegistry(transactions={len(self._transactions)}, sector_pairs={len(self._sector_pairs)})"
+
+
 class SimulationMode(Enum):
     """Modes de simulation disponibles"""
     FEASIBILITY = "FEASIBILITY"      # Validation faisabilité seulement
     OPTIMIZATION = "OPTIMIZATION"    # Price Discovery complet
 
 
+class FlowAggregation(Enum):
+    """Granularité de validation des flux inter-sectoriels"""
+    PAIR = "PAIR"        # Validation exacte: chaque paire agent×agent dans le pipeline DAG
+    SECTOR = "SECTOR"    # Estimation sans état: représentants validés hors DAG de la simulation
+
+
+@dataclass(frozen=True)
+class SectorFlowRule:
+    """
+    Règle de flux inter-sectoriel: montant = balance source × taux
+
+    Le taux ne dépend que de l'intensité, le montant que de l'agent source:
+    toutes les cibles d'une source reçoivent le même montant.
+    target_sector None = tous les autres secteurs présents.
+    """
+    source_sector: str
+    target_sector: Optional[str]
+    base_rate: float
+    intensity_rate: float
+    minimum_amount: Decimal
+
+    def rate(self, flow_intensity: float) -> Decimal:
+        return Decimal(str(self.base_rate + self.intensity_rate * flow_intensity))
+
+    def target_sectors(self, present_sectors) -> List[str]:
+        """Secteurs cibles présents (ordre de present_sectors pour target_sector None)"""
+        if self.target_sector is None:
+            return [sector for sector in present_sectors if sector != self.source_sector]
+        return [self.target_sector] if self.target_sector in present_sectors else []
+
+
+# Règles uniques des flux inter-sectoriels (création par paire et validation agrégée)
+# Règles réciproques (source/cible inversées): création alternée par paire d'agents
+INTER_SECTORAL_FLOW_RULES = (
+    SectorFlowRule('AGRICULTURE', 'INDUSTRY', 0.4, 0.2, Decimal('50')),   # production
+    SectorFlowRule('INDUSTRY', 'SERVICES', 0.6, 0.2, Decimal('50')),      # distribution
+    SectorFlowRule('SERVICES', 'FINANCE', 0.2, 0.1, Decimal('50')),       # dépôts/investissements
+    SectorFlowRule('FINANCE', 'SERVICES', 0.25, 0.05, Decimal('100')),    # prêts/financement
+    SectorFlowRule('ENERGY', None, 0.05, 0.05, Decimal('30')),            # infrastructure
+)
+
+
 @dataclass
 class SimulationAgent:
     """
@@ -215,6 +371,82 @@ class SimulationResult:
     dag_stats: Dict[str, Any] = None
 
 
+@dataclass
+class SectorFlow:
+    """
+    Flux d'une paire de secteurs: sources éligibles × cibles
+
+    - SECTOR: verdict de la transaction représentative étendu à toutes les paires
+      (pair_results None)
+    - PAIR: résultat exact de chaque paire dans pair_results
+    """
+    source_sector: str
+    target_sector: str
+    source_amounts: Dict[str, Decimal]  # source éligible → montant vers chaque cible
+    target_agent_ids: List[str]
+    accepted: bool = False
+    representative_result: Optional[SimulationResult] = None
+    pair_results: Optional[Dict[Tuple[str, str], bool]] = None
+
+    def __post_init__(self):
+        self._targets = frozenset(self.target_agent_ids)
+
+    @property
+    def pair_count(self) -> int:
+        return len(self.source_amounts) * len(self.target_agent_ids)
+
+    @property
+    def accepted_count(self) -> int:
+        if self.pair_results is not None:
+            return sum(1 for accepted in self.pair_results.values() if accepted)
+        return self.pair_count if self.accepted else 0
+
+    @property
+    def volume(self) -> Decimal:
+        return sum(self.source_amounts.values(), Decimal('0')) * len(self.target_agent_ids)
+
+    def is_accepted(self, source_agent_id: str, target_agent_id: str) -> bool:
+        """Verdict d'une paire; False si la paire n'appartient pas au flux"""
+        if source_agent_id not in self.source_amounts or target_agent_id not in self._targets:
+            return False
+        if self.pair_results is not None:
+            return self.pair_results[(source_agent_id, target_agent_id)]
+        return self.accepted
+
+    def iter_pairs(self):
+        """Paires (source, cible, montant, accepté) sans matérialiser de transactions"""
+        for source_id, amount in self.source_amounts.items():
+            for target_id in self.target_agent_ids:
+                yield source_id, target_id, amount, self.is_accepted(source_id, target_id)
+
+
+@dataclass
+class InterSectoralFlowsResult:
+    """Flux inter-sectoriels validés + nombre de validations pipeline DAG exécutées"""
+    aggregation: FlowAggregation
+    flows: List[SectorFlow]
+    full_validations: int = 0
+    elapsed_ms: float = 0.0
+
+    @property
+    def pair_count(self) -> int:
+        return sum(flow.pair_count for flow in self.flows)
+
+    @property
+    def accepted_count(self) -> int:
+        return sum(flow.accepted_count for flow in self.flows)
+
+    @property
+    def volume(self) -> Decimal:
+        return sum((flow.volume for flow in self.flows), Decimal('0'))
+
+    def get_flow(self, source_sector: str, target_sector: str) -> Optional[SectorFlow]:
+        for flow in self.flows:
+            if (flow.source_sector, flow.target_sector) == (source_sector, target_sector):
+                return flow
+        return None
+
+
 class EconomicSimulation:
     """
     Simulateur Économique Principal - API Bridge ICGS
@@ -250,7 +482,7 @@ class EconomicSimulation:
 
         # État simulation
         self.agents: Dict[str, SimulationAgent] = {}
-        self.transactions: List[Transaction] = []
+        self.transactions = TransactionRegistry()
         self.taxonomy_configured = False  # Flag pour update batch unique
 
         # Character-Set Manager pour allocation sectorielle (capacité étendue)
@@ -435,7 +667,7 @@ class EconomicSimulation:
         """
         Crée automatiquement des transactions inter-sectorielles selon patterns économiques
 
-        Flux économiques réalistes:
+        Flux économiques réalistes (INTER_SECTORAL_FLOW_RULES):
         - AGRICULTURE → INDUSTRY (40-60% production flow)
         - INDUSTRY → SERVICES (60-80% distribution flow)
         - SERVICES ↔ FINANCE (20-30% financial flow)
@@ -455,74 +687,41 @@ class EconomicSimulation:
         # Grouper agents par secteur
         agents_by_sector = {}
         for agent_id, agent in self.agents.items():
-            sector = agent.sector
-            if sector not in agents_by_sector:
-                agents_by_sector[sector] = []
-            agents_by_sector[sector].append(agent)
+            agents_by_sector.setdefault(agent.sector, []).append(agent)
+
+        # Règles réciproques (SERVICES ↔ FINANCE): alternées par paire d'agents
+        rules_by_pair = {(rule.source_sector, rule.target_sector): rule for rule in INTER_SECTORAL_FLOW_RULES}
+        interleaved_rules = set()
 
         try:
-            # 1. AGRICULTURE → INDUSTRY (production flow)
-            if 'AGRICULTURE' in agents_by_sector and 'INDUSTRY' in agents_by_sector:
-                for agri_agent in agents_by_sector['AGRICULTURE']:
-                    for indus_agent in agents_by_sector['INDUSTRY']:
-                        flow_amount = agri_agent.balance * Decimal(str(0.4 + 0.2 * flow_intensity))
-                        if flow_amount >= 50:  # Minimum economically meaningful
-                            tx_id = self.create_transaction(
-                                agri_agent.agent_id,
-                                indus_agent.agent_id,
-                                flow_amount
-                            )
-                            created_transactions.append(tx_id)
-
-            # 2. INDUSTRY → SERVICES (distribution flow)
-            if 'INDUSTRY' in agents_by_sector and 'SERVICES' in agents_by_sector:
-                for indus_agent in agents_by_sector['INDUSTRY']:
-                    for services_agent in agents_by_sector['SERVICES']:
-                        flow_amount = indus_agent.balance * Decimal(str(0.6 + 0.2 * flow_intensity))
-                        if flow_amount >= 50:
-                            tx_id = self.create_transaction(
-                                indus_agent.agent_id,
-                                services_agent.agent_id,
-                                flow_amount
-                            )
-                            created_transactions.append(tx_id)
-
-            # 3. SERVICES ↔ FINANCE (bidirectional financial flow)
-            if 'SERVICES' in agents_by_sector and 'FINANCE' in agents_by_sector:
-                for services_agent in agents_by_sector['SERVICES']:
-                    for finance_agent in agents_by_sector['FINANCE']:
-                        # SERVICES → FINANCE (deposits/investments)
-                        flow_amount = services_agent.balance * Decimal(str(0.2 + 0.1 * flow_intensity))
-                        if flow_amount >= 50:
-                            tx_id = self.create_transaction(
-                                services_agent.agent_id,
-                                finance_agent.agent_id,
-                                flow_amount
-                            )
-                            created_transactions.append(tx_id)
-
-                        # FINANCE → SERVICES (loans/funding)
-                        flow_amount = finance_agent.balance * Decimal(str(0.25 + 0.05 * flow_intensity))
-                        if flow_amount >= 100:
-                            tx_id = self.create_transaction(
-                                finance_agent.agent_id,
-                                services_agent.agent_id,
-                                flow_amount
-                            )
-                            created_transactions.append(tx_id)
-
-            # 4. ENERGY → ALL (infrastructure flow)
-            if 'ENERGY' in agents_by_sector:
-                for energy_agent in agents_by_sector['ENERGY']:
-                    for sector, agents_list in agents_by_sector.items():
-                        if sector != 'ENERGY':  # Energy flows to all other sectors
-                            for target_agent in agents_list:
-                                flow_amount = energy_agent.balance * Decimal(str(0.05 + 0.05 * flow_intensity))
-                                if flow_amount >= 30:
+            for rule in INTER_SECTORAL_FLOW_RULES:
+                if rule in interleaved_rules or rule.source_sector not in agents_by_sector:
+                    continue
+                reverse_rule = rules_by_pair.get((rule.target_sector, rule.source_sector))
+                if reverse_rule is not None:
+                    interleaved_rules.add(reverse_rule)
+                target_sectors = rule.target_sectors(agents_by_sector)
+                rate = rule.rate(flow_intensity)
+
+                for source_agent in agents_by_sector[rule.source_sector]:
+                    flow_amount = source_agent.balance * rate
+                    for target_sector in target_sectors:
+                        for target_agent in agents_by_sector[target_sector]:
+                            if flow_amount >= rule.minimum_amount:  # Minimum economically meaningful
+                                tx_id = self.create_transaction(
+                                    source_agent.agent_id,
+                                    target_agent.agent_id,
+                                    flow_amount
+                                )
+                                created_transactions.append(tx_id)
+
+                            if reverse_rule is not None:
+                                reverse_amount = target_agent.balance * reverse_rule.rate(flow_intensity)
+                                if reverse_amount >= reverse_rule.minimum_amount:
                                     tx_id = self.create_transaction(
-                                        energy_agent.agent_id,
                                         target_agent.agent_id,
-                                        flow_amount
+                                        source_agent.agent_id,
+                                        reverse_amount
                                     )
                                     created_transactions.append(tx_id)
 
@@ -532,9 +731,153 @@ class EconomicSimulation:
         except Exception as e:
             self.logger.error(f"Erreur création flux inter-sectoriels: {e}")
             raise
-
         return created_transactions
 
+    def validate_inter_sectoral_flows(self, flow_intensity: float = 0.5,
+                                      aggregation: FlowAggregation = FlowAggregation.SECTOR
+                                      ) -> InterSectoralFlowsResult:
+        """
+        Crée et valide les flux inter-sectoriels de create_inter_sectoral_flows_batch
+
+        - SECTOR (défaut): montants et seuils calculés une fois par agent source
+          sur les balances, une transaction représentative par paire secteurs
+          (agents de balance maximale) validée dans une simulation à un agent par
+          secteur, verdict étendu à toutes les paires. Coût linéaire en agents,
+          aucune transaction créée dans cette simulation, sans limite de capacité
+          taxonomique. Estimation sans état: l'historique de self.dag (transactions
+          déjà commitées) n'est pas pris en compte, le verdict peut donc différer
+          de PAIR une fois des transactions validées dans la simulation.
+        - PAIR (opt-in): create_inter_sectoral_flows_batch puis validation exacte
+          de chaque paire dans le DAG (add_transactions_batch_auto). Coût
+          quadratique en agents, limité par la capacité du Character-Set Manager.
+
+        Args:
+            flow_intensity: Intensité des flux (0.0 à 1.0, défaut 0.5)
+            aggregation: Granularité de validation
+
+        Returns:
+            InterSectoralFlowsResult avec un SectorFlow par paire secteurs
+        """
+        if not self.agents:
+            raise ValueError("Aucun agent créé. Créer des agents avant les flux inter-sectoriels.")
+
+        start_time = time.time()
+        if aggregation == FlowAggregation.PAIR:
+            flows, full_validations = self._validate_flows_per_pair(flow_intensity)
+        else:
+            flows, full_validations = self._validate_flows_per_sector(flow_intensity)
+
+        result = InterSectoralFlowsResult(
+            aggregation=aggregation,
+            flows=flows,
+            full_validations=full_validations,
+            elapsed_ms=(time.time() - start_time) * 1000
+        )
+        self.logger.info(f"Flux inter-sectoriels {aggregation.value}: {result.accepted_count}/{result.pair_count} "
+                         f"paires acceptées, {full_validations} validations DAG")
+        return result
+
+    def _validate_flows_per_pair(self, flow_intensity: float) -> Tuple[List[SectorFlow], int]:
+        """Validation exacte: toutes les paires créées et validées dans le DAG de la simulation"""
+        transaction_ids = self.create_inter_sectoral_flows_batch(flow_intensity)
+        transactions = [self.transactions.get(tx_id) for tx_id in transaction_ids]
+
+        if not self.taxonomy_configured:
+            self._configure_taxonomy_batch()
+            self.taxonomy_configured = True
+        batch = self.dag.add_transactions_batch_auto(transactions)
+
+        # Regroupement par paire secteurs: (montants par source, cibles ordonnées, résultats par paire)
+        grouped: Dict[Tuple[str, str], Tuple[Dict[str, Decimal], Dict[str, None], Dict]] = {}
+        for transaction, batch_result in zip(transactions, batch.results):
+            result = SimulationResult(
+                success=batch_result.accepted,
+                mode=SimulationMode.FEASIBILITY,
+                transaction_id=transaction.transaction_id,
+                status=SolutionStatus.FEASIBLE if batch_result.accepted else SolutionStatus.INFEASIBLE,
+                validation_time_ms=batch_result.validation_time_ms
+            )
+            self.transactions.record_validation(transaction.transaction_id, batch_result.accepted, result)
+
+            pair = (transaction.metadata['source_sector'], transaction.metadata['target_sector'])
+            source_amounts, targets, pair_results = grouped.setdefault(pair, ({}, {}, {}))
+            source_amounts[transaction.source_account_id] = transaction.amount
+            targets[transaction.target_account_id] = None
+            pair_results[(transaction.source_account_id, transaction.target_account_id)] = batch_result.accepted
+
+        flows = [
+            SectorFlow(
+                source_sector=source_sector,
+                target_sector=target_sector,
+                source_amounts=source_amounts,
+                target_agent_ids=list(targets),
+                accepted=all(pair_results.values()),
+                pair_results=pair_results
+            )
+            for (source_sector, target_sector), (source_amounts, targets, pair_results) in grouped.items()
+        ]
+        return flows, len(transactions)
+
+    def _validate_flows_per_sector(self, flow_intensity: float) -> Tuple[List[SectorFlow], int]:
+        """
+        Validation agrégée: une transaction représentative par paire secteurs
+
+        Sans état: simulation secteurs neuve à chaque appel (DAG vide), self.dag
+        ni consulté ni modifié. Le DAG n'offre pas de rollback et sa taxonomie est
+        figée au premier commit, les représentants ne peuvent donc pas y être
+        validés à blanc.
+        """
+        agents_by_sector: Dict[str, List[SimulationAgent]] = {}
+        for agent in self.agents.values():
+            agents_by_sector.setdefault(agent.sector, []).append(agent)
+
+        # Représentant = balance maximale: éligible dès qu'un agent du secteur l'est (montant croissant)
+        representatives = {sector: max(agents, key=lambda agent: agent.balance)
+                           for sector, agents in agents_by_sector.items()}
+
+        flows = []
+        for rule in INTER_SECTORAL_FLOW_RULES:
+            if rule.source_sector not in agents_by_sector:
+                continue
+
+            # Capacité par agent: un calcul par source (vs un par paire), identique pour toutes ses cibles
+            rate = rule.rate(flow_intensity)
+            source_amounts = {}
+            for agent in agents_by_sector[rule.source_sector]:
+                amount = agent.balance * rate
+                if amount >= rule.minimum_amount:
+                    source_amounts[agent.agent_id] = amount
+            if not source_amounts:
+                continue
+
+            for target_sector in rule.target_sectors(agents_by_sector):
+                flows.append(SectorFlow(
+                    source_sector=rule.source_sector,
+                    target_sector=target_sector,
+                    source_amounts=dict(source_amounts),
+                    target_agent_ids=[agent.agent_id for agent in agents_by_sector[target_sector]]
+                ))
+
+        if not flows:
+            return flows, 0
+
+        # Simulation secteurs: un agent par secteur (taxonomie 3 caractères × secteurs)
+        sector_simulation = EconomicSimulation(f"{self.simulation_id}_sector_flows")
+        for sector, agent in representatives.items():
+            sector_simulation.create_agent(agent.agent_id, sector, agent.balance)
+
+        for flow in flows:
+            source = representatives[flow.source_sector]
+            tx_id = sector_simulation.create_transaction(
+                source.agent_id,
+                representatives[flow.target_sector].agent_id,
+                flow.source_amounts[source.agent_id],
+                metadata={'aggregated_flow': True}
+            )
+            flow.representative_result = sector_simulation.validate_transaction(tx_id)
+            flow.accepted = flow.representative_result.success
+        return flows, len(flows)
+
     def _configure_taxonomy_batch(self):
         """
         Configuration batch unique de la taxonomie avec Character-Set Manager sectoriel
@@ -664,7 +1007,15 @@ class EconomicSimulation:
     def validate_transaction(self, transaction_id: str,
                            mode: SimulationMode = SimulationMode.FEASIBILITY) -> SimulationResult:
         """
-        Valide une transaction avec mode spécifié + cache optimisé
+        Valide une transaction avec mode spécifié + cache par contenu
+
+        Clés cache indépendantes de l'ID transaction:
+        - FEASIBILITY: contenu transaction (comptes, montant, mesures) + version
+          état DAG/NFA/taxonomie; seuls les rejets sont cachés (un commit change
+          la version), le résultat d'une transaction commitée reste définitif
+        - OPTIMIZATION: empreinte canonique du LP price discovery + objectif
+          (problème indépendant de l'état du DAG)
+        Les erreurs ne sont jamais cachées.
 
         Args:
             transaction_id: ID transaction à valider
@@ -673,31 +1024,14 @@ class EconomicSimulation:
         Returns:
             SimulationResult avec résultats validation
         """
-        # Générer clé cache basée sur transaction + mode
-        cache_key = f"{transaction_id}:{mode.value}"
-
-        # Vérifier cache pour résultats antérieurs
-        cached_result = self.performance_cache.get_validation_result(cache_key)
-        if cached_result is not None:
-            return cached_result
-
-        # Trouver transaction
-        transaction = None
-        for tx in self.transactions:
-            if tx.transaction_id == transaction_id:
-                transaction = tx
-                break
-
+        transaction = self.transactions.get(transaction_id)
         if not transaction:
-            result = SimulationResult(
+            return SimulationResult(
                 success=False,
                 mode=mode,
                 transaction_id=transaction_id,
                 error_message=f"Transaction '{transaction_id}' non trouvée"
             )
-            # Stocker result d'erreur dans cache (TTL court pour erreurs)
-            self.performance_cache.store_validation_result(cache_key, result)
-            return result
 
         try:
             import time
@@ -710,6 +1044,18 @@ class EconomicSimulation:
                 self.taxonomy_configured = True
 
             if mode == SimulationMode.FEASIBILITY:
+                # Transaction déjà commitée: ne jamais re-committer
+                committed = self.transactions.committed_result(transaction_id)
+                if committed is not None:
+                    self.performance_cache.record_hit()
+                    return committed
+
+                cached_result = self.performance_cache.get_validation_result(
+                    self._feasibility_cache_key(transaction))
+                if cached_result is not None:
+                    self.transactions.record_validation(transaction_id, cached_result.success)
+                    return replace(cached_result, transaction_id=transaction_id)
+
                 # Mode FEASIBILITY avec EnhancedDAG optimisé
                 success = self.dag.add_transaction_auto(transaction)
                 validation_time = (time.time() - start_time) * 1000
@@ -729,74 +1075,167 @@ class EconomicSimulation:
                     validation_time_ms=validation_time,
                     dag_stats=dict(self.dag.stats)
                 )
+                self.transactions.record_validation(transaction_id, success, result)
+
+                # Rejet: DAG inchangé hormis comptes/taxonomie créés → clé à la version après validation
+                if not success:
+                    self.performance_cache.store_validation_result(
+                        self._feasibility_cache_key(transaction), result)
+                return result
 
             elif mode == SimulationMode.OPTIMIZATION:
-                # Mode OPTIMIZATION avec Price Discovery (cache intégré)
-                result = self._run_price_discovery_cached(transaction, start_time, cache_key)
+                # Mode OPTIMIZATION avec Price Discovery (cache par empreinte LP)
+                problem, objective_coeffs = self._build_price_discovery_problem(transaction)
+                cache_key = (mode.value, problem.fingerprint(),
+                             tuple(sorted(objective_coeffs.items())))
+
+                cached_result = self.performance_cache.get_validation_result(cache_key)
+                if cached_result is not None:
+                    return replace(cached_result, transaction_id=transaction_id)
 
-            # Stocker résultat dans cache pour réutilisation
-            self.performance_cache.store_validation_result(cache_key, result)
-            return result
+                result = self._run_price_discovery(transaction, start_time, problem, objective_coeffs)
+                if result.error_message is None:
+                    self.performance_cache.store_validation_result(cache_key, result)
+                return result
 
         except Exception as e:
-            error_result = SimulationResult(
+            return SimulationResult(
                 success=False,
                 mode=mode,
                 transaction_id=transaction_id,
                 error_message=f"Erreur validation: {str(e)}"
             )
-            # Stocker erreur dans cache avec TTL réduit
-            self.performance_cache.store_validation_result(cache_key, error_result)
-            return error_result
 
-    def _run_price_discovery(self, transaction: Transaction, start_time: float) -> SimulationResult:
+    def _feasibility_cache_key(self, transaction: Transaction) -> Tuple:
         """
-        Exécute Price Discovery pour une transaction
+        Clé cache FEASIBILITY: contenu déterminant le LP de validation + version DAG
 
-        Utilise le nouveau solve_optimization_problem d'icgs_core
-        pour découvrir prix optimal.
+        Les measure_id (dérivés de l'ID transaction) sont exclus; à version
+        d'état égale, deux transactions de même contenu donnent le même LP.
         """
-        try:
-            # Construction problème LP depuis transaction
-            from icgs_core import LinearProgram, LinearConstraint, ConstraintType
+        def measures_key(measures: List[TransactionMeasure]) -> Tuple:
+            return tuple(
+                (measure.primary_regex_pattern, measure.primary_regex_weight,
+                 measure.acceptable_value, measure.required_value, tuple(measure.secondary_patterns))
+                for measure in measures
+            )
+        return (SimulationMode.FEASIBILITY.value,
+                transaction.source_account_id, transaction.target_account_id, transaction.amount,
+                measures_key(transaction.source_measures), measures_key(transaction.target_measures),
+                self.dag.get_state_version())
 
-            # Créer problème LP simple pour cette transaction
-            problem = LinearProgram(f"price_discovery_{transaction.transaction_id}")
+    def _build_price_discovery_problem(self, transaction: Transaction) -> Tuple[Any, Dict[str, Decimal]]:
+        """
+        Construit problème LP Price Discovery + coefficients objectif
 
-            # Variables: flux source et target
-            problem.add_variable("source_flux", lower_bound=Decimal('0'))
-            problem.add_variable("target_flux", lower_bound=Decimal('0'))
+        Problème indépendant de l'ID transaction et de l'état du DAG
+        (montant + poids secteurs), d'où une empreinte réutilisable en cache.
+        """
+        source_agent = self.agents[transaction.source_account_id]
+        target_agent = self.agents[transaction.target_account_id]
+        return self._build_sector_price_problem(
+            source_agent.sector, target_agent.sector, transaction.amount,
+            f"price_discovery_{transaction.transaction_id}"
+        )
 
-            # Contrainte: conservation flux
-            constraint = LinearConstraint(
-                coefficients={
-                    "source_flux": Decimal('1'),
-                    "target_flux": Decimal('-1')
-                },
-                bound=Decimal('0'),
-                constraint_type=ConstraintType.EQ,
-                name="flux_conservation"
-            )
-            problem.add_constraint(constraint)
-
-            # Contrainte capacité
-            capacity_constraint = LinearConstraint(
-                coefficients={"source_flux": Decimal('1')},
-                bound=transaction.amount,
-                constraint_type=ConstraintType.LEQ,
-                name="source_capacity"
-            )
-            problem.add_constraint(capacity_constraint)
+    def _build_sector_price_problem(self, source_sector: str, target_sector: str, amount: Decimal,
+                                    problem_name: str) -> Tuple[Any, Dict[str, Decimal]]:
+        """LP Price Discovery entre deux secteurs: capacité source = amount (contrainte source_capacity)"""
+        from icgs_core import LinearProgram, LinearConstraint, ConstraintType
+
+        problem = LinearProgram(problem_name)
+
+        # Variables: flux source et target
+        problem.add_variable("source_flux", lower_bound=Decimal('0'))
+        problem.add_variable("target_flux", lower_bound=Decimal('0'))
+
+        # Contrainte: conservation flux
+        constraint = LinearConstraint(
+            coefficients={
+                "source_flux": Decimal('1'),
+                "target_flux": Decimal('-1')
+            },
+            bound=Decimal('0'),
+            constraint_type=ConstraintType.EQ,
+            name="flux_conservation"
+        )
+        problem.add_constraint(constraint)
+
+        # Contrainte capacité
+        capacity_constraint = LinearConstraint(
+            coefficients={"source_flux": Decimal('1')},
+            bound=amount,
+            constraint_type=ConstraintType.LEQ,
+            name="source_capacity"
+        )
+        problem.add_constraint(capacity_constraint)
 
-            # Coefficients objectif (prix unitaires par secteur)
-            source_agent = self.agents[transaction.source_account_id]
-            target_agent = self.agents[transaction.target_account_id]
+        # Coefficients objectif (prix unitaires par secteur)
+        objective_coeffs = {
+            "source_flux": get_sector_info(source_sector).weight,
+            "target_flux": get_sector_info(target_sector).weight
+        }
+        return problem, objective_coeffs
 
-            objective_coeffs = {
-                "source_flux": source_agent.get_sector_info().weight,
-                "target_flux": target_agent.get_sector_info().weight
-            }
+    def get_price_curve(self, source_agent_id: str, target_agent_id: str,
+                        min_amount: Decimal, max_amount: Decimal) -> ParametricPriceCurve:
+        """
+        Courbe prix optimal Price Discovery en fonction du montant entre deux agents
+
+        Args:
+            source_agent_id: Agent source
+            target_agent_id: Agent cible
+            min_amount: Montant minimal analysé
+            max_amount: Montant maximal analysé
+
+        Returns:
+            ParametricPriceCurve (price_at(amount) en O(log points de rupture))
+
+        Raises:
+            ValueError: Si agent inconnu ou intervalle vide
+        """
+        if source_agent_id not in self.agents:
+            raise ValueError(f"Agent source '{source_agent_id}' non trouvé")
+        if target_agent_id not in self.agents:
+            raise ValueError(f"Agent cible '{target_agent_id}' non trouvé")
+        return self.get_sector_price_curve(self.agents[source_agent_id].sector,
+                                           self.agents[target_agent_id].sector,
+                                           min_amount, max_amount)
+
+    def get_sector_price_curve(self, source_sector: str, target_sector: str,
+                               min_amount: Decimal, max_amount: Decimal) -> ParametricPriceCurve:
+        """
+        Courbe prix optimal entre deux secteurs sur [min_amount, max_amount]
+
+        Une seule analyse paramétrique (Simplex dual exact) remplace un
+        price discovery par montant candidat; courbe mise en cache par
+        empreinte LP + objectif + intervalle.
+        """
+        problem, objective_coeffs = self._build_sector_price_problem(
+            source_sector, target_sector, Decimal('0'),
+            f"price_curve_{source_sector}_{target_sector}"
+        )
+        rhs_direction = {"source_capacity": Decimal('1')}
+        cache_key = ("PRICE_CURVE", problem.fingerprint(), tuple(sorted(objective_coeffs.items())),
+                     Decimal(min_amount), Decimal(max_amount))
+
+        curve = self.performance_cache.get_validation_result(cache_key)
+        if curve is None:
+            curve = self.simplex_solver.solve_parametric_rhs(
+                problem, objective_coeffs, rhs_direction, Decimal(min_amount), Decimal(max_amount)
+            )
+            self.performance_cache.store_validation_result(cache_key, curve)
+        return curve
+
+    def _run_price_discovery(self, transaction: Transaction, start_time: float,
+                             problem: Any, objective_coeffs: Dict[str, Decimal]) -> SimulationResult:
+        """
+        Exécute Price Discovery pour une transaction
 
+        Utilise le nouveau solve_optimization_problem d'icgs_core
+        pour découvrir prix optimal.
+        """
+        try:
             # Cache LinearProgram pour API 3D
             self._current_linear_program = problem
 
@@ -1066,7 +1505,7 @@ class EconomicSimulation:
             for tx_id in transaction_ids[:50]:  # Limite pour performance web
                 try:
                     # Récupérer détails transaction
-                    transaction = next((tx for tx in self.transactions if tx.transaction_id == tx_id), None)
+                    transaction = self.transactions.get(tx_id)
                     if transaction:
                         # Analyse 3D avec l'analyseur intégré
                         self.analyze_transaction_3d(
@@ -1111,50 +1550,6 @@ class EconomicSimulation:
         except Exception as e:
             self.logger.warning(f"Erreur capture 3D avec cache pour {transaction.transaction_id}: {e}")
 
-    def _run_price_discovery_cached(self, transaction: Transaction, start_time: float, cache_key: str) -> SimulationResult:
-        """
-        Exécute Price Discovery avec cache optimisé pour 65 agents
-        """
-        try:
-            # Vérifier cache spécialisé pour optimization
-            opt_cache_key = f"price_discovery:{transaction.source_account_id}:{transaction.target_account_id}:{transaction.amount}"
-            cached_opt_result = self.performance_cache.get_3d_data(opt_cache_key)
-
-            if cached_opt_result is not None:
-                # Reconstruction résultat depuis cache
-                return SimulationResult(
-                    success=cached_opt_result.get('success', False),
-                    mode=SimulationMode.OPTIMIZATION,
-                    transaction_id=transaction.transaction_id,
-                    status=cached_opt_result.get('status'),
-                    optimal_price=cached_opt_result.get('optimal_price'),
-                    validation_time_ms=cached_opt_result.get('validation_time_ms', 0.0)
-                )
-
-            # Exécution price discovery normale
-            result = self._run_price_discovery(transaction, start_time)
-
-            # Stocker résultat optimization en cache
-            if result.success:
-                cache_data = {
-                    'success': result.success,
-                    'status': result.status,
-                    'optimal_price': result.optimal_price,
-                    'validation_time_ms': result.validation_time_ms,
-                    'timestamp': time.time()
-                }
-                self.performance_cache.store_3d_data(opt_cache_key, cache_data)
-
-            return result
-
-        except Exception as e:
-            return SimulationResult(
-                success=False,
-                mode=SimulationMode.OPTIMIZATION,
-                transaction_id=transaction.transaction_id,
-                error_message=f"Erreur price discovery cached: {str(e)}"
-            )
-
     def get_performance_stats(self) -> Dict[str, Any]:
         """
         Statistiques performance complètes pour 65 agents
@@ -1228,7 +1623,6 @@ class EconomicSimulation:
                 self.logger.info("Activation optimisations charge web massive (65 agents)")
 
                 # Ajustement paramètres cache pour performance web
-                self.performance_cache.validation_ttl = 180.0  # Réduit TTL pour web
                 self.performance_cache.data_3d_ttl = 300.0
 
                 # Préparation taxonomie
@@ -1519,7 +1913,7 @@ class EconomicSimulation:
 
             # Métriques transactions
             if self.transactions:
-                total_volume = sum(tx.amount for tx in self.transactions)
+                total_volume = self.transactions.total_volume
                 avg_transaction = total_volume / len(self.transactions)
                 metrics['transaction_volume'] = str(total_volume)
                 metrics['average_transaction'] = str(avg_transaction)
@@ -46,8 +46,8 @@ class SimulationSerializer:
                 'id': agent.agent_id,
                 'balance': str(agent.balance),
                 'sector': agent.sector,
-                'transactions_sent': len([tx for tx in simulation.transactions if tx.source_account_id == agent_id]),
-                'transactions_received': len([tx for tx in simulation.transactions if tx.target_account_id == agent_id])
+                'transactions_sent': simulation.transactions.sent_count(agent_id),
+                'transactions_received': simulation.transactions.received_count(agent_id)
             }
 
         # Sérialisation des transactions
@@ -59,7 +59,7 @@ class SimulationSerializer:
                 'target_account_id': transaction.target_account_id,
                 'amount': str(transaction.amount),
                 'timestamp': transaction.timestamp.isoformat() if hasattr(transaction, 'timestamp') else datetime.now().isoformat(),
-                'status': getattr(transaction, 'status', 'pending')
+                'status': simulation.transactions.status(transaction.transaction_id)
             }
             transactions_data.append(tx_data)
 
@@ -599,7 +599,7 @@ class ICGSSVGAPIServer:
             simulation = self.web_manager.icgs_core
 
             # Recherche transaction
-            transaction = next((tx for tx in simulation.transactions if tx.transaction_id == tx_id), None)
+            transaction = simulation.transactions.get(tx_id)
             if not transaction:
                 return None
 
@@ -157,7 +157,11 @@ class ValidationDataCollector:
 
             # Extraction métriques depuis objets réels avec gestion défensive
             vertices_count = len(path_classes) if path_classes and hasattr(path_classes, '__len__') else 0
-            constraints_count = len(lp_problem.constraints) if lp_problem and hasattr(lp_problem, 'constraints') and lp_problem.constraints else 0
+            compiled = lp_problem.compile_constraints() if lp_problem and hasattr(lp_problem, 'compile_constraints') else None
+            if compiled is not None:
+                constraints_count = compiled.num_rows
+            else:
+                constraints_count = len(lp_problem.constraints) if lp_problem and hasattr(lp_problem, 'constraints') and lp_problem.constraints else 0
             algorithm_steps = getattr(simplex_solution, 'iterations_used', 0) if simplex_solution else 0
 
             logger.info(f"📊 Extracted basic metrics: vertices={vertices_count}, constraints={constraints_count}, steps={algorithm_steps}")
@@ -168,10 +172,14 @@ class ValidationDataCollector:
 
             if simplex_solution and hasattr(simplex_solution, 'variables') and simplex_solution.variables:
                 try:
-                    # Extraction variables solution (format Decimal → float)
-                    optimal_coordinates = [
-                        float(value) for value in simplex_solution.variables.values()
-                    ]
+                    # Extraction variables solution (format Decimal → float),
+                    # ordre colonnes stable de la matrice compilée si disponible
+                    if compiled is not None and compiled.num_columns:
+                        optimal_coordinates = list(compiled.to_vector(simplex_solution.variables))
+                    else:
+                        optimal_coordinates = [
+                            float(value) for value in simplex_solution.variables.values()
+                        ]
                     logger.info(f"📊 Extracted coordinates: {len(optimal_coordinates)} variables")
                 except Exception as coord_error:
                     logger.warning(f"⚠️ Failed to extract coordinates: {coord_error}")
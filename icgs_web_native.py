@@ -30,6 +30,7 @@ from collections import defaultdict
 # ICGS Core imports
 from icgs_simulation import EconomicSimulation
 from icgs_simulation.api.icgs_bridge import SimulationResult, SimulationMode
+from icgs_core import ParametricPriceCurve
 
 # Lazy import ValidationDataCollector pour capture métriques WebNative
 def _get_webnative_validation_collector():
@@ -496,6 +497,16 @@ class WebNativeICGS:
 
         return sorted(suggestions, key=lambda s: s.confidence, reverse=True)
 
+    def get_price_curve(self, source_id: str, target_id: str,
+                        min_amount: Decimal, max_amount: Decimal) -> Optional[ParametricPriceCurve]:
+        """Courbe prix optimal par montant pour la paire de secteurs des agents (None si agent inconnu)"""
+        if source_id not in self.agent_registry or target_id not in self.agent_registry:
+            return None
+        return self.icgs_core.get_sector_price_curve(
+            self.agent_registry[source_id].sector, self.agent_registry[target_id].sector,
+            Decimal(str(min_amount)), Decimal(str(max_amount))
+        )
+
     def process_transaction_lightweight(self, source_id: str, target_id: str, amount: Decimal) -> Dict[str, Any]:
         """
         Transaction simple pour WebNativeICGS qui évite la taxonomie lourde
@@ -321,10 +321,21 @@ def api_transaction_suggestions():
         # Obtenir suggestions contextuelles sans imposer
         suggestions = manager.get_contextual_suggestions(source_id, target_id, amount)
 
-        return jsonify({
+        # Courbe prix optimal par montant (what-if sans re-résolution par montant candidat)
+        response = {
             'success': True,
             'suggestions': suggestions
-        })
+        }
+        if amount is not None:
+            amount = Decimal(str(amount))
+            min_amount, max_amount = data.get('price_range', [0, amount * 2])
+            curve = manager.get_price_curve(source_id, target_id, min_amount, max_amount)
+            if curve is not None:
+                price = curve.price_at(amount)
+                response['price_curve'] = curve.to_dict()
+                response['optimal_price'] = str(price) if price is not None else None
+
+        return jsonify(response)
 
     except Exception as e:
         return jsonify({
@@ -906,7 +917,7 @@ def api_launch_massive_economy_3d():
                 opt_result = simulation.validate_transaction(tx_id, simulation.SimulationMode.OPTIMIZATION)
 
                 # Récupérer détails transaction pour affichage
-                transaction = next((tx for tx in simulation.transactions if tx.transaction_id == tx_id), None)
+                transaction = simulation.transactions.get(tx_id)
 
                 sample_results.append({
                     'tx_id': tx_id,
@@ -1068,7 +1079,7 @@ def api_get_transaction_3d_detail(tx_id):
         simulation = web_manager.icgs_core
 
         # Trouver la transaction
-        transaction = next((tx for tx in simulation.transactions if tx.transaction_id == tx_id), None)
+        transaction = simulation.transactions.get(tx_id)
         if not transaction:
             return jsonify({
                 'success': False,
@@ -141,12 +141,10 @@ def test_web_load_optimization():
     # Vérifier que taxonomie est configurée
     assert simulation.taxonomy_configured, "Taxonomie pas configurée après optimisation"
 
-    # Vérifier ajustements TTL cache
-    assert simulation.performance_cache.validation_ttl <= 200.0, "TTL validation pas ajusté"
+    # Vérifier ajustements TTL cache (cache validation invalidé par version état DAG, sans TTL)
     assert simulation.performance_cache.data_3d_ttl <= 350.0, "TTL 3D pas ajusté"
 
     print(f"   ✅ Taxonomie configurée: {simulation.taxonomy_configured}")
-    print(f"   ✅ TTL validation: {simulation.performance_cache.validation_ttl}s")
     print(f"   ✅ TTL données 3D: {simulation.performance_cache.data_3d_ttl}s")
 
     return True
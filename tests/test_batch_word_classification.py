@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests classification batch (classify_words_batch) NFA principal + target NFA
+
+Valide:
+- Résultats batch identiques à l'évaluation mot à mot (avec et sans DFA paresseux)
+- Fallback target NFA pour mots rejetés par le NFA principal
+- Pipeline: un seul appel batch, mots dupliqués évalués une fois
+"""
+
+import unittest
+import random
+from decimal import Decimal
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+def _dual_nfa(lazy_dfa: bool) -> AnchoredWeightedNFA:
+    main_nfa = AnchoredWeightedNFA("batch_main")
+    main_nfa.add_weighted_regex("source", "A[BC]*D", Decimal('1'))
+    target_nfa = AnchoredWeightedNFA("batch_target")
+    target_nfa.add_weighted_regex("target", ".*[CD].*", Decimal('1'))
+
+    if lazy_dfa:
+        main_nfa.enable_lazy_dfa(max_states=16)
+        target_nfa.enable_lazy_dfa(max_states=16)
+    main_nfa.metadata['target_nfa'] = target_nfa
+    main_nfa.freeze()
+    target_nfa.freeze()
+    return main_nfa
+
+
+class TestBatchWordClassification(unittest.TestCase):
+
+    def test_batch_matches_word_by_word(self):
+        rnd = random.Random(21)
+        words = [''.join(rnd.choice("ABCD") for _ in range(rnd.randint(0, 7))) for _ in range(300)]
+
+        for lazy_dfa in (False, True):
+            nfa = _dual_nfa(lazy_dfa)
+            target_nfa = nfa.metadata['target_nfa']
+            batch = nfa.classify_words_batch(words)
+
+            for word in words:
+                expected = nfa.evaluate_to_final_state(word) or target_nfa.evaluate_to_final_state(word)
+                self.assertEqual(batch[word], expected, (lazy_dfa, word))
+
+    def test_target_fallback_for_rejected_words(self):
+        nfa = _dual_nfa(lazy_dfa=False)
+        results = nfa.classify_words_batch(["ABD", "BC", "BB", "ABD"])
+
+        self.assertEqual(len(results), 3)
+        self.assertIn(results["ABD"], nfa.shared_nfa.final_state_ids)
+        self.assertIn(results["BC"], nfa.metadata['target_nfa'].shared_nfa.final_state_ids)
+        self.assertIsNone(results["BB"])
+
+    def test_pipeline_uses_single_batch_call(self):
+        nfa = _dual_nfa(lazy_dfa=True)
+        enumerator = DAGPathEnumerator(MagicMock())
+        paths = [["p0"], ["p1"], ["p2"], ["p3"]]
+        words = ["ABD", "ABD", "BC", ""]
+        path_classes = defaultdict(list)
+
+        nfa.classify_words_batch = MagicMock(side_effect=nfa.classify_words_batch)
+        classified = enumerator._classify_paths_with_nfa(paths, words, nfa, path_classes,
+                                                         {'performance_warnings': []})
+
+        self.assertEqual(classified, 3)
+        nfa.classify_words_batch.assert_called_once()
+        self.assertEqual(sum(len(class_paths) for class_paths in path_classes.values()), 3)
+        self.assertEqual(nfa.stats['batch_words_classified'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
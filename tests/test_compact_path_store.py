@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests stockage compact chemins (PathPrefixTree / CompactPathList)
+
+Valide:
+- Chemins matérialisés identiques au parcours reverse de référence
+- Préfixes partagés: une entrée d'arbre par visite DFS, un int par chemin
+- Cache énumérateur et classes d'équivalence adossés au même arbre
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+from icgs_core.path_store import PathPrefixTree, CompactPathList, ROOT_ENTRY
+
+
+def _diamond_chain(num_diamonds: int):
+    """Chaîne de losanges: 2^num_diamonds chemins sink → source"""
+    current = Node("source_0")
+    for index in range(num_diamonds):
+        upper, lower, joined = Node(f"up_{index}"), Node(f"down_{index}"), Node(f"join_{index}")
+        for start, end in ((current, upper), (current, lower), (upper, joined), (lower, joined)):
+            connect_nodes(start, end, Edge(f"e_{start.node_id}_{end.node_id}", start, end))
+        current = joined
+    return current
+
+
+def _reference_paths(sink: Node):
+    """Parcours reverse exhaustif (incoming_edges) en ordre DFS"""
+    paths = []
+
+    def visit(node, prefix):
+        prefix = prefix + [node.node_id]
+        if not node.incoming_edges:
+            paths.append(tuple(prefix))
+        for edge in node.incoming_edges.values():
+            visit(edge.source_node, prefix)
+
+    visit(sink, [])
+    return paths
+
+
+class TestPathPrefixTree(unittest.TestCase):
+
+    def test_shared_prefix_materialization(self):
+        tree = PathPrefixTree()
+        sink, a, b = Node("sink"), Node("a"), Node("b")
+        root = tree.extend(ROOT_ENTRY, sink)
+        left = tree.extend(root, a)
+        right = tree.extend(root, b)
+
+        paths = CompactPathList(tree)
+        paths.append_entry(left)
+        paths.append_entry(right)
+
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(paths, [[sink, a], [sink, b]])
+        self.assertEqual(paths[1:], [[sink, b]])
+        self.assertEqual(tree.path_node_ids(right), ["sink", "b"])
+
+
+class TestEnumeratorCompactPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = _diamond_chain(4)
+        self.transaction_edge = Edge("tx", Node("payer"), self.sink, edge_type=EdgeType.TEMPORARY)
+        self.enumerator = DAGPathEnumerator(AccountTaxonomy(), max_paths=1000)
+
+    def test_enumeration_matches_reference_and_shares_prefixes(self):
+        paths = [tuple(node.node_id for node in path)
+                 for path in self.enumerator.enumerate_paths_from_transaction(self.transaction_edge, 0)]
+
+        self.assertEqual(paths, _reference_paths(self.sink))
+        self.assertEqual(len(paths), 16)
+        # Arbre: une entrée par visite DFS, très inférieur à la somme des longueurs
+        self.assertLess(len(self.enumerator.path_tree), sum(len(path) for path in paths) // 2)
+
+        cached = list(self.enumerator.enumerate_paths_from_transaction(self.transaction_edge, 0))
+        self.assertEqual(self.enumerator.stats.cache_hits, 1)
+        self.assertEqual([tuple(node.node_id for node in path) for path in cached], paths)
+
+    def test_classes_are_compact_views(self):
+        nfa = MagicMock(spec=['evaluate_to_final_state'])
+        nfa.evaluate_to_final_state.side_effect = lambda word: "final_up" if word else None
+        self.enumerator.convert_paths_to_words = lambda paths, transaction_num: [
+            "W" if path[1].node_id == "up_3" else "" for path in paths]
+
+        path_classes = self.enumerator.enumerate_and_classify(self.transaction_edge, nfa, 0)
+
+        self.assertIsInstance(path_classes["final_up"], CompactPathList)
+        self.assertEqual(len(path_classes["final_up"]), 8)
+        self.assertIs(path_classes["final_up"].tree, self.enumerator.path_tree)
+        for path in path_classes["final_up"]:
+            self.assertEqual(path[1].node_id, "up_3")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests matrice contraintes compilée CSR (LinearProgram.compile_constraints)
+
+Valide:
+- Structure CSR (indptr/indices/data float64 + ombre Decimal), index variables stable
+- A @ x, violations, slacks et satisfaction identiques aux méthodes par contrainte
+- Lignes limites tranchées en Decimal exact (filtre flottant non décisif)
+- Cache invalidé à l'ajout de variables/contraintes et à la modification d'une contrainte
+"""
+
+import random
+import unittest
+from decimal import Decimal
+
+from icgs_core.linear_programming import (
+    LinearProgram, LinearConstraint, ConstraintType, CompiledConstraintMatrix
+)
+
+
+def build_program(seed: int = 7, num_vars: int = 12, num_constraints: int = 20) -> LinearProgram:
+    rng = random.Random(seed)
+    program = LinearProgram("compiled_test")
+    for j in range(num_vars):
+        program.add_variable(f"f_{j}", upper_bound=Decimal('100'))
+    types = [ConstraintType.LEQ, ConstraintType.GEQ, ConstraintType.EQ]
+    for i in range(num_constraints):
+        chosen = rng.sample(range(num_vars), rng.randint(1, 5))
+        coefficients = {f"f_{j}": Decimal(rng.randint(-40, 40)) / 10 for j in chosen}
+        program.add_constraint(LinearConstraint(
+            coefficients=coefficients,
+            bound=Decimal(rng.randint(-50, 50)),
+            constraint_type=types[i % 3],
+            name=f"c_{i}"
+        ))
+    return program
+
+
+class TestCompiledConstraintMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.program = build_program()
+        self.compiled = self.program.compile_constraints()
+
+    def test_csr_structure(self):
+        compiled = self.compiled
+        self.assertIsInstance(compiled, CompiledConstraintMatrix)
+        self.assertEqual(compiled.variable_order, sorted(self.program.variables))
+        self.assertEqual(compiled.indptr.typecode, 'q')
+        self.assertEqual(compiled.data.typecode, 'd')
+        self.assertEqual(len(compiled.indptr), compiled.num_rows + 1)
+        self.assertEqual(len(compiled.data), len(compiled.exact_data))
+
+        A, b, order = self.program.get_constraint_matrix()
+        for i, constraint in enumerate(self.program.constraints):
+            expected_row = [constraint.coefficients.get(var_id, Decimal('0')) for var_id in order]
+            self.assertEqual(A[i], expected_row)
+            self.assertEqual(b[i], constraint.bound)
+
+    def test_vector_operations_match_constraint_methods(self):
+        rng = random.Random(11)
+        for _ in range(30):
+            values = {f"f_{j}": Decimal(rng.randint(0, 200)) / 4
+                      for j in range(12) if rng.random() < 0.9}
+            constraints = self.program.constraints
+            self.assertEqual(self.compiled.exact_multiply(values), [c.evaluate(values) for c in constraints])
+            self.assertEqual(self.compiled.violation_vector(values), [c.get_violation(values) for c in constraints])
+            self.assertEqual(self.compiled.slack_vector(values), [c.get_slack(values) for c in constraints])
+            mask = [c.is_satisfied(values) for c in constraints]
+            self.assertEqual(self.compiled.satisfied_mask(values), mask)
+            self.assertEqual(self.compiled.all_satisfied(values), all(mask))
+
+            x = self.compiled.to_vector(values)
+            for lhs, exact in zip(self.compiled.multiply(x), self.compiled.exact_multiply(values)):
+                self.assertAlmostEqual(lhs, float(exact), places=9)
+
+    def test_boundary_rows_decided_exactly(self):
+        program = LinearProgram("boundary")
+        program.add_variable("a")
+        program.add_variable("b")
+        program.add_constraint(LinearConstraint({"a": Decimal('1'), "b": Decimal('1')}, Decimal('0.3'),
+                                                ConstraintType.LEQ, name="leq", tolerance=Decimal('0')))
+        program.add_constraint(LinearConstraint({"a": Decimal('1'), "b": Decimal('1')}, Decimal('0.3'),
+                                                ConstraintType.EQ, name="eq", tolerance=Decimal('0')))
+        compiled = program.compile_constraints()
+
+        # 0.1 + 0.2 != 0.3 en float, égal en Decimal
+        values = {"a": Decimal('0.1'), "b": Decimal('0.2')}
+        self.assertEqual(compiled.satisfied_mask(values), [True, True])
+        over = {"a": Decimal('0.1'), "b": Decimal('0.2000000000000000001')}
+        self.assertEqual(compiled.satisfied_mask(over), [False, False])
+
+    def test_program_level_api_and_cache(self):
+        program = self.program
+        self.assertIs(program.compile_constraints(), self.compiled)
+
+        values = {var_id: Decimal('1') for var_id in program.variables}
+        program.set_variable_values(values)
+        expected_violations = {c.name: c.get_violation(values) for c in program.constraints
+                               if c.get_violation(values) > 0}
+        self.assertEqual(program.get_constraint_violations(), expected_violations)
+        self.assertEqual(program.get_constraint_slacks(),
+                         {c.name: c.get_slack(values) for c in program.constraints})
+        self.assertEqual(program.is_feasible(), not expected_violations)
+
+        program.add_variable("extra")
+        program.add_constraint(LinearConstraint({"extra": Decimal('1')}, Decimal('5'), ConstraintType.LEQ))
+        recompiled = program.compile_constraints()
+        self.assertIsNot(recompiled, self.compiled)
+        self.assertEqual(recompiled.num_rows, 21)
+        self.assertEqual(program.stats['matrix_compilations'], 2)
+
+    def test_constraint_mutation_invalidates_cache(self):
+        program = LinearProgram("mutation")
+        program.add_variable("x")
+        program.add_variable("y")
+        constraint = LinearConstraint({"x": Decimal('1')}, Decimal('5'), ConstraintType.LEQ, name="cap")
+        program.add_constraint(constraint)
+        program.set_variable_values({"x": Decimal('3'), "y": Decimal('0')})
+        self.assertTrue(program.is_feasible())
+        structure = program.structure_fingerprint()
+
+        # Affectation RHS: violation visible, structure inchangée
+        constraint.bound = Decimal('2')
+        self.assertFalse(constraint.is_satisfied(program.get_variable_values()))
+        self.assertFalse(program.is_feasible())
+        self.assertEqual(program.get_constraint_violations(), {"cap": Decimal('1')})
+        self.assertEqual(program.get_constraint_matrix()[1], [Decimal('2')])
+        self.assertEqual(program.structure_fingerprint(), structure)
+
+        # Mutation en place des coefficients: matrice et structure recalculées
+        constraint.coefficients["y"] = Decimal('2')
+        self.assertEqual(program.get_constraint_matrix()[0], [[Decimal('1'), Decimal('2')]])
+        self.assertNotEqual(program.structure_fingerprint(), structure)
+
+        # Remplacement d'une contrainte à nombre de lignes égal
+        program.constraints[0] = LinearConstraint({"y": Decimal('1')}, Decimal('9'), ConstraintType.LEQ, name="cap")
+        self.assertTrue(program.is_feasible())
+        compilations = program.stats['matrix_compilations']
+        program.compile_constraints()
+        self.assertEqual(program.stats['matrix_compilations'], compilations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests cache validation adressé par contenu (PerformanceCache + EconomicSimulation)
+
+Valide:
+- Empreinte LinearProgram canonique (ordre, écriture Decimal, noms ignorés)
+- Éviction LRU O(1) bornée par max_validation_cache
+- Clé FEASIBILITY indépendante de l'ID, invalidée par la version d'état DAG
+- Re-validation d'une transaction commitée sans second commit
+- Hit OPTIMIZATION entre transactions d'IDs différents et même LP
+"""
+
+import unittest
+from decimal import Decimal
+
+from icgs_core.linear_programming import LinearProgram, LinearConstraint, ConstraintType
+from icgs_simulation.api.icgs_bridge import EconomicSimulation, PerformanceCache, SimulationMode
+
+
+def _program(name: str, bound: str, coefficient: str, reverse: bool = False) -> LinearProgram:
+    program = LinearProgram(name)
+    variables = ["x", "y"]
+    for var_id in reversed(variables) if reverse else variables:
+        program.add_variable(var_id, lower_bound=Decimal('0'))
+    constraints = [
+        LinearConstraint({"x": Decimal(coefficient), "y": Decimal('0')}, Decimal(bound),
+                         ConstraintType.LEQ, name=f"{name}_capacity"),
+        LinearConstraint({"x": Decimal('1'), "y": Decimal('-1')}, Decimal('0'),
+                         ConstraintType.EQ, name=f"{name}_conservation"),
+    ]
+    for constraint in reversed(constraints) if reverse else constraints:
+        program.add_constraint(constraint)
+    return program
+
+
+class TestContentAddressedValidationCache(unittest.TestCase):
+
+    def test_fingerprint_canonical(self):
+        reference = _program("lp_a", "100", "1")
+        self.assertEqual(reference.fingerprint(), _program("lp_b", "100.00", "1.0", reverse=True).fingerprint())
+        self.assertNotEqual(reference.fingerprint(), _program("lp_a", "101", "1").fingerprint())
+        self.assertNotEqual(reference.fingerprint(), _program("lp_a", "100", "2").fingerprint())
+
+    def test_lru_eviction(self):
+        cache = PerformanceCache(max_validation_cache=2)
+        cache.store_validation_result(("a",), "A")
+        cache.store_validation_result(("b",), "B")
+        self.assertEqual(cache.get_validation_result(("a",)), "A")
+
+        cache.store_validation_result(("c",), "C")
+        self.assertIsNone(cache.get_validation_result(("b",)))
+        self.assertEqual(cache.get_validation_result(("a",)), "A")
+        self.assertEqual(cache.get_cache_stats()['validation_cache_size'], 2)
+        self.assertEqual((cache.hit_count, cache.miss_count), (2, 1))
+
+    def test_feasibility_key_and_committed_revalidation(self):
+        simulation = EconomicSimulation("content_cache")
+        simulation.create_agent("FARM", "AGRICULTURE", Decimal('1000'))
+        simulation.create_agent("FACTORY", "INDUSTRY", Decimal('1000'))
+        first_id = simulation.create_transaction("FARM", "FACTORY", Decimal('100'))
+        second_id = simulation.create_transaction("FARM", "FACTORY", Decimal('100'))
+        first, second = simulation.transactions.get(first_id), simulation.transactions.get(second_id)
+
+        simulation._configure_taxonomy_batch()
+        simulation.taxonomy_configured = True
+        self.assertEqual(simulation._feasibility_cache_key(first), simulation._feasibility_cache_key(second))
+
+        key_before = simulation._feasibility_cache_key(second)
+        result = simulation.validate_transaction(first_id)
+        self.assertTrue(result.success)
+        self.assertNotEqual(simulation._feasibility_cache_key(second), key_before)
+
+        counter = simulation.dag.transaction_counter
+        hits = simulation.performance_cache.hit_count
+        self.assertIs(simulation.validate_transaction(first_id), result)
+        self.assertEqual(simulation.dag.transaction_counter, counter)
+        self.assertEqual(simulation.performance_cache.hit_count, hits + 1)
+
+        self.assertTrue(simulation.validate_transaction(second_id).success)
+        self.assertEqual(simulation.dag.transaction_counter, counter + 1)
+
+    def test_optimization_hit_across_ids(self):
+        simulation = EconomicSimulation("content_cache_optimization")
+        simulation.create_agent("FARM", "AGRICULTURE", Decimal('1000'))
+        simulation.create_agent("FACTORY", "INDUSTRY", Decimal('1000'))
+        first_id = simulation.create_transaction("FARM", "FACTORY", Decimal('100'))
+        second_id = simulation.create_transaction("FARM", "FACTORY", Decimal('100.00'))
+
+        first = simulation.validate_transaction(first_id, SimulationMode.OPTIMIZATION)
+        hits = simulation.performance_cache.hit_count
+        second = simulation.validate_transaction(second_id, SimulationMode.OPTIMIZATION)
+
+        self.assertEqual(simulation.performance_cache.hit_count, hits + 1)
+        self.assertEqual(second.transaction_id, second_id)
+        self.assertEqual(second.optimal_price, first.optimal_price)
+        self.assertEqual(second.success, first.success)
+
+
+if __name__ == '__main__':
+    unittest.main()
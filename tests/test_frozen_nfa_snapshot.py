@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests snapshot frozen immuable AnchoredWeightedNFA (FrozenNFASnapshot)
+
+Valide:
+- Évaluation CSR + epsilon-closures précalculées identique au parcours des transitions
+- Snapshot partagé entre freeze() tant que la structure ne change pas
+- Nouveau snapshot après modification structurelle
+"""
+
+import unittest
+import random
+from decimal import Decimal
+
+from icgs_core.anchored_nfa import AnchoredWeightedNFA, FrozenNFASnapshot
+from icgs_core.weighted_nfa import TransitionType
+
+
+def _reference_frozen_evaluation(nfa: AnchoredWeightedNFA, word: str):
+    """Simulation par scan complet des transitions (ancienne implémentation)"""
+    def closure(states):
+        result, stack = set(states), list(states)
+        while stack:
+            current = stack.pop()
+            for t in nfa.transitions:
+                if t.from_state == current and t.transition_type == TransitionType.EPSILON:
+                    if t.to_state not in result:
+                        result.add(t.to_state)
+                        stack.append(t.to_state)
+        return result
+
+    current = closure({nfa.initial_state_id})
+    for symbol in word:
+        current = closure({t.to_state for state_id in current for t in nfa.transitions
+                           if t.from_state == state_id and t.matches(symbol)})
+    return current & {state.state_id for state in nfa.get_final_states()}
+
+
+def _random_character_nfa(seed: int) -> AnchoredWeightedNFA:
+    """NFA CHARACTER/EPSILON aléatoire (cycles epsilon inclus)"""
+    rnd = random.Random(seed)
+    nfa = AnchoredWeightedNFA(f"random_{seed}")
+    for i in range(12):
+        nfa.add_state(f"s{i}", is_final=rnd.random() < 0.3)
+    nfa.set_initial_state("s0")
+    for _ in range(30):
+        source, target = f"s{rnd.randrange(12)}", f"s{rnd.randrange(12)}"
+        if rnd.random() < 0.3:
+            nfa.add_transition(source, target, None, TransitionType.EPSILON)
+        else:
+            nfa.add_transition(source, target, rnd.choice("ABC"), TransitionType.CHARACTER)
+    return nfa
+
+
+class TestFrozenNFASnapshot(unittest.TestCase):
+
+    def test_csr_evaluation_matches_transition_scan(self):
+        rnd = random.Random(2)
+        for seed in range(15):
+            nfa = _random_character_nfa(seed)
+            nfa.freeze()
+            for _ in range(60):
+                word = ''.join(rnd.choice("ABC") for _ in range(rnd.randint(0, 6)))
+                self.assertEqual(nfa._evaluate_with_frozen_snapshot(word),
+                                 _reference_frozen_evaluation(nfa, word), (seed, word))
+
+    def test_precomputed_closures_match_traversal(self):
+        nfa = _random_character_nfa(4)
+        expected = {state_id: nfa._epsilon_closure({state_id}) for state_id in nfa.states}
+
+        nfa.freeze()
+        for state_id, closure in expected.items():
+            self.assertEqual(nfa._epsilon_closure({state_id}), closure)
+
+    def test_refreeze_reuses_snapshot_until_structure_changes(self):
+        nfa = AnchoredWeightedNFA("reuse")
+        nfa.add_weighted_regex("m1", "A", Decimal('1'))
+
+        nfa.freeze()
+        first = nfa.frozen_snapshot
+        self.assertIsInstance(first, FrozenNFASnapshot)
+        nfa.unfreeze()
+        nfa.freeze()
+
+        self.assertIs(nfa.frozen_snapshot, first)
+        self.assertEqual(nfa.stats['snapshot_builds'], 1)
+        self.assertEqual(nfa.stats['snapshot_reuses'], 1)
+
+        nfa.unfreeze()
+        nfa.add_weighted_regex("m2", "B", Decimal('1'))
+        nfa.freeze()
+
+        self.assertIsNot(nfa.frozen_snapshot, first)
+        self.assertGreater(nfa.frozen_snapshot.version, first.version)
+        self.assertEqual(len(nfa.frozen_final_states), 2)
+        self.assertEqual(len(first.final_states), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests logging hot-path DAGPathEnumerator (niveaux capturés par énumération)
+
+Valide:
+- Logger à WARNING: aucun message debug/info formaté pendant le parcours
+- Compteurs EnumerationStatistics alimentés quel que soit le niveau
+- Logger à DEBUG: traces détaillées restaurées
+"""
+
+import logging
+import unittest
+from unittest.mock import patch
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+def _diamond_transaction_edge() -> Edge:
+    source, upper, lower, sink = Node("src"), Node("up"), Node("down"), Node("sink")
+    for start, end in ((source, upper), (source, lower), (upper, sink), (lower, sink)):
+        connect_nodes(start, end, Edge(f"e_{start.node_id}_{end.node_id}", start, end))
+    return Edge("tx", Node("payer"), sink, edge_type=EdgeType.TEMPORARY)
+
+
+class TestHotPathLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.enumerator = DAGPathEnumerator(AccountTaxonomy(), max_paths=100)
+        self.previous_level = self.enumerator.logger.level
+
+    def tearDown(self):
+        self.enumerator.logger.setLevel(self.previous_level)
+
+    def _enumerate_with_patched_logger(self):
+        transaction_edge = _diamond_transaction_edge()
+        with patch.object(self.enumerator.logger, 'debug') as debug, \
+                patch.object(self.enumerator.logger, 'info') as info:
+            paths = list(self.enumerator.enumerate_paths_from_transaction(transaction_edge, 0))
+        messages = [call.args[0] for call in debug.call_args_list + info.call_args_list]
+        return paths, messages
+
+    def test_warning_level_formats_no_traversal_messages(self):
+        self.enumerator.logger.setLevel(logging.WARNING)
+
+        paths, messages = self._enumerate_with_patched_logger()
+
+        self.assertEqual(len(paths), 2)
+        self.assertFalse(self.enumerator.trace_debug)
+        self.assertFalse(any("path found" in message or "Backtracked" in message
+                             for message in messages))
+        self.assertEqual(self.enumerator.stats.complete_paths_found, 2)
+        self.assertGreater(self.enumerator.stats.causal_edges_explored, 0)
+        self.assertGreater(self.enumerator.stats.backtracks, 0)
+
+    def test_debug_level_restores_traces(self):
+        self.enumerator.logger.setLevel(logging.DEBUG)
+
+        paths, messages = self._enumerate_with_patched_logger()
+
+        self.assertEqual(len(paths), 2)
+        self.assertTrue(self.enumerator.trace_debug)
+        self.assertEqual(sum("Complete path found" in message for message in messages), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
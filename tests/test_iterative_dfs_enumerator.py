@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests moteur DFS itératif DAGPathEnumerator (pile explicite)
+
+Valide:
+- Chemins et statistiques identiques au moteur récursif legacy
+  (alternance causale pair/impair, fallback exhaustif, cycles)
+- Chaînes profondes au-delà de la limite de récursion Python
+- État DFS nettoyé après arrêt anticipé du consommateur
+"""
+
+import sys
+import unittest
+import random
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+class _UnboundedDepthEnumerator(DAGPathEnumerator):
+    """Limites profondeur/mémoire levées pour chaînes longues"""
+    MEMORY_PROTECTION_THRESHOLD = 10 ** 9
+
+    def _get_adaptive_max_depth(self) -> int:
+        return 10 ** 6
+
+
+def _random_graph(seed: int):
+    """Graphe aléatoire nœuds _source/_sink/neutres (cycles possibles)"""
+    rnd = random.Random(seed)
+    names = [f"acc{i}_{rnd.choice(['source', 'sink', 'hub'])}" for i in range(10)]
+    nodes = [Node(name) for name in names]
+    for edge_num in range(rnd.randint(8, 20)):
+        source, target = rnd.sample(nodes, 2)
+        connect_nodes(source, target, Edge(f"e{edge_num}", source, target))
+    return nodes
+
+
+def _enumerate(engine: str, transaction_edge: Edge, enumerator_class=DAGPathEnumerator):
+    enumerator = enumerator_class(AccountTaxonomy(), max_paths=500)
+    enumerator.dfs_engine = engine
+    paths = [tuple(node.node_id for node in path)
+             for path in enumerator.enumerate_paths_from_transaction(transaction_edge, 0)]
+    return paths, enumerator
+
+
+class TestIterativeDFSEquivalence(unittest.TestCase):
+
+    def test_random_graphs_match_recursive_engine(self):
+        total_paths = 0
+        for seed in range(40):
+            nodes = _random_graph(seed)
+            transaction_edge = Edge("tx", Node("payer_source"), nodes[0], edge_type=EdgeType.TEMPORARY)
+
+            reference, recursive = _enumerate("RECURSIVE", transaction_edge)
+            paths, iterative = _enumerate("ITERATIVE", transaction_edge)
+
+            self.assertEqual(paths, reference, seed)
+            total_paths += len(paths)
+            for field_name in ('cycles_detected', 'max_depth_reached', 'early_terminations',
+                               'reachability_prunes', 'warning_patterns'):
+                self.assertEqual(getattr(iterative.stats, field_name),
+                                 getattr(recursive.stats, field_name), (seed, field_name))
+            self.assertEqual(getattr(iterative.stats, 'causal_edges_explored', 0),
+                             getattr(recursive.stats, 'causal_edges_explored', 0), seed)
+
+        self.assertGreater(total_paths, 20)
+
+    def test_chain_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 200
+        nodes = [Node(f"chain_{i}") for i in range(depth)]
+        for upstream, downstream in zip(nodes[1:], nodes):
+            connect_nodes(upstream, downstream, Edge(f"e_{upstream.node_id}", upstream, downstream))
+        transaction_edge = Edge("tx", Node("payer"), nodes[0], edge_type=EdgeType.TEMPORARY)
+
+        paths, enumerator = _enumerate("ITERATIVE", transaction_edge, _UnboundedDepthEnumerator)
+
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(len(paths[0]), depth)
+        self.assertEqual(enumerator.stats.max_depth_reached, depth)
+
+    def test_early_stop_cleans_dfs_state(self):
+        source, upper, lower, sink = Node("src"), Node("up"), Node("down"), Node("sink")
+        for start, end in ((source, upper), (source, lower), (upper, sink), (lower, sink)):
+            connect_nodes(start, end, Edge(f"e_{start.node_id}_{end.node_id}", start, end))
+        transaction_edge = Edge("tx", Node("payer"), sink, edge_type=EdgeType.TEMPORARY)
+        enumerator = DAGPathEnumerator(AccountTaxonomy(), max_paths=500)
+
+        generator = enumerator._enumerate_path_entries(transaction_edge, 0)
+        first = next(generator, None)
+        generator.close()
+
+        self.assertIsNotNone(first)
+        self.assertEqual(enumerator.current_path, [])
+        self.assertEqual(enumerator.visited_nodes, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
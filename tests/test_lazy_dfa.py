@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests DFA paresseux (LazySubsetDFA) sur SharedNFA frozen
+
+Valide:
+- Classification DFA identique à la simulation NFA caractère par caractère
+- Annotation états DFA finaux = ensemble des états finaux NFA
+- Éviction au plafond d'états puis fallback simulation NFA
+"""
+
+import unittest
+import random
+from decimal import Decimal
+
+from icgs_core.shared_nfa import SharedNFA
+from icgs_core.lazy_dfa import LazySubsetDFA
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+
+
+PATTERNS = ["A.*B", "[AB]C*", "A(B|C)*D", ".*CD", "(AB)*"]
+ALPHABET = "ABCD"
+
+
+def _frozen_nfa(patterns) -> SharedNFA:
+    nfa = SharedNFA("lazy_dfa_test")
+    for index, pattern in enumerate(patterns):
+        nfa.add_measure(f"m{index}", pattern, Decimal('1'))
+    nfa.freeze()
+    return nfa
+
+
+def _simulate(nfa: SharedNFA, word: str):
+    """Simulation NFA de référence (sans DFA)"""
+    states = nfa.initial_state_set()
+    for char in word:
+        states = nfa.step_state_set(states, char)
+        if not states:
+            return frozenset()
+    return states
+
+
+class TestLazySubsetDFA(unittest.TestCase):
+
+    def test_dfa_matches_nfa_simulation(self):
+        rnd = random.Random(8)
+        nfa = _frozen_nfa(PATTERNS)
+        words = [''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 8))) for _ in range(400)]
+
+        expected = [nfa.evaluate_word_to_final(word) for word in words]
+        nfa.enable_lazy_dfa()
+        actual = [nfa.evaluate_word_to_final(word) for word in words]
+
+        self.assertEqual(actual, expected)
+        dfa_stats = nfa.get_stats()['lazy_dfa']
+        self.assertGreater(dfa_stats['cache_hits'], dfa_stats['cache_misses'])
+        self.assertEqual(nfa.stats['dfa_evaluations'], len(words))
+
+    def test_final_state_annotation(self):
+        nfa = _frozen_nfa(PATTERNS)
+        nfa.enable_lazy_dfa()
+        dfa = nfa.get_lazy_dfa()
+
+        for word in ["AB", "ACD", "A", "ABAB", "CD", "D", ""]:
+            self.assertEqual(dfa.evaluate_final_states(word),
+                             _simulate(nfa, word) & nfa.frozen_snapshot.final_state_ids, word)
+
+    def test_state_cap_evicts_then_falls_back(self):
+        rnd = random.Random(3)
+        nfa = _frozen_nfa(PATTERNS)
+        dfa = LazySubsetDFA(nfa.initial_state_set(), nfa.step_state_set, nfa.resolve_final_state,
+                            frozenset(nfa.frozen_snapshot.final_state_ids),
+                            max_states=2, max_cache_resets=2)
+
+        for _ in range(200):
+            word = ''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 8)))
+            self.assertEqual(dfa.evaluate_final_states(word),
+                             _simulate(nfa, word) & nfa.frozen_snapshot.final_state_ids, word)
+
+        stats = dfa.get_stats()
+        self.assertEqual(stats['cache_resets'], 2)
+        self.assertTrue(stats['blown_up'])
+        self.assertGreater(stats['nfa_fallbacks'], 0)
+        self.assertLessEqual(stats['dfa_states'], 2)
+
+    def test_dfa_discarded_with_snapshot(self):
+        nfa = AnchoredWeightedNFA("anchored_lazy")
+        nfa.add_weighted_regex("m1", "A.*B", Decimal('1'))
+        nfa.enable_lazy_dfa(max_states=64)
+        nfa.freeze()
+        self.assertIsNotNone(nfa.evaluate_to_final_state("AXB"))
+        first_dfa = nfa.shared_nfa.frozen_snapshot.lazy_dfa
+
+        nfa.unfreeze()
+        nfa.add_weighted_regex("m2", "C", Decimal('1'))
+        nfa.freeze()
+
+        self.assertIsNotNone(nfa.evaluate_to_final_state("AYB"))
+        self.assertIsNot(nfa.shared_nfa.frozen_snapshot.lazy_dfa, first_dfa)
+
+
+if __name__ == '__main__':
+    unittest.main()
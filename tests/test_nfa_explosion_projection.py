@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests pré-check explosion NFA sans deepcopy (project_final_state_count)
+
+Valide:
+- Comptage projeté identique au comptage après ajout réel sur copie
+- Patterns invalides rejetés comme lors de l'ajout réel
+- DAG: rejet au seuil d'explosion sans modification du NFA permanent
+"""
+
+import unittest
+import copy
+import random
+from decimal import Decimal
+
+from icgs_core import DAG, DAGConfiguration, Transaction, TransactionMeasure
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+
+
+class TestFinalStateProjection(unittest.TestCase):
+    """Équivalence projection analytique vs deepcopy + ajout"""
+
+    def test_projection_matches_copied_nfa(self):
+        rnd = random.Random(13)
+        patterns = [".*A.*", ".*[BC].*", "^D.*", "E", ".*[FG].*$"]
+        nfa = AnchoredWeightedNFA("projection")
+
+        for _ in range(40):
+            measures = [(f"m{rnd.randint(0, 60)}", rnd.choice(patterns)) for _ in range(rnd.randint(1, 4))]
+
+            reference = copy.deepcopy(nfa)
+            for measure_id, pattern in measures:
+                reference.add_weighted_regex(measure_id, pattern, Decimal('1'))
+
+            self.assertEqual(nfa.project_final_state_count(measures), len(reference.get_final_states()))
+
+            for measure_id, pattern in measures:
+                nfa.add_weighted_regex(measure_id, pattern, Decimal('1'))
+
+    def test_invalid_pattern_raises(self):
+        nfa = AnchoredWeightedNFA("invalid")
+        nfa.add_weighted_regex("m1", ".*A.*", Decimal('1'))
+
+        with self.assertRaises(ValueError):
+            nfa.project_final_state_count([("m2", ".*[AB.*")])
+        self.assertEqual(len(nfa.get_final_states()), 1)
+
+
+class TestDAGExplosionCheck(unittest.TestCase):
+    """DAG._validate_transaction_nfa_explosion sur NFA permanent"""
+
+    def _transaction(self, tx_num: int) -> Transaction:
+        return Transaction(
+            transaction_id=f"tx_{tx_num}", source_account_id="alice", target_account_id="bob",
+            amount=Decimal('10'),
+            source_measures=[TransactionMeasure(
+                measure_id=f"tx_{tx_num}_source", account_id="alice",
+                primary_regex_pattern=".*A.*", primary_regex_weight=Decimal('1'),
+                acceptable_value=Decimal('100'))],
+            target_measures=[TransactionMeasure(
+                measure_id=f"tx_{tx_num}_target", account_id="bob",
+                primary_regex_pattern=".*B.*", primary_regex_weight=Decimal('1'),
+                acceptable_value=Decimal('100'))]
+        )
+
+    def test_threshold_enforced_without_mutation(self):
+        dag = DAG(DAGConfiguration(nfa_explosion_threshold=5))
+        dag.anchored_nfa = AnchoredWeightedNFA("permanent")
+        for measure_num in range(4):
+            dag.anchored_nfa.add_weighted_regex(f"existing_{measure_num}", ".*A.*", Decimal('1'))
+
+        self.assertFalse(dag._validate_transaction_nfa_explosion(self._transaction(1)))
+        self.assertEqual(len(dag.anchored_nfa.get_final_states()), 4)
+
+        dag.configuration.nfa_explosion_threshold = 6
+        self.assertTrue(dag._validate_transaction_nfa_explosion(self._transaction(1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests backends numériques du Simplex révisé (float, fraction, scaled_integer)
+
+Valide:
+- Statuts et objectifs optimaux exacts identiques entre backends
+- Échelle 10^E fixe: données entières, certificats ramenés à l'échelle d'origine
+- Sélection par instance TripleValidationOrientedSimplex, nom inconnu rejeté
+"""
+
+import random
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from icgs_core import (
+    TripleValidationOrientedSimplex, LinearProgram, LinearConstraint,
+    ConstraintType
+)
+from icgs_core.numeric_backend import NUMERIC_BACKENDS, NumericBackend, ScaledIntegerBackend, get_numeric_backend
+from icgs_core.revised_simplex import BoundedRevisedSimplex
+
+
+def _monetary_problem(rnd: random.Random, num_vars: int, num_constraints: int) -> LinearProgram:
+    problem = LinearProgram("monetary_lp")
+    for j in range(num_vars):
+        problem.add_variable(f"f_{j}", Decimal('0'), Decimal(rnd.randint(5, 50)))
+    for i in range(num_constraints):
+        coefficients = {f"f_{j}": Decimal(rnd.randint(1, 400)) / 100
+                        for j in range(num_vars) if rnd.random() < 0.6} or {"f_0": Decimal('1')}
+        constraint_type = [ConstraintType.LEQ, ConstraintType.GEQ, ConstraintType.EQ][i % 3]
+        problem.add_constraint(LinearConstraint(coefficients, Decimal(rnd.randint(0, 9000)) / 100,
+                                                constraint_type, name=f"c{i}"))
+    return problem
+
+
+class TestNumericBackends(unittest.TestCase):
+
+    def test_backends_agree_on_status_and_optimum(self):
+        rnd = random.Random(19)
+        for _ in range(15):
+            problem = _monetary_problem(rnd, 6, 5)
+            objective = {f"f_{j}": Decimal(rnd.randint(1, 9)) for j in range(6)}
+            results = {name: BoundedRevisedSimplex(problem, backend=name).solve(objective)
+                       for name in NUMERIC_BACKENDS}
+
+            statuses = {result.status for result in results.values()}
+            self.assertEqual(len(statuses), 1, statuses)
+            for result in results.values():
+                self.assertTrue(result.certificate.verified)
+            if statuses == {"OPTIMAL"}:
+                optima = {result.certificate.objective_value for result in results.values()}
+                self.assertEqual(len(optima), 1)
+            if statuses == {"INFEASIBLE"}:
+                for result in results.values():
+                    self.assertLess(result.certificate.farkas_bound, 0)
+
+    def test_scaled_integer_rows(self):
+        problem = LinearProgram("scaled")
+        problem.add_variable("a")
+        problem.add_variable("b")
+        problem.add_constraint(LinearConstraint({"a": Decimal('0.25'), "b": Decimal('1.5')},
+                                                Decimal('10.10'), ConstraintType.GEQ))
+        problem.add_constraint(LinearConstraint({"a": Decimal('1'), "b": Decimal('1')},
+                                                Decimal('3'), ConstraintType.LEQ))
+
+        engine = BoundedRevisedSimplex(problem, backend="scaled_integer")
+        self.assertEqual(engine.row_scale, 100)
+        for column in engine.exact_columns:
+            self.assertTrue(all(value.denominator == 1 for value in column.values()))
+
+        # Infaisable: 0.25a + 1.5b ≤ 4.5 < 10.1 ; borne Farkas à l'échelle d'origine
+        scaled = engine.solve()
+        reference = BoundedRevisedSimplex(problem, backend="fraction").solve()
+        self.assertEqual(scaled.status, "INFEASIBLE")
+        self.assertEqual(scaled.certificate.farkas_bound, reference.certificate.farkas_bound)
+
+        self.assertEqual(ScaledIntegerBackend(max_exponent=1).row_scale(problem.compile_constraints()), 1)
+
+    def test_solver_instance_backend_selection(self):
+        problem = _monetary_problem(random.Random(3), 5, 4)
+        objective = {f"f_{j}": Decimal('1') for j in range(5)}
+        values = {}
+        for name in NUMERIC_BACKENDS:
+            solver = TripleValidationOrientedSimplex(numeric_backend=name)
+            self.assertEqual(solver.numeric_backend.name, name)
+            solution = solver.solve_optimization_problem(problem, objective)
+            values[name] = (solution.status, solution.final_objective_value)
+        self.assertEqual(len(set(values.values())), 1, values)
+
+        with self.assertRaises(ValueError):
+            TripleValidationOrientedSimplex(numeric_backend="decimal")
+        self.assertIs(get_numeric_backend(NUMERIC_BACKENDS["float"]), NUMERIC_BACKENDS["float"])
+        self.assertEqual(NUMERIC_BACKENDS["fraction"].number(Decimal('0.1')), Fraction(1, 10))
+
+        # Backend incomplet rejeté à l'instanciation
+        class PartialBackend(NumericBackend):
+            def number(self, value):
+                return float(value)
+
+        with self.assertRaises(TypeError):
+            PartialBackend()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests Price Discovery paramétrique (solve_parametric_rhs + courbe prix EconomicSimulation)
+
+Valide:
+- Courbe exacte identique aux résolutions directes montant par montant
+- Domaine faisable: début calculé si infaisable en parameter_min, fin si infaisable au-delà
+- Intervalles décalés (parameter_min > 0, parameter_max < 0) identiques aux résolutions directes
+- Début exact non décimal (84/11): aucun arrondi du RHS décalé
+- Requêtes price_at hors domaine, erreurs d'arguments
+- API EconomicSimulation.get_price_curve cohérente avec validate_transaction OPTIMIZATION
+"""
+
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+from icgs_core import (
+    TripleValidationOrientedSimplex, LinearProgram, LinearConstraint, ConstraintType, SolutionStatus
+)
+from icgs_simulation.api.icgs_bridge import EconomicSimulation, SimulationMode
+
+
+def _covering_problem() -> LinearProgram:
+    """min x + y, x + 2y ≥ demand (paramètre), 3x + y ≥ 6"""
+    problem = LinearProgram("covering")
+    problem.add_variable("x")
+    problem.add_variable("y")
+    problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('2')}, Decimal('0'),
+                                            ConstraintType.GEQ, name="demand"))
+    problem.add_constraint(LinearConstraint({"x": Decimal('3'), "y": Decimal('1')}, Decimal('6'),
+                                            ConstraintType.GEQ, name="mix"))
+    return problem
+
+
+def _domain_problem() -> LinearProgram:
+    """x ∈ [0, 10], x ≥ -5 + s·p (demand), x ≤ -3 + s·p (capacity)"""
+    problem = LinearProgram("domain")
+    problem.add_variable("x", Decimal('0'), Decimal('10'))
+    problem.add_constraint(LinearConstraint({"x": Decimal('1')}, Decimal('-5'),
+                                            ConstraintType.GEQ, name="demand"))
+    problem.add_constraint(LinearConstraint({"x": Decimal('1')}, Decimal('-3'),
+                                            ConstraintType.LEQ, name="capacity"))
+    return problem
+
+
+OBJECTIVE = {"x": Decimal('1'), "y": Decimal('1')}
+DOMAIN_OBJECTIVE = {"x": Decimal('2')}
+
+
+class TestParametricRHS(unittest.TestCase):
+
+    def test_curve_matches_direct_solves(self):
+        problem = _covering_problem()
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+            problem, OBJECTIVE, {"demand": Decimal('1')}, Decimal('0'), Decimal('30'))
+
+        self.assertEqual(curve.status, SolutionStatus.OPTIMAL)
+        self.assertEqual(curve.breakpoints, [Fraction(0), Fraction(2), Fraction(12)])
+        self.assertEqual(curve.slopes, [Fraction(0), Fraction(2, 5), Fraction(1, 2)])
+        self.assertEqual(curve.parameter_end, Fraction(30))
+
+        for step in range(61):
+            amount = Decimal(step) / 2
+            direct = TripleValidationOrientedSimplex().solve_optimization_problem(
+                problem.with_rhs_shift({"demand": Decimal('1')}, amount), OBJECTIVE)
+            self.assertEqual(curve.exact_price_at(amount), direct.certificate.objective_value)
+        self.assertEqual(curve.price_at(Decimal('4')), Decimal('2.8'))
+        self.assertIsNone(curve.price_at(Decimal('31')))
+
+    def assert_matches_direct_solves(self, curve, problem, objective, direction, amounts):
+        for amount in amounts:
+            direct = TripleValidationOrientedSimplex().solve_optimization_problem(
+                problem.with_rhs_shift(direction, amount), objective)
+            if direct.status == SolutionStatus.OPTIMAL:
+                self.assertEqual(curve.exact_price_at(amount), direct.certificate.objective_value, amount)
+            else:
+                self.assertEqual(direct.status, SolutionStatus.INFEASIBLE, amount)
+                self.assertIsNone(curve.exact_price_at(amount), amount)
+
+    def test_feasible_domain_bounds(self):
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+            _domain_problem(), DOMAIN_OBJECTIVE, {"demand": Decimal('1'), "capacity": Decimal('1')},
+            Decimal('0'), Decimal('20'))
+
+        # Faisable ssi 3 ≤ p ≤ 15 (x ≤ p - 3, x ≥ p - 5, x ≤ 10)
+        self.assertEqual(curve.feasible_range, (Fraction(3), Fraction(15)))
+        self.assertIsNone(curve.price_at(Decimal('2')))
+        self.assertEqual(curve.price_at(Decimal('4')), Decimal('0'))
+        self.assertEqual(curve.price_at(Decimal('9')), Decimal('8'))
+        self.assertIsNone(curve.price_at(Decimal('16')))
+
+    def test_feasible_domain_inside_positive_range(self):
+        problem = _domain_problem()
+        direction = {"demand": Decimal('1'), "capacity": Decimal('1')}
+        amounts = [Decimal(step) / 4 for step in range(81)]
+
+        for parameter_min in (Decimal('1'), Decimal('2.5')):
+            curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+                problem, DOMAIN_OBJECTIVE, direction, parameter_min, Decimal('20'))
+
+            # Infaisable en parameter_min > 0: domaine strictement intérieur
+            self.assertEqual(curve.status, SolutionStatus.OPTIMAL)
+            self.assertEqual(curve.feasible_range, (Fraction(3), Fraction(15)))
+            self.assertIsNone(curve.price_at(parameter_min))
+            self.assertEqual(curve.price_at(Decimal('9')), Decimal('8'))
+            self.assert_matches_direct_solves(curve, problem, DOMAIN_OBJECTIVE, direction,
+                                              [amount for amount in amounts if amount >= parameter_min])
+
+        # Début faisable non entier dans un intervalle décalé
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+            problem, DOMAIN_OBJECTIVE, direction, Decimal('2.75'), Decimal('3.5'))
+        self.assertEqual(curve.feasible_range, (Fraction(3), Fraction(7, 2)))
+
+    def test_feasible_domain_inside_negative_range(self):
+        problem = _domain_problem()
+        direction = {"demand": Decimal('-1'), "capacity": Decimal('-1')}
+
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+            problem, DOMAIN_OBJECTIVE, direction, Decimal('-20'), Decimal('-1'))
+
+        # Faisable ssi -15 ≤ p ≤ -3 (x ≤ -3 - p, x ≥ -5 - p, x ≤ 10)
+        self.assertEqual(curve.status, SolutionStatus.OPTIMAL)
+        self.assertEqual(curve.feasible_range, (Fraction(-15), Fraction(-3)))
+        self.assert_matches_direct_solves(curve, problem, DOMAIN_OBJECTIVE, direction,
+                                          [Decimal(step) / 4 for step in range(-80, -3)])
+
+    def test_repeating_decimal_start(self):
+        problem = LinearProgram("repeating_start")
+        problem.add_variable("x0", Decimal('0'), Decimal('11'))
+        problem.add_variable("x1", Decimal('0'), Decimal('15'))
+        problem.add_constraint(LinearConstraint({"x0": Decimal('4'), "x1": Decimal('4')}, Decimal('4'),
+                                                ConstraintType.GEQ, name="demand"))
+        problem.add_constraint(LinearConstraint({"x0": Decimal('2'), "x1": Decimal('1')}, Decimal('-2'),
+                                                ConstraintType.LEQ, name="capacity"))
+        problem.add_constraint(LinearConstraint({"x0": Decimal('-1'), "x1": Decimal('4')}, Decimal('-2'),
+                                                ConstraintType.LEQ, name="mix"))
+        objective = {"x0": Decimal('5'), "x1": Decimal('3')}
+        direction = {"demand": Decimal('1'), "capacity": Decimal('1')}
+
+        curve = TripleValidationOrientedSimplex().solve_parametric_rhs(
+            problem, objective, direction, Decimal('0'), Decimal('10'))
+
+        # Faisable ssi p ≥ 84/11 (début non représentable en Decimal)
+        self.assertEqual(curve.status, SolutionStatus.OPTIMAL)
+        self.assertEqual(curve.feasible_range, (Fraction(84, 11), Fraction(10)))
+        self.assertIsNone(curve.price_at(Decimal('7.6')))
+        for amount in (Decimal('7.64'), Decimal('8'), Decimal('10')):
+            direct = TripleValidationOrientedSimplex().solve_optimization_problem(
+                problem.with_rhs_shift(direction, amount), objective)
+            self.assertEqual(direct.status, SolutionStatus.OPTIMAL)
+            self.assertEqual(curve.exact_price_at(amount), direct.certificate.objective_value)
+        self.assertEqual(curve.exact_price_at(Decimal('10')), Fraction(169, 10))
+
+    def test_rhs_shift_exact(self):
+        shifted = _covering_problem().with_rhs_shift({"demand": Decimal('3')}, Decimal('0.' + '3' * 60))
+        self.assertEqual(shifted.constraints[0].bound, Decimal('0.' + '9' * 60))
+
+    def test_invalid_arguments(self):
+        solver = TripleValidationOrientedSimplex()
+        with self.assertRaises(ValueError):
+            solver.solve_parametric_rhs(_covering_problem(), OBJECTIVE, {"unknown": Decimal('1')},
+                                        Decimal('0'), Decimal('1'))
+        with self.assertRaises(ValueError):
+            solver.solve_parametric_rhs(_covering_problem(), OBJECTIVE, {"demand": Decimal('1')},
+                                        Decimal('2'), Decimal('1'))
+
+
+class TestSimulationPriceCurve(unittest.TestCase):
+
+    def test_price_curve_matches_price_discovery(self):
+        simulation = EconomicSimulation("price_curve")
+        simulation.create_agent("FARM", "AGRICULTURE", Decimal('1000'))
+        simulation.create_agent("FACTORY", "INDUSTRY", Decimal('1000'))
+
+        curve = simulation.get_price_curve("FARM", "FACTORY", Decimal('0'), Decimal('1000'))
+        self.assertEqual(curve.status, SolutionStatus.OPTIMAL)
+        self.assertIs(simulation.get_price_curve("FARM", "FACTORY", Decimal('0'), Decimal('1000')), curve)
+
+        for amount in (Decimal('10'), Decimal('250.50'), Decimal('1000')):
+            tx_id = simulation.create_transaction("FARM", "FACTORY", amount)
+            result = simulation.validate_transaction(tx_id, SimulationMode.OPTIMIZATION)
+            self.assertEqual(curve.price_at(amount), result.optimal_price)
+
+        self.assertEqual(curve.to_dict()['status'], 'OPTIMAL')
+        with self.assertRaises(ValueError):
+            simulation.get_price_curve("FARM", "UNKNOWN", Decimal('0'), Decimal('10'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests moteur comptage chemins DP (PathCountDPEngine)
+
+Valide équivalence avec l'énumération explicite DAGPathEnumerator.enumerate_and_classify:
+- Mêmes classes d'équivalence et mêmes nombres de chemins par état final
+- Priorité NFA principal puis NFA cible (hybrid dual-NFA)
+- Fallback énumération pour graphes cycliques
+- Sélection moteur via DAGConfiguration
+"""
+
+import unittest
+import random
+from decimal import Decimal
+
+from icgs_core import (
+    DAG, DAGConfiguration, Transaction, TransactionMeasure, Account
+)
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+from icgs_core.path_count_engine import PathCountDPEngine, PathCountResult
+
+
+class TestPathCountDPEngine(unittest.TestCase):
+    """Cross-check moteur DP vs énumérateur explicite"""
+
+    def _build_layered_dag(self, layers: int, width: int, seed: int):
+        """DAG aléatoire en couches se terminant sur target_sink"""
+        rnd = random.Random(seed)
+        chars = iter("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789")
+        mappings = {}
+        rows = []
+
+        for layer in range(layers):
+            row = []
+            for index in range(width):
+                # payer_sink = nœud origin transaction (règle causale incoming-only)
+                node_id = "payer_sink" if (layer, index) == (1, 0) else f"n{layer}_{index}_sink"
+                row.append(Node(node_id))
+                mappings[node_id] = next(chars)
+            rows.append(row)
+
+        target_sink = Node("target_sink")
+        payer_source = Node("payer_source")
+        mappings["target_sink"] = next(chars)
+        mappings["payer_source"] = next(chars)
+
+        taxonomy = AccountTaxonomy()
+        taxonomy.update_taxonomy(mappings, 0)
+
+        edge_counter = 0
+        for node in rows[0]:
+            connect_nodes(node, target_sink, Edge(f"e{edge_counter}", node, target_sink))
+            edge_counter += 1
+
+        for layer in range(layers - 1):
+            for downstream in rows[layer]:
+                for upstream in rows[layer + 1]:
+                    if rnd.random() < 0.6:
+                        connect_nodes(upstream, downstream,
+                                      Edge(f"e{edge_counter}", upstream, downstream))
+                        edge_counter += 1
+
+        transaction_edge = Edge("tx_payer_target", payer_source, target_sink,
+                                edge_type=EdgeType.TEMPORARY)
+        return taxonomy, transaction_edge
+
+    def _build_dual_nfa(self):
+        """NFA principal + NFA cible en metadata, tous deux frozen"""
+        main_nfa = AnchoredWeightedNFA("main")
+        main_nfa.add_weighted_regex("m1", ".*[ABC].*", Decimal('1'))
+
+        target_nfa = AnchoredWeightedNFA("target")
+        target_nfa.add_weighted_regex("t1", ".*[DEFG].*", Decimal('1'))
+        target_nfa.add_weighted_regex("t2", "^H.*", Decimal('1'))
+
+        main_nfa.metadata['target_nfa'] = target_nfa
+        main_nfa.freeze()
+        target_nfa.freeze()
+        return main_nfa
+
+    def test_counts_match_enumeration_on_layered_dags(self):
+        """Comptes DP identiques aux longueurs des classes énumérées"""
+        for seed in range(8):
+            taxonomy, transaction_edge = self._build_layered_dag(6, 4, seed)
+            nfa = self._build_dual_nfa()
+
+            enumerated = DAGPathEnumerator(taxonomy, max_paths=10000).enumerate_and_classify(
+                transaction_edge, nfa, 0
+            )
+            result = PathCountDPEngine(DAGPathEnumerator(taxonomy, max_paths=10000)).count_and_classify(
+                transaction_edge, nfa, 0
+            )
+
+            self.assertEqual(result.engine, "dp")
+            self.assertEqual({state: len(paths) for state, paths in enumerated.items()},
+                             result.path_counts, f"seed={seed}")
+            self.assertEqual(set(enumerated.keys()), set(result.to_path_classes().keys()))
+
+    def test_witness_paths_are_enumerated_paths(self):
+        """Chemins témoins bornés et présents dans l'énumération"""
+        taxonomy, transaction_edge = self._build_layered_dag(6, 4, 0)
+        nfa = self._build_dual_nfa()
+
+        enumerated = DAGPathEnumerator(taxonomy, max_paths=10000).enumerate_and_classify(
+            transaction_edge, nfa, 0
+        )
+        engine = PathCountDPEngine(DAGPathEnumerator(taxonomy, max_paths=10000),
+                                   max_witnesses_per_class=1)
+        result = engine.count_and_classify(transaction_edge, nfa, 0)
+
+        for state_id, witnesses in result.witness_paths.items():
+            self.assertLessEqual(len(witnesses), 1)
+            enumerated_ids = {tuple(n.node_id for n in path) for path in enumerated[state_id]}
+            for witness in witnesses:
+                self.assertIn(tuple(n.node_id for n in witness), enumerated_ids)
+
+    def test_cyclic_graph_falls_back_to_enumeration(self):
+        """Cycle dans graphe reverse → fallback énumération explicite"""
+        taxonomy = AccountTaxonomy()
+        taxonomy.update_taxonomy({"a_sink": "A", "b_sink": "B", "target_sink": "C",
+                                  "payer_source": "D"}, 0)
+
+        a_sink, b_sink = Node("a_sink"), Node("b_sink")
+        target_sink, payer_source = Node("target_sink"), Node("payer_source")
+        connect_nodes(a_sink, target_sink, Edge("e1", a_sink, target_sink))
+        connect_nodes(b_sink, a_sink, Edge("e2", b_sink, a_sink))
+        connect_nodes(a_sink, b_sink, Edge("e3", a_sink, b_sink))
+        transaction_edge = Edge("tx", payer_source, target_sink, edge_type=EdgeType.TEMPORARY)
+
+        engine = PathCountDPEngine(DAGPathEnumerator(taxonomy, max_paths=100))
+        result = engine.count_and_classify(transaction_edge, self._build_dual_nfa(), 0)
+
+        self.assertIsInstance(result, PathCountResult)
+        self.assertEqual(result.engine, "enumeration")
+        self.assertEqual(engine.get_statistics()['cyclic_graph_fallbacks'], 1)
+
+
+class TestDAGPathClassificationEngine(unittest.TestCase):
+    """Sélection moteur DP_COUNT via DAGConfiguration"""
+
+    def _run_transactions(self, engine_name: str):
+        dag = DAG(DAGConfiguration(max_path_enumeration=1000,
+                                   path_classification_engine=engine_name))
+        mappings = {
+            "alice_source": "A", "alice_sink": "B",
+            "bob_source": "C", "bob_sink": "D",
+            "carol_source": "E", "carol_sink": "F"
+        }
+        for tx_num in range(6):
+            dag.account_taxonomy.update_taxonomy(mappings, tx_num)
+
+        for account_id in ("alice", "bob", "carol"):
+            dag.add_account(Account(account_id, Decimal('1000')))
+
+        results = []
+        for index, (source, target) in enumerate([("alice", "bob"), ("bob", "carol"),
+                                                   ("carol", "bob"), ("alice", "carol")]):
+            transaction = Transaction(
+                transaction_id=f"tx_{index}",
+                source_account_id=source,
+                target_account_id=target,
+                amount=Decimal('100'),
+                source_measures=[TransactionMeasure(
+                    measure_id=f"source_{index}", account_id=source,
+                    primary_regex_pattern=".*[ACE].*", primary_regex_weight=Decimal('1'),
+                    acceptable_value=Decimal('500'))],
+                target_measures=[TransactionMeasure(
+                    measure_id=f"target_{index}", account_id=target,
+                    primary_regex_pattern=".*[BDF].*", primary_regex_weight=Decimal('1'),
+                    acceptable_value=Decimal('500'), required_value=Decimal('10'))]
+            )
+            results.append(dag.add_transaction(transaction))
+        return dag, results
+
+    def test_dp_engine_matches_enumeration_pipeline(self):
+        """Mêmes décisions de validation avec DP_COUNT et ENUMERATION"""
+        enum_dag, enum_results = self._run_transactions("ENUMERATION")
+        dp_dag, dp_results = self._run_transactions("DP_COUNT")
+
+        self.assertEqual(enum_results, dp_results)
+        self.assertEqual(dp_dag.stats['dp_path_counts_used'], len(dp_results))
+        self.assertEqual(enum_dag.stats['dp_path_counts_used'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests caches LRU énumérateur: chemins (PathLRUCache) et mots (WordLRUCache)
+
+Valide:
+- Hits entre transactions sous une même version structurelle
+- Invalidation précise: seule une arête touchant l'arbre caché invalide
+- Budget octets avec éviction LRU et compteurs exposés dans les métriques pipeline
+- Mots réutilisés entre transactions tant que la version des mappings est inchangée
+"""
+
+import unittest
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+from icgs_core.path_store import PathLRUCache, WordLRUCache
+
+
+def _chain(prefix: str, length: int = 4):
+    nodes = [Node(f"{prefix}_{i}") for i in range(length)]
+    for upstream, downstream in zip(nodes[1:], nodes):
+        connect_nodes(upstream, downstream, Edge(f"e_{upstream.node_id}", upstream, downstream))
+    return nodes
+
+
+def _paths(enumerator, transaction_edge, transaction_num):
+    return [[node.node_id for node in path]
+            for path in enumerator.enumerate_paths_from_transaction(transaction_edge, transaction_num)]
+
+
+class TestVersionedPathCache(unittest.TestCase):
+
+    def setUp(self):
+        self.enumerator = DAGPathEnumerator(AccountTaxonomy(), max_paths=100)
+        self.cache = self.enumerator._path_cache
+        self.cache.advance_versions(0, 0)
+        self.nodes = _chain("chain")
+        self.transaction_edge = Edge("tx", Node("payer"), self.nodes[0], edge_type=EdgeType.TEMPORARY)
+
+    def test_hit_across_transactions_same_version(self):
+        first = _paths(self.enumerator, self.transaction_edge, 1)
+        second = _paths(self.enumerator, self.transaction_edge, 2)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.cache.stats['hits'], 1)
+        self.assertEqual(self.cache.stats['misses'], 1)
+
+    def test_only_edges_touching_cached_tree_invalidate(self):
+        reference = _paths(self.enumerator, self.transaction_edge, 1)
+
+        # Arête hors arbre: entrée reportée sur la nouvelle version
+        self.cache.advance_versions(1, 0, ("elsewhere_a", "elsewhere_b"))
+        self.assertEqual(_paths(self.enumerator, self.transaction_edge, 2), reference)
+        self.assertEqual(self.cache.stats['hits'], 1)
+
+        # Arête vers un nœud de l'arbre: entrée invalidée, nouveau chemin visible
+        extra = Node("extra")
+        connect_nodes(extra, self.nodes[2], Edge("e_extra", extra, self.nodes[2]))
+        self.assertEqual(self.cache.advance_versions(2, 0, ("extra", self.nodes[2].node_id)), 1)
+
+        refreshed = _paths(self.enumerator, self.transaction_edge, 3)
+        self.assertEqual(len(refreshed), len(reference) + 1)
+        self.assertEqual(self.cache.stats['invalidations'], 1)
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        sizes = []
+        edges = []
+        for prefix in ("a", "b", "c"):
+            nodes = _chain(prefix)
+            edges.append(Edge(f"tx_{prefix}", Node(f"payer_{prefix}"), nodes[0], edge_type=EdgeType.TEMPORARY))
+        _paths(self.enumerator, edges[0], 0)
+        sizes.append(self.cache.current_bytes)
+        self.cache.max_bytes = sizes[0] * 2
+
+        _paths(self.enumerator, edges[1], 0)
+        _paths(self.enumerator, edges[0], 0)  # a redevient MRU
+        _paths(self.enumerator, edges[2], 0)  # évince b
+
+        self.assertEqual(self.cache.stats['evictions'], 1)
+        self.assertLessEqual(self.cache.current_bytes, self.cache.max_bytes)
+        self.assertTrue(any(key.startswith("a_0_") for key in self.cache))
+        self.assertFalse(any(key.startswith("b_0_") for key in self.cache))
+
+        metrics = self.enumerator.get_pipeline_performance_metrics()['path_cache']
+        self.assertEqual(metrics['evicted'], 1)
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['misses'], 3)
+
+    def test_unversioned_cache_keeps_transaction_scope(self):
+        cache = PathLRUCache()
+        self.assertNotEqual(cache.make_key("n", "s", 1, 10), cache.make_key("n", "s", 2, 10))
+        cache.advance_versions(5, 3)
+        self.assertEqual(cache.make_key("n", "s", 1, 10), cache.make_key("n", "s", 2, 10))
+
+
+class TestWordLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = AccountTaxonomy()
+        self.taxonomy.update_taxonomy({'a': 'A', 'b': 'B'}, 0)
+        self.taxonomy.update_taxonomy({'c': 'C'}, 1)
+        self.enumerator = DAGPathEnumerator(self.taxonomy)
+        self.path = [Node("a"), Node("b")]
+
+    def test_words_shared_across_transactions_until_remap(self):
+        self.assertEqual(self.enumerator.convert_paths_to_words([self.path], 0), ["AB"])
+        self.assertEqual(self.enumerator.convert_paths_to_words([self.path], 1), ["AB"])
+        self.assertEqual(self.enumerator._word_cache.stats['hits'], 1)
+        self.assertEqual(self.taxonomy.get_taxonomy_snapshot(1).mapping_version, 0)
+
+        # Remappage d'un compte existant: nouvelle version, pas de mot périmé
+        self.taxonomy.update_taxonomy({'b': 'Z'}, 2)
+        self.assertEqual(self.enumerator.convert_paths_to_words([self.path], 2), ["AZ"])
+        self.assertEqual(self.enumerator.convert_paths_to_words([self.path], 1), ["AB"])
+        self.assertEqual(self.enumerator._word_cache.stats['hits'], 2)
+
+    def test_lru_eviction_within_entry_and_byte_budget(self):
+        cache = WordLRUCache(max_entries=2)
+        cache.store(("k1",), "w1")
+        cache.store(("k2",), "w2")
+        self.assertEqual(cache.lookup(("k1",)), "w1")  # k1 redevient MRU
+        cache.store(("k3",), "w3")
+
+        self.assertEqual(list(cache), [("k1",), ("k3",)])
+        self.assertEqual(cache.stats['evictions'], 1)
+
+        cache.max_bytes = WordLRUCache.entry_bytes("w1")
+        cache.trim()
+        self.assertEqual(list(cache), [("k3",)])
+        self.assertEqual(cache.current_bytes, WordLRUCache.entry_bytes("w3"))
+
+
+if __name__ == '__main__':
+    unittest.main()
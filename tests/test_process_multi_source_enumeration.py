@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests énumération multi-source en processus workers (coordination_mode="process")
+
+Valide:
+- DAGSnapshot: ordre incoming/outgoing préservé après restauration
+- Résultats fusionnés identiques au mode séquentiel (ordre sources, chemins, classes)
+- Worker count configurable et fallback séquentiel si NFA non picklable
+"""
+
+import unittest
+
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.enumeration_snapshot import DAGSnapshot
+from icgs_core.path_enumerator import DAGPathEnumerator
+
+
+ACCOUNT_CHARS = {
+    'source_0': 'A', 'source_1': 'B', 'source_2': 'C', 'source_3': 'D',
+    'hub_0': 'H', 'hub_1': 'I', 'target': 'T'
+}
+
+
+def _multi_source_dag():
+    """4 sources → 2 hubs (croisés) → target"""
+    sources = [Node(f"source_{i}") for i in range(4)]
+    hubs = [Node("hub_0"), Node("hub_1")]
+    target = Node("target")
+    for index, source in enumerate(sources):
+        for hub in (hubs[index % 2], hubs[(index + 1) % 2])[:1 + index % 2]:
+            connect_nodes(source, hub, Edge(f"e_{source.node_id}_{hub.node_id}", source, hub))
+    for hub in hubs:
+        connect_nodes(hub, target, Edge(f"e_{hub.node_id}_target", hub, target))
+    target_edge = Edge("tx", hubs[0], target, "50", EdgeType.TRANSACTION)
+    return sources, target_edge
+
+
+def _frozen_nfa():
+    nfa = AnchoredWeightedNFA("multi_source_nfa")
+    nfa.add_weighted_regex("via_hub", ".*[HI].*", 1)
+    nfa.freeze()
+    return nfa
+
+
+def _node_ids(merged):
+    return {state: [[node.node_id for node in path] for path in paths]
+            for state, paths in merged['merged_classifications'].items()}
+
+
+class TestDAGSnapshot(unittest.TestCase):
+
+    def test_restore_preserves_adjacency_order(self):
+        sources, target_edge = _multi_source_dag()
+        snapshot, live_nodes = DAGSnapshot.capture([target_edge.target_node])
+        restored = snapshot.restore()
+
+        self.assertEqual(set(restored), set(live_nodes))
+        for node_id, node in live_nodes.items():
+            self.assertEqual(list(restored[node_id].incoming_edges), list(node.incoming_edges))
+            self.assertEqual(list(restored[node_id].outgoing_edges), list(node.outgoing_edges))
+        self.assertIsNone(snapshot.unreachable_ids)
+
+
+class TestProcessMultiSourceEnumeration(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = AccountTaxonomy()
+        self.taxonomy.update_taxonomy(ACCOUNT_CHARS, 0)
+
+    def _run(self, mode, nfa, max_workers=2):
+        sources, target_edge = _multi_source_dag()
+        enumerator = DAGPathEnumerator(self.taxonomy, max_paths=200, batch_size=50,
+                                       max_workers=max_workers)
+        return enumerator.enumerate_from_multiple_sources(sources, target_edge, nfa, 0, mode), enumerator
+
+    def test_process_mode_matches_sequential(self):
+        reference, _ = self._run("sequential", _frozen_nfa())
+        result, enumerator = self._run("process", _frozen_nfa())
+
+        self.assertEqual(result['coordination_summary']['coordination_mode'], "process")
+        self.assertEqual(enumerator.multi_source_stats['process_pool_runs'], 1)
+        self.assertEqual(list(result['source_individual_results']),
+                         list(reference['source_individual_results']))
+        self.assertEqual(_node_ids(result['enumeration_results']),
+                         _node_ids(reference['enumeration_results']))
+        self.assertGreater(result['enumeration_results']['total_unique_paths'], 0)
+        self.assertEqual(result['enumeration_results']['merge_summary'],
+                         reference['enumeration_results']['merge_summary'])
+
+    def test_unpicklable_nfa_falls_back_to_sequential(self):
+        nfa = _frozen_nfa()
+        nfa.metadata['callback'] = lambda word: word
+
+        result, enumerator = self._run("process", nfa, max_workers=1)
+
+        self.assertEqual(result['coordination_summary']['coordination_mode'], "sequential")
+        self.assertEqual(enumerator.multi_source_stats['process_pool_fallbacks'], 1)
+        self.assertGreater(result['enumeration_results']['total_unique_paths'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
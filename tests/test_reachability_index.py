@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests index reachability incrémental (ReachabilityIndex)
+
+Valide:
+- Fermeture transitive incrémentale identique au recalcul complet
+- Pruning énumérateur des branches sans source (résultats inchangés)
+- Maintenance par DAG._commit_transaction_atomic et requêtes comptes
+"""
+
+import unittest
+import random
+from decimal import Decimal
+
+from icgs_core import DAG, DAGConfiguration, Transaction, TransactionMeasure, Account
+from icgs_core.account_taxonomy import AccountTaxonomy
+from icgs_core.dag_structures import Node, Edge, EdgeType, connect_nodes
+from icgs_core.path_enumerator import DAGPathEnumerator
+from icgs_core.reachability_index import ReachabilityIndex
+
+
+def _brute_force_ancestors(nodes, edges):
+    """Ancêtres par parcours reverse complet depuis chaque nœud"""
+    predecessors = {node.node_id: set() for node in nodes}
+    for edge in edges:
+        predecessors[edge.target_node.node_id].add(edge.source_node.node_id)
+
+    result = {}
+    for node in nodes:
+        seen, stack = set(), list(predecessors[node.node_id])
+        while stack:
+            current = stack.pop()
+            if current not in seen:
+                seen.add(current)
+                stack.extend(predecessors[current])
+        result[node.node_id] = seen
+    return result
+
+
+class TestReachabilityIndex(unittest.TestCase):
+    """Cohérence index incrémental"""
+
+    def test_incremental_closure_matches_brute_force(self):
+        """Après chaque ajout arête, ancêtres/descendants = recalcul complet"""
+        rnd = random.Random(3)
+        nodes = [Node(f"n{i}") for i in range(25)]
+        index = ReachabilityIndex()
+        for node in nodes:
+            index.add_node(node)
+
+        edges = []
+        for edge_num in range(60):
+            source, target = rnd.sample(nodes, 2)
+            edge = Edge(f"e{edge_num}", source, target)
+            connect_nodes(source, target, edge)
+            edges.append(edge)
+            self.assertTrue(index.add_edge(edge))
+
+            expected = _brute_force_ancestors(nodes, edges)
+            for node in nodes:
+                self.assertEqual(index.ancestors_of(node.node_id), expected[node.node_id])
+                for ancestor_id in expected[node.node_id]:
+                    self.assertIn(node.node_id, index.descendants_of(ancestor_id))
+
+        self.assertFalse(index.add_edge(edges[0]))
+
+    def test_can_reach_source_on_closed_cycle(self):
+        """Cycle sans entrée depuis une source: aucune source atteignable"""
+        a, b, c, sink = Node("a"), Node("b"), Node("c"), Node("sink")
+        index = ReachabilityIndex()
+        for source, target, edge_id in [(a, b, "ab"), (b, a, "ba"), (c, sink, "cs")]:
+            edge = Edge(edge_id, source, target)
+            connect_nodes(source, target, edge)
+            index.add_edge(edge)
+
+        self.assertFalse(index.can_reach_source(a))
+        self.assertTrue(index.can_reach_source(sink))
+        self.assertTrue(index.can_reach_source(c))
+
+        # Nœud modifié hors index: réponse conservatrice
+        d = Node("d")
+        connect_nodes(d, a, Edge("da", d, a))
+        self.assertTrue(index.can_reach_source(a))
+
+
+class TestEnumeratorReachabilityPruning(unittest.TestCase):
+    """Pruning énumérateur via index"""
+
+    def test_pruning_preserves_enumerated_paths(self):
+        """Branches cycliques mortes élaguées, chemins complets identiques"""
+        taxonomy = AccountTaxonomy()
+        taxonomy.update_taxonomy({"target_sink": "T", "alice_source": "A", "bob_sink": "B",
+                                  "loop_a_sink": "L", "loop_b_sink": "M",
+                                  "payer_source": "P"}, 0)
+
+        target_sink, alice_source = Node("target_sink"), Node("alice_source")
+        bob_sink, loop_a, loop_b = Node("bob_sink"), Node("loop_a_sink"), Node("loop_b_sink")
+        payer_source = Node("payer_source")
+        edges = [Edge("e1", alice_source, bob_sink), Edge("e2", bob_sink, target_sink),
+                 Edge("e3", loop_a, target_sink), Edge("e4", loop_b, loop_a),
+                 Edge("e5", loop_a, loop_b)]
+        for edge in edges:
+            connect_nodes(edge.source_node, edge.target_node, edge)
+
+        index = ReachabilityIndex()
+        index.rebuild([target_sink, alice_source, bob_sink, loop_a, loop_b], edges)
+        transaction_edge = Edge("tx", payer_source, target_sink, edge_type=EdgeType.TEMPORARY)
+
+        def enumerate_paths(with_index: bool):
+            enumerator = DAGPathEnumerator(taxonomy, max_paths=100)
+            enumerator.reachability_index = index if with_index else None
+            paths = [tuple(n.node_id for n in path)
+                     for path in enumerator.enumerate_paths_from_transaction(transaction_edge, 0)]
+            return paths, enumerator.stats
+
+        reference_paths, _ = enumerate_paths(False)
+        pruned_paths, pruned_stats = enumerate_paths(True)
+
+        self.assertEqual(pruned_paths, reference_paths)
+        self.assertEqual(pruned_stats.reachability_prunes, 1)
+
+
+class TestDAGReachabilityIndex(unittest.TestCase):
+    """Maintenance index par DAG"""
+
+    def setUp(self):
+        self.dag = DAG(DAGConfiguration(max_path_enumeration=1000))
+        mappings = {
+            "alice_source": "A", "alice_sink": "B",
+            "bob_source": "C", "bob_sink": "D",
+            "carol_source": "E", "carol_sink": "F"
+        }
+        for tx_num in range(4):
+            self.dag.account_taxonomy.update_taxonomy(mappings, tx_num)
+        for account_id in ("alice", "bob", "carol"):
+            self.dag.add_account(Account(account_id, Decimal('1000')))
+
+    def _transaction(self, tx_id: str, source: str, target: str) -> Transaction:
+        return Transaction(
+            transaction_id=tx_id, source_account_id=source, target_account_id=target,
+            amount=Decimal('100'),
+            source_measures=[TransactionMeasure(
+                measure_id=f"{tx_id}_source", account_id=source,
+                primary_regex_pattern=".*[ACE].*", primary_regex_weight=Decimal('1'),
+                acceptable_value=Decimal('500'))],
+            target_measures=[TransactionMeasure(
+                measure_id=f"{tx_id}_target", account_id=target,
+                primary_regex_pattern=".*[BDF].*", primary_regex_weight=Decimal('1'),
+                acceptable_value=Decimal('500'), required_value=Decimal('10'))]
+        )
+
+    def test_commit_updates_feeding_accounts(self):
+        """Chaque commit met à jour l'index sans reconstruction"""
+        self.assertEqual(self.dag.get_feeding_accounts("bob"), {"bob"})
+        self.assertFalse(self.dag.can_account_feed("alice", "bob"))
+
+        self.assertTrue(self.dag.add_transaction(self._transaction("tx_1", "alice", "bob")))
+
+        self.assertEqual(self.dag.get_feeding_accounts("bob"), {"alice", "bob"})
+        self.assertTrue(self.dag.can_account_feed("alice", "bob"))
+        self.assertFalse(self.dag.can_account_feed("bob", "alice"))
+
+        stats = self.dag.get_dag_statistics()['reachability_stats']
+        self.assertEqual(stats['edges_indexed'], len(self.dag.edges))
+        self.assertEqual(stats['full_rebuilds'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
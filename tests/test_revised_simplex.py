@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests Simplex révisé borné (BoundedRevisedSimplex) et certificats exacts
+
+Valide:
+- Faisabilité correcte là où l'ancienne heuristique Phase 1 échouait
+- Rayon de Farkas exact pour problèmes infaisables
+- Équivalence pivots float (toutes fréquences refactorisation) vs arithmétique exacte
+- Intégration TripleValidationOrientedSimplex (FEASIBILITY + OPTIMIZATION)
+"""
+
+import unittest
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+from icgs_core import (
+    TripleValidationOrientedSimplex, LinearProgram, LinearConstraint,
+    ConstraintType, SolutionStatus
+)
+from icgs_core.revised_simplex import BoundedRevisedSimplex, BasisFactorization
+
+
+def _random_problem(rnd: random.Random, num_vars: int, num_constraints: int) -> LinearProgram:
+    problem = LinearProgram("random_lp")
+    for j in range(num_vars):
+        upper = Decimal(rnd.randint(1, 20)) if rnd.random() < 0.3 else None
+        problem.add_variable(f"x{j}", Decimal('0'), upper)
+
+    for i in range(num_constraints):
+        coefficients = {
+            f"x{j}": Decimal(rnd.randint(-5, 8)) / Decimal(rnd.choice([1, 3, 10]))
+            for j in range(num_vars) if rnd.random() < 0.7
+        }
+        coefficients = {var_id: c for var_id, c in coefficients.items() if c} or {"x0": Decimal('1')}
+        constraint_type = rnd.choice([ConstraintType.LEQ, ConstraintType.GEQ, ConstraintType.EQ])
+        problem.add_constraint(LinearConstraint(coefficients, Decimal(rnd.randint(-5, 30)),
+                                                constraint_type, name=f"c{i}"))
+    return problem
+
+
+def _exactly_satisfied(problem: LinearProgram, point) -> bool:
+    for constraint in problem.constraints:
+        lhs = sum(Fraction(coeff) * point[var_id] for var_id, coeff in constraint.coefficients.items())
+        bound = Fraction(constraint.bound)
+        if constraint.constraint_type == ConstraintType.LEQ and lhs > bound:
+            return False
+        if constraint.constraint_type == ConstraintType.GEQ and lhs < bound:
+            return False
+        if constraint.constraint_type == ConstraintType.EQ and lhs != bound:
+            return False
+    return True
+
+
+class TestBasisFactorization(unittest.TestCase):
+    """LU + fichier eta"""
+
+    def test_ftran_btran_after_eta_updates(self):
+        """Solutions exactes identiques avec updates eta et après refactorisation"""
+        columns = [{0: Fraction(2), 1: Fraction(1)}, {0: Fraction(1), 2: Fraction(3)}, {1: Fraction(4)}]
+        factorization = BasisFactorization(3, Fraction(0), Fraction(0), refactor_frequency=10)
+        factorization.factorize(columns)
+
+        entering = {0: Fraction(1), 1: Fraction(1), 2: Fraction(1)}
+        w = factorization.ftran([entering.get(i, Fraction(0)) for i in range(3)])
+        factorization.update(1, w)
+        columns[1] = entering
+
+        reference = BasisFactorization(3, Fraction(0), Fraction(0))
+        reference.factorize(columns)
+
+        rhs = [Fraction(5), Fraction(-2), Fraction(7)]
+        self.assertEqual(factorization.ftran(rhs), reference.ftran(rhs))
+        self.assertEqual(factorization.btran(rhs), reference.btran(rhs))
+
+
+class TestBoundedRevisedSimplex(unittest.TestCase):
+    """Moteur révisé et certificats"""
+
+    def test_feasible_problem_rejected_by_uniform_heuristic(self):
+        """x + y ≥ 10, x - y ≤ -4: faisable (x=3, y=7)"""
+        problem = LinearProgram("heuristic_gap")
+        problem.add_variable("x")
+        problem.add_variable("y")
+        problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('1')}, Decimal('10'),
+                                                ConstraintType.GEQ, name="total"))
+        problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('-1')}, Decimal('-4'),
+                                                ConstraintType.LEQ, name="spread"))
+
+        result = BoundedRevisedSimplex(problem).solve()
+
+        self.assertEqual(result.status, "FEASIBLE")
+        self.assertTrue(result.certificate.verified)
+        self.assertTrue(_exactly_satisfied(problem, result.values))
+
+    def test_infeasible_problem_returns_farkas_ray(self):
+        """x + y ≤ 5 et x + y ≥ 8: rayon de Farkas exact"""
+        problem = LinearProgram("infeasible")
+        problem.add_variable("x")
+        problem.add_variable("y")
+        problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('1')}, Decimal('5'),
+                                                ConstraintType.LEQ, name="cap"))
+        problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('1')}, Decimal('8'),
+                                                ConstraintType.GEQ, name="need"))
+
+        result = BoundedRevisedSimplex(problem).solve()
+
+        self.assertEqual(result.status, "INFEASIBLE")
+        self.assertEqual(result.certificate.certificate_type, "FARKAS_RAY")
+        self.assertTrue(result.certificate.verified)
+        self.assertLess(result.certificate.farkas_bound, 0)
+        self.assertEqual(len(result.certificate.farkas_multipliers), 2)
+
+    def test_float_pivots_match_exact_arithmetic(self):
+        """Statuts et optima identiques float (refactorisation 1/3/20) vs Fraction"""
+        rnd = random.Random(11)
+        for _ in range(150):
+            problem = _random_problem(rnd, rnd.randint(2, 6), rnd.randint(2, 6))
+            objective = {f"x{j}": Decimal(rnd.randint(-3, 6)) for j in range(len(problem.variables))}
+            exact = BoundedRevisedSimplex(problem, exact=True).solve(objective)
+
+            for refactor_frequency in (1, 3, 20):
+                result = BoundedRevisedSimplex(problem, refactor_frequency=refactor_frequency).solve(objective)
+                self.assertEqual(result.status, exact.status)
+                self.assertTrue(result.certificate.verified)
+
+                if result.status == "OPTIMAL":
+                    self.assertTrue(result.certificate.dual_feasible)
+                    self.assertEqual(result.certificate.objective_value, exact.certificate.objective_value)
+                if result.status in ("OPTIMAL", "UNBOUNDED"):
+                    self.assertTrue(_exactly_satisfied(problem, result.values))
+
+
+class TestTripleValidationRevisedIntegration(unittest.TestCase):
+    """Intégration solveur principal"""
+
+    def setUp(self):
+        self.solver = TripleValidationOrientedSimplex()
+        self.problem = LinearProgram("integration")
+        self.problem.add_variable("a")
+        self.problem.add_variable("b", upper_bound=Decimal('6'))
+        self.problem.add_constraint(LinearConstraint({"a": Decimal('1'), "b": Decimal('1')}, Decimal('10'),
+                                                     ConstraintType.GEQ, name="demand"))
+        self.problem.add_constraint(LinearConstraint({"a": Decimal('2'), "b": Decimal('1')}, Decimal('30'),
+                                                     ConstraintType.LEQ, name="capacity"))
+
+    def test_feasibility_solution_carries_certificate(self):
+        solution = self.solver.solve_with_absolute_guarantees(self.problem)
+
+        self.assertEqual(solution.status, SolutionStatus.FEASIBLE)
+        self.assertTrue(solution.certificate.verified)
+        for constraint in self.problem.constraints:
+            self.assertTrue(constraint.is_satisfied(solution.variables))
+        self.assertGreater(self.solver.get_solver_stats()['exact_certificates'], 0)
+
+    def test_optimization_reaches_vertex_optimum(self):
+        """min 3a + b: optimum a=4, b=6 → 18"""
+        solution = self.solver.solve_optimization_problem(
+            self.problem, {"a": Decimal('3'), "b": Decimal('1')}
+        )
+
+        self.assertEqual(solution.status, SolutionStatus.OPTIMAL)
+        self.assertEqual(solution.optimal_price, Decimal('18'))
+        self.assertTrue(solution.certificate.dual_feasible)
+
+
+if __name__ == '__main__':
+    unittest.main()
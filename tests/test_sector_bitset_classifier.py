@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests classification bitset patterns sectoriels .*X.* / .*[ABC].*
+
+Valide:
+- Reconnaissance famille patterns émis par NamedCharacterSetManager
+- Équivalence stricte avec évaluation regex/Thompson générale
+- Fallback NFA général pour patterns hors famille
+"""
+
+import unittest
+import random
+from decimal import Decimal
+
+from icgs_core.anchored_nfa import AnchoredWeightedNFA
+from icgs_core.anchored_nfa_v2 import AnchoredWeightedNFA as AnchoredWeightedNFAv2
+from icgs_core.character_set_manager import NamedCharacterSetManager
+from icgs_core.nfa_performance_optimizations import SectorBitsetClassifier
+
+
+def _random_words(alphabet: str, count: int, seed: int = 7):
+    rnd = random.Random(seed)
+    return [''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 6)))
+            for _ in range(count)]
+
+
+class TestSectorBitsetClassifier(unittest.TestCase):
+    """Tests unitaires SectorBitsetClassifier"""
+
+    def test_parse_sector_pattern_family(self):
+        """Patterns sectoriels reconnus, autres rejetés"""
+        parse = SectorBitsetClassifier.parse_sector_pattern
+
+        self.assertEqual(parse(".*X.*"), frozenset("X"))
+        self.assertEqual(parse(".*[ABC].*"), frozenset("ABC"))
+        self.assertEqual(parse(".*.*[ABC].*$"), frozenset("ABC"))
+        self.assertEqual(parse("^.*Y.*$"), frozenset("Y"))
+        self.assertEqual(parse(".*[αβ].*"), frozenset("αβ"))
+
+        for pattern in ["^A.*", ".*[^AB].*", ".*[A-C].*", ".*AB.*", "N", ".*N$", ""]:
+            self.assertIsNone(parse(pattern), pattern)
+
+    def test_character_set_manager_patterns_compile(self):
+        """Tous patterns émis par NamedCharacterSetManager sont dans la famille"""
+        manager = NamedCharacterSetManager()
+        manager.define_character_set('AGRICULTURE', ['A', 'B', 'C'])
+        manager.define_character_set('INDUSTRY', ['I'])
+
+        for sector in ('AGRICULTURE', 'INDUSTRY'):
+            pattern = manager.get_regex_pattern_for_sector(sector)
+            self.assertIsNotNone(SectorBitsetClassifier.parse_sector_pattern(pattern), pattern)
+
+    def test_or_reduction_over_word(self):
+        """Classification = union des états dont la classe intersecte le mot"""
+        classifier = SectorBitsetClassifier()
+        self.assertTrue(classifier.register("agri", ".*[ABC].*"))
+        self.assertTrue(classifier.register("indu", ".*[IJ].*"))
+        self.assertFalse(classifier.register("other", "^A.*"))
+
+        self.assertEqual(classifier.classify("XAY"), frozenset({"agri"}))
+        self.assertEqual(classifier.classify("BJ"), frozenset({"agri", "indu"}))
+        self.assertEqual(classifier.classify("XYZ"), frozenset())
+        self.assertEqual(classifier.get_stats()['patterns_rejected'], 1)
+
+
+class TestBitsetNFAEquivalence(unittest.TestCase):
+    """Équivalence fast path bitset vs évaluation générale"""
+
+    def test_anchored_nfa_v1_matches_regex_evaluation(self):
+        """v1: résultats identiques avec et sans fast path"""
+        def build(enable_fast_path: bool):
+            nfa = AnchoredWeightedNFA("sector_v1")
+            nfa.add_weighted_regex("agri", ".*[ABC].*", Decimal('1.0'))
+            nfa.add_weighted_regex("indu", ".*X.*", Decimal('1.2'))
+            nfa.add_weighted_regex_with_character_class_support("serv", ".*[DEα].*", Decimal('0.8'))
+            if not enable_fast_path:
+                nfa._get_full_sector_classifier = lambda: None
+            return nfa
+
+        fast_nfa, reference_nfa = build(True), build(False)
+
+        for word in _random_words("ABCDEXYZα\n", 2000):
+            self.assertEqual(fast_nfa.evaluate_word(word), reference_nfa.evaluate_word(word), repr(word))
+
+        self.assertGreater(fast_nfa.stats['bitset_evaluations'], 0)
+        self.assertEqual(reference_nfa.stats['bitset_evaluations'], 0)
+
+    def test_anchored_nfa_v1_falls_back_outside_family(self):
+        """v1: pattern hors famille désactive fast path"""
+        nfa = AnchoredWeightedNFA("mixed_v1")
+        nfa.add_weighted_regex("agri", ".*[ABC].*", Decimal('1.0'))
+        nfa.add_weighted_regex("suffix", "N", Decimal('1.0'))  # ancré en .*N$
+
+        self.assertIsNone(nfa._get_full_sector_classifier())
+        self.assertTrue(nfa.evaluate_word("AN"))
+        self.assertEqual(nfa.stats['bitset_evaluations'], 0)
+
+    def test_anchored_nfa_v2_matches_thompson_evaluation(self):
+        """v2: fast path sectoriel identique à simulation Thompson"""
+        words = _random_words("ABCXYZαβ\n", 2000)
+
+        for pattern in [".*X.*", ".*[ABC].*", ".*[αβ].*", "^A.*"]:
+            nfa = AnchoredWeightedNFAv2("sector_v2")
+            nfa.add_weighted_regex("m", pattern, Decimal('1'))
+            nfa.freeze()
+            snapshot = nfa.shared_nfa.frozen_snapshot
+            sector_plan = snapshot.sector_plan
+
+            self.assertEqual(sector_plan is None, pattern == "^A.*", pattern)
+
+            for word in words:
+                fast_result = nfa.evaluate_to_final_state(word)
+                snapshot.sector_plan = None
+                reference_result = nfa.evaluate_to_final_state(word)
+                snapshot.sector_plan = sector_plan
+                self.assertEqual(fast_result, reference_result, f"{pattern} {word!r}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests validation agrégée des flux inter-sectoriels (EconomicSimulation.validate_inter_sectoral_flows)
+
+Valide:
+- SECTOR identique à PAIR (sources, montants, cibles, verdict par paire)
+- Seuils minimaux appliqués par agent source, paires hors flux rejetées
+- Ordre de création par paire (SERVICES ↔ FINANCE alternés par paire d'agents)
+- SECTOR sans transaction dans la simulation ni limite de capacité taxonomique
+- SECTOR sans état après commits préalables (historique DAG ignoré), comparé à PAIR
+"""
+
+import unittest
+from decimal import Decimal
+
+from icgs_simulation.api.icgs_bridge import EconomicSimulation, FlowAggregation
+
+
+SECTORS = ['AGRICULTURE', 'INDUSTRY', 'SERVICES', 'FINANCE', 'ENERGY']
+
+
+def _simulation(name: str, agents_per_sector: int) -> EconomicSimulation:
+    simulation = EconomicSimulation(name)
+    for sector in SECTORS:
+        for i in range(agents_per_sector):
+            simulation.create_agent(f"{sector}_{i}", sector, Decimal(str(150 + 400 * i)))
+    return simulation
+
+
+class TestSectorFlowAggregation(unittest.TestCase):
+
+    def test_sector_matches_pair(self):
+        exact = _simulation("flows_pair", 3).validate_inter_sectoral_flows(0.5, FlowAggregation.PAIR)
+        simulation = _simulation("flows_sector", 3)
+        aggregated = simulation.validate_inter_sectoral_flows(0.5)
+
+        self.assertEqual(aggregated.aggregation, FlowAggregation.SECTOR)
+        self.assertEqual({(f.source_sector, f.target_sector) for f in aggregated.flows},
+                         {(f.source_sector, f.target_sector) for f in exact.flows})
+        self.assertEqual(aggregated.full_validations, len(aggregated.flows))
+        self.assertEqual(exact.full_validations, exact.pair_count)
+        self.assertEqual(aggregated.pair_count, exact.pair_count)
+        self.assertEqual(aggregated.volume, exact.volume)
+        self.assertEqual(aggregated.accepted_count, exact.accepted_count)
+        self.assertGreater(exact.accepted_count, 0)
+
+        for exact_flow in exact.flows:
+            flow = aggregated.get_flow(exact_flow.source_sector, exact_flow.target_sector)
+            self.assertEqual(flow.source_amounts, exact_flow.source_amounts)
+            self.assertEqual(flow.target_agent_ids, exact_flow.target_agent_ids)
+            self.assertIsNone(flow.pair_results)
+            self.assertEqual(list(flow.iter_pairs()), list(exact_flow.iter_pairs()))
+
+        # Agrégé: aucune transaction dans la simulation, DAG intact
+        self.assertEqual(len(simulation.transactions), 0)
+        self.assertFalse(simulation.taxonomy_configured)
+
+    def test_pair_records_registry(self):
+        simulation = _simulation("flows_registry", 2)
+        result = simulation.validate_inter_sectoral_flows(0.5, FlowAggregation.PAIR)
+
+        self.assertEqual(len(simulation.transactions), result.pair_count)
+        validated = sum(1 for tx in simulation.transactions
+                        if simulation.transactions.status(tx.transaction_id) == 'validated')
+        self.assertEqual(validated, result.accepted_count)
+
+        # Re-validation d'une paire commitée: résultat conservé, pas de second commit
+        first = simulation.transactions[0]
+        self.assertEqual(simulation.transactions.status(first.transaction_id), 'validated')
+        counter = simulation.dag.transaction_counter
+        self.assertTrue(simulation.validate_transaction(first.transaction_id).success)
+        self.assertEqual(simulation.dag.transaction_counter, counter)
+
+    def test_pair_creation_order(self):
+        simulation = _simulation("flows_order", 2)
+        transaction_ids = simulation.create_inter_sectoral_flows_batch(0.5)
+        created = [(simulation.transactions.get(tx_id).source_account_id,
+                    simulation.transactions.get(tx_id).target_account_id) for tx_id in transaction_ids]
+
+        # Balances 150/550: SERVICES_0 → FINANCE (37.5 < 50) et FINANCE_0 → SERVICES (41.25 < 100) exclus
+        expected = [
+            ('AGRICULTURE_0', 'INDUSTRY_0'), ('AGRICULTURE_0', 'INDUSTRY_1'),
+            ('AGRICULTURE_1', 'INDUSTRY_0'), ('AGRICULTURE_1', 'INDUSTRY_1'),
+            ('INDUSTRY_0', 'SERVICES_0'), ('INDUSTRY_0', 'SERVICES_1'),
+            ('INDUSTRY_1', 'SERVICES_0'), ('INDUSTRY_1', 'SERVICES_1'),
+            ('FINANCE_1', 'SERVICES_0'),
+            ('SERVICES_1', 'FINANCE_0'),
+            ('SERVICES_1', 'FINANCE_1'), ('FINANCE_1', 'SERVICES_1'),
+        ] + [('ENERGY_1', f"{sector}_{i}") for sector in SECTORS[:4] for i in range(2)]
+        self.assertEqual(created, expected)
+
+    def test_sector_ignores_dag_history(self):
+        simulation = _simulation("flows_history", 2)
+        for source, target in (('AGRICULTURE_1', 'INDUSTRY_0'), ('FINANCE_1', 'SERVICES_0'),
+                               ('SERVICES_1', 'FINANCE_0')):
+            tx_id = simulation.create_transaction(source, target, Decimal('500'))
+            self.assertTrue(simulation.validate_transaction(tx_id).success)
+        committed = simulation.dag.transaction_counter
+
+        # SECTOR: estimation sans état, identique à une simulation sans historique, DAG non modifié
+        aggregated = simulation.validate_inter_sectoral_flows(0.5)
+        stateless = _simulation("flows_no_history", 2).validate_inter_sectoral_flows(0.5)
+        self.assertEqual(simulation.dag.transaction_counter, committed)
+        self.assertEqual([(f.source_sector, f.target_sector, f.accepted) for f in aggregated.flows],
+                         [(f.source_sector, f.target_sector, f.accepted) for f in stateless.flows])
+
+        # PAIR sur le même DAG (historique inclus): mêmes paires et montants; verdicts
+        # identiques pour cet historique, sans garantie en général
+        exact = simulation.validate_inter_sectoral_flows(0.5, FlowAggregation.PAIR)
+        self.assertEqual(simulation.dag.transaction_counter, committed + exact.accepted_count)
+        self.assertEqual(aggregated.pair_count, exact.pair_count)
+        self.assertEqual(aggregated.volume, exact.volume)
+        for exact_flow in exact.flows:
+            flow = aggregated.get_flow(exact_flow.source_sector, exact_flow.target_sector)
+            self.assertEqual(list(flow.iter_pairs()), list(exact_flow.iter_pairs()))
+
+    def test_minimum_amount_per_source(self):
+        simulation = _simulation("flows_threshold", 2)
+        result = simulation.validate_inter_sectoral_flows(0.0)
+
+        # FINANCE → SERVICES: taux 0.25, seuil 100 → FINANCE_0 (150) exclu, FINANCE_1 (550) inclus
+        flow = result.get_flow('FINANCE', 'SERVICES')
+        self.assertEqual(flow.source_amounts, {'FINANCE_1': Decimal('550') * Decimal('0.25')})
+        self.assertTrue(flow.is_accepted('FINANCE_1', 'SERVICES_0'))
+        self.assertFalse(flow.is_accepted('FINANCE_0', 'SERVICES_0'))
+        self.assertFalse(flow.is_accepted('FINANCE_1', 'INDUSTRY_0'))
+
+        # ENERGY → autres secteurs: 0.05 × 550 < 30 → aucun flux
+        self.assertIsNone(result.get_flow('ENERGY', 'AGRICULTURE'))
+
+    def test_sector_beyond_taxonomy_capacity(self):
+        simulation = _simulation("flows_capacity", 12)
+        result = simulation.validate_inter_sectoral_flows(0.5)
+
+        self.assertEqual(result.full_validations, 8)
+        self.assertEqual(result.get_flow('AGRICULTURE', 'INDUSTRY').pair_count, 12 * 12)
+        self.assertEqual(result.accepted_count, result.pair_count)
+
+        with self.assertRaises(RuntimeError):
+            _simulation("flows_capacity_pair", 12).validate_inter_sectoral_flows(0.5, FlowAggregation.PAIR)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests warm-start Simplex depuis base persistée (SimplexBasis)
+
+Valide:
+- Réutilisation factorisation + Simplex dual quand seuls les RHS changent
+- Équivalence optimum warm-start vs cold-start sur séquences de LPs
+- Statistiques solveur: warm-start compté seulement si base réellement installée
+- Cache structure LP → dernière base: warm-start sans pivot, hit rate, éviction LRU
+"""
+
+import unittest
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+from icgs_core import (
+    TripleValidationOrientedSimplex, LinearProgram, LinearConstraint,
+    ConstraintType, SolutionStatus
+)
+from icgs_core.revised_simplex import BoundedRevisedSimplex
+
+
+def _covering_problem(demand: str) -> LinearProgram:
+    """min x + y, x + 2y ≥ demand, 3x + y ≥ 6"""
+    problem = LinearProgram("covering")
+    problem.add_variable("x")
+    problem.add_variable("y")
+    problem.add_constraint(LinearConstraint({"x": Decimal('1'), "y": Decimal('2')}, Decimal(demand),
+                                            ConstraintType.GEQ, name="demand"))
+    problem.add_constraint(LinearConstraint({"x": Decimal('3'), "y": Decimal('1')}, Decimal('6'),
+                                            ConstraintType.GEQ, name="mix"))
+    return problem
+
+
+OBJECTIVE = {"x": Decimal('1'), "y": Decimal('1')}
+
+
+class TestDualSimplexWarmStart(unittest.TestCase):
+    """Moteur révisé: réinstallation base + Simplex dual"""
+
+    def test_rhs_change_reuses_factorization(self):
+        """Base optimale devenue primal-infaisable: pivots duals, optimum exact"""
+        first = BoundedRevisedSimplex(_covering_problem('4')).solve(OBJECTIVE)
+        self.assertEqual(first.status, "OPTIMAL")
+        self.assertEqual(first.certificate.objective_value, Fraction(14, 5))
+
+        warm = BoundedRevisedSimplex(_covering_problem('16')).solve(OBJECTIVE, warm_basis=first.final_basis)
+        cold = BoundedRevisedSimplex(_covering_problem('16')).solve(OBJECTIVE)
+
+        self.assertTrue(warm.warm_start_accepted)
+        self.assertTrue(warm.factorization_reused)
+        self.assertGreater(warm.dual_iterations, 0)
+        self.assertEqual(warm.status, "OPTIMAL")
+        self.assertTrue(warm.certificate.dual_feasible)
+        self.assertEqual(warm.certificate.objective_value, cold.certificate.objective_value)
+        self.assertEqual(warm.certificate.objective_value, Fraction(8))
+
+    def test_structure_change_maps_basis_by_labels(self):
+        """Coefficients modifiés: base mappée par labels puis refactorisée"""
+        first = BoundedRevisedSimplex(_covering_problem('4')).solve(OBJECTIVE)
+
+        changed = _covering_problem('4')
+        changed.constraints[1].coefficients["x"] = Decimal('2')
+        result = BoundedRevisedSimplex(changed).solve(OBJECTIVE, warm_basis=first.final_basis)
+
+        self.assertTrue(result.warm_start_accepted)
+        self.assertFalse(result.factorization_reused)
+        self.assertEqual(result.status, "OPTIMAL")
+        self.assertEqual(result.certificate.objective_value,
+                         BoundedRevisedSimplex(changed).solve(OBJECTIVE).certificate.objective_value)
+
+    def test_row_basis_is_not_a_warm_start(self):
+        """Base persistée = base lignes: aucun travail évité, warm-start refusé"""
+        problem = LinearProgram("slack")
+        problem.add_variable("x")
+        problem.add_constraint(LinearConstraint({"x": Decimal('1')}, Decimal('5'), ConstraintType.LEQ))
+
+        first = BoundedRevisedSimplex(problem).solve()
+        result = BoundedRevisedSimplex(problem).solve(warm_basis=first.final_basis)
+
+        self.assertFalse(result.warm_start_accepted)
+        self.assertEqual(result.status, "FEASIBLE")
+
+    def test_warm_sequences_match_cold_solves(self):
+        """Séquences LPs RHS perturbés: statut et optimum identiques warm vs cold"""
+        rnd = random.Random(5)
+        warm_starts = 0
+        for _ in range(25):
+            num_vars, num_constraints = rnd.randint(2, 6), rnd.randint(2, 6)
+            coefficients = [{f"x{j}": Decimal(rnd.randint(1, 9)) for j in range(num_vars) if rnd.random() < 0.6}
+                            or {"x0": Decimal('1')} for _ in range(num_constraints)]
+            types = [rnd.choice([ConstraintType.LEQ, ConstraintType.GEQ]) for _ in range(num_constraints)]
+            objective = {f"x{j}": Decimal(rnd.randint(1, 5)) for j in range(num_vars)}
+
+            stored = None
+            for _ in range(5):
+                problem = LinearProgram("sequence")
+                for j in range(num_vars):
+                    problem.add_variable(f"x{j}", upper_bound=Decimal(rnd.randint(5, 30)))
+                for i in range(num_constraints):
+                    problem.add_constraint(LinearConstraint(coefficients[i], Decimal(rnd.randint(2, 40)),
+                                                            types[i], name=f"c{i}"))
+
+                cold = BoundedRevisedSimplex(problem).solve(objective)
+                warm = BoundedRevisedSimplex(problem).solve(objective, warm_basis=stored)
+
+                self.assertEqual(warm.status, cold.status)
+                self.assertTrue(warm.certificate.verified)
+                if warm.status == "OPTIMAL":
+                    self.assertEqual(warm.certificate.objective_value, cold.certificate.objective_value)
+                    stored = warm.final_basis
+                warm_starts += warm.warm_start_accepted
+
+        self.assertGreater(warm_starts, 0)
+
+
+class TestSolverWarmStartStatistics(unittest.TestCase):
+    """TripleValidationOrientedSimplex: base persistée et ventilation pivots"""
+
+    def test_stored_basis_drives_warm_start_counters(self):
+        solver = TripleValidationOrientedSimplex()
+        self.assertIsNone(solver.stored_basis)
+
+        first = solver.solve_optimization_problem(_covering_problem('4'), OBJECTIVE)
+        self.assertEqual(first.status, SolutionStatus.OPTIMAL)
+        self.assertFalse(first.warm_start_successful)
+        self.assertIsNotNone(solver.stored_basis)
+
+        second = solver.solve_optimization_problem(_covering_problem('3'), OBJECTIVE, first.variables)
+        self.assertTrue(second.warm_start_successful)
+        self.assertEqual(second.phase2_iterations, 0)
+        self.assertEqual(second.optimal_price, Decimal('2.4'))
+
+        stats = solver.get_solver_stats()
+        self.assertEqual(stats['warm_starts_used'], 1)
+        self.assertEqual(stats['cold_starts_used'], 1)
+        self.assertGreater(stats['cold_start_pivots'], 0)
+        self.assertEqual(stats['factorizations_reused'], 1)
+        self.assertGreaterEqual(stats['warm_start_pivots_saved'], 1)
+
+    def test_infeasible_pivot_keeps_cold_start(self):
+        """Pivot violant les contraintes: cold-start malgré base persistée"""
+        solver = TripleValidationOrientedSimplex()
+        solver.solve_with_absolute_guarantees(_covering_problem('4'))
+
+        solution = solver.solve_with_absolute_guarantees(_covering_problem('4'), {"x": Decimal('0'), "y": Decimal('0')})
+
+        self.assertEqual(solution.status, SolutionStatus.FEASIBLE)
+        self.assertFalse(solution.warm_start_successful)
+        self.assertEqual(solver.get_solver_stats()['warm_starts_used'], 0)
+
+
+def _mix_problem(demand: str) -> LinearProgram:
+    """Structure distincte de _covering_problem (coefficient mix modifié)"""
+    problem = _covering_problem(demand)
+    problem.constraints[1] = LinearConstraint({"x": Decimal('2'), "y": Decimal('1')}, Decimal('6'),
+                                              ConstraintType.GEQ, name="mix")
+    return problem
+
+
+class TestStructureBasisCache(unittest.TestCase):
+    """Mémoïsation structure LP (structure_fingerprint) → dernière base optimale"""
+
+    def test_structure_fingerprint_separates_rhs(self):
+        self.assertEqual(_covering_problem('4').structure_fingerprint(),
+                         _covering_problem('16.0').structure_fingerprint())
+        self.assertNotEqual(_covering_problem('4').fingerprint(), _covering_problem('16').fingerprint())
+        self.assertNotEqual(_covering_problem('4').rhs_signature(), _covering_problem('16').rhs_signature())
+        self.assertEqual(_covering_problem('4').rhs_signature(), _covering_problem('4.00').rhs_signature())
+        self.assertNotEqual(_covering_problem('4').structure_fingerprint(), _mix_problem('4').structure_fingerprint())
+
+    def test_repeated_structure_warm_starts_without_pivot(self):
+        solver = TripleValidationOrientedSimplex()
+        solver.solve_optimization_problem(_covering_problem('4'), OBJECTIVE)
+        solver.solve_optimization_problem(_mix_problem('4'), OBJECTIVE)
+
+        solution = solver.solve_optimization_problem(_covering_problem('3'), OBJECTIVE)
+        cold = TripleValidationOrientedSimplex(max_structure_bases=0).solve_optimization_problem(
+            _covering_problem('3'), OBJECTIVE)
+
+        self.assertTrue(solution.warm_start_successful)
+        self.assertLessEqual(solution.iterations_used, 1)
+        self.assertEqual(solution.optimal_price, cold.optimal_price)
+        self.assertEqual(solution.optimal_price, Decimal('2.4'))
+
+        stats = solver.get_solver_stats()
+        self.assertEqual((stats['structure_cache_hits'], stats['structure_cache_misses']), (1, 2))
+        self.assertEqual(stats['structure_cache_hit_rate'], round(1 / 3, 4))
+        self.assertEqual(stats['structure_cache_size'], 2)
+        self.assertFalse(cold.warm_start_successful)
+
+    def test_lru_eviction(self):
+        solver = TripleValidationOrientedSimplex(max_structure_bases=1)
+        solver.solve_optimization_problem(_covering_problem('4'), OBJECTIVE)
+        solver.solve_optimization_problem(_mix_problem('4'), OBJECTIVE)
+
+        solution = solver.solve_optimization_problem(_covering_problem('3'), OBJECTIVE)
+        self.assertFalse(solution.warm_start_successful)
+        stats = solver.get_solver_stats()
+        self.assertEqual(stats['structure_cache_hits'], 0)
+        self.assertEqual(stats['structure_cache_evictions'], 2)
+        self.assertEqual(stats['structure_cache_size'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
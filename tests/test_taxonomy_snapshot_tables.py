@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests tables denses par snapshot AccountTaxonomy (convert_path_to_word)
+
+Valide:
+- Mots identiques au mapping historique nœud par nœud sur tout l'historique
+- Une table array('I') par snapshot, construite à la demande, cache LRU borné
+- Mapping absent du snapshot applicable: chemin historique (erreur explicite)
+"""
+
+import unittest
+
+from icgs_core.account_taxonomy import AccountTaxonomy, TaxonomySnapshot
+from icgs_core.dag_structures import Node
+
+
+class TestSnapshotTables(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = AccountTaxonomy()
+        self.taxonomy.update_taxonomy({'alice': 'A', 'bob': 'B'}, 0)
+        self.taxonomy.update_taxonomy({'carol': 'C'}, 3)
+        self.taxonomy.update_taxonomy({'bob': 'Ω'}, 7)
+
+    def test_words_match_per_node_mapping(self):
+        paths = [[Node("alice"), Node("bob")], [Node("bob"), Node("alice"), Node("bob")]]
+        for transaction_num in range(0, 10):
+            for path in paths:
+                expected = ''.join(self.taxonomy.get_character_mapping(node.node_id, transaction_num)
+                                   for node in path)
+                self.assertEqual(self.taxonomy.convert_path_to_word(path, transaction_num), expected)
+
+        self.assertEqual(self.taxonomy.convert_path_to_word([Node("carol"), Node("bob")], 8), "CΩ")
+        self.assertEqual(len(self.taxonomy._snapshot_tables), 3)
+        self.assertEqual(self.taxonomy._snapshot_tables[3].typecode, 'I')
+
+    def test_table_cache_bounded(self):
+        taxonomy = AccountTaxonomy(max_snapshot_tables=2)
+        for transaction_num in range(6):
+            taxonomy.update_taxonomy({f"agent_{transaction_num}": chr(0x41 + transaction_num)}, transaction_num)
+        path = [Node("agent_0"), Node("agent_1")]
+        for transaction_num in range(1, 6):
+            self.assertEqual(taxonomy.convert_path_to_word(path, transaction_num), "AB")
+
+        self.assertEqual(list(taxonomy._snapshot_tables), [4, 5])
+        self.assertEqual(taxonomy.stats['snapshot_tables_evicted'], 3)
+
+        # Snapshot évincé reconstruit à l'identique
+        self.assertEqual(taxonomy.convert_path_to_word([Node("agent_2")], 2), "C")
+        self.assertEqual(list(taxonomy._snapshot_tables), [5, 2])
+
+    def test_missing_mapping_uses_historical_path(self):
+        with self.assertRaises(ValueError):
+            self.taxonomy.convert_path_to_word([Node("carol")], 1)
+
+        # Snapshot non cumulatif (historique manuel): recherche arrière préservée
+        self.taxonomy.taxonomy_history.append(TaxonomySnapshot(9, {'dave': 'D'}, 0.0))
+        self.assertEqual(self.taxonomy.convert_path_to_word([Node("dave"), Node("alice")], 9), "DA")
+
+
+if __name__ == '__main__':
+    unittest.main()
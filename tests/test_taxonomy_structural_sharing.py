@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests partage structurel de l'historique taxonomique (MappingHistory)
+
+Valide:
+- Snapshots = vues sur l'historique partagé, mapping hérité complet
+- Stockage O(changements): une version par compte modifié seulement
+- Lecture historique identique à l'ancien modèle copie complète
+- DAG.add_accounts_batch: un seul snapshot pour tout le lot
+"""
+
+import pickle
+import unittest
+from decimal import Decimal
+
+from icgs_core.account_taxonomy import AccountTaxonomy, SharedMappingView, TaxonomySnapshot
+from icgs_core.dag import DAG
+from icgs_core.dag_structures import Account
+
+
+class TestSharedMappingHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.taxonomy = AccountTaxonomy()
+        self.taxonomy.update_taxonomy({'alice': 'A', 'bob': 'B'}, 0)
+        self.taxonomy.update_taxonomy({'carol': 'C'}, 3)
+        self.taxonomy.update_taxonomy({'bob': 'Ω', 'alice': 'A'}, 7)
+
+    def test_snapshots_match_full_copy_model(self):
+        expected = {
+            0: {'alice': 'A', 'bob': 'B'},
+            3: {'alice': 'A', 'bob': 'B', 'carol': 'C'},
+            7: {'alice': 'A', 'bob': 'Ω', 'carol': 'C'},
+        }
+        for snapshot in self.taxonomy.taxonomy_history:
+            self.assertIsInstance(snapshot.account_mappings, SharedMappingView)
+            self.assertEqual(dict(snapshot.account_mappings), expected[snapshot.transaction_num])
+            self.assertEqual(snapshot.account_mappings, expected[snapshot.transaction_num])
+
+        first = self.taxonomy.taxonomy_history[0].account_mappings
+        self.assertNotIn('carol', first)
+        with self.assertRaises(KeyError):
+            first['carol']
+        self.assertEqual([s.mapping_version for s in self.taxonomy.taxonomy_history], [0, 0, 1])
+
+    def test_storage_grows_with_changes_only(self):
+        history = self.taxonomy.mapping_history
+        self.assertEqual(history.account_order, ['alice', 'bob', 'carol'])
+        self.assertEqual(len(history.versions['alice'][0]), 1)
+        self.assertEqual(history.versions['bob'], ([0, 7], ['B', 'Ω']))
+
+        for transaction_num in range(8, 58):
+            self.taxonomy.update_taxonomy({'alice': 'A', 'bob': 'Ω', 'carol': 'C'}, transaction_num)
+        self.assertEqual(sum(len(v[0]) for v in history.versions.values()), 4)
+        self.assertEqual(self.taxonomy.get_character_mapping('bob', 5), 'B')
+        self.assertEqual(self.taxonomy.get_character_mapping('bob', 57), 'Ω')
+
+    def test_copy_and_pickle(self):
+        view = self.taxonomy.taxonomy_history[1].account_mappings
+        copied = view.copy()
+        copied['dave'] = 'D'
+        self.assertNotIn('dave', view)
+
+        restored = pickle.loads(pickle.dumps(self.taxonomy))
+        self.assertEqual(dict(restored.taxonomy_history[1].account_mappings), dict(view))
+
+    def test_external_snapshot_inherited(self):
+        self.taxonomy.taxonomy_history.append(TaxonomySnapshot(9, {'dave': 'D'}, 0.0))
+        self.taxonomy.update_taxonomy({'erin': 'E'}, 10)
+        latest = self.taxonomy.get_taxonomy_snapshot(10).account_mappings
+        self.assertEqual(latest['dave'], 'D')
+        self.assertEqual(latest['erin'], 'E')
+
+    def test_invalid_update_leaves_history_untouched(self):
+        with self.assertRaises(ValueError):
+            self.taxonomy.update_taxonomy({'frank': 'F', 'gina': 'ab'}, 8)
+        self.assertNotIn('frank', self.taxonomy.mapping_history.versions)
+        self.assertEqual(len(self.taxonomy.taxonomy_history), 3)
+
+
+class TestAddAccountsBatch(unittest.TestCase):
+
+    def test_single_snapshot_for_batch(self):
+        dag = DAG()
+        initial_snapshots = len(dag.account_taxonomy.taxonomy_history)
+        accounts = [
+            (Account(f"agent_{i}", Decimal('100')), {'source': chr(0x41 + i), 'sink': chr(0x61 + i)})
+            for i in range(5)
+        ]
+        added = dag.add_accounts_batch(accounts)
+
+        self.assertEqual(added, 5)
+        self.assertEqual(len(dag.account_taxonomy.taxonomy_history), initial_snapshots + 1)
+        mappings = dag.account_taxonomy.taxonomy_history[-1].account_mappings
+        self.assertIn('agent_0_source', mappings)
+        self.assertEqual(mappings['agent_2_sink'], 'c')
+        self.assertEqual(dag.add_accounts_batch(accounts[:1]), 0)
+
+    def test_invalid_chars_add_nothing(self):
+        dag = DAG()
+        initial_snapshots = len(dag.account_taxonomy.taxonomy_history)
+        with self.assertRaises(ValueError):
+            dag.add_accounts_batch([
+                (Account("ok", Decimal('100')), {'source': 'A', 'sink': 'B'}),
+                (Account("bad", Decimal('100')), {'source': 'C'}),
+            ])
+        self.assertEqual(dag.accounts, {})
+        self.assertEqual(len(dag.account_taxonomy.taxonomy_history), initial_snapshots)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests registre transactions indexé EconomicSimulation (TransactionRegistry)
+
+Valide:
+- API liste préservée (len, itération, index, slices) + lookup par ID
+- Compteurs par agent et agrégats paires secteurs identiques aux scans complets
+- Statuts validation et agrégats validés idempotents
+- Sérialisation utilisant les compteurs du registre
+"""
+
+import random
+import unittest
+from decimal import Decimal
+
+from icgs_core import Transaction
+from icgs_simulation.api.icgs_bridge import EconomicSimulation, TransactionRegistry
+from icgs_simulation.persistence.simulation_serializer import SimulationSerializer
+
+
+SECTORS = ['AGRICULTURE', 'INDUSTRY', 'SERVICES']
+
+
+def _transaction(tx_id: str, source: str, target: str, amount: int) -> Transaction:
+    return Transaction(tx_id, source, target, Decimal(amount),
+                       metadata={'source_sector': SECTORS[int(source[1:]) % 3],
+                                 'target_sector': SECTORS[int(target[1:]) % 3]})
+
+
+class TestTransactionRegistry(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(21)
+        self.registry = TransactionRegistry()
+        self.transactions = []
+        for i in range(300):
+            source, target = rnd.sample(range(12), 2)
+            transaction = _transaction(f"TX_{i}", f"a{source}", f"a{target}", rnd.randint(1, 500))
+            self.registry.append(transaction)
+            self.transactions.append(transaction)
+
+    def test_sequence_api_and_lookup(self):
+        self.assertEqual(len(self.registry), 300)
+        self.assertEqual(list(self.registry), self.transactions)
+        self.assertEqual(self.registry[-20:], self.transactions[-20:])
+        self.assertIs(self.registry.get("TX_42"), self.transactions[42])
+        self.assertIsNone(self.registry.get("TX_missing"))
+        self.assertIn("TX_7", self.registry)
+        self.assertIn(self.transactions[7], self.registry)
+        self.assertEqual(self.registry.total_volume, sum(tx.amount for tx in self.transactions))
+
+        with self.assertRaises(ValueError):
+            self.registry.append(_transaction("TX_0", "a1", "a2", 10))
+
+    def test_counters_match_full_scans(self):
+        for agent in range(12):
+            agent_id = f"a{agent}"
+            self.assertEqual(self.registry.sent_count(agent_id),
+                             len([tx for tx in self.transactions if tx.source_account_id == agent_id]))
+            self.assertEqual(self.registry.received_count(agent_id),
+                             len([tx for tx in self.transactions if tx.target_account_id == agent_id]))
+
+        for (source_sector, target_sector), aggregate in self.registry.get_sector_pairs().items():
+            matching = [tx for tx in self.transactions
+                        if (tx.metadata['source_sector'], tx.metadata['target_sector']) == (source_sector, target_sector)]
+            self.assertEqual(aggregate['count'], len(matching))
+            self.assertEqual(aggregate['volume'], sum(tx.amount for tx in matching))
+        self.assertEqual(self.registry.sector_pair_stats('ENERGY', 'FINANCE')['count'], 0)
+
+    def test_validation_status_transitions(self):
+        transaction = self.transactions[0]
+        pair = (transaction.metadata['source_sector'], transaction.metadata['target_sector'])
+        self.assertEqual(self.registry.status(transaction.transaction_id), 'pending')
+
+        self.registry.record_validation(transaction.transaction_id, True)
+        self.registry.record_validation(transaction.transaction_id, True)
+        stats = self.registry.sector_pair_stats(*pair)
+        self.assertEqual(stats['validated_count'], 1)
+        self.assertEqual(stats['validated_volume'], transaction.amount)
+
+        self.registry.record_validation(transaction.transaction_id, False)
+        self.assertEqual(self.registry.status(transaction.transaction_id), 'rejected')
+        self.assertEqual(self.registry.sector_pair_stats(*pair)['validated_count'], 0)
+
+    def test_simulation_registry_and_serialization(self):
+        simulation = EconomicSimulation("registry_test")
+        simulation.create_agent("FARM", "AGRICULTURE", Decimal('1000'))
+        simulation.create_agent("FACTORY", "INDUSTRY", Decimal('1000'))
+        tx_ids = [simulation.create_transaction("FARM", "FACTORY", Decimal('100')) for _ in range(3)]
+
+        self.assertIsInstance(simulation.transactions, TransactionRegistry)
+        self.assertEqual(simulation.transactions.sector_pair_stats('AGRICULTURE', 'INDUSTRY')['count'], 3)
+
+        result = simulation.validate_transaction(tx_ids[0])
+        self.assertEqual(simulation.transactions.status(tx_ids[0]),
+                         'validated' if result.success else 'rejected')
+
+        state = SimulationSerializer().serialize(simulation)
+        self.assertEqual(state.agents['FARM']['transactions_sent'], 3)
+        self.assertEqual(state.agents['FACTORY']['transactions_received'], 3)
+        self.assertEqual([tx['status'] for tx in state.transactions][1:], ['pending', 'pending'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests validation batch DAG.add_transactions_batch
+
+Valide:
+- Résultats, commits et pivots identiques à une boucle add_transaction
+- Un NFA temporaire par signature de patterns (measure_id aliasés)
+- Raisons de rejet par transaction, cache NFA libéré après le batch
+- EnhancedDAG.add_transactions_batch_auto avec extension taxonomie automatique
+"""
+
+import unittest
+from decimal import Decimal
+
+from icgs_core import DAG, DAGConfiguration, Transaction, TransactionMeasure, Account
+from icgs_core.enhanced_dag import EnhancedDAG
+
+
+MAPPINGS = {
+    "alice_source": "A", "alice_sink": "B",
+    "bob_source": "C", "bob_sink": "D",
+    "carol_source": "E", "carol_sink": "F"
+}
+
+FLOWS = [("alice", "bob"), ("bob", "carol"), ("alice", "carol"),
+         ("carol", "bob"), ("alice", "bob"), ("bob", "carol")]
+
+
+def _transaction(tx_id: str, source: str, target: str, amount: str = '100',
+                 source_pattern: str = ".*[ACE].*") -> Transaction:
+    return Transaction(
+        transaction_id=tx_id, source_account_id=source, target_account_id=target,
+        amount=Decimal(amount),
+        source_measures=[TransactionMeasure(
+            measure_id=f"{tx_id}_source", account_id=source,
+            primary_regex_pattern=source_pattern, primary_regex_weight=Decimal('1'),
+            acceptable_value=Decimal('500'))],
+        target_measures=[TransactionMeasure(
+            measure_id=f"{tx_id}_target", account_id=target,
+            primary_regex_pattern=".*[BDF].*", primary_regex_weight=Decimal('1'),
+            acceptable_value=Decimal('500'), required_value=Decimal('10'))]
+    )
+
+
+def _build_dag() -> DAG:
+    dag = DAG(DAGConfiguration(max_path_enumeration=1000))
+    for tx_num in range(len(FLOWS) + 1):
+        dag.account_taxonomy.update_taxonomy(MAPPINGS, tx_num)
+    for account_id in ("alice", "bob", "carol"):
+        dag.add_account(Account(account_id, Decimal('1000')))
+    return dag
+
+
+class TestAddTransactionsBatch(unittest.TestCase):
+
+    def test_batch_matches_sequential_loop(self):
+        transactions = [_transaction(f"tx_{i}", source, target)
+                        for i, (source, target) in enumerate(FLOWS)]
+
+        loop_dag = _build_dag()
+        loop_results = [loop_dag.add_transaction(tx) for tx in transactions]
+
+        batch_dag = _build_dag()
+        batch = batch_dag.add_transactions_batch(transactions)
+
+        self.assertEqual([result.accepted for result in batch.results], loop_results)
+        self.assertEqual([result.transaction_id for result in batch.results],
+                         [tx.transaction_id for tx in transactions])
+        self.assertEqual(sorted(batch_dag.edges), sorted(loop_dag.edges))
+        self.assertEqual(batch_dag.transaction_counter, loop_dag.transaction_counter)
+        self.assertEqual(batch_dag.stored_pivot, loop_dag.stored_pivot)
+        for account_id, account in loop_dag.accounts.items():
+            self.assertEqual(batch_dag.accounts[account_id].balance.current_balance,
+                             account.balance.current_balance)
+
+        # Même signature patterns pour toutes les transactions: un seul NFA construit
+        self.assertEqual(batch.distinct_nfa_signatures, 1)
+        self.assertFalse(batch.results[0].nfa_reused)
+        self.assertEqual(batch.nfa_reuses, len(transactions) - 1)
+        self.assertIsNone(batch_dag._temporary_nfa_cache)
+        self.assertEqual(batch_dag.stats['batches_processed'], 1)
+        self.assertGreater(batch.total_time_ms, 0)
+        self.assertGreater(batch.transactions_per_second, 0)
+
+    def test_rejections_and_distinct_signatures(self):
+        dag = _build_dag()
+        transactions = [
+            _transaction("tx_ok", "alice", "bob"),
+            _transaction("tx_unknown_account", "bob", "dave"),
+            _transaction("tx_other_pattern", "bob", "carol", source_pattern=".*[AC].*"),
+        ]
+        batch = dag.add_transactions_batch(transactions)
+
+        self.assertEqual([result.accepted for result in batch.results], [True, False, True])
+        self.assertEqual(batch.results[1].rejection_reason, "ERROR")
+        self.assertIsNone(batch.results[0].rejection_reason)
+        self.assertEqual(batch.accepted_count, 2)
+        self.assertEqual(batch.rejected_count, 1)
+        self.assertEqual(batch.distinct_nfa_signatures, 2)
+        self.assertEqual([result.nfa_reused for result in batch.results], [False, False, False])
+        self.assertNotIn("transaction_tx_unknown_account", dag.edges)
+
+    def test_enhanced_dag_batch_auto(self):
+        dag = EnhancedDAG(DAGConfiguration(max_path_enumeration=1000))
+        dag.configure_accounts_simple(MAPPINGS)
+        for account_id in ("alice", "bob", "carol"):
+            dag.add_account(Account(account_id, Decimal('1000')))
+
+        transactions = [_transaction(f"tx_{i}", source, target)
+                        for i, (source, target) in enumerate(FLOWS[:4])]
+        batch = dag.add_transactions_batch_auto(transactions)
+
+        self.assertEqual(batch.accepted_count, 4)
+        self.assertEqual(dag.transaction_counter, 4)
+        self.assertEqual(dag._migration_stats['transactions_auto'], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()